@@ -127,132 +127,132 @@ hero(witch_doctor).
 hero(zuus).
 
 % Attack Types
+attack_type(abaddon, melee).
+attack_type(abyssal_underlord, melee).
+attack_type(alchemist, melee).
+attack_type(ancient_apparition, ranged).
 attack_type(antimage, melee).
+attack_type(arc_warden, ranged).
 attack_type(axe, melee).
 attack_type(bane, ranged).
+attack_type(batrider, ranged).
+attack_type(beastmaster, melee).
 attack_type(bloodseeker, melee).
+attack_type(bounty_hunter, melee).
+attack_type(brewmaster, melee).
+attack_type(bristleback, melee).
+attack_type(broodmother, melee).
+attack_type(centaur, melee).
+attack_type(chaos_knight, melee).
+attack_type(chen, ranged).
+attack_type(clinkz, ranged).
 attack_type(crystal_maiden, ranged).
+attack_type(dark_seer, melee).
+attack_type(dark_willow, ranged).
+attack_type(dawnbreaker, melee).
+attack_type(dazzle, ranged).
+attack_type(death_prophet, ranged).
+attack_type(disruptor, ranged).
+attack_type(doom_bringer, melee).
+attack_type(dragon_knight, melee).
 attack_type(drow_ranger, ranged).
+attack_type(earth_spirit, melee).
 attack_type(earthshaker, melee).
+attack_type(elder_titan, melee).
+attack_type(ember_spirit, melee).
+attack_type(enchantress, ranged).
+attack_type(enigma, ranged).
+attack_type(faceless_void, melee).
+attack_type(furion, ranged).
+attack_type(grimstroke, ranged).
+attack_type(gyrocopter, ranged).
+attack_type(hoodwink, ranged).
+attack_type(huskar, ranged).
+attack_type(invoker, ranged).
+attack_type(jakiro, ranged).
 attack_type(juggernaut, melee).
+attack_type(keeper_of_the_light, ranged).
+attack_type(kez, melee).
+attack_type(kunkka, melee).
+attack_type(legion_commander, melee).
+attack_type(leshrac, ranged).
+attack_type(lich, ranged).
+attack_type(life_stealer, melee).
+attack_type(lina, ranged).
+attack_type(lion, ranged).
+attack_type(lone_druid, ranged).
+attack_type(luna, ranged).
+attack_type(lycan, melee).
+attack_type(magnataur, melee).
+attack_type(marci, melee).
+attack_type(mars, melee).
+attack_type(medusa, ranged).
+attack_type(meepo, melee).
 attack_type(mirana, ranged).
+attack_type(monkey_king, melee).
 attack_type(morphling, ranged).
+attack_type(muerta, ranged).
+attack_type(naga_siren, melee).
+attack_type(necrolyte, ranged).
 attack_type(nevermore, ranged).
+attack_type(night_stalker, melee).
+attack_type(nyx_assassin, melee).
+attack_type(obsidian_destroyer, ranged).
+attack_type(ogre_magi, melee).
+attack_type(omniknight, melee).
+attack_type(oracle, ranged).
+attack_type(pangolier, melee).
+attack_type(phantom_assassin, melee).
 attack_type(phantom_lancer, melee).
+attack_type(phoenix, ranged).
+attack_type(primal_beast, melee).
 attack_type(puck, ranged).
 attack_type(pudge, melee).
+attack_type(pugna, ranged).
+attack_type(queenofpain, ranged).
+attack_type(rattletrap, melee).
 attack_type(razor, ranged).
+attack_type(riki, melee).
+attack_type(ringmaster, ranged).
+attack_type(rubick, ranged).
 attack_type(sand_king, melee).
-attack_type(storm_spirit, ranged).
-attack_type(sven, melee).
-attack_type(tiny, melee).
-attack_type(vengefulspirit, ranged).
-attack_type(windrunner, ranged).
-attack_type(zuus, ranged).
-attack_type(kunkka, melee).
-attack_type(lina, ranged).
-attack_type(lion, ranged).
+attack_type(shadow_demon, ranged).
 attack_type(shadow_shaman, ranged).
+attack_type(shredder, melee).
+attack_type(silencer, ranged).
+attack_type(skeleton_king, melee).
+attack_type(skywrath_mage, ranged).
 attack_type(slardar, melee).
-attack_type(tidehunter, melee).
-attack_type(witch_doctor, ranged).
-attack_type(lich, ranged).
-attack_type(riki, melee).
-attack_type(enigma, ranged).
-attack_type(tinker, ranged).
+attack_type(slark, melee).
+attack_type(snapfire, ranged).
 attack_type(sniper, ranged).
-attack_type(necrolyte, ranged).
-attack_type(warlock, ranged).
-attack_type(beastmaster, melee).
-attack_type(queenofpain, ranged).
-attack_type(venomancer, ranged).
-attack_type(faceless_void, melee).
-attack_type(skeleton_king, melee).
-attack_type(death_prophet, ranged).
-attack_type(phantom_assassin, melee).
-attack_type(pugna, ranged).
-attack_type(templar_assassin, ranged).
-attack_type(viper, ranged).
-attack_type(luna, ranged).
-attack_type(dragon_knight, melee).
-attack_type(dazzle, ranged).
-attack_type(rattletrap, melee).
-attack_type(leshrac, ranged).
-attack_type(furion, ranged).
-attack_type(life_stealer, melee).
-attack_type(dark_seer, melee).
-attack_type(clinkz, ranged).
-attack_type(omniknight, melee).
-attack_type(enchantress, ranged).
-attack_type(huskar, ranged).
-attack_type(night_stalker, melee).
-attack_type(broodmother, melee).
-attack_type(bounty_hunter, melee).
-attack_type(weaver, ranged).
-attack_type(jakiro, ranged).
-attack_type(batrider, ranged).
-attack_type(chen, ranged).
 attack_type(spectre, melee).
-attack_type(ancient_apparition, ranged).
-attack_type(doom_bringer, melee).
-attack_type(ursa, melee).
 attack_type(spirit_breaker, melee).
-attack_type(gyrocopter, ranged).
-attack_type(alchemist, melee).
-attack_type(invoker, ranged).
-attack_type(silencer, ranged).
-attack_type(obsidian_destroyer, ranged).
-attack_type(lycan, melee).
-attack_type(brewmaster, melee).
-attack_type(shadow_demon, ranged).
-attack_type(lone_druid, ranged).
-attack_type(chaos_knight, melee).
-attack_type(meepo, melee).
+attack_type(storm_spirit, ranged).
+attack_type(sven, melee).
+attack_type(techies, ranged).
+attack_type(templar_assassin, ranged).
+attack_type(terrorblade, melee).
+attack_type(tidehunter, melee).
+attack_type(tinker, ranged).
+attack_type(tiny, melee).
 attack_type(treant, melee).
-attack_type(ogre_magi, melee).
-attack_type(undying, melee).
-attack_type(rubick, ranged).
-attack_type(disruptor, ranged).
-attack_type(nyx_assassin, melee).
-attack_type(naga_siren, melee).
-attack_type(keeper_of_the_light, ranged).
-attack_type(wisp, ranged).
-attack_type(visage, ranged).
-attack_type(slark, melee).
-attack_type(medusa, ranged).
 attack_type(troll_warlord, ranged).
-attack_type(centaur, melee).
-attack_type(magnataur, melee).
-attack_type(shredder, melee).
-attack_type(bristleback, melee).
 attack_type(tusk, melee).
-attack_type(skywrath_mage, ranged).
-attack_type(abaddon, melee).
-attack_type(elder_titan, melee).
-attack_type(legion_commander, melee).
-attack_type(techies, ranged).
-attack_type(ember_spirit, melee).
-attack_type(earth_spirit, melee).
-attack_type(abyssal_underlord, melee).
-attack_type(terrorblade, melee).
-attack_type(phoenix, ranged).
-attack_type(oracle, ranged).
-attack_type(winter_wyvern, ranged).
-attack_type(arc_warden, ranged).
-attack_type(monkey_king, melee).
-attack_type(dark_willow, ranged).
-attack_type(pangolier, melee).
-attack_type(grimstroke, ranged).
-attack_type(hoodwink, ranged).
+attack_type(undying, melee).
+attack_type(ursa, melee).
+attack_type(vengefulspirit, ranged).
+attack_type(venomancer, ranged).
+attack_type(viper, ranged).
+attack_type(visage, ranged).
 attack_type(void_spirit, melee).
-attack_type(snapfire, ranged).
-attack_type(mars, melee).
-attack_type(ringmaster, ranged).
-attack_type(dawnbreaker, melee).
-attack_type(marci, melee).
-attack_type(primal_beast, melee).
-attack_type(muerta, ranged).
-attack_type(kez, melee).
+attack_type(warlock, ranged).
+attack_type(weaver, ranged).
+attack_type(windrunner, ranged).
+attack_type(winter_wyvern, ranged).
+attack_type(wisp, ranged).
+attack_type(witch_doctor, ranged).
+attack_type(zuus, ranged).
 
 % Properti: Atribut Utama (hasPrimaryAttribute)
 primary_attribute(abaddon, universal).
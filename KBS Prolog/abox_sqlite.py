@@ -0,0 +1,355 @@
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+
+from kbs_engine import Engine, Program
+
+# Database SQLite yang ditulis aboxconvertprolog.py --sqlite, di samping file ABox
+SQLITE_FILE = "abox_dota2.sqlite3"
+ABOX_FILE = "abox_dota2.pl"
+
+# Relasi ABox: predikat -> (jenis entitas subject, jenis entitas object).
+# Setiap relasi menjadi satu tabel (subject, object) berisi id entitas.
+RELATIONS = {
+    "primary_attribute": ("hero", "attribute"),
+    "attack_type": ("hero", "attack_type"),
+    "has_role": ("hero", "role"),
+    "has_ability": ("hero", "ability"),
+    "ability_type": ("ability", "behavior"),
+    "damage_type": ("ability", "damage_type"),
+}
+
+# Statistik numerik: kolom -> (data property ontologi, key JSON, tipe SQL).
+# Aturan pengambilannya mengikuti json_to_ontology.py, jadi hasil dari OWL
+# dan dari JSON sama.
+HERO_STATS = {
+    "localized_name": ("localizedName", "localized_name", "TEXT"),
+    "health": ("health", "base_health", "INTEGER"),
+    "health_regen": ("healthRegen", "base_health_regen", "REAL"),
+    "mana": ("mana", "base_mana", "INTEGER"),
+    "mana_regen": ("manaRegen", "base_mana_regen", "REAL"),
+    "armor": ("armor", "base_armor", "INTEGER"),
+    "magic_resistance": ("magicResistance", "base_mr", "INTEGER"),
+    "attack_min": ("baseMinAttackDamage", "base_attack_min", "INTEGER"),
+    "attack_max": ("baseMaxAttackDamage", "base_attack_max", "INTEGER"),
+    "strength_gain": ("strengthGain", "str_gain", "REAL"),
+    "agility_gain": ("agilityGain", "agi_gain", "REAL"),
+    "intelligence_gain": ("intelligenceGain", "int_gain", "REAL"),
+    "attack_range": ("attackRange", "attack_range", "INTEGER"),
+    "attack_rate": ("attackRate", "attack_rate", "REAL"),
+    "movement_speed": ("movementSpeed", "move_speed", "INTEGER"),
+    "day_vision": ("dayVision", "day_vision", "INTEGER"),
+    "night_vision": ("nightVision", "night_vision", "INTEGER"),
+}
+ITEM_STATS = {
+    "display_name": ("displayName", "dname", "TEXT"),
+    "cost": ("cost", "cost", "INTEGER"),
+    "tier": ("tier", "tier", "INTEGER"),
+    "cooldown": ("cooldown", "cd", "REAL"),
+}
+
+FACT_RE = re.compile(r"(\w+)\(([^,()]+)(?:, ([^,()]+))?\)\.")
+
+
+def create_schema(db):
+    """Tabel entitas, satu tabel per relasi, dan tabel statistik. Index dibuat terpisah oleh create_indexes."""
+    db.execute("CREATE TABLE entity (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, name TEXT NOT NULL, UNIQUE (kind, name))")
+    for predicate in RELATIONS:
+        db.execute(f"CREATE TABLE {predicate} (subject INTEGER NOT NULL REFERENCES entity(id), "
+                   f"object INTEGER NOT NULL REFERENCES entity(id), PRIMARY KEY (subject, object)) WITHOUT ROWID")
+    for table, key, stats in (("hero_stats", "hero", HERO_STATS), ("item_stats", "item", ITEM_STATS)):
+        columns = ", ".join(f"{column} {sql_type}" for column, (_, _, sql_type) in stats.items())
+        db.execute(f"CREATE TABLE {table} ({key} INTEGER PRIMARY KEY REFERENCES entity(id), {columns})")
+
+def create_indexes(db):
+    """
+    Primary key (subject, object) sudah menjadi index arah maju; index
+    (object, subject) menutup arah balik, jadi kedua arah dijawab dari index
+    saja tanpa membaca tabelnya.
+    """
+    for predicate in RELATIONS:
+        db.execute(f"CREATE INDEX {predicate}_by_object ON {predicate} (object, subject)")
+
+def _coerce(value, sql_type):
+    if sql_type == "TEXT": return str(value)
+    value = float(value)
+    return int(value) if sql_type == "INTEGER" and value.is_integer() else value
+
+
+def fact_tuples(facts):
+    """
+    Mengubah kumpulan fakta teks hasil konversi (seperti yang ditulis ke
+    file .pl) menjadi (daftar hero, dict predikat -> list (subject, object)).
+    """
+    heroes = []
+    relations = {predicate: [] for predicate in RELATIONS}
+    for name in ("hero", *RELATIONS):
+        for fact in facts.get(name, ()):
+            predicate, subject, obj = FACT_RE.match(fact).groups()
+            if predicate == "hero": heroes.append(subject)
+            else: relations[predicate].append((subject, obj))
+    return heroes, relations
+
+
+def write_database(path, heroes, relations, hero_stats, item_stats, items=()):
+    """
+    Menulis database SQLite ke `path` dalam SATU transaksi: semua entitas,
+    relasi, dan statistik dimasukkan dengan executemany, index dibuat setelah
+    data masuk, lalu ANALYZE. Database ditulis ke file sementara lalu
+    menggantikan file lama, sehingga pembaca tidak pernah melihat file setengah jadi.
+    hero_stats/item_stats: dict nama -> {kolom: nilai}.
+    Mengembalikan jumlah baris per tabel.
+    """
+    tmp = path + ".tmp"
+    if os.path.exists(tmp): os.remove(tmp)
+    db = sqlite3.connect(tmp, isolation_level=None)
+    db.execute("PRAGMA journal_mode = OFF")
+    db.execute("PRAGMA synchronous = OFF")
+
+    ids = {}
+    def entity(kind, name):
+        key = (kind, name)
+        entity_id = ids.get(key)
+        if entity_id is None: entity_id = ids[key] = len(ids) + 1
+        return entity_id
+
+    # Id diberikan dalam urutan nama, jadi isi database tidak bergantung pada urutan set fakta
+    for name in sorted(heroes): entity("hero", name)
+    rows = {}
+    for predicate, (subject_kind, object_kind) in RELATIONS.items():
+        rows[predicate] = sorted((entity(subject_kind, s), entity(object_kind, o)) for s, o in sorted(set(relations.get(predicate, ()))))
+    for name in sorted(items): entity("item", name)
+    stat_rows = {}
+    for table, kind, stats, values in (("hero_stats", "hero", HERO_STATS, hero_stats), ("item_stats", "item", ITEM_STATS, item_stats)):
+        stat_rows[table] = sorted(
+            (entity(kind, name), *(None if fields.get(c) is None else _coerce(fields[c], stats[c][2]) for c in stats))
+            for name, fields in sorted(values.items()))
+
+    try:
+        db.execute("BEGIN")
+        create_schema(db)
+        db.executemany("INSERT INTO entity VALUES (?, ?, ?)", ((i, kind, name) for (kind, name), i in ids.items()))
+        for predicate, pairs in rows.items():
+            db.executemany(f"INSERT INTO {predicate} VALUES (?, ?)", pairs)
+        for table, table_rows in stat_rows.items():
+            if table_rows: db.executemany(f"INSERT INTO {table} VALUES ({', '.join('?' * len(table_rows[0]))})", table_rows)
+        create_indexes(db)
+        db.execute("ANALYZE")
+        db.execute("COMMIT")
+    finally:
+        db.close()
+    os.replace(tmp, path)
+    return {"entity": len(ids), **{p: len(r) for p, r in rows.items()}, **{t: len(r) for t, r in stat_rows.items()}}
+
+
+class AboxDatabase:
+    """API query di atas database hasil write_database. Nama entitas sama dengan atom di file ABox."""
+    def __init__(self, path=SQLITE_FILE):
+        if not os.path.exists(path): raise FileNotFoundError(f"database '{path}' tidak ditemukan")
+        self.db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    def close(self):
+        self.db.close()
+
+    @staticmethod
+    def _relation(predicate):
+        if predicate not in RELATIONS: raise ValueError(f"relasi '{predicate}' tidak dikenal")
+        return RELATIONS[predicate]
+
+    def objects(self, predicate, subject):
+        """Semua X dengan predicate(subject, X), misalnya objects("has_role", "axe")."""
+        subject_kind, _ = self._relation(predicate)
+        rows = self.db.execute(f"SELECT o.name FROM entity s JOIN {predicate} r ON r.subject = s.id "
+                               f"JOIN entity o ON o.id = r.object WHERE s.kind = ? AND s.name = ? ORDER BY o.name",
+                               (subject_kind, subject))
+        return [name for name, in rows]
+
+    def subjects(self, predicate, obj):
+        """Semua X dengan predicate(X, obj), misalnya subjects("has_role", "carry")."""
+        _, object_kind = self._relation(predicate)
+        rows = self.db.execute(f"SELECT s.name FROM entity o JOIN {predicate} r ON r.object = o.id "
+                               f"JOIN entity s ON s.id = r.subject WHERE o.kind = ? AND o.name = ? ORDER BY s.name",
+                               (object_kind, obj))
+        return [name for name, in rows]
+
+    def damage_type_per_role(self):
+        """{role: {damage type: jumlah pasangan (hero, ability)}} untuk ability milik hero dengan role tersebut."""
+        result = {}
+        rows = self.db.execute("""
+            SELECT role.name, damage.name, COUNT(*)
+            FROM has_role hr
+            JOIN has_ability ha ON ha.subject = hr.subject
+            JOIN damage_type dt ON dt.subject = ha.object
+            JOIN entity role ON role.id = hr.object
+            JOIN entity damage ON damage.id = dt.object
+            GROUP BY role.name, damage.name""")
+        for role, damage, count in rows: result.setdefault(role, {})[damage] = count
+        return result
+
+    def active_abilities_per_attribute(self):
+        """{atribut utama: rata-rata jumlah ability non-pasif per hero}."""
+        rows = self.db.execute("""
+            SELECT attribute.name, AVG(active)
+            FROM (SELECT pa.subject AS hero, pa.object AS attribute_id,
+                         (SELECT COUNT(*) FROM has_ability ha
+                          WHERE ha.subject = pa.subject AND NOT EXISTS (
+                              SELECT 1 FROM ability_type t JOIN entity b ON b.id = t.object
+                              WHERE t.subject = ha.object AND b.kind = 'behavior' AND b.name = 'passive')) AS active
+                  FROM primary_attribute pa)
+            JOIN entity attribute ON attribute.id = attribute_id
+            GROUP BY attribute.name""")
+        return dict(rows)
+
+    def hero_stats(self, hero):
+        cursor = self.db.execute("SELECT s.* FROM hero_stats s JOIN entity e ON e.id = s.hero "
+                                 "WHERE e.kind = 'hero' AND e.name = ?", (hero,))
+        row = cursor.fetchone()
+        if row is None: return None
+        return {column: value for (column, *_), value in zip(cursor.description, row) if column != "hero"}
+
+    def top_heroes(self, stat, limit=5, role=None):
+        """Hero dengan nilai `stat` tertinggi, opsional hanya hero dengan role tertentu."""
+        if stat not in HERO_STATS: raise ValueError(f"statistik '{stat}' tidak dikenal")
+        query = f"SELECT e.name, s.{stat} FROM hero_stats s JOIN entity e ON e.id = s.hero"
+        params = []
+        if role is not None:
+            query += " JOIN has_role hr ON hr.subject = s.hero JOIN entity r ON r.id = hr.object AND r.kind = 'role' AND r.name = ?"
+            params.append(role)
+        query += f" WHERE s.{stat} IS NOT NULL ORDER BY s.{stat} DESC, e.name LIMIT ?"
+        return self.db.execute(query, (*params, limit)).fetchall()
+
+    def sql(self, query, params=()):
+        """Query SQL bebas (read-only)."""
+        return self.db.execute(query, params).fetchall()
+
+
+# === Pembanding: query yang sama sebagai goal Prolog di kbs_engine ===
+
+def parse_goal(text):
+    """Mem-parsing body Prolog (tanpa titik) menjadi goal kbs_engine."""
+    return Program().load_text(f"q :- {text}.").rules["q"][0][1]
+
+class PrologQueries:
+    """
+    Query analitik yang sama dengan AboxDatabase, ditulis sebagai loop
+    findall/length atas fakta ABox dan dievaluasi oleh kbs_engine.
+    """
+    def __init__(self, abox_file=ABOX_FILE):
+        self.program = Program().load(abox_file)
+        self.engine = Engine(self.program)
+        self.roles = sorted({row[1] for row in self.program.facts["has_role"]})
+        self.damage_types = sorted({row[1] for row in self.program.facts["damage_type"]})
+        self.attributes = sorted({row[1] for row in self.program.facts["primary_attribute"]})
+
+    def objects(self, predicate, subject):
+        return sorted(b["X"] for b in self.engine.solve(parse_goal(f"{predicate}({subject}, X)"), [{}]))
+
+    def subjects(self, predicate, obj):
+        return sorted(b["X"] for b in self.engine.solve(parse_goal(f"{predicate}(X, {obj})"), [{}]))
+
+    def count(self, text):
+        binding, = self.engine.solve(parse_goal(text), [{}])
+        return binding["N"]
+
+    def damage_type_per_role(self):
+        result = {}
+        for role in self.roles:
+            for damage in self.damage_types:
+                n = self.count(f"findall(A, (has_role(H, {role}), has_ability(H, A), damage_type(A, {damage})), L), length(L, N)")
+                if n: result.setdefault(role, {})[damage] = n
+        return result
+
+    def active_abilities_per_attribute(self):
+        result = {}
+        for attribute in self.attributes:
+            active = self.count(f"findall(A, (primary_attribute(H, {attribute}), has_ability(H, A), "
+                                f"\\+ ability_type(A, passive)), L), length(L, N)")
+            heroes = self.count(f"findall(H, primary_attribute(H, {attribute}), L), length(L, N)")
+            result[attribute] = active / heroes
+        return result
+
+
+def benchmark(database_file, abox_file, budget=0.5):
+    """
+    Menjalankan setiap query di SQLite dan di kbs_engine, memastikan hasilnya
+    sama, dan mencetak waktu per query serta waktu membuka masing-masing
+    sumber. Mengembalikan jumlah query yang hasilnya berbeda.
+    """
+    start = time.perf_counter()
+    database = AboxDatabase(database_file)
+    open_time = time.perf_counter() - start
+    start = time.perf_counter()
+    prolog = PrologQueries(abox_file)
+    load_time = time.perf_counter() - start
+
+    hero, role = min(prolog.program.facts["hero"])[0], prolog.roles[0]
+    queries = [
+        (f"has_role({hero}, X)", lambda q: q.objects("has_role", hero)),
+        (f"has_role(X, {role})", lambda q: q.subjects("has_role", role)),
+        ("damage type per role", lambda q: q.damage_type_per_role()),
+        ("active abilities per attribute", lambda q: {k: round(v, 9) for k, v in q.active_abilities_per_attribute().items()}),
+    ]
+    mismatches = 0
+    print(f"{'query':<32} {'SQLite':>12} {'kbs_engine':>12} {'speedup':>9}")
+    print(f"{'buka / muat':<32} {open_time * 1000:9.3f} ms {load_time * 1000:9.3f} ms {load_time / open_time:8.1f}x")
+    for label, run in queries:
+        timings = []
+        results = []
+        for backend in (database, prolog):
+            results.append(run(backend))
+            rounds, start = 0, time.perf_counter()
+            while time.perf_counter() - start < budget:
+                run(backend)
+                rounds += 1
+            timings.append((time.perf_counter() - start) / rounds)
+        same = results[0] == results[1]
+        mismatches += not same
+        print(f"{label:<32} {timings[0] * 1000:9.3f} ms {timings[1] * 1000:9.3f} ms {timings[1] / timings[0]:8.1f}x"
+              + ("" if same else "  BERBEDA"))
+    database.close()
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query analitik atas database SQLite ABox (aboxconvertprolog.py --sqlite).")
+    parser.add_argument("--database", default=SQLITE_FILE, help="file database SQLite")
+    parser.add_argument("--damage-per-role", action="store_true", help="distribusi damage type ability per role hero")
+    parser.add_argument("--active-per-attribute", action="store_true",
+                        help="rata-rata jumlah ability non-pasif per hero untuk setiap atribut utama")
+    parser.add_argument("--hero", help="tampilkan statistik dan relasi satu hero (misalnya axe)")
+    parser.add_argument("--top", metavar="STAT", choices=list(HERO_STATS),
+                        help=f"hero dengan nilai tertinggi untuk kolom ini ({', '.join(HERO_STATS)})")
+    parser.add_argument("--role", help="dengan --top, hanya hero dengan role ini")
+    parser.add_argument("--sql", help="jalankan query SQL bebas")
+    parser.add_argument("--bench", action="store_true",
+                        help=f"bandingkan waktu dan hasil query dengan goal Prolog yang sama di kbs_engine atas '{ABOX_FILE}'")
+    args = parser.parse_args()
+
+    try:
+        database = AboxDatabase(args.database)
+    except FileNotFoundError as e:
+        print(f"GAGAL: {e}. Jalankan dulu: python aboxconvertprolog.py --sqlite", file=sys.stderr)
+        sys.exit(1)
+
+    if args.damage_per_role:
+        for role, counts in sorted(database.damage_type_per_role().items()):
+            print(f"{role:<12} " + "  ".join(f"{damage} {n}" for damage, n in sorted(counts.items())))
+    if args.active_per_attribute:
+        for attribute, average in sorted(database.active_abilities_per_attribute().items()):
+            print(f"{attribute:<14} {average:.2f}")
+    if args.hero:
+        stats = database.hero_stats(args.hero)
+        if stats is None: print(f"Hero '{args.hero}' tidak ditemukan.")
+        else:
+            for column, value in stats.items(): print(f"  {column:<18} {value}")
+            for predicate in ("primary_attribute", "attack_type", "has_role", "has_ability"):
+                print(f"  {predicate:<18} {', '.join(database.objects(predicate, args.hero))}")
+    if args.top:
+        for name, value in database.top_heroes(args.top, role=args.role): print(f"{name:<24} {value}")
+    if args.sql:
+        for row in database.sql(args.sql): print(*row, sep="\t")
+    database.close()
+    if args.bench and benchmark(args.database, ABOX_FILE): sys.exit(1)
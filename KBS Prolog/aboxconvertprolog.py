@@ -1,13 +1,46 @@
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
 import rdflib
 from rdflib.namespace import RDF, OWL, RDFS
 import sys
 
+# Modul yang dipakai bersama json_to_ontology.py (stage_profile.py, checksum.py) ada di folder Ontologi
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Ontologi"))
+
+from abox_sqlite import HERO_STATS, ITEM_STATS, SQLITE_FILE, fact_tuples, write_database
+from ontology_cache import clear_cache, load_ontology_triples, load_quadstore_triples, load_shard_triples, shard_files
+from stage_profile import NULL_PROFILER, StageProfiler
+
 # Nama file ontologi
 ONTOLOGY_FILE = "../Ontologi/dota2_ontology.owl"
 
+# Quadstore SQLite owlready2 (json_to_ontology.py --output-format sqlite/both)
+QUADSTORE_FILE = "../Ontologi/dota2_ontology.sqlite3"
+
+# Ontologi yang dipecah per jenis entitas (json_to_ontology.py --sharded).
+# ABox hanya butuh shard hero dan ability; shard item dibaca jika database
+# SQLite juga ditulis. Talent, facet, unit, dan structure tidak pernah dibaca.
+SHARD_DIR = "../Ontologi/dota2_ontology_shards"
+ABOX_SHARDS = ("heroes", "abilities")
+SQLITE_SHARDS = ("items",)
+
+# File JSON sumber (dipakai langsung oleh mode --from-json)
+JSON_DIR = "../Ontologi"
+HEROES_FILE = os.path.join(JSON_DIR, "heroes.json")
+HERO_ABILITIES_FILE = os.path.join(JSON_DIR, "hero_abilities.json")
+ABILITIES_FILE = os.path.join(JSON_DIR, "abilities.json")
+ITEMS_FILE = os.path.join(JSON_DIR, "items.json")
+
 # Nama file Prolog ABox yang akan dihasilkan
 OUTPUT_FILE = "abox_dota2.pl"
 
+# Laporan profiling per tahap (--profile) dan dump cProfile tahap terberat (--profile-cprofile)
+PROFILE_FILE = "aboxconvertprolog.profile.json"
+CPROFILE_FILE = "aboxconvertprolog.prof"
+
 # Namespace dari ontologi
 NS_BASE = "http://www.semanticweb.org/dota2-ontology#"
 NS = rdflib.Namespace(NS_BASE)
@@ -30,106 +63,502 @@ def get_local_name(term):
     else:
         return str(term).lower()
 
+def get_json_local_name(name):
+    """
+    Versi get_local_name untuk nama yang dibaca langsung dari JSON.
+    Nama individu di ontologi dibentuk dari nilai JSON dengan spasi diganti
+    underscore, jadi aturannya sama dengan local name URI-nya.
+    Contoh:
+    - "npc_dota_hero_antimage" -> "antimage"
+    - "No Target" -> "no_target"
+    """
+    return name.replace(" ", "_").lower().replace('npc_dota_hero_', '')
+
 def format_prolog_fact(predicate, subject, obj):
     """Memformat triple sebagai fakta Prolog: predicate(subject, object)."""
     return f"{predicate}({get_local_name(subject)}, {get_local_name(obj)}).\n"
 
+def format_json_fact(predicate, subject, obj):
+    """Seperti format_prolog_fact, tetapi untuk nama yang berasal dari JSON."""
+    return f"{predicate}({get_json_local_name(subject)}, {get_json_local_name(obj)}).\n"
+
+def write_abox(output_file, hero_facts, attack_type_facts, attribute_facts, role_facts,
+               hero_ability_facts, ability_type_facts, damage_type_facts):
+    """
+    Menulis semua fakta ke file ABox Prolog. Setiap kumpulan fakta diurutkan
+    secara alfabetis, sehingga mode OWL, quadstore, shard, dan --from-json
+    menghasilkan file yang sama.
+    """
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("% === Fakta Hero ===\n")
+        f.writelines(sorted(hero_facts))
+        f.write("\n")
+
+        if attack_type_facts:
+            f.write("% Attack Types\n")
+            f.writelines(sorted(attack_type_facts))
+            f.write("\n")
+
+        f.write("% Properti: Atribut Utama (hasPrimaryAttribute)\n")
+        f.writelines(sorted(attribute_facts))
+        f.write("\n")
+
+        f.write("% Properti: Role (hasRole)\n")
+        f.writelines(sorted(role_facts))
+        f.write("\n")
+
+        f.write("% Properti: Kepemilikan Ability (hasAbility)\n")
+        f.writelines(sorted(hero_ability_facts))
+        f.write("\n")
+
+        f.write("% === Fakta Ability ===\n\n")
+        f.write("% Properti: Tipe Ability (abilityType)\n")
+        f.writelines(sorted(ability_type_facts))
+        f.write("\n")
+
+        f.write("% Properti: Tipe Damage (damageType)\n")
+        f.writelines(sorted(damage_type_facts))
+        f.write("\n")
+
+
+# Tabel dispatch: predikat ontologi -> (fungsi pembentuk fakta, hanya_untuk_ability).
+# Setiap fungsi menerima (subject, object) dan menghasilkan pasangan
+# (nama kumpulan, fakta). Predikat baru cukup didaftarkan dengan @fact_extractor,
+# tanpa menambah scan baru atas graph.
+FACT_EXTRACTORS = {}
+
+# Pembentuk data untuk database SQLite (--sqlite); hanya ikut di-scan jika
+# database ditulis, dan hasilnya tidak masuk ke file .pl.
+SQLITE_EXTRACTORS = {}
+SQLITE_COLLECTIONS = ("hero_stat", "item", "item_stat")
+
+def fact_extractor(predicate, ability_detail=False, registry=FACT_EXTRACTORS):
+    """
+    Mendaftarkan fungsi pembentuk fakta untuk sebuah predikat di `registry`.
+    Jika ability_detail=True, fakta hanya disimpan untuk subject yang
+    merupakan objek dari :hasAbility (ability milik hero).
+    """
+    def register(func):
+        registry[predicate] = (func, ability_detail)
+        return func
+    return register
+
+@fact_extractor(NS.hasPrimaryAttribute)
+def _primary_attribute_facts(s, o):
+    yield "hero", f"hero({get_local_name(s)}).\n"
+    yield "primary_attribute", format_prolog_fact("primary_attribute", s, o)
 
-def convert_ontology():
-    """Membaca file OWL dan mengonversinya menjadi ABox Prolog."""
-    
-    g = rdflib.Graph()
+@fact_extractor(NS.hasAttackType)
+def _attack_type_facts(s, o):
+    yield "attack_type", format_prolog_fact("attack_type", s, o)
+
+@fact_extractor(NS.hasRole)
+def _role_facts(s, o):
+    yield "has_role", format_prolog_fact("has_role", s, o)
+
+@fact_extractor(NS.hasAbility)
+def _hero_ability_facts(s, o):
+    yield "has_ability", format_prolog_fact("has_ability", s, o)
+    yield "ability", o
+
+@fact_extractor(NS.hasBehavior, ability_detail=True)
+def _ability_type_facts(s, o):
+    yield "ability_type", format_prolog_fact("ability_type", s, o)
+
+@fact_extractor(NS.hasDamageType, ability_detail=True)
+def _damage_type_facts(s, o):
+    yield "damage_type", format_prolog_fact("damage_type", s, o)
+
+# Statistik hero/item untuk database SQLite (--sqlite), sebagai tuple
+# (nama, kolom, nilai). Data property yang sama juga dipakai unit, structure,
+# dan ability; yang bukan hero/item disaring oleh write_sqlite.
+def _stat_extractor(name, column):
+    def extract(s, o):
+        yield name, (get_local_name(s), column, o.toPython())
+    return extract
+
+for _table, _stats in (("hero_stat", HERO_STATS), ("item_stat", ITEM_STATS)):
+    for _column, (_prop, _, _) in _stats.items():
+        fact_extractor(NS[_prop], registry=SQLITE_EXTRACTORS)(_stat_extractor(_table, _column))
+
+ITEM_CLASSES = {NS.Item, NS.ComponentItem, NS.CraftedItem, NS.ConsumableItem, NS.NeutralItem}
+
+@fact_extractor(RDF.type, registry=SQLITE_EXTRACTORS)
+def _item_facts(s, o):
+    if o in ITEM_CLASSES: yield "item", get_local_name(s)
+
+
+def stat_table(stat_facts, names):
+    """Tuple (nama, kolom, nilai) milik `names` -> dict nama -> {kolom: nilai}."""
+    table = {}
+    for name, column, value in stat_facts:
+        if name in names: table.setdefault(name, {})[column] = value
+    return table
+
+def write_sqlite(path, facts, stats):
+    """
+    Menulis fakta ABox beserta statistik hero dan item (`stats`, kumpulan
+    SQLITE_COLLECTIONS) ke database SQLite (lihat abox_sqlite.py). Hero adalah
+    subject yang punya localizedName, item adalah individu dengan class item.
+    Mengembalikan jumlah baris per tabel.
+    """
+    heroes, relations = fact_tuples(facts)
+    hero_names = {name for name, column, _ in stats["hero_stat"] if column == "localized_name"}
+    return write_database(path, heroes, relations, stat_table(stats["hero_stat"], hero_names),
+                          stat_table(stats["item_stat"], stats["item"]), sorted(stats["item"]))
+
+
+def extract_facts(g, profiler=NULL_PROFILER, extractors=FACT_EXTRACTORS):
+    """
+    Membaca seluruh triple graph dalam SATU kali scan dan meneruskan setiap
+    triple ke fungsi pembentuk fakta di `extractors` sesuai predikatnya.
+    Mengembalikan (facts, stats): facts adalah dict nama kumpulan -> set fakta,
+    stats berisi jumlah triple yang di-scan dan waktu per predikat.
+    Scan dan penyaringan detail ability dicatat sebagai tahap `profiler`.
+    """
+    facts = defaultdict(set)
+    # Fakta detail ability ditahan dulu bersama subject-nya, karena daftar
+    # ability hero baru lengkap setelah scan selesai.
+    pending = defaultdict(set)
+    predicate_time = defaultdict(float)
+    predicate_count = defaultdict(int)
+    scanned = 0
+
+    with profiler.stage("scan") as counters:
+        for s, p, o in g:
+            scanned += 1
+            entry = extractors.get(p)
+            if entry is None:
+                continue
+            extractor, ability_detail = entry
+            start = time.perf_counter()
+            for name, fact in extractor(s, o):
+                if ability_detail:
+                    pending[name].add((s, fact))
+                else:
+                    facts[name].add(fact)
+            predicate_time[p] += time.perf_counter() - start
+            predicate_count[p] += 1
+        counters["triples"] = scanned
+        counters["matched"] = sum(predicate_count.values())
+
+    with profiler.stage("ability_detail") as counters:
+        abilities = facts["ability"]
+        for name, subject_facts in pending.items():
+            facts[name] = {fact for s, fact in subject_facts if s in abilities}
+        counters["abilities"] = len(abilities)
+        counters["candidates"] = sum(len(v) for v in pending.values())
+        counters["kept"] = sum(len(facts[name]) for name in pending)
+
+    stats = {
+        "triples": scanned,
+        "predicates": {str(p).split("#")[-1]: (predicate_count[p], predicate_time[p]) for p in predicate_count},
+    }
+    return facts, stats
+
+
+def convert_ontology(use_cache=True, from_quadstore=False, profiler=NULL_PROFILER, sqlite_file=None, from_shards=False,
+                     output_file=OUTPUT_FILE):
+    """
+    Membaca file OWL dan mengonversinya menjadi ABox Prolog di output_file.
+    Jika use_cache=True, hasil parse disimpan sebagai snapshot yang dikunci
+    dengan hash isi file OWL, sehingga run berikutnya tidak perlu mem-parsing
+    RDF/XML lagi selama ontologinya tidak berubah.
+    Jika from_quadstore=True, triple dibaca langsung dari quadstore SQLite,
+    hanya untuk predikat yang terdaftar di FACT_EXTRACTORS.
+    Jika from_shards=True, hanya shard ontologi yang dibutuhkan yang di-parse
+    (lihat ABOX_SHARDS), dengan cache yang sama seperti file OWL.
+    Jika sqlite_file diberikan, fakta yang sama juga ditulis ke database
+    SQLite, dan SQLITE_EXTRACTORS ikut dipakai saat scan.
+    Mengembalikan True jika berhasil, False jika ontologi gagal dimuat atau
+    output gagal ditulis.
+    """
+    extractors = FACT_EXTRACTORS if sqlite_file is None else {**FACT_EXTRACTORS, **SQLITE_EXTRACTORS}
     try:
-        g.parse(ONTOLOGY_FILE, format="xml")
-        print(f"Berhasil memuat {ONTOLOGY_FILE}")
+        with profiler.stage("load") as counters:
+            if from_quadstore:
+                g = load_quadstore_triples(QUADSTORE_FILE, predicates=extractors.keys())
+                print(f"Berhasil memuat {QUADSTORE_FILE}")
+            elif from_shards:
+                shards = ABOX_SHARDS + (SQLITE_SHARDS if sqlite_file is not None else ())
+                g, from_cache = load_shard_triples(shard_files(SHARD_DIR, shards), use_cache=use_cache)
+                print(f"Berhasil memuat shard {', '.join(shards)} dari {SHARD_DIR}" + (" (dari cache)" if from_cache else ""))
+                counters["from_cache"] = int(from_cache)
+                counters["shards"] = len(shards)
+            else:
+                g, from_cache = load_ontology_triples(ONTOLOGY_FILE, use_cache=use_cache)
+                print(f"Berhasil memuat {ONTOLOGY_FILE}" + (" (dari cache)" if from_cache else ""))
+                counters["from_cache"] = int(from_cache)
+            counters["triples"] = len(g)
     except Exception as e:
         print(f"GAGAL memuat file ontologi: {e}", file=sys.stderr)
-        return
+        return False
+
+    # Satu kali scan untuk semua predikat yang terdaftar di `extractors`
+    print("Mencari Hero, Atribut, Role, Ability, dan detail Ability...")
+    facts, stats = extract_facts(g, profiler, extractors)
+    sqlite_stats = {name: facts.pop(name, set()) for name in SQLITE_COLLECTIONS}
+
+    hero_facts = facts["hero"]
+    attack_type_facts = facts["attack_type"]
+    attribute_facts = facts["primary_attribute"]
+    role_facts = facts["has_role"]
+    hero_ability_facts = facts["has_ability"]
+    ability_type_facts = facts["ability_type"]
+    damage_type_facts = facts["damage_type"]
 
-    g.bind("", NS)
+    print(f"\nScan selesai: {stats['triples']} triple dibaca.")
+    for predicate, (count, seconds) in sorted(stats["predicates"].items()):
+        print(f"  {predicate:<22} {count:>6} triple  {seconds * 1000:8.2f} ms")
 
-    # Kumpulan untuk menyimpan fakta Prolog
+    print("\nHASIL DIAGNOSTIK")
+    print(f"Ditemukan   {len(hero_facts)} hero (dari 'hasPrimaryAttribute').")
+    print(f"Ditemukan   {len(attack_type_facts)} fakta 'attack_type' (dari 'hasAttackType').")
+    print(f"Ditemukan   {len(attribute_facts)} fakta 'primary_attribute'.")
+    print(f"Ditemukan   {len(role_facts)} fakta 'has_role'.")
+    print(f"Ditemukan   {len(hero_ability_facts)} fakta 'has_ability'.")
+    print(f"Ditemukan   {len(ability_type_facts)} fakta 'ability_type' (dari 'hasBehavior').")
+    print(f"Ditemukan   {len(damage_type_facts)} fakta 'damage_type' (dari 'hasDamageType').")
+
+    try:
+        with profiler.stage("write") as counters:
+            write_abox(output_file, hero_facts, attack_type_facts, attribute_facts, role_facts,
+                       hero_ability_facts, ability_type_facts, damage_type_facts)
+            counters["facts"] = sum(map(len, (hero_facts, attack_type_facts, attribute_facts, role_facts,
+                                               hero_ability_facts, ability_type_facts, damage_type_facts)))
+            counters["bytes"] = os.path.getsize(output_file)
+
+        print(f"Konversi selesai! Berhasil.\n")
+        print(f"ABox Prolog telah disimpan ke: {output_file}")
+
+        if sqlite_file is not None:
+            with profiler.stage("sqlite") as counters:
+                counters.update(write_sqlite(sqlite_file, facts, sqlite_stats))
+            print(f"Database SQLite telah disimpan ke: {sqlite_file} "
+                  f"({counters['entity']} entitas, {counters['hero_stats']} hero, {counters['item_stats']} item)")
+
+    except Exception as e:
+        print(f"Gagal menulis ke file output: {e}", file=sys.stderr)
+        return False
+    return True
+
+
+def collect_json_facts(heroes_data, hero_abilities_data, abilities_data, profiler=NULL_PROFILER):
+    """
+    Membentuk fakta ABox dari data JSON yang sudah dimuat.
+    Mengembalikan dict nama kumpulan -> set fakta.
+    """
     hero_facts = set()
+    attack_type_facts = set()
     attribute_facts = set()
     role_facts = set()
     hero_ability_facts = set()
-    ability_facts = set() 
+    ability_facts = set()
     ability_type_facts = set()
     damage_type_facts = set()
 
-    # 1. Temukan Atribut Utama (:hasPrimaryAttribute)
-    print("Mencari Hero dan Atribut...")
-    for s, p, o in g.triples((None, NS.hasPrimaryAttribute, None)):
-        hero_facts.add(f"hero({get_local_name(s)}).\n")
-        attribute_facts.add(format_prolog_fact("primary_attribute", s, o))
+    attr_map = {'str': 'Strength', 'agi': 'Agility', 'int': 'Intelligence', 'all': 'Universal'}
+    skipped_abilities = ["dota_base_ability", "dota_empty_ability", "special_bonus_attributes", "generic_hidden"]
 
-    # 2. Temukan Role (:hasRole)
-    print("Mencari Role...")
-    for s, p, o in g.triples((None, NS.hasRole, None)):
-        role_facts.add(format_prolog_fact("has_role", s, o))
+    # 1. Hero, atribut utama, attack type, dan role (heroes.json)
+    print("Mencari Hero, Atribut, dan Role...")
+    with profiler.stage("heroes", heroes=len(heroes_data)):
+        for hero_info in heroes_data.values():
+            hero_name = hero_info['name']
+            primary_attr = hero_info.get('primary_attr')
+            if primary_attr in attr_map:
+                hero_facts.add(f"hero({get_json_local_name(hero_name)}).\n")
+                attribute_facts.add(format_json_fact("primary_attribute", hero_name, attr_map[primary_attr]))
+            if hero_info.get('attack_type'):
+                attack_type_facts.add(format_json_fact("attack_type", hero_name, hero_info['attack_type']))
+            for role_name in hero_info.get('roles', []):
+                role_facts.add(format_json_fact("has_role", hero_name, role_name))
 
-    # 3. Temukan Ability Hero (:hasAbility)
-    print("Mencari Ability...")
-    for s, p, o in g.triples((None, NS.hasAbility, None)):
-        hero_ability_facts.add(format_prolog_fact("has_ability", s, o))
-        ability_facts.add(o) # Tambahkan 'o' (objek/ability) ke set
+            # 2. Ability hero (hero_abilities.json)
+            for ability_name in hero_abilities_data.get(hero_name, {}).get('abilities', []):
+                if ability_name not in ["generic_hidden", "dota_base_ability"]:
+                    hero_ability_facts.add(format_json_fact("has_ability", hero_name, ability_name))
+                    ability_facts.add(ability_name)
 
-    # 4. Temukan Tipe Ability & Damage
+    # 3. Tipe ability & damage (abilities.json)
     print(f"Mencari detail untuk {len(ability_facts)} ability...")
+    with profiler.stage("ability_detail", abilities=len(ability_facts)):
+        for ability_name in ability_facts:
+            ability_info = abilities_data.get(ability_name)
+            if ability_info is None or ability_name in skipped_abilities:
+                continue
+            if ability_info.get('dmg_type'):
+                damage_type_facts.add(format_json_fact("damage_type", ability_name, ability_info['dmg_type']))
+            behaviors = ability_info.get('behavior')
+            if isinstance(behaviors, str): behaviors = [behaviors]
+            if isinstance(behaviors, list):
+                for behavior_name in behaviors:
+                    ability_type_facts.add(format_json_fact("ability_type", ability_name, behavior_name))
 
-    for ability_uri in ability_facts:
-        # Ambil SEMUA properti untuk ability ini
-        for p, o in g.predicate_objects(subject=ability_uri):
-            # Ganti NS.abilityType -> NS.hasBehavior
-            if p == NS.hasBehavior:
-                ability_type_facts.add(format_prolog_fact("ability_type", ability_uri, o))
-            
-            # Ganti NS.damageType -> NS.hasDamageType
-            elif p == NS.hasDamageType:
-                damage_type_facts.add(format_prolog_fact("damage_type", ability_uri, o))
+    return {
+        "hero": hero_facts,
+        "attack_type": attack_type_facts,
+        "primary_attribute": attribute_facts,
+        "has_role": role_facts,
+        "has_ability": hero_ability_facts,
+        "ability": ability_facts,
+        "ability_type": ability_type_facts,
+        "damage_type": damage_type_facts,
+    }
 
 
+def collect_json_stats(heroes_data, items_data, profiler=NULL_PROFILER):
+    """
+    Statistik hero dan item untuk write_sqlite dari data JSON yang sudah
+    dimuat, dengan aturan yang sama seperti json_to_ontology.py.
+    Mengembalikan dict nama kumpulan (SQLITE_COLLECTIONS) -> set.
+    """
+    hero_stat_facts = set()
+    item_facts = set()
+    item_stat_facts = set()
+
+    for hero_info in heroes_data.values():
+        for column, (_, key, _) in HERO_STATS.items():
+            if hero_info.get(key) is not None:
+                hero_stat_facts.add((get_json_local_name(hero_info['name']), column, hero_info[key]))
+
+    with profiler.stage("items", items=len(items_data)):
+        for item_key, item_info in items_data.items():
+            name = get_json_local_name(item_key)
+            item_facts.add(name)
+            item_facts.update(get_json_local_name(c) for c in item_info.get('components') or [] if c)
+            if item_info.get('dname') is not None: item_stat_facts.add((name, "display_name", item_info['dname']))
+            if item_info.get('cost'): item_stat_facts.add((name, "cost", item_info['cost']))
+            if item_info.get('tier'): item_stat_facts.add((name, "tier", item_info['tier']))
+            if item_info.get('cd') and isinstance(item_info['cd'], (int, float)):
+                item_stat_facts.add((name, "cooldown", item_info['cd']))
+
+    return {"hero_stat": hero_stat_facts, "item": item_facts, "item_stat": item_stat_facts}
+
+
+def convert_json(profiler=NULL_PROFILER, sqlite_file=None, output_file=OUTPUT_FILE):
+    """
+    Membangun ABox Prolog di output_file langsung dari file JSON, tanpa
+    melewati file OWL.
+    Aturan pembentukan individu mengikuti json_to_ontology.py, sehingga
+    hasilnya sama persis dengan hasil konversi ontologi.
+    Jika sqlite_file diberikan, items.json ikut dibaca untuk database SQLite.
+    Mengembalikan True jika berhasil, False jika gagal (seperti convert_ontology).
+    """
+    try:
+        with profiler.stage("load") as counters:
+            with open(HEROES_FILE, "r", encoding="utf-8") as f: heroes_data = json.load(f)
+            with open(HERO_ABILITIES_FILE, "r", encoding="utf-8") as f: hero_abilities_data = json.load(f)
+            with open(ABILITIES_FILE, "r", encoding="utf-8") as f: abilities_data = json.load(f)
+            items_data = None
+            if sqlite_file is not None:
+                with open(ITEMS_FILE, "r", encoding="utf-8") as f: items_data = json.load(f)
+            counters["abilities"] = len(abilities_data)
+        print(f"Berhasil memuat data JSON dari {JSON_DIR}")
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"GAGAL memuat file JSON: {e}", file=sys.stderr)
+        return False
+
+    facts = collect_json_facts(heroes_data, hero_abilities_data, abilities_data, profiler)
+    hero_facts = facts["hero"]
+    attack_type_facts = facts["attack_type"]
+    attribute_facts = facts["primary_attribute"]
+    role_facts = facts["has_role"]
+    hero_ability_facts = facts["has_ability"]
+    ability_type_facts = facts["ability_type"]
+    damage_type_facts = facts["damage_type"]
+
     print("\nHASIL DIAGNOSTIK")
-    print(f"Ditemukan   {len(hero_facts)} hero (dari 'hasPrimaryAttribute').")
+    print(f"Ditemukan   {len(hero_facts)} hero (dari 'primary_attr').")
+    print(f"Ditemukan   {len(attack_type_facts)} fakta 'attack_type'.")
     print(f"Ditemukan   {len(attribute_facts)} fakta 'primary_attribute'.")
     print(f"Ditemukan   {len(role_facts)} fakta 'has_role'.")
     print(f"Ditemukan   {len(hero_ability_facts)} fakta 'has_ability'.")
-    print(f"Ditemukan   {len(ability_type_facts)} fakta 'ability_type' (dari 'hasBehavior').")
-    print(f"Ditemukan   {len(damage_type_facts)} fakta 'damage_type' (dari 'hasDamageType').")
+    print(f"Ditemukan   {len(ability_type_facts)} fakta 'ability_type' (dari 'behavior').")
+    print(f"Ditemukan   {len(damage_type_facts)} fakta 'damage_type' (dari 'dmg_type').")
 
     try:
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            f.write("% === Fakta Hero ===\n")
-            f.writelines(sorted(hero_facts))
-            f.write("\n")
-
-            f.write("% Properti: Atribut Utama (hasPrimaryAttribute)\n")
-            f.writelines(sorted(attribute_facts))
-            f.write("\n")
-            
-            f.write("% Properti: Role (hasRole)\n")
-            f.writelines(sorted(role_facts))
-            f.write("\n")
-
-            f.write("% Properti: Kepemilikan Ability (hasAbility)\n")
-            f.writelines(sorted(hero_ability_facts))
-            f.write("\n")
-
-            f.write("% === Fakta Ability ===\n\n")
-            f.write("% Properti: Tipe Ability (abilityType)\n")
-            f.writelines(sorted(ability_type_facts))
-            f.write("\n")
-
-            f.write("% Properti: Tipe Damage (damageType)\n")
-            f.writelines(sorted(damage_type_facts))
-            f.write("\n")
+        with profiler.stage("write") as counters:
+            write_abox(output_file, hero_facts, attack_type_facts, attribute_facts, role_facts,
+                       hero_ability_facts, ability_type_facts, damage_type_facts)
+            counters["facts"] = sum(map(len, (hero_facts, attack_type_facts, attribute_facts, role_facts,
+                                               hero_ability_facts, ability_type_facts, damage_type_facts)))
+            counters["bytes"] = os.path.getsize(output_file)
 
         print(f"Konversi selesai! Berhasil.\n")
-        print(f"ABox Prolog telah disimpan ke: {OUTPUT_FILE}")
+        print(f"ABox Prolog telah disimpan ke: {output_file}")
+
+        if sqlite_file is not None:
+            with profiler.stage("sqlite") as counters:
+                counters.update(write_sqlite(sqlite_file, facts, collect_json_stats(heroes_data, items_data, profiler)))
+            print(f"Database SQLite telah disimpan ke: {sqlite_file} "
+                  f"({counters['entity']} entitas, {counters['hero_stats']} hero, {counters['item_stats']} item)")
 
     except Exception as e:
         print(f"Gagal menulis ke file output: {e}", file=sys.stderr)
+        return False
+    return True
 
 # --- Jalankan Konverter ---
 if __name__ == "__main__":
-    convert_ontology()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Konversi data Dota 2 menjadi ABox Prolog.")
+    parser.add_argument("--from-json", action="store_true",
+                        help="bangun ABox langsung dari file JSON, tanpa mem-parsing file OWL")
+    parser.add_argument("--check", action="store_true",
+                        help="jangan timpa ABox; bandingkan hasil konversi dengan file yang sudah ada")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="selalu parse ulang file OWL, tanpa membaca atau menulis cache")
+    parser.add_argument("--from-quadstore", action="store_true",
+                        help=f"baca triple langsung dari quadstore SQLite '{QUADSTORE_FILE}', tanpa file OWL")
+    parser.add_argument("--from-shards", action="store_true",
+                        help=f"baca hanya shard hero dan ability (ditambah item untuk --sqlite) dari '{SHARD_DIR}', bukan seluruh file OWL")
+    parser.add_argument("--sqlite", nargs="?", const=SQLITE_FILE, metavar="PATH",
+                        help=f"tulis juga database SQLite berisi entitas, relasi, dan statistik hero/item (default '{SQLITE_FILE}')")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="hapus semua snapshot ontologi di cache sebelum konversi")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_FILE, metavar="PATH",
+                        help=f"catat waktu wall, waktu CPU, memori puncak (tracemalloc), dan counter per tahap ke JSON (default '{PROFILE_FILE}')")
+    parser.add_argument("--profile-cprofile", nargs="?", const=CPROFILE_FILE, metavar="PATH",
+                        help=f"jalankan juga cProfile per tahap dan simpan profil tahap terberat (default '{CPROFILE_FILE}'); otomatis --profile")
+    parser.add_argument("--profile-no-tracemalloc", action="store_true",
+                        help="profiling tanpa tracemalloc, yang memperlambat konversi")
+    args = parser.parse_args()
+
+    if args.profile_cprofile and not args.profile: args.profile = PROFILE_FILE
+    profiler = (StageProfiler(trace_memory=not args.profile_no_tracemalloc, cprofile=bool(args.profile_cprofile))
+                if args.profile else NULL_PROFILER)
+
+    if args.clear_cache:
+        print(f"Cache dibersihkan: {clear_cache()} snapshot dihapus.")
+
+    # --check menulis ke file sementara lalu membandingkannya; database tidak ditulis
+    output_file = OUTPUT_FILE + ".check" if args.check else OUTPUT_FILE
+    if args.check: args.sqlite = None
+
+    if args.from_json:
+        ok = convert_json(profiler, sqlite_file=args.sqlite, output_file=output_file)
+    else:
+        ok = convert_ontology(use_cache=not args.no_cache, from_quadstore=args.from_quadstore, profiler=profiler,
+                              sqlite_file=args.sqlite, from_shards=args.from_shards, output_file=output_file)
+
+    if profiler.enabled:
+        source = ("json" if args.from_json else "quadstore" if args.from_quadstore
+                  else "shards" if args.from_shards else "owl")
+        report = profiler.write(args.profile, "aboxconvertprolog.py", cprofile_path=args.profile_cprofile, source=source)
+        print(f"Profil per tahap disimpan ke '{args.profile}' (tahap terberat: {report['hottest_stage']}).")
+        if args.profile_cprofile: print(f"cProfile tahap '{report['hottest_stage']}' disimpan ke '{args.profile_cprofile}'.")
+
+    if not ok:
+        if args.check and os.path.exists(output_file): os.remove(output_file)
+        print("Konversi gagal" + (f"; tidak ada yang dibandingkan dengan {OUTPUT_FILE}" if args.check else "."),
+              file=sys.stderr)
+        sys.exit(1)
+
+    if args.check:
+        with open(output_file, "rb") as f: generated = f.read()
+        with open(OUTPUT_FILE, "rb") as f: existing = f.read()
+        os.remove(output_file)
+        if generated != existing:
+            print(f"BERBEDA: hasil konversi tidak sama dengan {OUTPUT_FILE}", file=sys.stderr)
+            sys.exit(1)
+        print(f"SAMA: hasil konversi identik dengan {OUTPUT_FILE}")
\ No newline at end of file
@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+# Script di folder ini membuka file .pl dan JSON dengan path relatif terhadap folder ini
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def script_dir():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(SCRIPT_DIR)
+        yield SCRIPT_DIR
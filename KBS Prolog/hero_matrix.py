@@ -0,0 +1,268 @@
+import argparse
+import ast
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from kbs_engine import Engine, Program
+
+# File ABox yang dipakai sebagai sumber default
+ABOX_FILE = "abox_dota2.pl"
+
+# File TBox + aturan KBS, hanya dipakai oleh --check sebagai pembanding
+MAIN_FILE = "tubes1_main.pl"
+
+# Perbandingan "kolom op bilangan" dalam query; dibungkus kurung sebelum di-parse
+COMPARISON = re.compile(r"\b([A-Za-z_]\w*)\s*(>=|<=|==|!=|>|<)\s*(-?\d+)\b")
+
+
+class Mask:
+    """
+    Himpunan hero dalam bentuk bitset (np.packbits), satu bit per baris matriks.
+    Operator &, | dan ~ bekerja langsung pada byte yang sudah dipadatkan.
+    """
+    __slots__ = ("matrix", "bits")
+
+    def __init__(self, matrix, bits):
+        self.matrix = matrix
+        self.bits = bits
+
+    def __and__(self, other):
+        return Mask(self.matrix, self.bits & other.bits)
+
+    def __or__(self, other):
+        return Mask(self.matrix, self.bits | other.bits)
+
+    def __invert__(self):
+        # Bit padding di byte terakhir harus tetap 0 setelah negasi
+        return Mask(self.matrix, ~self.bits & self.matrix.valid)
+
+    def to_bool(self):
+        return np.unpackbits(self.bits, count=len(self.matrix)).astype(bool)
+
+    def count(self):
+        return int(np.unpackbits(self.bits).sum())
+
+    def heroes(self):
+        return [self.matrix.heroes[i] for i in np.flatnonzero(self.to_bool())]
+
+
+class HeroMatrix:
+    """
+    Matriks hero x fitur berbasis kolom.
+    Fitur boolean disimpan sebagai bitset per kolom (`bits[kolom]`), fitur
+    numerik sebagai array int per kolom (`counts[kolom]`). Nama kolom boolean
+    mengikuti predikat TBox (is_carry, is_agility_hero, is_melee_hero,
+    has_aoe_ability, ...), sehingga query bisa ditulis dengan nama yang sama
+    seperti di Prolog.
+    """
+    def __init__(self, heroes, flags, counts):
+        self.heroes = list(heroes)
+        n = len(self.heroes)
+        self.bits = {name: np.packbits(np.asarray(col, dtype=bool)) for name, col in flags.items()}
+        self.counts = {name: np.asarray(col, dtype=np.int32) for name, col in counts.items()}
+        self.valid = np.packbits(np.ones(n, dtype=bool))
+
+    def __len__(self):
+        return len(self.heroes)
+
+    @property
+    def columns(self):
+        return list(self.bits) + list(self.counts)
+
+    def col(self, name):
+        if name not in self.bits:
+            raise KeyError(f"kolom boolean tidak dikenal: {name}")
+        return Mask(self, self.bits[name])
+
+    def compare(self, name, op, value):
+        if name not in self.counts:
+            raise KeyError(f"kolom numerik tidak dikenal: {name}")
+        col = self.counts[name]
+        result = {">=": col >= value, "<=": col <= value, ">": col > value,
+                  "<": col < value, "==": col == value, "!=": col != value}[op]
+        return Mask(self, np.packbits(result))
+
+    def all(self):
+        return Mask(self, self.valid)
+
+    def where(self, expression):
+        """
+        Mengevaluasi query seperti "is_carry & is_agility_hero & ~is_durable"
+        atau "is_intelligence_hero & active_ability_count >= 3".
+        Hanya nama kolom, &, |, ~ (atau `not`), perbandingan kolom numerik
+        dengan bilangan bulat, dan tanda kurung yang diizinkan.
+        Di Python & dan | mengikat lebih kuat daripada perbandingan
+        (`a >= 3 & b` berarti `a >= (3 & b)`), jadi setiap perbandingan
+        dibungkus kurung dulu agar berlaku seperti operand biasa.
+        """
+        return self._eval(ast.parse(COMPARISON.sub(r"(\1 \2 \3)", expression), mode="eval").body)
+
+    def _eval(self, node):
+        if isinstance(node, ast.Name):
+            return self.col(node.id)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Invert, ast.Not)):
+            return ~self._eval(node.operand)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+            return self._eval(node.left) & self._eval(node.right)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            return self._eval(node.left) | self._eval(node.right)
+        if isinstance(node, ast.BoolOp):
+            masks = [self._eval(v) for v in node.values]
+            result = masks[0]
+            for mask in masks[1:]:
+                result = result & mask if isinstance(node.op, ast.And) else result | mask
+            return result
+        if (isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.left, ast.Name)
+                and isinstance(node.comparators[0], ast.Constant) and isinstance(node.comparators[0].value, int)):
+            op = {ast.GtE: ">=", ast.LtE: "<=", ast.Gt: ">", ast.Lt: "<", ast.Eq: "==", ast.NotEq: "!="}[type(node.ops[0])]
+            return self.compare(node.left.id, op, node.comparators[0].value)
+        raise ValueError(f"ekspresi query tidak didukung: {ast.unparse(node)}")
+
+    @classmethod
+    def from_program(cls, program):
+        """Membangun matriks dari fakta ABox yang sudah dimuat (kbs_engine.Program)."""
+        facts = program.facts
+        heroes = sorted(h for (h,) in facts["hero"])
+        row = {hero: i for i, hero in enumerate(heroes)}
+        n = len(heroes)
+        flags = defaultdict(lambda: np.zeros(n, dtype=bool))
+
+        for hero, attribute in facts["primary_attribute"]:
+            if hero in row: flags[f"is_{attribute}_hero"][row[hero]] = True
+        for hero, attack in facts["attack_type"]:
+            if hero in row: flags[f"is_{attack}_hero"][row[hero]] = True
+        for hero, role in facts["has_role"]:
+            if hero in row: flags[f"is_{role}"][row[hero]] = True
+
+        types = defaultdict(list)
+        for ability, ability_type in facts["ability_type"]:
+            types[ability].append(ability_type)
+        damages = defaultdict(set)
+        for ability, damage in facts["damage_type"]:
+            damages[ability].add(damage)
+
+        # Jumlah ability aktif dihitung seperti findall di is_spell_caster:
+        # satu per pasangan (ability, tipe) dengan tipe selain passive.
+        active = np.zeros(n, dtype=np.int32)
+        # Kolom flag ability selalu ada, walaupun tidak ada hero yang memenuhinya
+        for name in ("has_passive_ability", "has_aoe_ability", "has_pure_damage_ability", "has_channeled_ability"):
+            flags[name]
+        for hero, ability in facts["has_ability"]:
+            if hero not in row: continue
+            i = row[hero]
+            ability_types = types.get(ability, ())
+            non_passive = sum(1 for t in ability_types if t != "passive")
+            active[i] += non_passive
+            if "passive" in ability_types: flags["has_passive_ability"][i] = True
+            if "aoe" in ability_types: flags["has_aoe_ability"][i] = True
+            if "channeled" in ability_types: flags["has_channeled_ability"][i] = True
+            if "pure" in damages.get(ability, ()) and non_passive: flags["has_pure_damage_ability"][i] = True
+
+        return cls(heroes, dict(sorted(flags.items())), {"active_ability_count": active})
+
+    @classmethod
+    def from_abox(cls, path=ABOX_FILE):
+        return cls.from_program(Program().load(path))
+
+    @classmethod
+    def from_json(cls):
+        """Membangun matriks langsung dari file JSON, dengan aturan yang sama seperti aboxconvertprolog.py."""
+        from aboxconvertprolog import ABILITIES_FILE, HERO_ABILITIES_FILE, HEROES_FILE, collect_json_facts
+        with open(HEROES_FILE, "r", encoding="utf-8") as f: heroes_data = json.load(f)
+        with open(HERO_ABILITIES_FILE, "r", encoding="utf-8") as f: hero_abilities_data = json.load(f)
+        with open(ABILITIES_FILE, "r", encoding="utf-8") as f: abilities_data = json.load(f)
+        facts = collect_json_facts(heroes_data, hero_abilities_data, abilities_data)
+        text = "".join(line for key, lines in facts.items() if key != "ability" for line in lines)
+        return cls.from_program(Program().load_text(text))
+
+    def tile(self, copies):
+        """Menggandakan semua baris `copies` kali, untuk mengukur skala hero set yang besar."""
+        heroes = [f"{hero}_{k}" for k in range(copies) for hero in self.heroes]
+        n = len(self)
+        flags = {name: np.tile(np.unpackbits(bits, count=n).astype(bool), copies) for name, bits in self.bits.items()}
+        counts = {name: np.tile(col, copies) for name, col in self.counts.items()}
+        return HeroMatrix(heroes, flags, counts)
+
+
+def check(matrix, main_file=MAIN_FILE):
+    """Membandingkan setiap kolom boolean dengan predikat TBox yang bernama sama di kbs_engine."""
+    engine = Engine(Program().load(main_file)).run()
+    ok = True
+    compared = 0
+    queries = [(name, name) for name in matrix.bits]
+    # Aturan KBS yang bisa ditulis ulang sebagai query matriks
+    queries += [
+        ("is_hard_carry", "is_carry & is_agility_hero"),
+        ("is_glass_cannon", "(is_nuker | is_carry) & ~is_durable"),
+        ("is_ganker", "is_disabler & is_nuker & ~is_carry"),
+        ("is_spell_caster", "is_intelligence_hero & active_ability_count >= 3"),
+        ("is_spell_caster", "active_ability_count >= 3 & is_intelligence_hero"),
+        ("is_position_1", "is_carry & ~is_support & (is_agility_hero | is_strength_hero)"),
+        ("is_position_5", "is_support & ~is_carry & ~is_initiator"),
+    ]
+    for predicate, query in queries:
+        if predicate not in engine.program.rules: continue
+        expected = {h for h in matrix.heroes if engine.holds(predicate, h)}
+        got = set(matrix.where(query).heroes())
+        compared += 1
+        if expected != got:
+            ok = False
+            print(f"BERBEDA: {predicate} ({query}): {sorted(expected ^ got)}", file=sys.stderr)
+    # Perbandingan di posisi mana pun dalam rantai &/| harus sama dengan versi berkurung
+    for query, bracketed in [
+        ("active_ability_count >= 3 & is_nuker", "(active_ability_count >= 3) & is_nuker"),
+        ("is_intelligence_hero & active_ability_count >= 3 & is_nuker",
+         "is_intelligence_hero & (active_ability_count >= 3) & is_nuker"),
+        ("is_support | active_ability_count < 2 & ~is_carry", "is_support | ((active_ability_count < 2) & ~is_carry)"),
+    ]:
+        compared += 1
+        if matrix.where(query).heroes() != matrix.where(bracketed).heroes():
+            ok = False
+            print(f"BERBEDA: '{query}' != '{bracketed}'", file=sys.stderr)
+    if ok: print(f"SAMA: {compared} kolom/query cocok dengan aturan Prolog di kbs_engine.")
+    return ok
+
+def benchmark(matrix, query, copies, repeat=1000):
+    for m in (matrix, matrix.tile(copies)):
+        start = time.perf_counter()
+        for _ in range(repeat): m.where(query).bits
+        elapsed = (time.perf_counter() - start) / repeat
+        print(f"  {len(m):>8} hero: {elapsed * 1e6:8.1f} us per query")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query hero Dota 2 secara vektor dengan matriks hero x fitur.")
+    parser.add_argument("query", nargs="?",
+                        help='contoh: "is_carry & is_agility_hero & ~is_durable"')
+    parser.add_argument("--from-json", action="store_true",
+                        help="bangun matriks langsung dari file JSON, bukan dari ABox")
+    parser.add_argument("--check", action="store_true",
+                        help="bandingkan kolom dan beberapa aturan KBS dengan hasil kbs_engine")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="ukur waktu query pada matriks asli dan matriks yang digandakan N kali")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    matrix = HeroMatrix.from_json() if args.from_json else HeroMatrix.from_abox()
+    print(f"Matriks dibangun: {len(matrix)} hero x {len(matrix.columns)} kolom "
+          f"({time.perf_counter() - start:.3f} s)")
+
+    if args.query:
+        result = matrix.where(args.query)
+        print(f"{result.count()} hero cocok dengan '{args.query}':")
+        for hero in result.heroes(): print(f"  {hero}")
+    else:
+        print("Kolom:", ", ".join(matrix.columns))
+
+    if args.bench:
+        query = args.query or "is_carry & is_agility_hero & ~is_durable"
+        print(f"\nBenchmark '{query}':")
+        benchmark(matrix, query, args.bench)
+
+    if args.check and not check(matrix):
+        sys.exit(1)
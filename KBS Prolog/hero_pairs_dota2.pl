@@ -0,0 +1,1267 @@
+% === Fakta Pasangan Hero ===
+% Dihasilkan oleh Ontologi/hero_pairs.py (top 5 per hero)
+
+% counters(Hero, Lawan): Hero efektif melawan Lawan
+counters(antimage, spectre).
+counters(antimage, morphling).
+counters(antimage, slardar).
+counters(antimage, life_stealer).
+counters(antimage, lycan).
+counters(axe, morphling).
+counters(axe, slardar).
+counters(axe, faceless_void).
+counters(axe, life_stealer).
+counters(axe, treant).
+counters(bane, slardar).
+counters(bane, faceless_void).
+counters(bane, life_stealer).
+counters(bane, spectre).
+counters(bane, pangolier).
+counters(bloodseeker, spectre).
+counters(bloodseeker, morphling).
+counters(bloodseeker, slardar).
+counters(bloodseeker, life_stealer).
+counters(bloodseeker, lycan).
+counters(crystal_maiden, chaos_knight).
+counters(crystal_maiden, spectre).
+counters(crystal_maiden, axe).
+counters(crystal_maiden, kunkka).
+counters(crystal_maiden, tidehunter).
+counters(drow_ranger, broodmother).
+counters(drow_ranger, void_spirit).
+counters(drow_ranger, slardar).
+counters(drow_ranger, faceless_void).
+counters(drow_ranger, spirit_breaker).
+counters(earthshaker, morphling).
+counters(earthshaker, slardar).
+counters(earthshaker, faceless_void).
+counters(earthshaker, life_stealer).
+counters(earthshaker, treant).
+counters(juggernaut, chaos_knight).
+counters(juggernaut, spectre).
+counters(juggernaut, phantom_lancer).
+counters(juggernaut, mirana).
+counters(juggernaut, skywrath_mage).
+counters(mirana, slardar).
+counters(mirana, faceless_void).
+counters(mirana, life_stealer).
+counters(mirana, spectre).
+counters(mirana, pangolier).
+counters(morphling, axe).
+counters(morphling, tiny).
+counters(morphling, kunkka).
+counters(morphling, slardar).
+counters(morphling, tidehunter).
+counters(nevermore, slardar).
+counters(nevermore, faceless_void).
+counters(nevermore, life_stealer).
+counters(nevermore, spectre).
+counters(nevermore, pangolier).
+counters(phantom_lancer, chaos_knight).
+counters(phantom_lancer, spectre).
+counters(phantom_lancer, enchantress).
+counters(phantom_lancer, medusa).
+counters(phantom_lancer, razor).
+counters(puck, spectre).
+counters(puck, slardar).
+counters(puck, faceless_void).
+counters(puck, life_stealer).
+counters(puck, lycan).
+counters(pudge, axe).
+counters(pudge, bane).
+counters(pudge, morphling).
+counters(pudge, razor).
+counters(pudge, tidehunter).
+counters(razor, axe).
+counters(razor, tiny).
+counters(razor, kunkka).
+counters(razor, slardar).
+counters(razor, tidehunter).
+counters(sand_king, spectre).
+counters(sand_king, morphling).
+counters(sand_king, slardar).
+counters(sand_king, life_stealer).
+counters(sand_king, treant).
+counters(storm_spirit, axe).
+counters(storm_spirit, tiny).
+counters(storm_spirit, kunkka).
+counters(storm_spirit, slardar).
+counters(storm_spirit, tidehunter).
+counters(sven, spectre).
+counters(sven, morphling).
+counters(sven, slardar).
+counters(sven, life_stealer).
+counters(sven, treant).
+counters(tiny, spectre).
+counters(tiny, chaos_knight).
+counters(tiny, phantom_lancer).
+counters(tiny, terrorblade).
+counters(tiny, hoodwink).
+counters(vengefulspirit, slardar).
+counters(vengefulspirit, faceless_void).
+counters(vengefulspirit, life_stealer).
+counters(vengefulspirit, spectre).
+counters(vengefulspirit, pangolier).
+counters(windrunner, slardar).
+counters(windrunner, faceless_void).
+counters(windrunner, life_stealer).
+counters(windrunner, spectre).
+counters(windrunner, pangolier).
+counters(zuus, spectre).
+counters(zuus, slardar).
+counters(zuus, faceless_void).
+counters(zuus, life_stealer).
+counters(zuus, lycan).
+counters(kunkka, spectre).
+counters(kunkka, morphling).
+counters(kunkka, slardar).
+counters(kunkka, life_stealer).
+counters(kunkka, treant).
+counters(lina, spectre).
+counters(lina, slardar).
+counters(lina, faceless_void).
+counters(lina, life_stealer).
+counters(lina, lycan).
+counters(lion, spectre).
+counters(lion, slardar).
+counters(lion, faceless_void).
+counters(lion, life_stealer).
+counters(lion, lycan).
+counters(shadow_shaman, chaos_knight).
+counters(shadow_shaman, spectre).
+counters(shadow_shaman, axe).
+counters(shadow_shaman, kunkka).
+counters(shadow_shaman, tidehunter).
+counters(slardar, mirana).
+counters(slardar, broodmother).
+counters(slardar, invoker).
+counters(slardar, phoenix).
+counters(slardar, void_spirit).
+counters(tidehunter, morphling).
+counters(tidehunter, slardar).
+counters(tidehunter, faceless_void).
+counters(tidehunter, life_stealer).
+counters(tidehunter, treant).
+counters(witch_doctor, spectre).
+counters(witch_doctor, slardar).
+counters(witch_doctor, faceless_void).
+counters(witch_doctor, life_stealer).
+counters(witch_doctor, lycan).
+counters(lich, chaos_knight).
+counters(lich, spectre).
+counters(lich, axe).
+counters(lich, kunkka).
+counters(lich, tidehunter).
+counters(riki, chaos_knight).
+counters(riki, spectre).
+counters(riki, enchantress).
+counters(riki, medusa).
+counters(riki, razor).
+counters(enigma, spectre).
+counters(enigma, chaos_knight).
+counters(enigma, slardar).
+counters(enigma, faceless_void).
+counters(enigma, spirit_breaker).
+counters(tinker, spectre).
+counters(tinker, slardar).
+counters(tinker, faceless_void).
+counters(tinker, life_stealer).
+counters(tinker, lycan).
+counters(sniper, spectre).
+counters(sniper, slardar).
+counters(sniper, faceless_void).
+counters(sniper, life_stealer).
+counters(sniper, lycan).
+counters(necrolyte, slardar).
+counters(necrolyte, faceless_void).
+counters(necrolyte, life_stealer).
+counters(necrolyte, spectre).
+counters(necrolyte, pangolier).
+counters(warlock, spectre).
+counters(warlock, chaos_knight).
+counters(warlock, slardar).
+counters(warlock, faceless_void).
+counters(warlock, spirit_breaker).
+counters(beastmaster, morphling).
+counters(beastmaster, slardar).
+counters(beastmaster, faceless_void).
+counters(beastmaster, life_stealer).
+counters(beastmaster, treant).
+counters(queenofpain, axe).
+counters(queenofpain, tiny).
+counters(queenofpain, kunkka).
+counters(queenofpain, slardar).
+counters(queenofpain, tidehunter).
+counters(venomancer, chaos_knight).
+counters(venomancer, spectre).
+counters(venomancer, axe).
+counters(venomancer, kunkka).
+counters(venomancer, tidehunter).
+counters(faceless_void, axe).
+counters(faceless_void, bane).
+counters(faceless_void, morphling).
+counters(faceless_void, pudge).
+counters(faceless_void, razor).
+counters(skeleton_king, morphling).
+counters(skeleton_king, slardar).
+counters(skeleton_king, faceless_void).
+counters(skeleton_king, life_stealer).
+counters(skeleton_king, treant).
+counters(death_prophet, chaos_knight).
+counters(death_prophet, spectre).
+counters(death_prophet, axe).
+counters(death_prophet, kunkka).
+counters(death_prophet, tidehunter).
+counters(phantom_assassin, mirana).
+counters(phantom_assassin, skywrath_mage).
+counters(phantom_assassin, lich).
+counters(phantom_assassin, broodmother).
+counters(phantom_assassin, ancient_apparition).
+counters(pugna, chaos_knight).
+counters(pugna, spectre).
+counters(pugna, axe).
+counters(pugna, kunkka).
+counters(pugna, tidehunter).
+counters(templar_assassin, broodmother).
+counters(templar_assassin, void_spirit).
+counters(templar_assassin, axe).
+counters(templar_assassin, tiny).
+counters(templar_assassin, tidehunter).
+counters(viper, chaos_knight).
+counters(viper, spectre).
+counters(viper, axe).
+counters(viper, kunkka).
+counters(viper, tidehunter).
+counters(luna, slardar).
+counters(luna, faceless_void).
+counters(luna, life_stealer).
+counters(luna, spectre).
+counters(luna, pangolier).
+counters(dragon_knight, spectre).
+counters(dragon_knight, morphling).
+counters(dragon_knight, slardar).
+counters(dragon_knight, life_stealer).
+counters(dragon_knight, lycan).
+counters(dazzle, broodmother).
+counters(dazzle, void_spirit).
+counters(dazzle, juggernaut).
+counters(dazzle, riki).
+counters(dazzle, marci).
+counters(rattletrap, spectre).
+counters(rattletrap, morphling).
+counters(rattletrap, slardar).
+counters(rattletrap, life_stealer).
+counters(rattletrap, treant).
+counters(leshrac, spectre).
+counters(leshrac, slardar).
+counters(leshrac, faceless_void).
+counters(leshrac, life_stealer).
+counters(leshrac, lycan).
+counters(furion, chaos_knight).
+counters(furion, spectre).
+counters(furion, axe).
+counters(furion, kunkka).
+counters(furion, tidehunter).
+counters(life_stealer, axe).
+counters(life_stealer, bane).
+counters(life_stealer, morphling).
+counters(life_stealer, pudge).
+counters(life_stealer, razor).
+counters(dark_seer, spectre).
+counters(dark_seer, morphling).
+counters(dark_seer, slardar).
+counters(dark_seer, life_stealer).
+counters(dark_seer, lycan).
+counters(clinkz, phantom_lancer).
+counters(clinkz, broodmother).
+counters(clinkz, void_spirit).
+counters(clinkz, riki).
+counters(clinkz, marci).
+counters(omniknight, chaos_knight).
+counters(omniknight, spectre).
+counters(omniknight, enchantress).
+counters(omniknight, medusa).
+counters(omniknight, razor).
+counters(enchantress, spectre).
+counters(enchantress, slardar).
+counters(enchantress, faceless_void).
+counters(enchantress, life_stealer).
+counters(enchantress, lycan).
+counters(huskar, axe).
+counters(huskar, tiny).
+counters(huskar, kunkka).
+counters(huskar, slardar).
+counters(huskar, tidehunter).
+counters(night_stalker, morphling).
+counters(night_stalker, slardar).
+counters(night_stalker, faceless_void).
+counters(night_stalker, life_stealer).
+counters(night_stalker, treant).
+counters(broodmother, chaos_knight).
+counters(broodmother, spectre).
+counters(broodmother, enchantress).
+counters(broodmother, medusa).
+counters(broodmother, razor).
+counters(bounty_hunter, morphling).
+counters(bounty_hunter, slardar).
+counters(bounty_hunter, faceless_void).
+counters(bounty_hunter, life_stealer).
+counters(bounty_hunter, treant).
+counters(weaver, broodmother).
+counters(weaver, void_spirit).
+counters(weaver, axe).
+counters(weaver, tiny).
+counters(weaver, tidehunter).
+counters(jakiro, slardar).
+counters(jakiro, faceless_void).
+counters(jakiro, life_stealer).
+counters(jakiro, spectre).
+counters(jakiro, pangolier).
+counters(batrider, chaos_knight).
+counters(batrider, spectre).
+counters(batrider, axe).
+counters(batrider, kunkka).
+counters(batrider, tidehunter).
+counters(chen, antimage).
+counters(chen, axe).
+counters(chen, bloodseeker).
+counters(chen, juggernaut).
+counters(chen, phantom_lancer).
+counters(spectre, axe).
+counters(spectre, bane).
+counters(spectre, morphling).
+counters(spectre, pudge).
+counters(spectre, razor).
+counters(ancient_apparition, spectre).
+counters(ancient_apparition, slardar).
+counters(ancient_apparition, faceless_void).
+counters(ancient_apparition, life_stealer).
+counters(ancient_apparition, lycan).
+counters(doom_bringer, morphling).
+counters(doom_bringer, slardar).
+counters(doom_bringer, faceless_void).
+counters(doom_bringer, life_stealer).
+counters(doom_bringer, treant).
+counters(ursa, axe).
+counters(ursa, bane).
+counters(ursa, morphling).
+counters(ursa, pudge).
+counters(ursa, razor).
+counters(spirit_breaker, morphling).
+counters(spirit_breaker, slardar).
+counters(spirit_breaker, faceless_void).
+counters(spirit_breaker, life_stealer).
+counters(spirit_breaker, treant).
+counters(gyrocopter, spectre).
+counters(gyrocopter, slardar).
+counters(gyrocopter, faceless_void).
+counters(gyrocopter, life_stealer).
+counters(gyrocopter, lycan).
+counters(alchemist, phantom_lancer).
+counters(alchemist, mirana).
+counters(alchemist, hoodwink).
+counters(alchemist, broodmother).
+counters(alchemist, void_spirit).
+counters(invoker, spectre).
+counters(invoker, chaos_knight).
+counters(invoker, slardar).
+counters(invoker, faceless_void).
+counters(invoker, spirit_breaker).
+counters(silencer, spectre).
+counters(silencer, slardar).
+counters(silencer, faceless_void).
+counters(silencer, life_stealer).
+counters(silencer, pangolier).
+counters(obsidian_destroyer, chaos_knight).
+counters(obsidian_destroyer, spectre).
+counters(obsidian_destroyer, axe).
+counters(obsidian_destroyer, kunkka).
+counters(obsidian_destroyer, tidehunter).
+counters(lycan, antimage).
+counters(lycan, juggernaut).
+counters(lycan, morphling).
+counters(lycan, puck).
+counters(lycan, sand_king).
+counters(brewmaster, chaos_knight).
+counters(brewmaster, spectre).
+counters(brewmaster, enchantress).
+counters(brewmaster, medusa).
+counters(brewmaster, razor).
+counters(shadow_demon, chaos_knight).
+counters(shadow_demon, spectre).
+counters(shadow_demon, axe).
+counters(shadow_demon, kunkka).
+counters(shadow_demon, tidehunter).
+counters(lone_druid, antimage).
+counters(lone_druid, axe).
+counters(lone_druid, bloodseeker).
+counters(lone_druid, juggernaut).
+counters(lone_druid, phantom_lancer).
+counters(chaos_knight, morphling).
+counters(chaos_knight, slardar).
+counters(chaos_knight, faceless_void).
+counters(chaos_knight, life_stealer).
+counters(chaos_knight, treant).
+counters(meepo, spectre).
+counters(meepo, morphling).
+counters(meepo, slardar).
+counters(meepo, life_stealer).
+counters(meepo, lycan).
+counters(treant, chaos_knight).
+counters(treant, spectre).
+counters(treant, enchantress).
+counters(treant, medusa).
+counters(treant, razor).
+counters(ogre_magi, spectre).
+counters(ogre_magi, morphling).
+counters(ogre_magi, slardar).
+counters(ogre_magi, life_stealer).
+counters(ogre_magi, treant).
+counters(undying, chaos_knight).
+counters(undying, spectre).
+counters(undying, enchantress).
+counters(undying, medusa).
+counters(undying, razor).
+counters(rubick, spectre).
+counters(rubick, chaos_knight).
+counters(rubick, slardar).
+counters(rubick, faceless_void).
+counters(rubick, spirit_breaker).
+counters(disruptor, spectre).
+counters(disruptor, chaos_knight).
+counters(disruptor, slardar).
+counters(disruptor, faceless_void).
+counters(disruptor, spirit_breaker).
+counters(nyx_assassin, spectre).
+counters(nyx_assassin, morphling).
+counters(nyx_assassin, slardar).
+counters(nyx_assassin, life_stealer).
+counters(nyx_assassin, treant).
+counters(naga_siren, antimage).
+counters(naga_siren, juggernaut).
+counters(naga_siren, morphling).
+counters(naga_siren, puck).
+counters(naga_siren, sand_king).
+counters(keeper_of_the_light, chaos_knight).
+counters(keeper_of_the_light, spectre).
+counters(keeper_of_the_light, axe).
+counters(keeper_of_the_light, kunkka).
+counters(keeper_of_the_light, tidehunter).
+counters(wisp, axe).
+counters(wisp, tiny).
+counters(wisp, kunkka).
+counters(wisp, slardar).
+counters(wisp, tidehunter).
+counters(visage, spectre).
+counters(visage, slardar).
+counters(visage, faceless_void).
+counters(visage, life_stealer).
+counters(visage, pangolier).
+counters(slark, spectre).
+counters(slark, morphling).
+counters(slark, slardar).
+counters(slark, life_stealer).
+counters(slark, lycan).
+counters(medusa, spectre).
+counters(medusa, slardar).
+counters(medusa, faceless_void).
+counters(medusa, life_stealer).
+counters(medusa, pangolier).
+counters(troll_warlord, axe).
+counters(troll_warlord, tiny).
+counters(troll_warlord, kunkka).
+counters(troll_warlord, slardar).
+counters(troll_warlord, tidehunter).
+counters(centaur, spectre).
+counters(centaur, morphling).
+counters(centaur, slardar).
+counters(centaur, life_stealer).
+counters(centaur, lycan).
+counters(magnataur, morphling).
+counters(magnataur, slardar).
+counters(magnataur, faceless_void).
+counters(magnataur, life_stealer).
+counters(magnataur, treant).
+counters(shredder, chaos_knight).
+counters(shredder, spectre).
+counters(shredder, enchantress).
+counters(shredder, medusa).
+counters(shredder, razor).
+counters(bristleback, phantom_lancer).
+counters(bristleback, mirana).
+counters(bristleback, skywrath_mage).
+counters(bristleback, lich).
+counters(bristleback, ancient_apparition).
+counters(tusk, morphling).
+counters(tusk, slardar).
+counters(tusk, faceless_void).
+counters(tusk, life_stealer).
+counters(tusk, treant).
+counters(skywrath_mage, chaos_knight).
+counters(skywrath_mage, spectre).
+counters(skywrath_mage, axe).
+counters(skywrath_mage, kunkka).
+counters(skywrath_mage, tidehunter).
+counters(abaddon, axe).
+counters(abaddon, bane).
+counters(abaddon, morphling).
+counters(abaddon, pudge).
+counters(abaddon, razor).
+counters(elder_titan, chaos_knight).
+counters(elder_titan, spectre).
+counters(elder_titan, enchantress).
+counters(elder_titan, medusa).
+counters(elder_titan, razor).
+counters(legion_commander, chaos_knight).
+counters(legion_commander, spectre).
+counters(legion_commander, enchantress).
+counters(legion_commander, medusa).
+counters(legion_commander, razor).
+counters(techies, spectre).
+counters(techies, chaos_knight).
+counters(techies, phantom_lancer).
+counters(techies, slardar).
+counters(techies, spirit_breaker).
+counters(ember_spirit, chaos_knight).
+counters(ember_spirit, spectre).
+counters(ember_spirit, enchantress).
+counters(ember_spirit, medusa).
+counters(ember_spirit, razor).
+counters(earth_spirit, morphling).
+counters(earth_spirit, slardar).
+counters(earth_spirit, faceless_void).
+counters(earth_spirit, life_stealer).
+counters(earth_spirit, treant).
+counters(abyssal_underlord, spectre).
+counters(abyssal_underlord, chaos_knight).
+counters(abyssal_underlord, morphling).
+counters(abyssal_underlord, slardar).
+counters(abyssal_underlord, spirit_breaker).
+counters(terrorblade, spectre).
+counters(terrorblade, morphling).
+counters(terrorblade, slardar).
+counters(terrorblade, life_stealer).
+counters(terrorblade, lycan).
+counters(phoenix, spectre).
+counters(phoenix, slardar).
+counters(phoenix, faceless_void).
+counters(phoenix, life_stealer).
+counters(phoenix, lycan).
+counters(oracle, spectre).
+counters(oracle, slardar).
+counters(oracle, faceless_void).
+counters(oracle, life_stealer).
+counters(oracle, lycan).
+counters(winter_wyvern, chaos_knight).
+counters(winter_wyvern, spectre).
+counters(winter_wyvern, axe).
+counters(winter_wyvern, kunkka).
+counters(winter_wyvern, tidehunter).
+counters(arc_warden, chaos_knight).
+counters(arc_warden, spectre).
+counters(arc_warden, axe).
+counters(arc_warden, kunkka).
+counters(arc_warden, tidehunter).
+counters(monkey_king, spectre).
+counters(monkey_king, phantom_lancer).
+counters(monkey_king, hoodwink).
+counters(monkey_king, mirana).
+counters(monkey_king, antimage).
+counters(dark_willow, spectre).
+counters(dark_willow, slardar).
+counters(dark_willow, faceless_void).
+counters(dark_willow, life_stealer).
+counters(dark_willow, pangolier).
+counters(pangolier, mirana).
+counters(pangolier, broodmother).
+counters(pangolier, invoker).
+counters(pangolier, phoenix).
+counters(pangolier, void_spirit).
+counters(grimstroke, spectre).
+counters(grimstroke, slardar).
+counters(grimstroke, faceless_void).
+counters(grimstroke, life_stealer).
+counters(grimstroke, pangolier).
+counters(hoodwink, spectre).
+counters(hoodwink, slardar).
+counters(hoodwink, faceless_void).
+counters(hoodwink, life_stealer).
+counters(hoodwink, lycan).
+counters(void_spirit, axe).
+counters(void_spirit, bane).
+counters(void_spirit, morphling).
+counters(void_spirit, pudge).
+counters(void_spirit, razor).
+counters(snapfire, spectre).
+counters(snapfire, slardar).
+counters(snapfire, faceless_void).
+counters(snapfire, life_stealer).
+counters(snapfire, lycan).
+counters(mars, spectre).
+counters(mars, morphling).
+counters(mars, slardar).
+counters(mars, life_stealer).
+counters(mars, lycan).
+counters(ringmaster, spectre).
+counters(ringmaster, chaos_knight).
+counters(ringmaster, slardar).
+counters(ringmaster, faceless_void).
+counters(ringmaster, spirit_breaker).
+counters(dawnbreaker, morphling).
+counters(dawnbreaker, slardar).
+counters(dawnbreaker, faceless_void).
+counters(dawnbreaker, life_stealer).
+counters(dawnbreaker, treant).
+counters(marci, morphling).
+counters(marci, slardar).
+counters(marci, faceless_void).
+counters(marci, life_stealer).
+counters(marci, treant).
+counters(primal_beast, spectre).
+counters(primal_beast, phantom_lancer).
+counters(primal_beast, morphling).
+counters(primal_beast, slardar).
+counters(primal_beast, life_stealer).
+counters(muerta, chaos_knight).
+counters(muerta, spectre).
+counters(muerta, axe).
+counters(muerta, kunkka).
+counters(muerta, tidehunter).
+counters(kez, phantom_lancer).
+counters(kez, spectre).
+counters(kez, hoodwink).
+counters(kez, mirana).
+counters(kez, antimage).
+
+% synergizes_with(Hero, Rekan): Hero cocok satu tim dengan Rekan
+synergizes_with(antimage, alchemist).
+synergizes_with(antimage, kunkka).
+synergizes_with(antimage, ogre_magi).
+synergizes_with(antimage, skeleton_king).
+synergizes_with(antimage, silencer).
+synergizes_with(axe, kunkka).
+synergizes_with(axe, silencer).
+synergizes_with(axe, alchemist).
+synergizes_with(axe, lina).
+synergizes_with(axe, mirana).
+synergizes_with(bane, tiny).
+synergizes_with(bane, dragon_knight).
+synergizes_with(bane, meepo).
+synergizes_with(bane, alchemist).
+synergizes_with(bane, legion_commander).
+synergizes_with(bloodseeker, kunkka).
+synergizes_with(bloodseeker, alchemist).
+synergizes_with(bloodseeker, silencer).
+synergizes_with(bloodseeker, ogre_magi).
+synergizes_with(bloodseeker, tiny).
+synergizes_with(crystal_maiden, tiny).
+synergizes_with(crystal_maiden, bloodseeker).
+synergizes_with(crystal_maiden, alchemist).
+synergizes_with(crystal_maiden, pangolier).
+synergizes_with(crystal_maiden, dragon_knight).
+synergizes_with(drow_ranger, kunkka).
+synergizes_with(drow_ranger, alchemist).
+synergizes_with(drow_ranger, ogre_magi).
+synergizes_with(drow_ranger, silencer).
+synergizes_with(drow_ranger, skeleton_king).
+synergizes_with(earthshaker, tiny).
+synergizes_with(earthshaker, alchemist).
+synergizes_with(earthshaker, bloodseeker).
+synergizes_with(earthshaker, dragon_knight).
+synergizes_with(earthshaker, meepo).
+synergizes_with(juggernaut, ogre_magi).
+synergizes_with(juggernaut, skeleton_king).
+synergizes_with(juggernaut, silencer).
+synergizes_with(juggernaut, treant).
+synergizes_with(juggernaut, enchantress).
+synergizes_with(mirana, alchemist).
+synergizes_with(mirana, kunkka).
+synergizes_with(mirana, tiny).
+synergizes_with(mirana, silencer).
+synergizes_with(mirana, skeleton_king).
+synergizes_with(morphling, alchemist).
+synergizes_with(morphling, kunkka).
+synergizes_with(morphling, skeleton_king).
+synergizes_with(morphling, silencer).
+synergizes_with(morphling, pangolier).
+synergizes_with(nevermore, alchemist).
+synergizes_with(nevermore, kunkka).
+synergizes_with(nevermore, treant).
+synergizes_with(nevermore, ogre_magi).
+synergizes_with(nevermore, skeleton_king).
+synergizes_with(phantom_lancer, alchemist).
+synergizes_with(phantom_lancer, kunkka).
+synergizes_with(phantom_lancer, ogre_magi).
+synergizes_with(phantom_lancer, skeleton_king).
+synergizes_with(phantom_lancer, silencer).
+synergizes_with(puck, alchemist).
+synergizes_with(puck, bloodseeker).
+synergizes_with(puck, tiny).
+synergizes_with(puck, pangolier).
+synergizes_with(puck, silencer).
+synergizes_with(pudge, alchemist).
+synergizes_with(pudge, pangolier).
+synergizes_with(pudge, bloodseeker).
+synergizes_with(pudge, storm_spirit).
+synergizes_with(pudge, silencer).
+synergizes_with(razor, skeleton_king).
+synergizes_with(razor, alchemist).
+synergizes_with(razor, kunkka).
+synergizes_with(razor, treant).
+synergizes_with(razor, ogre_magi).
+synergizes_with(sand_king, tiny).
+synergizes_with(sand_king, bloodseeker).
+synergizes_with(sand_king, alchemist).
+synergizes_with(sand_king, silencer).
+synergizes_with(sand_king, meepo).
+synergizes_with(storm_spirit, alchemist).
+synergizes_with(storm_spirit, kunkka).
+synergizes_with(storm_spirit, silencer).
+synergizes_with(storm_spirit, pangolier).
+synergizes_with(storm_spirit, tiny).
+synergizes_with(sven, alchemist).
+synergizes_with(sven, kunkka).
+synergizes_with(sven, silencer).
+synergizes_with(sven, tiny).
+synergizes_with(sven, pangolier).
+synergizes_with(tiny, silencer).
+synergizes_with(tiny, kunkka).
+synergizes_with(tiny, alchemist).
+synergizes_with(tiny, sven).
+synergizes_with(tiny, ogre_magi).
+synergizes_with(vengefulspirit, tiny).
+synergizes_with(vengefulspirit, alchemist).
+synergizes_with(vengefulspirit, bloodseeker).
+synergizes_with(vengefulspirit, dragon_knight).
+synergizes_with(vengefulspirit, pangolier).
+synergizes_with(windrunner, alchemist).
+synergizes_with(windrunner, kunkka).
+synergizes_with(windrunner, silencer).
+synergizes_with(windrunner, skeleton_king).
+synergizes_with(windrunner, tiny).
+synergizes_with(zuus, alchemist).
+synergizes_with(zuus, kunkka).
+synergizes_with(zuus, ogre_magi).
+synergizes_with(zuus, skeleton_king).
+synergizes_with(zuus, treant).
+synergizes_with(kunkka, alchemist).
+synergizes_with(kunkka, silencer).
+synergizes_with(kunkka, tiny).
+synergizes_with(kunkka, dragon_knight).
+synergizes_with(kunkka, pangolier).
+synergizes_with(lina, alchemist).
+synergizes_with(lina, kunkka).
+synergizes_with(lina, tiny).
+synergizes_with(lina, silencer).
+synergizes_with(lina, skeleton_king).
+synergizes_with(lion, tiny).
+synergizes_with(lion, alchemist).
+synergizes_with(lion, bloodseeker).
+synergizes_with(lion, pangolier).
+synergizes_with(lion, dragon_knight).
+synergizes_with(shadow_shaman, alchemist).
+synergizes_with(shadow_shaman, bloodseeker).
+synergizes_with(shadow_shaman, tiny).
+synergizes_with(shadow_shaman, meepo).
+synergizes_with(shadow_shaman, kunkka).
+synergizes_with(slardar, kunkka).
+synergizes_with(slardar, silencer).
+synergizes_with(slardar, alchemist).
+synergizes_with(slardar, lina).
+synergizes_with(slardar, leshrac).
+synergizes_with(tidehunter, alchemist).
+synergizes_with(tidehunter, kunkka).
+synergizes_with(tidehunter, silencer).
+synergizes_with(tidehunter, tiny).
+synergizes_with(tidehunter, pangolier).
+synergizes_with(witch_doctor, tiny).
+synergizes_with(witch_doctor, alchemist).
+synergizes_with(witch_doctor, dragon_knight).
+synergizes_with(witch_doctor, pangolier).
+synergizes_with(witch_doctor, bloodseeker).
+synergizes_with(lich, tiny).
+synergizes_with(lich, axe).
+synergizes_with(lich, bloodseeker).
+synergizes_with(lich, slardar).
+synergizes_with(lich, alchemist).
+synergizes_with(riki, alchemist).
+synergizes_with(riki, silencer).
+synergizes_with(riki, kunkka).
+synergizes_with(riki, bane).
+synergizes_with(riki, ogre_magi).
+synergizes_with(enigma, alchemist).
+synergizes_with(enigma, silencer).
+synergizes_with(enigma, kunkka).
+synergizes_with(enigma, bloodseeker).
+synergizes_with(enigma, pangolier).
+synergizes_with(tinker, alchemist).
+synergizes_with(tinker, kunkka).
+synergizes_with(tinker, ogre_magi).
+synergizes_with(tinker, skeleton_king).
+synergizes_with(tinker, treant).
+synergizes_with(sniper, alchemist).
+synergizes_with(sniper, kunkka).
+synergizes_with(sniper, ogre_magi).
+synergizes_with(sniper, skeleton_king).
+synergizes_with(sniper, treant).
+synergizes_with(necrolyte, alchemist).
+synergizes_with(necrolyte, kunkka).
+synergizes_with(necrolyte, silencer).
+synergizes_with(necrolyte, skeleton_king).
+synergizes_with(necrolyte, tiny).
+synergizes_with(warlock, tiny).
+synergizes_with(warlock, alchemist).
+synergizes_with(warlock, bloodseeker).
+synergizes_with(warlock, terrorblade).
+synergizes_with(warlock, bristleback).
+synergizes_with(beastmaster, bloodseeker).
+synergizes_with(beastmaster, alchemist).
+synergizes_with(beastmaster, tiny).
+synergizes_with(beastmaster, silencer).
+synergizes_with(beastmaster, storm_spirit).
+synergizes_with(queenofpain, alchemist).
+synergizes_with(queenofpain, kunkka).
+synergizes_with(queenofpain, skeleton_king).
+synergizes_with(queenofpain, treant).
+synergizes_with(queenofpain, ogre_magi).
+synergizes_with(venomancer, alchemist).
+synergizes_with(venomancer, bloodseeker).
+synergizes_with(venomancer, tiny).
+synergizes_with(venomancer, meepo).
+synergizes_with(venomancer, kunkka).
+synergizes_with(faceless_void, alchemist).
+synergizes_with(faceless_void, kunkka).
+synergizes_with(faceless_void, silencer).
+synergizes_with(faceless_void, windrunner).
+synergizes_with(faceless_void, pangolier).
+synergizes_with(skeleton_king, alchemist).
+synergizes_with(skeleton_king, kunkka).
+synergizes_with(skeleton_king, silencer).
+synergizes_with(skeleton_king, leshrac).
+synergizes_with(skeleton_king, tiny).
+synergizes_with(death_prophet, alchemist).
+synergizes_with(death_prophet, kunkka).
+synergizes_with(death_prophet, ogre_magi).
+synergizes_with(death_prophet, silencer).
+synergizes_with(death_prophet, skeleton_king).
+synergizes_with(phantom_assassin, skeleton_king).
+synergizes_with(phantom_assassin, treant).
+synergizes_with(phantom_assassin, ogre_magi).
+synergizes_with(phantom_assassin, kunkka).
+synergizes_with(phantom_assassin, warlock).
+synergizes_with(pugna, alchemist).
+synergizes_with(pugna, axe).
+synergizes_with(pugna, bloodseeker).
+synergizes_with(pugna, slardar).
+synergizes_with(pugna, pangolier).
+synergizes_with(templar_assassin, skeleton_king).
+synergizes_with(templar_assassin, treant).
+synergizes_with(templar_assassin, ogre_magi).
+synergizes_with(templar_assassin, kunkka).
+synergizes_with(templar_assassin, alchemist).
+synergizes_with(viper, alchemist).
+synergizes_with(viper, kunkka).
+synergizes_with(viper, silencer).
+synergizes_with(viper, pangolier).
+synergizes_with(viper, tiny).
+synergizes_with(luna, alchemist).
+synergizes_with(luna, treant).
+synergizes_with(luna, ogre_magi).
+synergizes_with(luna, kunkka).
+synergizes_with(luna, skeleton_king).
+synergizes_with(dragon_knight, alchemist).
+synergizes_with(dragon_knight, kunkka).
+synergizes_with(dragon_knight, silencer).
+synergizes_with(dragon_knight, pangolier).
+synergizes_with(dragon_knight, tiny).
+synergizes_with(dazzle, meepo).
+synergizes_with(dazzle, dragon_knight).
+synergizes_with(dazzle, bloodseeker).
+synergizes_with(dazzle, sven).
+synergizes_with(dazzle, brewmaster).
+synergizes_with(rattletrap, alchemist).
+synergizes_with(rattletrap, bloodseeker).
+synergizes_with(rattletrap, tiny).
+synergizes_with(rattletrap, silencer).
+synergizes_with(rattletrap, pangolier).
+synergizes_with(leshrac, alchemist).
+synergizes_with(leshrac, kunkka).
+synergizes_with(leshrac, silencer).
+synergizes_with(leshrac, skeleton_king).
+synergizes_with(leshrac, tiny).
+synergizes_with(furion, alchemist).
+synergizes_with(furion, ogre_magi).
+synergizes_with(furion, kunkka).
+synergizes_with(furion, skeleton_king).
+synergizes_with(furion, treant).
+synergizes_with(life_stealer, alchemist).
+synergizes_with(life_stealer, kunkka).
+synergizes_with(life_stealer, silencer).
+synergizes_with(life_stealer, windrunner).
+synergizes_with(life_stealer, bane).
+synergizes_with(dark_seer, alchemist).
+synergizes_with(dark_seer, bloodseeker).
+synergizes_with(dark_seer, bristleback).
+synergizes_with(dark_seer, silencer).
+synergizes_with(dark_seer, pangolier).
+synergizes_with(clinkz, ogre_magi).
+synergizes_with(clinkz, skeleton_king).
+synergizes_with(clinkz, treant).
+synergizes_with(clinkz, kunkka).
+synergizes_with(clinkz, earthshaker).
+synergizes_with(omniknight, silencer).
+synergizes_with(omniknight, tiny).
+synergizes_with(omniknight, dragon_knight).
+synergizes_with(omniknight, chaos_knight).
+synergizes_with(omniknight, meepo).
+synergizes_with(enchantress, tiny).
+synergizes_with(enchantress, kunkka).
+synergizes_with(enchantress, alchemist).
+synergizes_with(enchantress, dragon_knight).
+synergizes_with(enchantress, meepo).
+synergizes_with(huskar, alchemist).
+synergizes_with(huskar, kunkka).
+synergizes_with(huskar, silencer).
+synergizes_with(huskar, pangolier).
+synergizes_with(huskar, tiny).
+synergizes_with(night_stalker, alchemist).
+synergizes_with(night_stalker, kunkka).
+synergizes_with(night_stalker, silencer).
+synergizes_with(night_stalker, tiny).
+synergizes_with(night_stalker, bloodseeker).
+synergizes_with(broodmother, alchemist).
+synergizes_with(broodmother, ogre_magi).
+synergizes_with(broodmother, skeleton_king).
+synergizes_with(broodmother, kunkka).
+synergizes_with(broodmother, silencer).
+synergizes_with(bounty_hunter, bloodseeker).
+synergizes_with(bounty_hunter, puck).
+synergizes_with(bounty_hunter, warlock).
+synergizes_with(bounty_hunter, viper).
+synergizes_with(bounty_hunter, batrider).
+synergizes_with(weaver, skeleton_king).
+synergizes_with(weaver, treant).
+synergizes_with(weaver, ogre_magi).
+synergizes_with(weaver, kunkka).
+synergizes_with(weaver, alchemist).
+synergizes_with(jakiro, alchemist).
+synergizes_with(jakiro, tiny).
+synergizes_with(jakiro, bloodseeker).
+synergizes_with(jakiro, kunkka).
+synergizes_with(jakiro, dragon_knight).
+synergizes_with(batrider, bloodseeker).
+synergizes_with(batrider, alchemist).
+synergizes_with(batrider, pangolier).
+synergizes_with(batrider, bristleback).
+synergizes_with(batrider, tiny).
+synergizes_with(chen, naga_siren).
+synergizes_with(chen, leshrac).
+synergizes_with(chen, juggernaut).
+synergizes_with(chen, kunkka).
+synergizes_with(chen, skeleton_king).
+synergizes_with(spectre, alchemist).
+synergizes_with(spectre, kunkka).
+synergizes_with(spectre, skeleton_king).
+synergizes_with(spectre, enchantress).
+synergizes_with(spectre, silencer).
+synergizes_with(ancient_apparition, tiny).
+synergizes_with(ancient_apparition, alchemist).
+synergizes_with(ancient_apparition, bloodseeker).
+synergizes_with(ancient_apparition, pangolier).
+synergizes_with(ancient_apparition, dragon_knight).
+synergizes_with(doom_bringer, alchemist).
+synergizes_with(doom_bringer, kunkka).
+synergizes_with(doom_bringer, silencer).
+synergizes_with(doom_bringer, tiny).
+synergizes_with(doom_bringer, pangolier).
+synergizes_with(ursa, alchemist).
+synergizes_with(ursa, kunkka).
+synergizes_with(ursa, silencer).
+synergizes_with(ursa, windrunner).
+synergizes_with(ursa, bane).
+synergizes_with(spirit_breaker, alchemist).
+synergizes_with(spirit_breaker, kunkka).
+synergizes_with(spirit_breaker, silencer).
+synergizes_with(spirit_breaker, windrunner).
+synergizes_with(spirit_breaker, leshrac).
+synergizes_with(gyrocopter, alchemist).
+synergizes_with(gyrocopter, kunkka).
+synergizes_with(gyrocopter, ogre_magi).
+synergizes_with(gyrocopter, silencer).
+synergizes_with(gyrocopter, skeleton_king).
+synergizes_with(alchemist, silencer).
+synergizes_with(alchemist, kunkka).
+synergizes_with(alchemist, dragon_knight).
+synergizes_with(alchemist, sven).
+synergizes_with(alchemist, tiny).
+synergizes_with(invoker, alchemist).
+synergizes_with(invoker, kunkka).
+synergizes_with(invoker, silencer).
+synergizes_with(invoker, ogre_magi).
+synergizes_with(invoker, skeleton_king).
+synergizes_with(silencer, alchemist).
+synergizes_with(silencer, kunkka).
+synergizes_with(silencer, tiny).
+synergizes_with(silencer, dragon_knight).
+synergizes_with(silencer, pangolier).
+synergizes_with(obsidian_destroyer, alchemist).
+synergizes_with(obsidian_destroyer, kunkka).
+synergizes_with(obsidian_destroyer, silencer).
+synergizes_with(obsidian_destroyer, ogre_magi).
+synergizes_with(obsidian_destroyer, skeleton_king).
+synergizes_with(lycan, alchemist).
+synergizes_with(lycan, kunkka).
+synergizes_with(lycan, skeleton_king).
+synergizes_with(lycan, silencer).
+synergizes_with(lycan, treant).
+synergizes_with(brewmaster, alchemist).
+synergizes_with(brewmaster, kunkka).
+synergizes_with(brewmaster, silencer).
+synergizes_with(brewmaster, pangolier).
+synergizes_with(brewmaster, tiny).
+synergizes_with(shadow_demon, tiny).
+synergizes_with(shadow_demon, bloodseeker).
+synergizes_with(shadow_demon, alchemist).
+synergizes_with(shadow_demon, pangolier).
+synergizes_with(shadow_demon, dragon_knight).
+synergizes_with(lone_druid, kunkka).
+synergizes_with(lone_druid, skeleton_king).
+synergizes_with(lone_druid, alchemist).
+synergizes_with(lone_druid, treant).
+synergizes_with(lone_druid, naga_siren).
+synergizes_with(chaos_knight, alchemist).
+synergizes_with(chaos_knight, kunkka).
+synergizes_with(chaos_knight, silencer).
+synergizes_with(chaos_knight, windrunner).
+synergizes_with(chaos_knight, leshrac).
+synergizes_with(meepo, alchemist).
+synergizes_with(meepo, kunkka).
+synergizes_with(meepo, silencer).
+synergizes_with(meepo, ogre_magi).
+synergizes_with(meepo, pangolier).
+synergizes_with(treant, razor).
+synergizes_with(treant, luna).
+synergizes_with(treant, tinker).
+synergizes_with(treant, leshrac).
+synergizes_with(treant, tiny).
+synergizes_with(ogre_magi, tiny).
+synergizes_with(ogre_magi, alchemist).
+synergizes_with(ogre_magi, bloodseeker).
+synergizes_with(ogre_magi, silencer).
+synergizes_with(ogre_magi, dragon_knight).
+synergizes_with(undying, bloodseeker).
+synergizes_with(undying, tiny).
+synergizes_with(undying, silencer).
+synergizes_with(undying, alchemist).
+synergizes_with(undying, meepo).
+synergizes_with(rubick, tiny).
+synergizes_with(rubick, alchemist).
+synergizes_with(rubick, bloodseeker).
+synergizes_with(rubick, pangolier).
+synergizes_with(rubick, dragon_knight).
+synergizes_with(disruptor, tiny).
+synergizes_with(disruptor, alchemist).
+synergizes_with(disruptor, bloodseeker).
+synergizes_with(disruptor, pangolier).
+synergizes_with(disruptor, dragon_knight).
+synergizes_with(nyx_assassin, alchemist).
+synergizes_with(nyx_assassin, tiny).
+synergizes_with(nyx_assassin, silencer).
+synergizes_with(nyx_assassin, pangolier).
+synergizes_with(nyx_assassin, bloodseeker).
+synergizes_with(naga_siren, alchemist).
+synergizes_with(naga_siren, kunkka).
+synergizes_with(naga_siren, silencer).
+synergizes_with(naga_siren, leshrac).
+synergizes_with(naga_siren, lina).
+synergizes_with(keeper_of_the_light, tiny).
+synergizes_with(keeper_of_the_light, bloodseeker).
+synergizes_with(keeper_of_the_light, alchemist).
+synergizes_with(keeper_of_the_light, pangolier).
+synergizes_with(keeper_of_the_light, dragon_knight).
+synergizes_with(wisp, tiny).
+synergizes_with(wisp, axe).
+synergizes_with(wisp, bloodseeker).
+synergizes_with(wisp, slardar).
+synergizes_with(wisp, alchemist).
+synergizes_with(visage, alchemist).
+synergizes_with(visage, tiny).
+synergizes_with(visage, bloodseeker).
+synergizes_with(visage, meepo).
+synergizes_with(visage, kunkka).
+synergizes_with(slark, alchemist).
+synergizes_with(slark, kunkka).
+synergizes_with(slark, silencer).
+synergizes_with(slark, ogre_magi).
+synergizes_with(slark, disruptor).
+synergizes_with(medusa, alchemist).
+synergizes_with(medusa, kunkka).
+synergizes_with(medusa, silencer).
+synergizes_with(medusa, skeleton_king).
+synergizes_with(medusa, ogre_magi).
+synergizes_with(troll_warlord, alchemist).
+synergizes_with(troll_warlord, kunkka).
+synergizes_with(troll_warlord, skeleton_king).
+synergizes_with(troll_warlord, silencer).
+synergizes_with(troll_warlord, ogre_magi).
+synergizes_with(centaur, alchemist).
+synergizes_with(centaur, bloodseeker).
+synergizes_with(centaur, silencer).
+synergizes_with(centaur, pangolier).
+synergizes_with(centaur, tiny).
+synergizes_with(magnataur, alchemist).
+synergizes_with(magnataur, bloodseeker).
+synergizes_with(magnataur, tiny).
+synergizes_with(magnataur, pangolier).
+synergizes_with(magnataur, silencer).
+synergizes_with(shredder, silencer).
+synergizes_with(shredder, storm_spirit).
+synergizes_with(shredder, viper).
+synergizes_with(shredder, slardar).
+synergizes_with(shredder, alchemist).
+synergizes_with(bristleback, silencer).
+synergizes_with(bristleback, kunkka).
+synergizes_with(bristleback, alchemist).
+synergizes_with(bristleback, skeleton_king).
+synergizes_with(bristleback, ogre_magi).
+synergizes_with(tusk, alchemist).
+synergizes_with(tusk, bloodseeker).
+synergizes_with(tusk, tiny).
+synergizes_with(tusk, pangolier).
+synergizes_with(tusk, silencer).
+synergizes_with(skywrath_mage, tiny).
+synergizes_with(skywrath_mage, bloodseeker).
+synergizes_with(skywrath_mage, alchemist).
+synergizes_with(skywrath_mage, pangolier).
+synergizes_with(skywrath_mage, dragon_knight).
+synergizes_with(abaddon, alchemist).
+synergizes_with(abaddon, kunkka).
+synergizes_with(abaddon, skeleton_king).
+synergizes_with(abaddon, naga_siren).
+synergizes_with(abaddon, silencer).
+synergizes_with(elder_titan, bloodseeker).
+synergizes_with(elder_titan, silencer).
+synergizes_with(elder_titan, alchemist).
+synergizes_with(elder_titan, storm_spirit).
+synergizes_with(elder_titan, pangolier).
+synergizes_with(legion_commander, alchemist).
+synergizes_with(legion_commander, kunkka).
+synergizes_with(legion_commander, silencer).
+synergizes_with(legion_commander, pangolier).
+synergizes_with(legion_commander, tiny).
+synergizes_with(techies, alchemist).
+synergizes_with(techies, bloodseeker).
+synergizes_with(techies, silencer).
+synergizes_with(techies, pangolier).
+synergizes_with(techies, tiny).
+synergizes_with(ember_spirit, alchemist).
+synergizes_with(ember_spirit, kunkka).
+synergizes_with(ember_spirit, silencer).
+synergizes_with(ember_spirit, pangolier).
+synergizes_with(ember_spirit, ogre_magi).
+synergizes_with(earth_spirit, alchemist).
+synergizes_with(earth_spirit, bloodseeker).
+synergizes_with(earth_spirit, tiny).
+synergizes_with(earth_spirit, pangolier).
+synergizes_with(earth_spirit, silencer).
+synergizes_with(abyssal_underlord, tiny).
+synergizes_with(abyssal_underlord, alchemist).
+synergizes_with(abyssal_underlord, silencer).
+synergizes_with(abyssal_underlord, bloodseeker).
+synergizes_with(abyssal_underlord, pangolier).
+synergizes_with(terrorblade, alchemist).
+synergizes_with(terrorblade, ogre_magi).
+synergizes_with(terrorblade, skeleton_king).
+synergizes_with(terrorblade, silencer).
+synergizes_with(terrorblade, treant).
+synergizes_with(phoenix, tiny).
+synergizes_with(phoenix, alchemist).
+synergizes_with(phoenix, bloodseeker).
+synergizes_with(phoenix, pangolier).
+synergizes_with(phoenix, dragon_knight).
+synergizes_with(oracle, tiny).
+synergizes_with(oracle, alchemist).
+synergizes_with(oracle, bloodseeker).
+synergizes_with(oracle, pangolier).
+synergizes_with(oracle, dragon_knight).
+synergizes_with(winter_wyvern, tiny).
+synergizes_with(winter_wyvern, bloodseeker).
+synergizes_with(winter_wyvern, alchemist).
+synergizes_with(winter_wyvern, pangolier).
+synergizes_with(winter_wyvern, dragon_knight).
+synergizes_with(arc_warden, alchemist).
+synergizes_with(arc_warden, kunkka).
+synergizes_with(arc_warden, ogre_magi).
+synergizes_with(arc_warden, skeleton_king).
+synergizes_with(arc_warden, treant).
+synergizes_with(monkey_king, silencer).
+synergizes_with(monkey_king, kunkka).
+synergizes_with(monkey_king, alchemist).
+synergizes_with(monkey_king, leshrac).
+synergizes_with(monkey_king, lina).
+synergizes_with(dark_willow, tiny).
+synergizes_with(dark_willow, alchemist).
+synergizes_with(dark_willow, bloodseeker).
+synergizes_with(dark_willow, dragon_knight).
+synergizes_with(dark_willow, pangolier).
+synergizes_with(pangolier, kunkka).
+synergizes_with(pangolier, silencer).
+synergizes_with(pangolier, alchemist).
+synergizes_with(pangolier, sven).
+synergizes_with(pangolier, legion_commander).
+synergizes_with(grimstroke, tiny).
+synergizes_with(grimstroke, alchemist).
+synergizes_with(grimstroke, bloodseeker).
+synergizes_with(grimstroke, dragon_knight).
+synergizes_with(grimstroke, pangolier).
+synergizes_with(hoodwink, bloodseeker).
+synergizes_with(hoodwink, tiny).
+synergizes_with(hoodwink, alchemist).
+synergizes_with(hoodwink, meepo).
+synergizes_with(hoodwink, dragon_knight).
+synergizes_with(void_spirit, alchemist).
+synergizes_with(void_spirit, kunkka).
+synergizes_with(void_spirit, silencer).
+synergizes_with(void_spirit, ogre_magi).
+synergizes_with(void_spirit, venomancer).
+synergizes_with(snapfire, tiny).
+synergizes_with(snapfire, bloodseeker).
+synergizes_with(snapfire, alchemist).
+synergizes_with(snapfire, meepo).
+synergizes_with(snapfire, dragon_knight).
+synergizes_with(mars, alchemist).
+synergizes_with(mars, kunkka).
+synergizes_with(mars, silencer).
+synergizes_with(mars, leshrac).
+synergizes_with(mars, lina).
+synergizes_with(ringmaster, tiny).
+synergizes_with(ringmaster, alchemist).
+synergizes_with(ringmaster, bloodseeker).
+synergizes_with(ringmaster, pangolier).
+synergizes_with(ringmaster, dragon_knight).
+synergizes_with(dawnbreaker, alchemist).
+synergizes_with(dawnbreaker, kunkka).
+synergizes_with(dawnbreaker, skeleton_king).
+synergizes_with(dawnbreaker, silencer).
+synergizes_with(dawnbreaker, enchantress).
+synergizes_with(marci, alchemist).
+synergizes_with(marci, kunkka).
+synergizes_with(marci, silencer).
+synergizes_with(marci, leshrac).
+synergizes_with(marci, tiny).
+synergizes_with(primal_beast, silencer).
+synergizes_with(primal_beast, sniper).
+synergizes_with(primal_beast, bloodseeker).
+synergizes_with(primal_beast, obsidian_destroyer).
+synergizes_with(primal_beast, invoker).
+synergizes_with(muerta, alchemist).
+synergizes_with(muerta, kunkka).
+synergizes_with(muerta, ogre_magi).
+synergizes_with(muerta, silencer).
+synergizes_with(muerta, skeleton_king).
+synergizes_with(kez, silencer).
+synergizes_with(kez, kunkka).
+synergizes_with(kez, ogre_magi).
+synergizes_with(kez, alchemist).
+synergizes_with(kez, disruptor).
+
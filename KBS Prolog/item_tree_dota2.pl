@@ -0,0 +1,1672 @@
+% === Fakta Item Build Tree ===
+% Dihasilkan oleh Ontologi/item_index.py dari items.json
+
+% item_requires(Item, Komponen): transitif dari requiresComponent
+item_requires(abyssal_blade, basher).
+item_requires(abyssal_blade, belt_of_strength).
+item_requires(abyssal_blade, mithril_hammer).
+item_requires(abyssal_blade, ogre_axe).
+item_requires(abyssal_blade, sange).
+item_requires(aeon_disk, energy_booster).
+item_requires(aeon_disk, vitality_booster).
+item_requires(aether_lens, energy_booster).
+item_requires(aether_lens, void_stone).
+item_requires(ancient_janggo, belt_of_strength).
+item_requires(ancient_janggo, robe).
+item_requires(ancient_janggo, wind_lace).
+item_requires(angels_demise, diadem).
+item_requires(angels_demise, phylactery).
+item_requires(angels_demise, point_booster).
+item_requires(angels_demise, tiara_of_selemene).
+item_requires(arcane_blink, blink).
+item_requires(arcane_blink, mystic_staff).
+item_requires(arcane_boots, boots).
+item_requires(arcane_boots, ring_of_basilius).
+item_requires(arcane_boots, sobi_mask).
+item_requires(armlet, blades_of_attack).
+item_requires(armlet, gloves).
+item_requires(armlet, helm_of_iron_will).
+item_requires(assault, buckler).
+item_requires(assault, hyperstone).
+item_requires(assault, platemail).
+item_requires(assault, ring_of_protection).
+item_requires(basher, belt_of_strength).
+item_requires(basher, mithril_hammer).
+item_requires(bfury, broadsword).
+item_requires(bfury, cornucopia).
+item_requires(bfury, quelling_blade).
+item_requires(black_king_bar, mithril_hammer).
+item_requires(black_king_bar, ogre_axe).
+item_requires(blade_mail, broadsword).
+item_requires(blade_mail, chainmail).
+item_requires(bloodstone, energy_booster).
+item_requires(bloodstone, point_booster).
+item_requires(bloodstone, soul_booster).
+item_requires(bloodstone, vitality_booster).
+item_requires(bloodstone, void_stone).
+item_requires(bloodstone, voodoo_mask).
+item_requires(bloodthorn, blitz_knuckles).
+item_requires(bloodthorn, cornucopia).
+item_requires(bloodthorn, hyperstone).
+item_requires(bloodthorn, javelin).
+item_requires(bloodthorn, oblivion_staff).
+item_requires(bloodthorn, orchid).
+item_requires(bloodthorn, robe).
+item_requires(bloodthorn, sobi_mask).
+item_requires(boots_of_bearing, ancient_janggo).
+item_requires(boots_of_bearing, belt_of_strength).
+item_requires(boots_of_bearing, boots).
+item_requires(boots_of_bearing, ring_of_regen).
+item_requires(boots_of_bearing, robe).
+item_requires(boots_of_bearing, tranquil_boots).
+item_requires(boots_of_bearing, wind_lace).
+item_requires(bracer, circlet).
+item_requires(bracer, gauntlets).
+item_requires(buckler, ring_of_protection).
+item_requires(butterfly, claymore).
+item_requires(butterfly, eagle).
+item_requires(butterfly, talisman_of_evasion).
+item_requires(crimson_guard, helm_of_iron_will).
+item_requires(crimson_guard, ring_of_health).
+item_requires(crimson_guard, vanguard).
+item_requires(crimson_guard, vitality_booster).
+item_requires(cyclone, staff_of_wizardry).
+item_requires(cyclone, void_stone).
+item_requires(cyclone, wind_lace).
+item_requires(dagon, diadem).
+item_requires(dagon, voodoo_mask).
+item_requires(desolator, blight_stone).
+item_requires(desolator, mithril_hammer).
+item_requires(devastator, blitz_knuckles).
+item_requires(devastator, chainmail).
+item_requires(devastator, mystic_staff).
+item_requires(devastator, oblivion_staff).
+item_requires(devastator, orb_of_venom).
+item_requires(devastator, robe).
+item_requires(devastator, sobi_mask).
+item_requires(devastator, witch_blade).
+item_requires(diffusal_blade, blade_of_alacrity).
+item_requires(diffusal_blade, robe).
+item_requires(diffusal_blade_2, blade_of_alacrity).
+item_requires(diffusal_blade_2, diffusal_blade).
+item_requires(diffusal_blade_2, recipe_diffusal_blade).
+item_requires(diffusal_blade_2, robe).
+item_requires(disperser, blade_of_alacrity).
+item_requires(disperser, diffusal_blade).
+item_requires(disperser, eagle).
+item_requires(disperser, robe).
+item_requires(dragon_lance, belt_of_strength).
+item_requires(dragon_lance, blade_of_alacrity).
+item_requires(echo_sabre, broadsword).
+item_requires(echo_sabre, ogre_axe).
+item_requires(echo_sabre, void_stone).
+item_requires(eternal_shroud, cloak).
+item_requires(eternal_shroud, ogre_axe).
+item_requires(eternal_shroud, vitality_booster).
+item_requires(ethereal_blade, aether_lens).
+item_requires(ethereal_blade, energy_booster).
+item_requires(ethereal_blade, ghost).
+item_requires(ethereal_blade, void_stone).
+item_requires(falcon_blade, blades_of_attack).
+item_requires(falcon_blade, fluffy_hat).
+item_requires(falcon_blade, sobi_mask).
+item_requires(force_staff, fluffy_hat).
+item_requires(force_staff, staff_of_wizardry).
+item_requires(glimmer_cape, cloak).
+item_requires(glimmer_cape, shadow_amulet).
+item_requires(great_famango, famango).
+item_requires(greater_crit, blades_of_attack).
+item_requires(greater_crit, claymore).
+item_requires(greater_crit, demon_edge).
+item_requires(greater_crit, lesser_crit).
+item_requires(greater_famango, famango).
+item_requires(greater_famango, great_famango).
+item_requires(guardian_greaves, arcane_boots).
+item_requires(guardian_greaves, boots).
+item_requires(guardian_greaves, buckler).
+item_requires(guardian_greaves, chainmail).
+item_requires(guardian_greaves, headdress).
+item_requires(guardian_greaves, mekansm).
+item_requires(guardian_greaves, ring_of_basilius).
+item_requires(guardian_greaves, ring_of_protection).
+item_requires(guardian_greaves, ring_of_regen).
+item_requires(guardian_greaves, sobi_mask).
+item_requires(gungir, point_booster).
+item_requires(gungir, rod_of_atos).
+item_requires(gungir, staff_of_wizardry).
+item_requires(gungir, vitality_booster).
+item_requires(hand_of_midas, gloves).
+item_requires(harpoon, broadsword).
+item_requires(harpoon, diadem).
+item_requires(harpoon, echo_sabre).
+item_requires(harpoon, ogre_axe).
+item_requires(harpoon, void_stone).
+item_requires(headdress, ring_of_regen).
+item_requires(heart, reaver).
+item_requires(heart, ring_of_tarrasque).
+item_requires(heavens_halberd, crown).
+item_requires(heavens_halberd, ring_of_health).
+item_requires(heavens_halberd, vanguard).
+item_requires(heavens_halberd, vitality_booster).
+item_requires(helm_of_the_dominator, crown).
+item_requires(helm_of_the_dominator, helm_of_iron_will).
+item_requires(helm_of_the_overlord, crown).
+item_requires(helm_of_the_overlord, helm_of_iron_will).
+item_requires(helm_of_the_overlord, helm_of_the_dominator).
+item_requires(helm_of_the_overlord, ultimate_orb).
+item_requires(hermes_sandals, blades_of_attack).
+item_requires(hermes_sandals, boots).
+item_requires(hermes_sandals, chainmail).
+item_requires(hermes_sandals, eagle).
+item_requires(hermes_sandals, phase_boots).
+item_requires(holy_locket, branches).
+item_requires(holy_locket, diadem).
+item_requires(holy_locket, magic_stick).
+item_requires(holy_locket, magic_wand).
+item_requires(hurricane_pike, belt_of_strength).
+item_requires(hurricane_pike, blade_of_alacrity).
+item_requires(hurricane_pike, dragon_lance).
+item_requires(hurricane_pike, fluffy_hat).
+item_requires(hurricane_pike, force_staff).
+item_requires(hurricane_pike, staff_of_wizardry).
+item_requires(invis_sword, blitz_knuckles).
+item_requires(invis_sword, claymore).
+item_requires(invis_sword, shadow_amulet).
+item_requires(iron_talon, quelling_blade).
+item_requires(iron_talon, ring_of_protection).
+item_requires(kaya, robe).
+item_requires(kaya, staff_of_wizardry).
+item_requires(kaya_and_sange, belt_of_strength).
+item_requires(kaya_and_sange, kaya).
+item_requires(kaya_and_sange, ogre_axe).
+item_requires(kaya_and_sange, robe).
+item_requires(kaya_and_sange, sange).
+item_requires(kaya_and_sange, staff_of_wizardry).
+item_requires(lesser_crit, blades_of_attack).
+item_requires(lesser_crit, claymore).
+item_requires(lotus_orb, energy_booster).
+item_requires(lotus_orb, pers).
+item_requires(lotus_orb, platemail).
+item_requires(lotus_orb, ring_of_health).
+item_requires(lotus_orb, void_stone).
+item_requires(lunar_crest, cloak).
+item_requires(lunar_crest, vitality_booster).
+item_requires(lunar_crest, wind_lace).
+item_requires(maelstrom, gloves).
+item_requires(maelstrom, javelin).
+item_requires(maelstrom, mithril_hammer).
+item_requires(mage_slayer, cloak).
+item_requires(mage_slayer, cornucopia).
+item_requires(mage_slayer, gloves).
+item_requires(mage_slayer, orb_of_venom).
+item_requires(magic_wand, branches).
+item_requires(magic_wand, magic_stick).
+item_requires(manta, blade_of_alacrity).
+item_requires(manta, boots_of_elves).
+item_requires(manta, diadem).
+item_requires(manta, yasha).
+item_requires(mask_of_madness, broadsword).
+item_requires(mask_of_madness, lifesteal).
+item_requires(medallion_of_courage, blight_stone).
+item_requires(medallion_of_courage, chainmail).
+item_requires(medallion_of_courage, sobi_mask).
+item_requires(mekansm, chainmail).
+item_requires(mekansm, headdress).
+item_requires(mekansm, ring_of_regen).
+item_requires(meteor_hammer, crown).
+item_requires(meteor_hammer, kaya).
+item_requires(meteor_hammer, robe).
+item_requires(meteor_hammer, staff_of_wizardry).
+item_requires(mjollnir, gloves).
+item_requires(mjollnir, hyperstone).
+item_requires(mjollnir, javelin).
+item_requires(mjollnir, maelstrom).
+item_requires(mjollnir, mithril_hammer).
+item_requires(monkey_king_bar, blitz_knuckles).
+item_requires(monkey_king_bar, demon_edge).
+item_requires(monkey_king_bar, javelin).
+item_requires(moon_shard, hyperstone).
+item_requires(necronomicon, belt_of_strength).
+item_requires(necronomicon, sobi_mask).
+item_requires(necronomicon_2, belt_of_strength).
+item_requires(necronomicon_2, necronomicon).
+item_requires(necronomicon_2, recipe_necronomicon).
+item_requires(necronomicon_2, sobi_mask).
+item_requires(necronomicon_3, belt_of_strength).
+item_requires(necronomicon_3, necronomicon).
+item_requires(necronomicon_3, necronomicon_2).
+item_requires(necronomicon_3, recipe_necronomicon).
+item_requires(necronomicon_3, sobi_mask).
+item_requires(null_talisman, circlet).
+item_requires(null_talisman, mantle).
+item_requires(nullifier, helm_of_iron_will).
+item_requires(nullifier, relic).
+item_requires(oblivion_staff, blitz_knuckles).
+item_requires(oblivion_staff, robe).
+item_requires(oblivion_staff, sobi_mask).
+item_requires(octarine_core, energy_booster).
+item_requires(octarine_core, point_booster).
+item_requires(octarine_core, soul_booster).
+item_requires(octarine_core, tiara_of_selemene).
+item_requires(octarine_core, vitality_booster).
+item_requires(orb_of_corrosion, blight_stone).
+item_requires(orb_of_corrosion, boots_of_elves).
+item_requires(orb_of_corrosion, orb_of_frost).
+item_requires(orchid, blitz_knuckles).
+item_requires(orchid, cornucopia).
+item_requires(orchid, oblivion_staff).
+item_requires(orchid, robe).
+item_requires(orchid, sobi_mask).
+item_requires(overwhelming_blink, blink).
+item_requires(overwhelming_blink, reaver).
+item_requires(pavise, energy_booster).
+item_requires(pavise, fluffy_hat).
+item_requires(pavise, ring_of_protection).
+item_requires(pers, ring_of_health).
+item_requires(pers, void_stone).
+item_requires(phase_boots, blades_of_attack).
+item_requires(phase_boots, boots).
+item_requires(phase_boots, chainmail).
+item_requires(phylactery, diadem).
+item_requires(phylactery, point_booster).
+item_requires(pipe, cloak).
+item_requires(pipe, headdress).
+item_requires(pipe, ring_of_regen).
+item_requires(pipe, ring_of_tarrasque).
+item_requires(power_treads, belt_of_strength).
+item_requires(power_treads, boots).
+item_requires(power_treads, gloves).
+item_requires(radiance, relic).
+item_requires(radiance, talisman_of_evasion).
+item_requires(rapier, demon_edge).
+item_requires(rapier, relic).
+item_requires(refresher, cornucopia).
+item_requires(refresher, ring_of_tarrasque).
+item_requires(refresher, tiara_of_selemene).
+item_requires(revenants_brooch, blades_of_attack).
+item_requires(revenants_brooch, claymore).
+item_requires(revenants_brooch, lesser_crit).
+item_requires(revenants_brooch, voodoo_mask).
+item_requires(ring_of_basilius, sobi_mask).
+item_requires(rod_of_atos, staff_of_wizardry).
+item_requires(rod_of_atos, vitality_booster).
+item_requires(samurai_tabi, belt_of_strength).
+item_requires(samurai_tabi, boots_of_elves).
+item_requires(samurai_tabi, robe).
+item_requires(samurai_tabi, ultimate_orb).
+item_requires(sange, belt_of_strength).
+item_requires(sange, ogre_axe).
+item_requires(sange_and_yasha, belt_of_strength).
+item_requires(sange_and_yasha, blade_of_alacrity).
+item_requires(sange_and_yasha, boots_of_elves).
+item_requires(sange_and_yasha, ogre_axe).
+item_requires(sange_and_yasha, sange).
+item_requires(sange_and_yasha, yasha).
+item_requires(satanic, claymore).
+item_requires(satanic, lifesteal).
+item_requires(satanic, reaver).
+item_requires(sheepstick, mystic_staff).
+item_requires(sheepstick, tiara_of_selemene).
+item_requires(shivas_guard, crown).
+item_requires(shivas_guard, helm_of_iron_will).
+item_requires(shivas_guard, platemail).
+item_requires(shivas_guard, veil_of_discord).
+item_requires(silver_edge, blitz_knuckles).
+item_requires(silver_edge, claymore).
+item_requires(silver_edge, demon_edge).
+item_requires(silver_edge, invis_sword).
+item_requires(silver_edge, shadow_amulet).
+item_requires(skadi, orb_of_frost).
+item_requires(skadi, ultimate_orb).
+item_requires(solar_crest, crown).
+item_requires(solar_crest, energy_booster).
+item_requires(solar_crest, fluffy_hat).
+item_requires(solar_crest, pavise).
+item_requires(solar_crest, ring_of_protection).
+item_requires(solar_crest, wind_lace).
+item_requires(soul_booster, energy_booster).
+item_requires(soul_booster, point_booster).
+item_requires(soul_booster, vitality_booster).
+item_requires(soul_ring, gauntlets).
+item_requires(soul_ring, ring_of_protection).
+item_requires(sphere, pers).
+item_requires(sphere, ring_of_health).
+item_requires(sphere, ultimate_orb).
+item_requires(sphere, void_stone).
+item_requires(spirit_vessel, circlet).
+item_requires(spirit_vessel, diadem).
+item_requires(spirit_vessel, ring_of_protection).
+item_requires(spirit_vessel, sobi_mask).
+item_requires(spirit_vessel, urn_of_shadows).
+item_requires(swift_blink, blink).
+item_requires(swift_blink, eagle).
+item_requires(tranquil_boots, boots).
+item_requires(tranquil_boots, ring_of_regen).
+item_requires(tranquil_boots, wind_lace).
+item_requires(travel_boots, boots).
+item_requires(travel_boots_2, boots).
+item_requires(travel_boots_2, recipe_travel_boots).
+item_requires(travel_boots_2, travel_boots).
+item_requires(trident, belt_of_strength).
+item_requires(trident, blade_of_alacrity).
+item_requires(trident, boots_of_elves).
+item_requires(trident, kaya).
+item_requires(trident, ogre_axe).
+item_requires(trident, robe).
+item_requires(trident, sange).
+item_requires(trident, staff_of_wizardry).
+item_requires(trident, yasha).
+item_requires(ultimate_scepter, blade_of_alacrity).
+item_requires(ultimate_scepter, ogre_axe).
+item_requires(ultimate_scepter, point_booster).
+item_requires(ultimate_scepter, staff_of_wizardry).
+item_requires(ultimate_scepter_2, blade_of_alacrity).
+item_requires(ultimate_scepter_2, ogre_axe).
+item_requires(ultimate_scepter_2, point_booster).
+item_requires(ultimate_scepter_2, staff_of_wizardry).
+item_requires(ultimate_scepter_2, ultimate_scepter).
+item_requires(urn_of_shadows, circlet).
+item_requires(urn_of_shadows, ring_of_protection).
+item_requires(urn_of_shadows, sobi_mask).
+item_requires(vanguard, ring_of_health).
+item_requires(vanguard, vitality_booster).
+item_requires(veil_of_discord, crown).
+item_requires(veil_of_discord, helm_of_iron_will).
+item_requires(vladmir, blades_of_attack).
+item_requires(vladmir, buckler).
+item_requires(vladmir, lifesteal).
+item_requires(vladmir, ring_of_basilius).
+item_requires(vladmir, ring_of_protection).
+item_requires(vladmir, sobi_mask).
+item_requires(ward_dispenser, ward_observer).
+item_requires(ward_dispenser, ward_sentry).
+item_requires(wind_waker, cyclone).
+item_requires(wind_waker, mystic_staff).
+item_requires(wind_waker, staff_of_wizardry).
+item_requires(wind_waker, void_stone).
+item_requires(wind_waker, wind_lace).
+item_requires(witch_blade, blitz_knuckles).
+item_requires(witch_blade, chainmail).
+item_requires(witch_blade, oblivion_staff).
+item_requires(witch_blade, orb_of_venom).
+item_requires(witch_blade, robe).
+item_requires(witch_blade, sobi_mask).
+item_requires(witches_switch, buckler).
+item_requires(witches_switch, headdress).
+item_requires(witches_switch, ring_of_basilius).
+item_requires(witches_switch, ring_of_protection).
+item_requires(witches_switch, ring_of_regen).
+item_requires(witches_switch, sobi_mask).
+item_requires(wraith_band, circlet).
+item_requires(wraith_band, slippers).
+item_requires(wraith_pact, blades_of_attack).
+item_requires(wraith_pact, buckler).
+item_requires(wraith_pact, lifesteal).
+item_requires(wraith_pact, point_booster).
+item_requires(wraith_pact, ring_of_basilius).
+item_requires(wraith_pact, ring_of_protection).
+item_requires(wraith_pact, sobi_mask).
+item_requires(wraith_pact, vladmir).
+item_requires(yasha, blade_of_alacrity).
+item_requires(yasha, boots_of_elves).
+item_requires(yasha_and_kaya, blade_of_alacrity).
+item_requires(yasha_and_kaya, boots_of_elves).
+item_requires(yasha_and_kaya, kaya).
+item_requires(yasha_and_kaya, robe).
+item_requires(yasha_and_kaya, staff_of_wizardry).
+item_requires(yasha_and_kaya, yasha).
+
+% item_builds_into(Komponen, Item): transitif dari buildsInto
+item_builds_into(aether_lens, ethereal_blade).
+item_builds_into(ancient_janggo, boots_of_bearing).
+item_builds_into(arcane_boots, guardian_greaves).
+item_builds_into(basher, abyssal_blade).
+item_builds_into(belt_of_strength, abyssal_blade).
+item_builds_into(belt_of_strength, ancient_janggo).
+item_builds_into(belt_of_strength, basher).
+item_builds_into(belt_of_strength, boots_of_bearing).
+item_builds_into(belt_of_strength, dragon_lance).
+item_builds_into(belt_of_strength, hurricane_pike).
+item_builds_into(belt_of_strength, kaya_and_sange).
+item_builds_into(belt_of_strength, necronomicon).
+item_builds_into(belt_of_strength, necronomicon_2).
+item_builds_into(belt_of_strength, necronomicon_3).
+item_builds_into(belt_of_strength, power_treads).
+item_builds_into(belt_of_strength, samurai_tabi).
+item_builds_into(belt_of_strength, sange).
+item_builds_into(belt_of_strength, sange_and_yasha).
+item_builds_into(belt_of_strength, trident).
+item_builds_into(blade_of_alacrity, diffusal_blade).
+item_builds_into(blade_of_alacrity, diffusal_blade_2).
+item_builds_into(blade_of_alacrity, disperser).
+item_builds_into(blade_of_alacrity, dragon_lance).
+item_builds_into(blade_of_alacrity, hurricane_pike).
+item_builds_into(blade_of_alacrity, manta).
+item_builds_into(blade_of_alacrity, sange_and_yasha).
+item_builds_into(blade_of_alacrity, trident).
+item_builds_into(blade_of_alacrity, ultimate_scepter).
+item_builds_into(blade_of_alacrity, ultimate_scepter_2).
+item_builds_into(blade_of_alacrity, yasha).
+item_builds_into(blade_of_alacrity, yasha_and_kaya).
+item_builds_into(blades_of_attack, armlet).
+item_builds_into(blades_of_attack, falcon_blade).
+item_builds_into(blades_of_attack, greater_crit).
+item_builds_into(blades_of_attack, hermes_sandals).
+item_builds_into(blades_of_attack, lesser_crit).
+item_builds_into(blades_of_attack, phase_boots).
+item_builds_into(blades_of_attack, revenants_brooch).
+item_builds_into(blades_of_attack, vladmir).
+item_builds_into(blades_of_attack, wraith_pact).
+item_builds_into(blight_stone, desolator).
+item_builds_into(blight_stone, medallion_of_courage).
+item_builds_into(blight_stone, orb_of_corrosion).
+item_builds_into(blink, arcane_blink).
+item_builds_into(blink, overwhelming_blink).
+item_builds_into(blink, swift_blink).
+item_builds_into(blitz_knuckles, bloodthorn).
+item_builds_into(blitz_knuckles, devastator).
+item_builds_into(blitz_knuckles, invis_sword).
+item_builds_into(blitz_knuckles, monkey_king_bar).
+item_builds_into(blitz_knuckles, oblivion_staff).
+item_builds_into(blitz_knuckles, orchid).
+item_builds_into(blitz_knuckles, silver_edge).
+item_builds_into(blitz_knuckles, witch_blade).
+item_builds_into(boots, arcane_boots).
+item_builds_into(boots, boots_of_bearing).
+item_builds_into(boots, guardian_greaves).
+item_builds_into(boots, hermes_sandals).
+item_builds_into(boots, phase_boots).
+item_builds_into(boots, power_treads).
+item_builds_into(boots, tranquil_boots).
+item_builds_into(boots, travel_boots).
+item_builds_into(boots, travel_boots_2).
+item_builds_into(boots_of_elves, manta).
+item_builds_into(boots_of_elves, orb_of_corrosion).
+item_builds_into(boots_of_elves, samurai_tabi).
+item_builds_into(boots_of_elves, sange_and_yasha).
+item_builds_into(boots_of_elves, trident).
+item_builds_into(boots_of_elves, yasha).
+item_builds_into(boots_of_elves, yasha_and_kaya).
+item_builds_into(branches, holy_locket).
+item_builds_into(branches, magic_wand).
+item_builds_into(broadsword, bfury).
+item_builds_into(broadsword, blade_mail).
+item_builds_into(broadsword, echo_sabre).
+item_builds_into(broadsword, harpoon).
+item_builds_into(broadsword, mask_of_madness).
+item_builds_into(buckler, assault).
+item_builds_into(buckler, guardian_greaves).
+item_builds_into(buckler, vladmir).
+item_builds_into(buckler, witches_switch).
+item_builds_into(buckler, wraith_pact).
+item_builds_into(chainmail, blade_mail).
+item_builds_into(chainmail, devastator).
+item_builds_into(chainmail, guardian_greaves).
+item_builds_into(chainmail, hermes_sandals).
+item_builds_into(chainmail, medallion_of_courage).
+item_builds_into(chainmail, mekansm).
+item_builds_into(chainmail, phase_boots).
+item_builds_into(chainmail, witch_blade).
+item_builds_into(circlet, bracer).
+item_builds_into(circlet, null_talisman).
+item_builds_into(circlet, spirit_vessel).
+item_builds_into(circlet, urn_of_shadows).
+item_builds_into(circlet, wraith_band).
+item_builds_into(claymore, butterfly).
+item_builds_into(claymore, greater_crit).
+item_builds_into(claymore, invis_sword).
+item_builds_into(claymore, lesser_crit).
+item_builds_into(claymore, revenants_brooch).
+item_builds_into(claymore, satanic).
+item_builds_into(claymore, silver_edge).
+item_builds_into(cloak, eternal_shroud).
+item_builds_into(cloak, glimmer_cape).
+item_builds_into(cloak, lunar_crest).
+item_builds_into(cloak, mage_slayer).
+item_builds_into(cloak, pipe).
+item_builds_into(cornucopia, bfury).
+item_builds_into(cornucopia, bloodthorn).
+item_builds_into(cornucopia, mage_slayer).
+item_builds_into(cornucopia, orchid).
+item_builds_into(cornucopia, refresher).
+item_builds_into(crown, heavens_halberd).
+item_builds_into(crown, helm_of_the_dominator).
+item_builds_into(crown, helm_of_the_overlord).
+item_builds_into(crown, meteor_hammer).
+item_builds_into(crown, shivas_guard).
+item_builds_into(crown, solar_crest).
+item_builds_into(crown, veil_of_discord).
+item_builds_into(cyclone, wind_waker).
+item_builds_into(demon_edge, greater_crit).
+item_builds_into(demon_edge, monkey_king_bar).
+item_builds_into(demon_edge, rapier).
+item_builds_into(demon_edge, silver_edge).
+item_builds_into(diadem, angels_demise).
+item_builds_into(diadem, dagon).
+item_builds_into(diadem, harpoon).
+item_builds_into(diadem, holy_locket).
+item_builds_into(diadem, manta).
+item_builds_into(diadem, phylactery).
+item_builds_into(diadem, spirit_vessel).
+item_builds_into(diffusal_blade, diffusal_blade_2).
+item_builds_into(diffusal_blade, disperser).
+item_builds_into(dragon_lance, hurricane_pike).
+item_builds_into(eagle, butterfly).
+item_builds_into(eagle, disperser).
+item_builds_into(eagle, hermes_sandals).
+item_builds_into(eagle, swift_blink).
+item_builds_into(echo_sabre, harpoon).
+item_builds_into(energy_booster, aeon_disk).
+item_builds_into(energy_booster, aether_lens).
+item_builds_into(energy_booster, bloodstone).
+item_builds_into(energy_booster, ethereal_blade).
+item_builds_into(energy_booster, lotus_orb).
+item_builds_into(energy_booster, octarine_core).
+item_builds_into(energy_booster, pavise).
+item_builds_into(energy_booster, solar_crest).
+item_builds_into(energy_booster, soul_booster).
+item_builds_into(famango, great_famango).
+item_builds_into(famango, greater_famango).
+item_builds_into(fluffy_hat, falcon_blade).
+item_builds_into(fluffy_hat, force_staff).
+item_builds_into(fluffy_hat, hurricane_pike).
+item_builds_into(fluffy_hat, pavise).
+item_builds_into(fluffy_hat, solar_crest).
+item_builds_into(force_staff, hurricane_pike).
+item_builds_into(gauntlets, bracer).
+item_builds_into(gauntlets, soul_ring).
+item_builds_into(ghost, ethereal_blade).
+item_builds_into(gloves, armlet).
+item_builds_into(gloves, hand_of_midas).
+item_builds_into(gloves, maelstrom).
+item_builds_into(gloves, mage_slayer).
+item_builds_into(gloves, mjollnir).
+item_builds_into(gloves, power_treads).
+item_builds_into(great_famango, greater_famango).
+item_builds_into(headdress, guardian_greaves).
+item_builds_into(headdress, mekansm).
+item_builds_into(headdress, pipe).
+item_builds_into(headdress, witches_switch).
+item_builds_into(helm_of_iron_will, armlet).
+item_builds_into(helm_of_iron_will, crimson_guard).
+item_builds_into(helm_of_iron_will, helm_of_the_dominator).
+item_builds_into(helm_of_iron_will, helm_of_the_overlord).
+item_builds_into(helm_of_iron_will, nullifier).
+item_builds_into(helm_of_iron_will, shivas_guard).
+item_builds_into(helm_of_iron_will, veil_of_discord).
+item_builds_into(helm_of_the_dominator, helm_of_the_overlord).
+item_builds_into(hyperstone, assault).
+item_builds_into(hyperstone, bloodthorn).
+item_builds_into(hyperstone, mjollnir).
+item_builds_into(hyperstone, moon_shard).
+item_builds_into(invis_sword, silver_edge).
+item_builds_into(javelin, bloodthorn).
+item_builds_into(javelin, maelstrom).
+item_builds_into(javelin, mjollnir).
+item_builds_into(javelin, monkey_king_bar).
+item_builds_into(kaya, kaya_and_sange).
+item_builds_into(kaya, meteor_hammer).
+item_builds_into(kaya, trident).
+item_builds_into(kaya, yasha_and_kaya).
+item_builds_into(lesser_crit, greater_crit).
+item_builds_into(lesser_crit, revenants_brooch).
+item_builds_into(lifesteal, mask_of_madness).
+item_builds_into(lifesteal, satanic).
+item_builds_into(lifesteal, vladmir).
+item_builds_into(lifesteal, wraith_pact).
+item_builds_into(maelstrom, mjollnir).
+item_builds_into(magic_stick, holy_locket).
+item_builds_into(magic_stick, magic_wand).
+item_builds_into(magic_wand, holy_locket).
+item_builds_into(mantle, null_talisman).
+item_builds_into(mekansm, guardian_greaves).
+item_builds_into(mithril_hammer, abyssal_blade).
+item_builds_into(mithril_hammer, basher).
+item_builds_into(mithril_hammer, black_king_bar).
+item_builds_into(mithril_hammer, desolator).
+item_builds_into(mithril_hammer, maelstrom).
+item_builds_into(mithril_hammer, mjollnir).
+item_builds_into(mystic_staff, arcane_blink).
+item_builds_into(mystic_staff, devastator).
+item_builds_into(mystic_staff, sheepstick).
+item_builds_into(mystic_staff, wind_waker).
+item_builds_into(necronomicon, necronomicon_2).
+item_builds_into(necronomicon, necronomicon_3).
+item_builds_into(necronomicon_2, necronomicon_3).
+item_builds_into(oblivion_staff, bloodthorn).
+item_builds_into(oblivion_staff, devastator).
+item_builds_into(oblivion_staff, orchid).
+item_builds_into(oblivion_staff, witch_blade).
+item_builds_into(ogre_axe, abyssal_blade).
+item_builds_into(ogre_axe, black_king_bar).
+item_builds_into(ogre_axe, echo_sabre).
+item_builds_into(ogre_axe, eternal_shroud).
+item_builds_into(ogre_axe, harpoon).
+item_builds_into(ogre_axe, kaya_and_sange).
+item_builds_into(ogre_axe, sange).
+item_builds_into(ogre_axe, sange_and_yasha).
+item_builds_into(ogre_axe, trident).
+item_builds_into(ogre_axe, ultimate_scepter).
+item_builds_into(ogre_axe, ultimate_scepter_2).
+item_builds_into(orb_of_frost, orb_of_corrosion).
+item_builds_into(orb_of_frost, skadi).
+item_builds_into(orb_of_venom, devastator).
+item_builds_into(orb_of_venom, mage_slayer).
+item_builds_into(orb_of_venom, witch_blade).
+item_builds_into(orchid, bloodthorn).
+item_builds_into(pavise, solar_crest).
+item_builds_into(pers, lotus_orb).
+item_builds_into(pers, sphere).
+item_builds_into(phase_boots, hermes_sandals).
+item_builds_into(phylactery, angels_demise).
+item_builds_into(platemail, assault).
+item_builds_into(platemail, lotus_orb).
+item_builds_into(platemail, shivas_guard).
+item_builds_into(point_booster, angels_demise).
+item_builds_into(point_booster, bloodstone).
+item_builds_into(point_booster, gungir).
+item_builds_into(point_booster, octarine_core).
+item_builds_into(point_booster, phylactery).
+item_builds_into(point_booster, soul_booster).
+item_builds_into(point_booster, ultimate_scepter).
+item_builds_into(point_booster, ultimate_scepter_2).
+item_builds_into(point_booster, wraith_pact).
+item_builds_into(quelling_blade, bfury).
+item_builds_into(quelling_blade, iron_talon).
+item_builds_into(reaver, heart).
+item_builds_into(reaver, overwhelming_blink).
+item_builds_into(reaver, satanic).
+item_builds_into(recipe_diffusal_blade, diffusal_blade_2).
+item_builds_into(recipe_necronomicon, necronomicon_2).
+item_builds_into(recipe_necronomicon, necronomicon_3).
+item_builds_into(recipe_travel_boots, travel_boots_2).
+item_builds_into(relic, nullifier).
+item_builds_into(relic, radiance).
+item_builds_into(relic, rapier).
+item_builds_into(ring_of_basilius, arcane_boots).
+item_builds_into(ring_of_basilius, guardian_greaves).
+item_builds_into(ring_of_basilius, vladmir).
+item_builds_into(ring_of_basilius, witches_switch).
+item_builds_into(ring_of_basilius, wraith_pact).
+item_builds_into(ring_of_health, crimson_guard).
+item_builds_into(ring_of_health, heavens_halberd).
+item_builds_into(ring_of_health, lotus_orb).
+item_builds_into(ring_of_health, pers).
+item_builds_into(ring_of_health, sphere).
+item_builds_into(ring_of_health, vanguard).
+item_builds_into(ring_of_protection, assault).
+item_builds_into(ring_of_protection, buckler).
+item_builds_into(ring_of_protection, guardian_greaves).
+item_builds_into(ring_of_protection, iron_talon).
+item_builds_into(ring_of_protection, pavise).
+item_builds_into(ring_of_protection, solar_crest).
+item_builds_into(ring_of_protection, soul_ring).
+item_builds_into(ring_of_protection, spirit_vessel).
+item_builds_into(ring_of_protection, urn_of_shadows).
+item_builds_into(ring_of_protection, vladmir).
+item_builds_into(ring_of_protection, witches_switch).
+item_builds_into(ring_of_protection, wraith_pact).
+item_builds_into(ring_of_regen, boots_of_bearing).
+item_builds_into(ring_of_regen, guardian_greaves).
+item_builds_into(ring_of_regen, headdress).
+item_builds_into(ring_of_regen, mekansm).
+item_builds_into(ring_of_regen, pipe).
+item_builds_into(ring_of_regen, tranquil_boots).
+item_builds_into(ring_of_regen, witches_switch).
+item_builds_into(ring_of_tarrasque, heart).
+item_builds_into(ring_of_tarrasque, pipe).
+item_builds_into(ring_of_tarrasque, refresher).
+item_builds_into(robe, ancient_janggo).
+item_builds_into(robe, bloodthorn).
+item_builds_into(robe, boots_of_bearing).
+item_builds_into(robe, devastator).
+item_builds_into(robe, diffusal_blade).
+item_builds_into(robe, diffusal_blade_2).
+item_builds_into(robe, disperser).
+item_builds_into(robe, kaya).
+item_builds_into(robe, kaya_and_sange).
+item_builds_into(robe, meteor_hammer).
+item_builds_into(robe, oblivion_staff).
+item_builds_into(robe, orchid).
+item_builds_into(robe, samurai_tabi).
+item_builds_into(robe, trident).
+item_builds_into(robe, witch_blade).
+item_builds_into(robe, yasha_and_kaya).
+item_builds_into(rod_of_atos, gungir).
+item_builds_into(sange, abyssal_blade).
+item_builds_into(sange, kaya_and_sange).
+item_builds_into(sange, sange_and_yasha).
+item_builds_into(sange, trident).
+item_builds_into(shadow_amulet, glimmer_cape).
+item_builds_into(shadow_amulet, invis_sword).
+item_builds_into(shadow_amulet, silver_edge).
+item_builds_into(slippers, wraith_band).
+item_builds_into(sobi_mask, arcane_boots).
+item_builds_into(sobi_mask, bloodthorn).
+item_builds_into(sobi_mask, devastator).
+item_builds_into(sobi_mask, falcon_blade).
+item_builds_into(sobi_mask, guardian_greaves).
+item_builds_into(sobi_mask, medallion_of_courage).
+item_builds_into(sobi_mask, necronomicon).
+item_builds_into(sobi_mask, necronomicon_2).
+item_builds_into(sobi_mask, necronomicon_3).
+item_builds_into(sobi_mask, oblivion_staff).
+item_builds_into(sobi_mask, orchid).
+item_builds_into(sobi_mask, ring_of_basilius).
+item_builds_into(sobi_mask, spirit_vessel).
+item_builds_into(sobi_mask, urn_of_shadows).
+item_builds_into(sobi_mask, vladmir).
+item_builds_into(sobi_mask, witch_blade).
+item_builds_into(sobi_mask, witches_switch).
+item_builds_into(sobi_mask, wraith_pact).
+item_builds_into(soul_booster, bloodstone).
+item_builds_into(soul_booster, octarine_core).
+item_builds_into(staff_of_wizardry, cyclone).
+item_builds_into(staff_of_wizardry, force_staff).
+item_builds_into(staff_of_wizardry, gungir).
+item_builds_into(staff_of_wizardry, hurricane_pike).
+item_builds_into(staff_of_wizardry, kaya).
+item_builds_into(staff_of_wizardry, kaya_and_sange).
+item_builds_into(staff_of_wizardry, meteor_hammer).
+item_builds_into(staff_of_wizardry, rod_of_atos).
+item_builds_into(staff_of_wizardry, trident).
+item_builds_into(staff_of_wizardry, ultimate_scepter).
+item_builds_into(staff_of_wizardry, ultimate_scepter_2).
+item_builds_into(staff_of_wizardry, wind_waker).
+item_builds_into(staff_of_wizardry, yasha_and_kaya).
+item_builds_into(talisman_of_evasion, butterfly).
+item_builds_into(talisman_of_evasion, radiance).
+item_builds_into(tiara_of_selemene, angels_demise).
+item_builds_into(tiara_of_selemene, octarine_core).
+item_builds_into(tiara_of_selemene, refresher).
+item_builds_into(tiara_of_selemene, sheepstick).
+item_builds_into(tranquil_boots, boots_of_bearing).
+item_builds_into(travel_boots, travel_boots_2).
+item_builds_into(ultimate_orb, helm_of_the_overlord).
+item_builds_into(ultimate_orb, samurai_tabi).
+item_builds_into(ultimate_orb, skadi).
+item_builds_into(ultimate_orb, sphere).
+item_builds_into(ultimate_scepter, ultimate_scepter_2).
+item_builds_into(urn_of_shadows, spirit_vessel).
+item_builds_into(vanguard, crimson_guard).
+item_builds_into(vanguard, heavens_halberd).
+item_builds_into(veil_of_discord, shivas_guard).
+item_builds_into(vitality_booster, aeon_disk).
+item_builds_into(vitality_booster, bloodstone).
+item_builds_into(vitality_booster, crimson_guard).
+item_builds_into(vitality_booster, eternal_shroud).
+item_builds_into(vitality_booster, gungir).
+item_builds_into(vitality_booster, heavens_halberd).
+item_builds_into(vitality_booster, lunar_crest).
+item_builds_into(vitality_booster, octarine_core).
+item_builds_into(vitality_booster, rod_of_atos).
+item_builds_into(vitality_booster, soul_booster).
+item_builds_into(vitality_booster, vanguard).
+item_builds_into(vladmir, wraith_pact).
+item_builds_into(void_stone, aether_lens).
+item_builds_into(void_stone, bloodstone).
+item_builds_into(void_stone, cyclone).
+item_builds_into(void_stone, echo_sabre).
+item_builds_into(void_stone, ethereal_blade).
+item_builds_into(void_stone, harpoon).
+item_builds_into(void_stone, lotus_orb).
+item_builds_into(void_stone, pers).
+item_builds_into(void_stone, sphere).
+item_builds_into(void_stone, wind_waker).
+item_builds_into(voodoo_mask, bloodstone).
+item_builds_into(voodoo_mask, dagon).
+item_builds_into(voodoo_mask, revenants_brooch).
+item_builds_into(ward_observer, ward_dispenser).
+item_builds_into(ward_sentry, ward_dispenser).
+item_builds_into(wind_lace, ancient_janggo).
+item_builds_into(wind_lace, boots_of_bearing).
+item_builds_into(wind_lace, cyclone).
+item_builds_into(wind_lace, lunar_crest).
+item_builds_into(wind_lace, solar_crest).
+item_builds_into(wind_lace, tranquil_boots).
+item_builds_into(wind_lace, wind_waker).
+item_builds_into(witch_blade, devastator).
+item_builds_into(yasha, manta).
+item_builds_into(yasha, sange_and_yasha).
+item_builds_into(yasha, trident).
+item_builds_into(yasha, yasha_and_kaya).
+
+% item_base_component(Item, KomponenDasar, Jumlah)
+item_base_component(abyssal_blade, belt_of_strength, 2).
+item_base_component(abyssal_blade, mithril_hammer, 1).
+item_base_component(abyssal_blade, ogre_axe, 1).
+item_base_component(aeon_disk, energy_booster, 1).
+item_base_component(aeon_disk, vitality_booster, 1).
+item_base_component(aether_lens, energy_booster, 1).
+item_base_component(aether_lens, void_stone, 1).
+item_base_component(ancient_janggo, belt_of_strength, 1).
+item_base_component(ancient_janggo, robe, 1).
+item_base_component(ancient_janggo, wind_lace, 1).
+item_base_component(angels_demise, diadem, 1).
+item_base_component(angels_demise, point_booster, 1).
+item_base_component(angels_demise, tiara_of_selemene, 1).
+item_base_component(arcane_blink, blink, 1).
+item_base_component(arcane_blink, mystic_staff, 1).
+item_base_component(arcane_boots, boots, 1).
+item_base_component(arcane_boots, sobi_mask, 1).
+item_base_component(armlet, blades_of_attack, 1).
+item_base_component(armlet, gloves, 1).
+item_base_component(armlet, helm_of_iron_will, 1).
+item_base_component(assault, hyperstone, 1).
+item_base_component(assault, platemail, 1).
+item_base_component(assault, ring_of_protection, 1).
+item_base_component(basher, belt_of_strength, 1).
+item_base_component(basher, mithril_hammer, 1).
+item_base_component(bfury, broadsword, 2).
+item_base_component(bfury, cornucopia, 1).
+item_base_component(bfury, quelling_blade, 1).
+item_base_component(black_king_bar, mithril_hammer, 1).
+item_base_component(black_king_bar, ogre_axe, 1).
+item_base_component(blade_mail, broadsword, 1).
+item_base_component(blade_mail, chainmail, 1).
+item_base_component(bloodstone, energy_booster, 1).
+item_base_component(bloodstone, point_booster, 1).
+item_base_component(bloodstone, vitality_booster, 1).
+item_base_component(bloodstone, void_stone, 1).
+item_base_component(bloodstone, voodoo_mask, 1).
+item_base_component(bloodthorn, blitz_knuckles, 1).
+item_base_component(bloodthorn, cornucopia, 1).
+item_base_component(bloodthorn, hyperstone, 1).
+item_base_component(bloodthorn, javelin, 1).
+item_base_component(bloodthorn, robe, 1).
+item_base_component(bloodthorn, sobi_mask, 1).
+item_base_component(boots_of_bearing, belt_of_strength, 1).
+item_base_component(boots_of_bearing, boots, 1).
+item_base_component(boots_of_bearing, ring_of_regen, 1).
+item_base_component(boots_of_bearing, robe, 1).
+item_base_component(boots_of_bearing, wind_lace, 2).
+item_base_component(bracer, circlet, 1).
+item_base_component(bracer, gauntlets, 1).
+item_base_component(buckler, ring_of_protection, 1).
+item_base_component(butterfly, claymore, 1).
+item_base_component(butterfly, eagle, 1).
+item_base_component(butterfly, talisman_of_evasion, 1).
+item_base_component(crimson_guard, helm_of_iron_will, 1).
+item_base_component(crimson_guard, ring_of_health, 1).
+item_base_component(crimson_guard, vitality_booster, 1).
+item_base_component(cyclone, staff_of_wizardry, 1).
+item_base_component(cyclone, void_stone, 1).
+item_base_component(cyclone, wind_lace, 1).
+item_base_component(dagon, diadem, 1).
+item_base_component(dagon, voodoo_mask, 1).
+item_base_component(desolator, blight_stone, 1).
+item_base_component(desolator, mithril_hammer, 2).
+item_base_component(devastator, blitz_knuckles, 1).
+item_base_component(devastator, chainmail, 1).
+item_base_component(devastator, mystic_staff, 1).
+item_base_component(devastator, orb_of_venom, 1).
+item_base_component(devastator, robe, 1).
+item_base_component(devastator, sobi_mask, 1).
+item_base_component(diffusal_blade, blade_of_alacrity, 1).
+item_base_component(diffusal_blade, robe, 1).
+item_base_component(diffusal_blade_2, blade_of_alacrity, 1).
+item_base_component(diffusal_blade_2, recipe_diffusal_blade, 1).
+item_base_component(diffusal_blade_2, robe, 1).
+item_base_component(disperser, blade_of_alacrity, 1).
+item_base_component(disperser, eagle, 1).
+item_base_component(disperser, robe, 1).
+item_base_component(dragon_lance, belt_of_strength, 1).
+item_base_component(dragon_lance, blade_of_alacrity, 1).
+item_base_component(echo_sabre, broadsword, 1).
+item_base_component(echo_sabre, ogre_axe, 1).
+item_base_component(echo_sabre, void_stone, 1).
+item_base_component(eternal_shroud, cloak, 1).
+item_base_component(eternal_shroud, ogre_axe, 1).
+item_base_component(eternal_shroud, vitality_booster, 1).
+item_base_component(ethereal_blade, energy_booster, 1).
+item_base_component(ethereal_blade, ghost, 1).
+item_base_component(ethereal_blade, void_stone, 1).
+item_base_component(falcon_blade, blades_of_attack, 1).
+item_base_component(falcon_blade, fluffy_hat, 1).
+item_base_component(falcon_blade, sobi_mask, 1).
+item_base_component(force_staff, fluffy_hat, 1).
+item_base_component(force_staff, staff_of_wizardry, 1).
+item_base_component(glimmer_cape, cloak, 1).
+item_base_component(glimmer_cape, shadow_amulet, 1).
+item_base_component(great_famango, famango, 3).
+item_base_component(greater_crit, blades_of_attack, 1).
+item_base_component(greater_crit, claymore, 1).
+item_base_component(greater_crit, demon_edge, 1).
+item_base_component(greater_famango, famango, 6).
+item_base_component(guardian_greaves, boots, 1).
+item_base_component(guardian_greaves, chainmail, 1).
+item_base_component(guardian_greaves, ring_of_protection, 1).
+item_base_component(guardian_greaves, ring_of_regen, 1).
+item_base_component(guardian_greaves, sobi_mask, 1).
+item_base_component(gungir, point_booster, 1).
+item_base_component(gungir, staff_of_wizardry, 1).
+item_base_component(gungir, vitality_booster, 1).
+item_base_component(hand_of_midas, gloves, 1).
+item_base_component(harpoon, broadsword, 1).
+item_base_component(harpoon, diadem, 1).
+item_base_component(harpoon, ogre_axe, 1).
+item_base_component(harpoon, void_stone, 1).
+item_base_component(headdress, ring_of_regen, 1).
+item_base_component(heart, reaver, 1).
+item_base_component(heart, ring_of_tarrasque, 1).
+item_base_component(heavens_halberd, crown, 1).
+item_base_component(heavens_halberd, ring_of_health, 1).
+item_base_component(heavens_halberd, vitality_booster, 1).
+item_base_component(helm_of_the_dominator, crown, 1).
+item_base_component(helm_of_the_dominator, helm_of_iron_will, 1).
+item_base_component(helm_of_the_overlord, crown, 1).
+item_base_component(helm_of_the_overlord, helm_of_iron_will, 1).
+item_base_component(helm_of_the_overlord, ultimate_orb, 1).
+item_base_component(hermes_sandals, blades_of_attack, 1).
+item_base_component(hermes_sandals, boots, 1).
+item_base_component(hermes_sandals, chainmail, 1).
+item_base_component(hermes_sandals, eagle, 1).
+item_base_component(holy_locket, branches, 2).
+item_base_component(holy_locket, diadem, 1).
+item_base_component(holy_locket, magic_stick, 1).
+item_base_component(hurricane_pike, belt_of_strength, 1).
+item_base_component(hurricane_pike, blade_of_alacrity, 1).
+item_base_component(hurricane_pike, fluffy_hat, 1).
+item_base_component(hurricane_pike, staff_of_wizardry, 1).
+item_base_component(invis_sword, blitz_knuckles, 1).
+item_base_component(invis_sword, claymore, 1).
+item_base_component(invis_sword, shadow_amulet, 1).
+item_base_component(iron_talon, quelling_blade, 1).
+item_base_component(iron_talon, ring_of_protection, 1).
+item_base_component(kaya, robe, 1).
+item_base_component(kaya, staff_of_wizardry, 1).
+item_base_component(kaya_and_sange, belt_of_strength, 1).
+item_base_component(kaya_and_sange, ogre_axe, 1).
+item_base_component(kaya_and_sange, robe, 1).
+item_base_component(kaya_and_sange, staff_of_wizardry, 1).
+item_base_component(lesser_crit, blades_of_attack, 1).
+item_base_component(lesser_crit, claymore, 1).
+item_base_component(lotus_orb, energy_booster, 1).
+item_base_component(lotus_orb, platemail, 1).
+item_base_component(lotus_orb, ring_of_health, 1).
+item_base_component(lotus_orb, void_stone, 1).
+item_base_component(lunar_crest, cloak, 1).
+item_base_component(lunar_crest, vitality_booster, 1).
+item_base_component(lunar_crest, wind_lace, 1).
+item_base_component(maelstrom, gloves, 1).
+item_base_component(maelstrom, javelin, 1).
+item_base_component(maelstrom, mithril_hammer, 1).
+item_base_component(mage_slayer, cloak, 1).
+item_base_component(mage_slayer, cornucopia, 1).
+item_base_component(mage_slayer, gloves, 1).
+item_base_component(mage_slayer, orb_of_venom, 1).
+item_base_component(magic_wand, branches, 2).
+item_base_component(magic_wand, magic_stick, 1).
+item_base_component(manta, blade_of_alacrity, 1).
+item_base_component(manta, boots_of_elves, 1).
+item_base_component(manta, diadem, 1).
+item_base_component(mask_of_madness, broadsword, 1).
+item_base_component(mask_of_madness, lifesteal, 1).
+item_base_component(medallion_of_courage, blight_stone, 1).
+item_base_component(medallion_of_courage, chainmail, 1).
+item_base_component(medallion_of_courage, sobi_mask, 1).
+item_base_component(mekansm, chainmail, 1).
+item_base_component(mekansm, ring_of_regen, 1).
+item_base_component(meteor_hammer, crown, 1).
+item_base_component(meteor_hammer, robe, 1).
+item_base_component(meteor_hammer, staff_of_wizardry, 1).
+item_base_component(mjollnir, gloves, 1).
+item_base_component(mjollnir, hyperstone, 1).
+item_base_component(mjollnir, javelin, 1).
+item_base_component(mjollnir, mithril_hammer, 1).
+item_base_component(monkey_king_bar, blitz_knuckles, 1).
+item_base_component(monkey_king_bar, demon_edge, 1).
+item_base_component(monkey_king_bar, javelin, 1).
+item_base_component(moon_shard, hyperstone, 2).
+item_base_component(necronomicon, belt_of_strength, 1).
+item_base_component(necronomicon, sobi_mask, 2).
+item_base_component(necronomicon_2, belt_of_strength, 1).
+item_base_component(necronomicon_2, recipe_necronomicon, 1).
+item_base_component(necronomicon_2, sobi_mask, 2).
+item_base_component(necronomicon_3, belt_of_strength, 1).
+item_base_component(necronomicon_3, recipe_necronomicon, 2).
+item_base_component(necronomicon_3, sobi_mask, 2).
+item_base_component(null_talisman, circlet, 1).
+item_base_component(null_talisman, mantle, 1).
+item_base_component(nullifier, helm_of_iron_will, 1).
+item_base_component(nullifier, relic, 1).
+item_base_component(oblivion_staff, blitz_knuckles, 1).
+item_base_component(oblivion_staff, robe, 1).
+item_base_component(oblivion_staff, sobi_mask, 1).
+item_base_component(octarine_core, energy_booster, 1).
+item_base_component(octarine_core, point_booster, 1).
+item_base_component(octarine_core, tiara_of_selemene, 1).
+item_base_component(octarine_core, vitality_booster, 1).
+item_base_component(orb_of_corrosion, blight_stone, 1).
+item_base_component(orb_of_corrosion, boots_of_elves, 1).
+item_base_component(orb_of_corrosion, orb_of_frost, 1).
+item_base_component(orchid, blitz_knuckles, 1).
+item_base_component(orchid, cornucopia, 1).
+item_base_component(orchid, robe, 1).
+item_base_component(orchid, sobi_mask, 1).
+item_base_component(overwhelming_blink, blink, 1).
+item_base_component(overwhelming_blink, reaver, 1).
+item_base_component(pavise, energy_booster, 1).
+item_base_component(pavise, fluffy_hat, 1).
+item_base_component(pavise, ring_of_protection, 1).
+item_base_component(pers, ring_of_health, 1).
+item_base_component(pers, void_stone, 1).
+item_base_component(phase_boots, blades_of_attack, 1).
+item_base_component(phase_boots, boots, 1).
+item_base_component(phase_boots, chainmail, 1).
+item_base_component(phylactery, diadem, 1).
+item_base_component(phylactery, point_booster, 1).
+item_base_component(pipe, cloak, 1).
+item_base_component(pipe, ring_of_regen, 1).
+item_base_component(pipe, ring_of_tarrasque, 1).
+item_base_component(power_treads, belt_of_strength, 1).
+item_base_component(power_treads, boots, 1).
+item_base_component(power_treads, gloves, 1).
+item_base_component(radiance, relic, 1).
+item_base_component(radiance, talisman_of_evasion, 1).
+item_base_component(rapier, demon_edge, 1).
+item_base_component(rapier, relic, 1).
+item_base_component(refresher, cornucopia, 1).
+item_base_component(refresher, ring_of_tarrasque, 1).
+item_base_component(refresher, tiara_of_selemene, 1).
+item_base_component(revenants_brooch, blades_of_attack, 1).
+item_base_component(revenants_brooch, claymore, 1).
+item_base_component(revenants_brooch, voodoo_mask, 1).
+item_base_component(ring_of_basilius, sobi_mask, 1).
+item_base_component(rod_of_atos, staff_of_wizardry, 1).
+item_base_component(rod_of_atos, vitality_booster, 1).
+item_base_component(samurai_tabi, belt_of_strength, 1).
+item_base_component(samurai_tabi, boots_of_elves, 1).
+item_base_component(samurai_tabi, robe, 1).
+item_base_component(samurai_tabi, ultimate_orb, 1).
+item_base_component(sange, belt_of_strength, 1).
+item_base_component(sange, ogre_axe, 1).
+item_base_component(sange_and_yasha, belt_of_strength, 1).
+item_base_component(sange_and_yasha, blade_of_alacrity, 1).
+item_base_component(sange_and_yasha, boots_of_elves, 1).
+item_base_component(sange_and_yasha, ogre_axe, 1).
+item_base_component(satanic, claymore, 1).
+item_base_component(satanic, lifesteal, 1).
+item_base_component(satanic, reaver, 1).
+item_base_component(sheepstick, mystic_staff, 1).
+item_base_component(sheepstick, tiara_of_selemene, 1).
+item_base_component(shivas_guard, crown, 1).
+item_base_component(shivas_guard, helm_of_iron_will, 1).
+item_base_component(shivas_guard, platemail, 1).
+item_base_component(silver_edge, blitz_knuckles, 1).
+item_base_component(silver_edge, claymore, 1).
+item_base_component(silver_edge, demon_edge, 1).
+item_base_component(silver_edge, shadow_amulet, 1).
+item_base_component(skadi, orb_of_frost, 1).
+item_base_component(skadi, ultimate_orb, 2).
+item_base_component(solar_crest, crown, 1).
+item_base_component(solar_crest, energy_booster, 1).
+item_base_component(solar_crest, fluffy_hat, 1).
+item_base_component(solar_crest, ring_of_protection, 1).
+item_base_component(solar_crest, wind_lace, 1).
+item_base_component(soul_booster, energy_booster, 1).
+item_base_component(soul_booster, point_booster, 1).
+item_base_component(soul_booster, vitality_booster, 1).
+item_base_component(soul_ring, gauntlets, 2).
+item_base_component(soul_ring, ring_of_protection, 1).
+item_base_component(sphere, ring_of_health, 1).
+item_base_component(sphere, ultimate_orb, 1).
+item_base_component(sphere, void_stone, 1).
+item_base_component(spirit_vessel, circlet, 1).
+item_base_component(spirit_vessel, diadem, 1).
+item_base_component(spirit_vessel, ring_of_protection, 1).
+item_base_component(spirit_vessel, sobi_mask, 1).
+item_base_component(swift_blink, blink, 1).
+item_base_component(swift_blink, eagle, 1).
+item_base_component(tranquil_boots, boots, 1).
+item_base_component(tranquil_boots, ring_of_regen, 1).
+item_base_component(tranquil_boots, wind_lace, 1).
+item_base_component(travel_boots, boots, 1).
+item_base_component(travel_boots_2, boots, 1).
+item_base_component(travel_boots_2, recipe_travel_boots, 1).
+item_base_component(trident, belt_of_strength, 1).
+item_base_component(trident, blade_of_alacrity, 1).
+item_base_component(trident, boots_of_elves, 1).
+item_base_component(trident, ogre_axe, 1).
+item_base_component(trident, robe, 1).
+item_base_component(trident, staff_of_wizardry, 1).
+item_base_component(ultimate_scepter, blade_of_alacrity, 1).
+item_base_component(ultimate_scepter, ogre_axe, 1).
+item_base_component(ultimate_scepter, point_booster, 1).
+item_base_component(ultimate_scepter, staff_of_wizardry, 1).
+item_base_component(ultimate_scepter_2, blade_of_alacrity, 1).
+item_base_component(ultimate_scepter_2, ogre_axe, 1).
+item_base_component(ultimate_scepter_2, point_booster, 1).
+item_base_component(ultimate_scepter_2, staff_of_wizardry, 1).
+item_base_component(urn_of_shadows, circlet, 1).
+item_base_component(urn_of_shadows, ring_of_protection, 1).
+item_base_component(urn_of_shadows, sobi_mask, 1).
+item_base_component(vanguard, ring_of_health, 1).
+item_base_component(vanguard, vitality_booster, 1).
+item_base_component(veil_of_discord, crown, 1).
+item_base_component(veil_of_discord, helm_of_iron_will, 1).
+item_base_component(vladmir, blades_of_attack, 1).
+item_base_component(vladmir, lifesteal, 1).
+item_base_component(vladmir, ring_of_protection, 1).
+item_base_component(vladmir, sobi_mask, 1).
+item_base_component(ward_dispenser, ward_observer, 1).
+item_base_component(ward_dispenser, ward_sentry, 1).
+item_base_component(wind_waker, mystic_staff, 1).
+item_base_component(wind_waker, staff_of_wizardry, 1).
+item_base_component(wind_waker, void_stone, 1).
+item_base_component(wind_waker, wind_lace, 1).
+item_base_component(witch_blade, blitz_knuckles, 1).
+item_base_component(witch_blade, chainmail, 1).
+item_base_component(witch_blade, orb_of_venom, 1).
+item_base_component(witch_blade, robe, 1).
+item_base_component(witch_blade, sobi_mask, 1).
+item_base_component(witches_switch, ring_of_protection, 1).
+item_base_component(witches_switch, ring_of_regen, 1).
+item_base_component(witches_switch, sobi_mask, 1).
+item_base_component(wraith_band, circlet, 1).
+item_base_component(wraith_band, slippers, 1).
+item_base_component(wraith_pact, blades_of_attack, 1).
+item_base_component(wraith_pact, lifesteal, 1).
+item_base_component(wraith_pact, point_booster, 1).
+item_base_component(wraith_pact, ring_of_protection, 1).
+item_base_component(wraith_pact, sobi_mask, 1).
+item_base_component(yasha, blade_of_alacrity, 1).
+item_base_component(yasha, boots_of_elves, 1).
+item_base_component(yasha_and_kaya, blade_of_alacrity, 1).
+item_base_component(yasha_and_kaya, boots_of_elves, 1).
+item_base_component(yasha_and_kaya, robe, 1).
+item_base_component(yasha_and_kaya, staff_of_wizardry, 1).
+
+% item_recipe_cost(Item, Gold)
+item_recipe_cost(abyssal_blade, 1275).
+item_recipe_cost(aeon_disk, 1200).
+item_recipe_cost(aether_lens, 775).
+item_recipe_cost(ancient_janggo, 500).
+item_recipe_cost(angels_demise, 1300).
+item_recipe_cost(arcane_blink, 1750).
+item_recipe_cost(arcane_boots, 475).
+item_recipe_cost(armlet, 625).
+item_recipe_cost(assault, 1300).
+item_recipe_cost(basher, 825).
+item_recipe_cost(bfury, 600).
+item_recipe_cost(black_king_bar, 1450).
+item_recipe_cost(blade_mail, 750).
+item_recipe_cost(bloodstone, 0).
+item_recipe_cost(bloodthorn, 450).
+item_recipe_cost(boots_of_bearing, 1700).
+item_recipe_cost(bracer, 210).
+item_recipe_cost(buckler, 250).
+item_recipe_cost(butterfly, 0).
+item_recipe_cost(crimson_guard, 1050).
+item_recipe_cost(cyclone, 675).
+item_recipe_cost(dagon, 1150).
+item_recipe_cost(desolator, 0).
+item_recipe_cost(devastator, 400).
+item_recipe_cost(diffusal_blade, 1050).
+item_recipe_cost(diffusal_blade_2, 300).
+item_recipe_cost(disperser, 800).
+item_recipe_cost(dragon_lance, 450).
+item_recipe_cost(echo_sabre, 0).
+item_recipe_cost(eternal_shroud, 900).
+item_recipe_cost(ethereal_blade, 1600).
+item_recipe_cost(falcon_blade, 250).
+item_recipe_cost(force_staff, 950).
+item_recipe_cost(glimmer_cape, 350).
+item_recipe_cost(great_famango, 0).
+item_recipe_cost(greater_crit, 900).
+item_recipe_cost(greater_famango, 0).
+item_recipe_cost(guardian_greaves, 1450).
+item_recipe_cost(gungir, 1100).
+item_recipe_cost(hand_of_midas, 1750).
+item_recipe_cost(harpoon, 1000).
+item_recipe_cost(headdress, 250).
+item_recipe_cost(heart, 600).
+item_recipe_cost(heavens_halberd, 450).
+item_recipe_cost(helm_of_the_dominator, 1125).
+item_recipe_cost(helm_of_the_overlord, 300).
+item_recipe_cost(hermes_sandals, 500).
+item_recipe_cost(holy_locket, 800).
+item_recipe_cost(hurricane_pike, 350).
+item_recipe_cost(invis_sword, 0).
+item_recipe_cost(iron_talon, 125).
+item_recipe_cost(kaya, 650).
+item_recipe_cost(kaya_and_sange, 0).
+item_recipe_cost(lesser_crit, 200).
+item_recipe_cost(lotus_orb, 250).
+item_recipe_cost(lunar_crest, 250).
+item_recipe_cost(maelstrom, 0).
+item_recipe_cost(mage_slayer, 0).
+item_recipe_cost(magic_wand, 150).
+item_recipe_cost(manta, 1550).
+item_recipe_cost(mask_of_madness, 0).
+item_recipe_cost(medallion_of_courage, 0).
+item_recipe_cost(mekansm, 800).
+item_recipe_cost(meteor_hammer, 300).
+item_recipe_cost(mjollnir, 550).
+item_recipe_cost(monkey_king_bar, 600).
+item_recipe_cost(moon_shard, 0).
+item_recipe_cost(necronomicon, 1250).
+item_recipe_cost(necronomicon_2, 0).
+item_recipe_cost(necronomicon_3, 0).
+item_recipe_cost(null_talisman, 210).
+item_recipe_cost(nullifier, 0).
+item_recipe_cost(oblivion_staff, 0).
+item_recipe_cost(octarine_core, 0).
+item_recipe_cost(orb_of_corrosion, 0).
+item_recipe_cost(orchid, 450).
+item_recipe_cost(overwhelming_blink, 1750).
+item_recipe_cost(pavise, 175).
+item_recipe_cost(pers, 0).
+item_recipe_cost(phase_boots, 0).
+item_recipe_cost(phylactery, 300).
+item_recipe_cost(pipe, 700).
+item_recipe_cost(power_treads, 0).
+item_recipe_cost(radiance, 0).
+item_recipe_cost(rapier, 0).
+item_recipe_cost(refresher, 200).
+item_recipe_cost(revenants_brooch, 600).
+item_recipe_cost(ring_of_basilius, 250).
+item_recipe_cost(rod_of_atos, 250).
+item_recipe_cost(samurai_tabi, 1100).
+item_recipe_cost(sange, 650).
+item_recipe_cost(sange_and_yasha, 0).
+item_recipe_cost(satanic, 0).
+item_recipe_cost(sheepstick, 600).
+item_recipe_cost(shivas_guard, 2050).
+item_recipe_cost(silver_edge, 250).
+item_recipe_cost(skadi, 0).
+item_recipe_cost(solar_crest, 500).
+item_recipe_cost(soul_booster, 0).
+item_recipe_cost(soul_ring, 350).
+item_recipe_cost(sphere, 600).
+item_recipe_cost(spirit_vessel, 900).
+item_recipe_cost(swift_blink, 1750).
+item_recipe_cost(tranquil_boots, 0).
+item_recipe_cost(travel_boots, 2000).
+item_recipe_cost(travel_boots_2, 0).
+item_recipe_cost(trident, 1).
+item_recipe_cost(ultimate_scepter, 0).
+item_recipe_cost(ultimate_scepter_2, 1600).
+item_recipe_cost(urn_of_shadows, 320).
+item_recipe_cost(vanguard, 0).
+item_recipe_cost(veil_of_discord, 300).
+item_recipe_cost(vladmir, 0).
+item_recipe_cost(ward_dispenser, 0).
+item_recipe_cost(wind_waker, 1400).
+item_recipe_cost(witch_blade, 250).
+item_recipe_cost(witches_switch, 625).
+item_recipe_cost(wraith_band, 210).
+item_recipe_cost(wraith_pact, 400).
+item_recipe_cost(yasha, 650).
+item_recipe_cost(yasha_and_kaya, 0).
+
+% item_total_cost(Item, Gold)
+item_total_cost(abyssal_blade, 6250).
+item_total_cost(aeon_disk, 3000).
+item_total_cost(aether_lens, 2275).
+item_total_cost(ancient_janggo, 1625).
+item_total_cost(angels_demise, 5600).
+item_total_cost(arcane_blink, 6800).
+item_total_cost(arcane_boots, 1400).
+item_total_cost(armlet, 2500).
+item_total_cost(assault, 5125).
+item_total_cost(basher, 2875).
+item_total_cost(belt_of_strength, 450).
+item_total_cost(bfury, 3900).
+item_total_cost(black_king_bar, 4050).
+item_total_cost(blade_mail, 2300).
+item_total_cost(blade_of_alacrity, 1000).
+item_total_cost(blades_of_attack, 450).
+item_total_cost(blight_stone, 300).
+item_total_cost(blink, 2250).
+item_total_cost(blitz_knuckles, 1000).
+item_total_cost(bloodstone, 4400).
+item_total_cost(bloodthorn, 6625).
+item_total_cost(boots, 500).
+item_total_cost(boots_of_bearing, 4225).
+item_total_cost(boots_of_elves, 450).
+item_total_cost(bracer, 505).
+item_total_cost(branches, 50).
+item_total_cost(broadsword, 1000).
+item_total_cost(buckler, 425).
+item_total_cost(butterfly, 5450).
+item_total_cost(chainmail, 550).
+item_total_cost(circlet, 155).
+item_total_cost(claymore, 1350).
+item_total_cost(cloak, 800).
+item_total_cost(cornucopia, 1200).
+item_total_cost(crimson_guard, 3725).
+item_total_cost(crown, 450).
+item_total_cost(cyclone, 2600).
+item_total_cost(dagon, 2850).
+item_total_cost(demon_edge, 2200).
+item_total_cost(desolator, 3500).
+item_total_cost(devastator, 5975).
+item_total_cost(diadem, 1000).
+item_total_cost(diffusal_blade, 2500).
+item_total_cost(diffusal_blade_2, 3850).
+item_total_cost(disperser, 6100).
+item_total_cost(dragon_lance, 1900).
+item_total_cost(eagle, 2800).
+item_total_cost(echo_sabre, 2700).
+item_total_cost(energy_booster, 800).
+item_total_cost(eternal_shroud, 3700).
+item_total_cost(ethereal_blade, 5375).
+item_total_cost(falcon_blade, 1125).
+item_total_cost(famango, 0).
+item_total_cost(fluffy_hat, 250).
+item_total_cost(force_staff, 2200).
+item_total_cost(gauntlets, 140).
+item_total_cost(ghost, 1500).
+item_total_cost(glimmer_cape, 2150).
+item_total_cost(gloves, 450).
+item_total_cost(great_famango, 0).
+item_total_cost(greater_crit, 5100).
+item_total_cost(greater_famango, 0).
+item_total_cost(guardian_greaves, 5050).
+item_total_cost(gungir, 4550).
+item_total_cost(hand_of_midas, 2200).
+item_total_cost(harpoon, 4700).
+item_total_cost(headdress, 425).
+item_total_cost(heart, 5200).
+item_total_cost(heavens_halberd, 2600).
+item_total_cost(helm_of_iron_will, 975).
+item_total_cost(helm_of_the_dominator, 2550).
+item_total_cost(helm_of_the_overlord, 5650).
+item_total_cost(hermes_sandals, 4800).
+item_total_cost(holy_locket, 2250).
+item_total_cost(hurricane_pike, 4450).
+item_total_cost(hyperstone, 2000).
+item_total_cost(invis_sword, 3350).
+item_total_cost(iron_talon, 400).
+item_total_cost(javelin, 900).
+item_total_cost(kaya, 2100).
+item_total_cost(kaya_and_sange, 4200).
+item_total_cost(lesser_crit, 2000).
+item_total_cost(lifesteal, 900).
+item_total_cost(lotus_orb, 3850).
+item_total_cost(lunar_crest, 2275).
+item_total_cost(maelstrom, 2950).
+item_total_cost(mage_slayer, 2800).
+item_total_cost(magic_stick, 200).
+item_total_cost(magic_wand, 450).
+item_total_cost(manta, 4650).
+item_total_cost(mantle, 140).
+item_total_cost(mask_of_madness, 1900).
+item_total_cost(medallion_of_courage, 1025).
+item_total_cost(mekansm, 1775).
+item_total_cost(meteor_hammer, 2850).
+item_total_cost(mithril_hammer, 1600).
+item_total_cost(mjollnir, 5500).
+item_total_cost(monkey_king_bar, 4700).
+item_total_cost(moon_shard, 4000).
+item_total_cost(mystic_staff, 2800).
+item_total_cost(necronomicon, 2050).
+item_total_cost(necronomicon_2, 3300).
+item_total_cost(necronomicon_3, 4550).
+item_total_cost(null_talisman, 505).
+item_total_cost(nullifier, 4375).
+item_total_cost(oblivion_staff, 1625).
+item_total_cost(octarine_core, 4800).
+item_total_cost(ogre_axe, 1000).
+item_total_cost(orb_of_corrosion, 1050).
+item_total_cost(orb_of_frost, 300).
+item_total_cost(orb_of_venom, 350).
+item_total_cost(orchid, 3275).
+item_total_cost(overwhelming_blink, 6800).
+item_total_cost(pavise, 1400).
+item_total_cost(pers, 1400).
+item_total_cost(phase_boots, 1500).
+item_total_cost(phylactery, 2500).
+item_total_cost(pipe, 3725).
+item_total_cost(platemail, 1400).
+item_total_cost(point_booster, 1200).
+item_total_cost(power_treads, 1400).
+item_total_cost(quelling_blade, 100).
+item_total_cost(radiance, 4700).
+item_total_cost(rapier, 5600).
+item_total_cost(reaver, 2800).
+item_total_cost(recipe_diffusal_blade, 1050).
+item_total_cost(recipe_necronomicon, 1250).
+item_total_cost(recipe_travel_boots, 2000).
+item_total_cost(refresher, 5000).
+item_total_cost(relic, 3400).
+item_total_cost(revenants_brooch, 3300).
+item_total_cost(ring_of_basilius, 425).
+item_total_cost(ring_of_health, 700).
+item_total_cost(ring_of_protection, 175).
+item_total_cost(ring_of_regen, 175).
+item_total_cost(ring_of_tarrasque, 1800).
+item_total_cost(robe, 450).
+item_total_cost(rod_of_atos, 2250).
+item_total_cost(samurai_tabi, 5250).
+item_total_cost(sange, 2100).
+item_total_cost(sange_and_yasha, 4200).
+item_total_cost(satanic, 5050).
+item_total_cost(shadow_amulet, 1000).
+item_total_cost(sheepstick, 5200).
+item_total_cost(shivas_guard, 5175).
+item_total_cost(silver_edge, 5800).
+item_total_cost(skadi, 5900).
+item_total_cost(slippers, 140).
+item_total_cost(sobi_mask, 175).
+item_total_cost(solar_crest, 2575).
+item_total_cost(soul_booster, 3000).
+item_total_cost(soul_ring, 805).
+item_total_cost(sphere, 4800).
+item_total_cost(spirit_vessel, 2725).
+item_total_cost(staff_of_wizardry, 1000).
+item_total_cost(swift_blink, 6800).
+item_total_cost(talisman_of_evasion, 1300).
+item_total_cost(tiara_of_selemene, 1800).
+item_total_cost(tranquil_boots, 900).
+item_total_cost(travel_boots, 2500).
+item_total_cost(travel_boots_2, 4500).
+item_total_cost(trident, 6301).
+item_total_cost(ultimate_orb, 2800).
+item_total_cost(ultimate_scepter, 4200).
+item_total_cost(ultimate_scepter_2, 5800).
+item_total_cost(urn_of_shadows, 825).
+item_total_cost(vanguard, 1700).
+item_total_cost(veil_of_discord, 1725).
+item_total_cost(vitality_booster, 1000).
+item_total_cost(vladmir, 2200).
+item_total_cost(void_stone, 700).
+item_total_cost(voodoo_mask, 700).
+item_total_cost(ward_dispenser, 50).
+item_total_cost(ward_observer, 0).
+item_total_cost(ward_sentry, 50).
+item_total_cost(wind_lace, 225).
+item_total_cost(wind_waker, 6800).
+item_total_cost(witch_blade, 2775).
+item_total_cost(witches_switch, 1900).
+item_total_cost(wraith_band, 505).
+item_total_cost(wraith_pact, 3800).
+item_total_cost(yasha, 2100).
+item_total_cost(yasha_and_kaya, 4200).
+
+% item_recipe_depth(Item, Kedalaman)
+item_recipe_depth(abyssal_blade, 2).
+item_recipe_depth(aeon_disk, 1).
+item_recipe_depth(aether_lens, 1).
+item_recipe_depth(ancient_janggo, 1).
+item_recipe_depth(angels_demise, 2).
+item_recipe_depth(arcane_blink, 1).
+item_recipe_depth(arcane_boots, 2).
+item_recipe_depth(armlet, 1).
+item_recipe_depth(assault, 2).
+item_recipe_depth(basher, 1).
+item_recipe_depth(belt_of_strength, 0).
+item_recipe_depth(bfury, 1).
+item_recipe_depth(black_king_bar, 1).
+item_recipe_depth(blade_mail, 1).
+item_recipe_depth(blade_of_alacrity, 0).
+item_recipe_depth(blades_of_attack, 0).
+item_recipe_depth(blight_stone, 0).
+item_recipe_depth(blink, 0).
+item_recipe_depth(blitz_knuckles, 0).
+item_recipe_depth(bloodstone, 2).
+item_recipe_depth(bloodthorn, 3).
+item_recipe_depth(boots, 0).
+item_recipe_depth(boots_of_bearing, 2).
+item_recipe_depth(boots_of_elves, 0).
+item_recipe_depth(bracer, 1).
+item_recipe_depth(branches, 0).
+item_recipe_depth(broadsword, 0).
+item_recipe_depth(buckler, 1).
+item_recipe_depth(butterfly, 1).
+item_recipe_depth(chainmail, 0).
+item_recipe_depth(circlet, 0).
+item_recipe_depth(claymore, 0).
+item_recipe_depth(cloak, 0).
+item_recipe_depth(cornucopia, 0).
+item_recipe_depth(crimson_guard, 2).
+item_recipe_depth(crown, 0).
+item_recipe_depth(cyclone, 1).
+item_recipe_depth(dagon, 1).
+item_recipe_depth(demon_edge, 0).
+item_recipe_depth(desolator, 1).
+item_recipe_depth(devastator, 3).
+item_recipe_depth(diadem, 0).
+item_recipe_depth(diffusal_blade, 1).
+item_recipe_depth(diffusal_blade_2, 2).
+item_recipe_depth(disperser, 2).
+item_recipe_depth(dragon_lance, 1).
+item_recipe_depth(eagle, 0).
+item_recipe_depth(echo_sabre, 1).
+item_recipe_depth(energy_booster, 0).
+item_recipe_depth(eternal_shroud, 1).
+item_recipe_depth(ethereal_blade, 2).
+item_recipe_depth(falcon_blade, 1).
+item_recipe_depth(famango, 0).
+item_recipe_depth(fluffy_hat, 0).
+item_recipe_depth(force_staff, 1).
+item_recipe_depth(gauntlets, 0).
+item_recipe_depth(ghost, 0).
+item_recipe_depth(glimmer_cape, 1).
+item_recipe_depth(gloves, 0).
+item_recipe_depth(great_famango, 1).
+item_recipe_depth(greater_crit, 2).
+item_recipe_depth(greater_famango, 2).
+item_recipe_depth(guardian_greaves, 3).
+item_recipe_depth(gungir, 2).
+item_recipe_depth(hand_of_midas, 1).
+item_recipe_depth(harpoon, 2).
+item_recipe_depth(headdress, 1).
+item_recipe_depth(heart, 1).
+item_recipe_depth(heavens_halberd, 2).
+item_recipe_depth(helm_of_iron_will, 0).
+item_recipe_depth(helm_of_the_dominator, 1).
+item_recipe_depth(helm_of_the_overlord, 2).
+item_recipe_depth(hermes_sandals, 2).
+item_recipe_depth(holy_locket, 2).
+item_recipe_depth(hurricane_pike, 2).
+item_recipe_depth(hyperstone, 0).
+item_recipe_depth(invis_sword, 1).
+item_recipe_depth(iron_talon, 1).
+item_recipe_depth(javelin, 0).
+item_recipe_depth(kaya, 1).
+item_recipe_depth(kaya_and_sange, 2).
+item_recipe_depth(lesser_crit, 1).
+item_recipe_depth(lifesteal, 0).
+item_recipe_depth(lotus_orb, 2).
+item_recipe_depth(lunar_crest, 1).
+item_recipe_depth(maelstrom, 1).
+item_recipe_depth(mage_slayer, 1).
+item_recipe_depth(magic_stick, 0).
+item_recipe_depth(magic_wand, 1).
+item_recipe_depth(manta, 2).
+item_recipe_depth(mantle, 0).
+item_recipe_depth(mask_of_madness, 1).
+item_recipe_depth(medallion_of_courage, 1).
+item_recipe_depth(mekansm, 2).
+item_recipe_depth(meteor_hammer, 2).
+item_recipe_depth(mithril_hammer, 0).
+item_recipe_depth(mjollnir, 2).
+item_recipe_depth(monkey_king_bar, 1).
+item_recipe_depth(moon_shard, 1).
+item_recipe_depth(mystic_staff, 0).
+item_recipe_depth(necronomicon, 1).
+item_recipe_depth(necronomicon_2, 2).
+item_recipe_depth(necronomicon_3, 3).
+item_recipe_depth(null_talisman, 1).
+item_recipe_depth(nullifier, 1).
+item_recipe_depth(oblivion_staff, 1).
+item_recipe_depth(octarine_core, 2).
+item_recipe_depth(ogre_axe, 0).
+item_recipe_depth(orb_of_corrosion, 1).
+item_recipe_depth(orb_of_frost, 0).
+item_recipe_depth(orb_of_venom, 0).
+item_recipe_depth(orchid, 2).
+item_recipe_depth(overwhelming_blink, 1).
+item_recipe_depth(pavise, 1).
+item_recipe_depth(pers, 1).
+item_recipe_depth(phase_boots, 1).
+item_recipe_depth(phylactery, 1).
+item_recipe_depth(pipe, 2).
+item_recipe_depth(platemail, 0).
+item_recipe_depth(point_booster, 0).
+item_recipe_depth(power_treads, 1).
+item_recipe_depth(quelling_blade, 0).
+item_recipe_depth(radiance, 1).
+item_recipe_depth(rapier, 1).
+item_recipe_depth(reaver, 0).
+item_recipe_depth(recipe_diffusal_blade, 0).
+item_recipe_depth(recipe_necronomicon, 0).
+item_recipe_depth(recipe_travel_boots, 0).
+item_recipe_depth(refresher, 1).
+item_recipe_depth(relic, 0).
+item_recipe_depth(revenants_brooch, 2).
+item_recipe_depth(ring_of_basilius, 1).
+item_recipe_depth(ring_of_health, 0).
+item_recipe_depth(ring_of_protection, 0).
+item_recipe_depth(ring_of_regen, 0).
+item_recipe_depth(ring_of_tarrasque, 0).
+item_recipe_depth(robe, 0).
+item_recipe_depth(rod_of_atos, 1).
+item_recipe_depth(samurai_tabi, 1).
+item_recipe_depth(sange, 1).
+item_recipe_depth(sange_and_yasha, 2).
+item_recipe_depth(satanic, 1).
+item_recipe_depth(shadow_amulet, 0).
+item_recipe_depth(sheepstick, 1).
+item_recipe_depth(shivas_guard, 2).
+item_recipe_depth(silver_edge, 2).
+item_recipe_depth(skadi, 1).
+item_recipe_depth(slippers, 0).
+item_recipe_depth(sobi_mask, 0).
+item_recipe_depth(solar_crest, 2).
+item_recipe_depth(soul_booster, 1).
+item_recipe_depth(soul_ring, 1).
+item_recipe_depth(sphere, 2).
+item_recipe_depth(spirit_vessel, 2).
+item_recipe_depth(staff_of_wizardry, 0).
+item_recipe_depth(swift_blink, 1).
+item_recipe_depth(talisman_of_evasion, 0).
+item_recipe_depth(tiara_of_selemene, 0).
+item_recipe_depth(tranquil_boots, 1).
+item_recipe_depth(travel_boots, 1).
+item_recipe_depth(travel_boots_2, 2).
+item_recipe_depth(trident, 2).
+item_recipe_depth(ultimate_orb, 0).
+item_recipe_depth(ultimate_scepter, 1).
+item_recipe_depth(ultimate_scepter_2, 2).
+item_recipe_depth(urn_of_shadows, 1).
+item_recipe_depth(vanguard, 1).
+item_recipe_depth(veil_of_discord, 1).
+item_recipe_depth(vitality_booster, 0).
+item_recipe_depth(vladmir, 2).
+item_recipe_depth(void_stone, 0).
+item_recipe_depth(voodoo_mask, 0).
+item_recipe_depth(ward_dispenser, 1).
+item_recipe_depth(ward_observer, 0).
+item_recipe_depth(ward_sentry, 0).
+item_recipe_depth(wind_lace, 0).
+item_recipe_depth(wind_waker, 2).
+item_recipe_depth(witch_blade, 2).
+item_recipe_depth(witches_switch, 2).
+item_recipe_depth(wraith_band, 1).
+item_recipe_depth(wraith_pact, 3).
+item_recipe_depth(yasha, 1).
+item_recipe_depth(yasha_and_kaya, 2).
+
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from kb_server import SOCKET_FILE, KnowledgeBase, percentile
+from kbs_engine import MAIN_FILE
+
+
+def make_requests(kb, count, seed=0):
+    """Campuran request yang mirip pemakaian nyata, diambil acak dari isi knowledge base."""
+    rng = random.Random(seed)
+    heroes = kb.heroes
+    abilities = sorted(kb.ability_heroes)
+    roles = sorted(kb.role_heroes)
+    labels = kb.labels
+    makers = [
+        (40, lambda: {"op": "classify", "hero": rng.choice(heroes)}),
+        (20, lambda: {"op": "hero", "hero": rng.choice(heroes)}),
+        (15, lambda: {"op": "ability", "ability": rng.choice(abilities)}),
+        (15, lambda: {"op": "heroes", "role": rng.sample(roles, 2), "label": rng.choice(labels)}),
+        (10, lambda: {"op": "query", "predicate": "counters", "args": [None, rng.choice(heroes)]}),
+    ]
+    weights = [w for w, _ in makers]
+    requests = []
+    for i in range(count):
+        _, make = rng.choices(makers, weights)[0]
+        request = make()
+        request["id"] = i
+        requests.append(request)
+    return requests
+
+
+async def connect(args):
+    if args.port is not None: return await asyncio.open_connection(args.host, args.port)
+    return await asyncio.open_unix_connection(args.socket)
+
+async def client(args, requests, latencies):
+    """Satu koneksi: kirim request satu per satu dan catat waktu bolak-balik masing-masing."""
+    reader, writer = await connect(args)
+    errors = 0
+    for request in requests:
+        start = time.perf_counter()
+        writer.write((json.dumps(request) + "\n").encode("utf-8"))
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if not response["ok"] or response["id"] != request["id"]: errors += 1
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+async def server_stats(args):
+    reader, writer = await connect(args)
+    writer.write(b'{"op": "stats"}\n')
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response["result"]
+
+async def run(args, requests):
+    latencies = []
+    chunks = [requests[i::args.concurrency] for i in range(args.concurrency)]
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(client(args, chunk, latencies) for chunk in chunks))
+    elapsed = time.perf_counter() - start
+    return latencies, sum(errors), elapsed, await server_stats(args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load generator untuk kb_server.py.")
+    parser.add_argument("--socket", default=SOCKET_FILE, help="socket Unix server")
+    parser.add_argument("--port", type=int, help="hubungkan ke TCP port ini, bukan socket Unix")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-n", "--requests", type=int, default=20000, help="jumlah request total")
+    parser.add_argument("-c", "--concurrency", type=int, default=16, help="jumlah koneksi paralel")
+    parser.add_argument("--cold", type=int, default=5, metavar="N",
+                        help="bandingkan dengan N kali memuat ulang knowledge base per query (0 = lewati)")
+    args = parser.parse_args()
+
+    kb = KnowledgeBase(MAIN_FILE)
+    requests = make_requests(kb, args.requests)
+
+    latencies, errors, elapsed, stats = asyncio.run(run(args, requests))
+    latencies.sort()
+    print(f"{len(latencies)} request, {args.concurrency} koneksi, {elapsed:.2f} s "
+          f"({len(latencies) / elapsed:,.0f} request/s), {errors} error")
+    print(f"Bolak-balik klien: p50 {percentile(latencies, 50) * 1e6:.0f} us, "
+          f"p99 {percentile(latencies, 99) * 1e6:.0f} us, max {latencies[-1] * 1e6:.0f} us")
+    print("Di server (waktu proses per operasi):")
+    for op, summary in stats["latency"].items():
+        print(f"  {op:<10} {summary['count']:>8}  p50 {summary['p50_us']:>8.1f} us  p99 {summary['p99_us']:>8.1f} us")
+
+    if args.cold:
+        start = time.perf_counter()
+        for _ in range(args.cold): KnowledgeBase(MAIN_FILE).classify(kb.heroes[0])
+        cold = (time.perf_counter() - start) / args.cold
+        print(f"Tanpa server (muat + inferensi per query): {cold * 1000:.0f} ms per query")
+
+    if errors: sys.exit(1)
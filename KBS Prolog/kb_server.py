@@ -0,0 +1,380 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import defaultdict, deque
+
+from kbs_engine import MAIN_FILE, Engine, Program
+
+# Socket Unix default untuk mode server
+SOCKET_FILE = "kb_server.sock"
+
+# Interval (detik) pengecekan perubahan file .pl untuk hot reload
+RELOAD_INTERVAL = 1.0
+
+# Jumlah latency terakhir per operasi yang disimpan untuk p50/p99
+LATENCY_WINDOW = 10000
+
+# Batas default jumlah baris hasil operasi "query"
+QUERY_LIMIT = 1000
+
+# Panjang maksimum satu baris request (byte); baris yang lebih panjang dibuang
+LINE_LIMIT = 2 ** 16
+
+# Operasi yang dikenal; operasi lain dicatat di statistik latency sebagai "invalid"
+OPERATIONS = ("hero", "classify", "ability", "heroes", "query", "stats", "reload")
+
+
+class KnowledgeBase:
+    """
+    Snapshot knowledge base yang sudah dimuat dan diinferensi sekali, beserta
+    index untuk lookup langsung: hero -> role/atribut/ability/klasifikasi,
+    role -> hero, ability -> tipe/damage/hero, label -> hero, dan relasi
+    counters/synergizes_with. Snapshot tidak pernah diubah setelah dibuat;
+    reload membuat snapshot baru lalu menukarnya.
+    """
+    def __init__(self, main_file=MAIN_FILE):
+        start = time.perf_counter()
+        self.main_file = main_file
+        self.program = Program().load(main_file)
+        self.signature = file_signature(self.program.files)
+        self.engine = Engine(self.program).run()
+        self.labels = self.program.derived_unary()
+        relations = self.engine.relations
+
+        self.heroes = sorted(row[0] for row in relations["hero"].tuples)
+        self.hero_set = set(self.heroes)
+        self.attribute = {hero: attribute for hero, attribute in relations["primary_attribute"].tuples}
+        self.hero_roles = group(relations["has_role"].tuples)
+        self.role_heroes = group((role, hero) for hero, role in relations["has_role"].tuples)
+        self.attack_types = group(relations["attack_type"].tuples)
+        self.hero_abilities = group(relations["has_ability"].tuples)
+        self.ability_heroes = group((ability, hero) for hero, ability in relations["has_ability"].tuples)
+        self.ability_types = group(relations["ability_type"].tuples)
+        self.ability_damage = group(relations["damage_type"].tuples)
+        self.counters = group(relations["counters"].tuples)
+        self.countered_by = group((b, a) for a, b in relations["counters"].tuples)
+        self.synergies = group(relations["synergizes_with"].tuples)
+
+        self.label_heroes = {label: {row[0] for row in relations[label].tuples} for label in self.labels}
+        self.hero_labels = {hero: [label for label in self.labels if hero in self.label_heroes[label]]
+                            for hero in self.heroes}
+        self.load_time = time.perf_counter() - start
+
+    def hero(self, name):
+        if name not in self.hero_set: raise KeyError(f"hero tidak dikenal: {name}")
+        return {
+            "hero": name,
+            "primary_attribute": self.attribute.get(name),
+            "attack_type": sorted(self.attack_types.get(name, ())),
+            "roles": sorted(self.hero_roles.get(name, ())),
+            "abilities": sorted(self.hero_abilities.get(name, ())),
+            "classifications": self.hero_labels[name],
+            "counters": sorted(self.counters.get(name, ())),
+            "countered_by": sorted(self.countered_by.get(name, ())),
+            "synergizes_with": sorted(self.synergies.get(name, ())),
+        }
+
+    def classify(self, name):
+        if name not in self.hero_set: raise KeyError(f"hero tidak dikenal: {name}")
+        return {"hero": name, "classifications": self.hero_labels[name]}
+
+    def ability(self, name):
+        if name not in self.ability_heroes and name not in self.ability_types:
+            raise KeyError(f"ability tidak dikenal: {name}")
+        return {
+            "ability": name,
+            "heroes": sorted(self.ability_heroes.get(name, ())),
+            "types": sorted(self.ability_types.get(name, ())),
+            "damage_types": sorted(self.ability_damage.get(name, ())),
+        }
+
+    def find_heroes(self, roles=(), labels=(), attribute=None, attack_type=None):
+        """Hero yang memenuhi semua syarat sekaligus (irisan index)."""
+        sets = []
+        for role in roles: sets.append(self.role_heroes.get(role, set()))
+        for label in labels:
+            if label not in self.label_heroes: raise KeyError(f"klasifikasi tidak dikenal: {label}")
+            sets.append(self.label_heroes[label])
+        if attribute is not None: sets.append({h for h, a in self.attribute.items() if a == attribute})
+        if attack_type is not None: sets.append({h for h, t in self.attack_types.items() if attack_type in t})
+        if not sets: return list(self.heroes)
+        sets.sort(key=len)
+        return sorted(set.intersection(*sets))
+
+    def query(self, predicate, args, limit=QUERY_LIMIT):
+        """
+        Lookup fakta/hasil inferensi apa saja seperti query Prolog: argumen
+        null adalah variabel bebas, argumen lain harus sama persis. Memakai
+        index hash per posisi argumen dari kbs_engine.Relation.
+        """
+        if predicate not in self.engine.relations: raise KeyError(f"predikat tidak dikenal: {predicate}")
+        relation = self.engine.relations[predicate]
+        arity = len(next(iter(relation.tuples), args))
+        if arity != len(args): raise ValueError(f"{predicate} berarity {arity}, bukan {len(args)}")
+        positions = tuple(i for i, v in enumerate(args) if v is not None)
+        key = tuple(args[i] for i in positions)
+        rows = sorted(relation.lookup(positions, key))
+        return {"predicate": predicate, "count": len(rows), "rows": [list(row) for row in rows[:limit]]}
+
+
+def group(pairs):
+    result = defaultdict(set)
+    for key, value in pairs: result[key].add(value)
+    return dict(result)
+
+def file_signature(paths):
+    """(path, mtime, ukuran) setiap file yang dimuat; berubah jika salah satu file diedit."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+class LatencyStats:
+    """Latency per operasi (jendela geser LATENCY_WINDOW request terakhir) untuk p50/p99."""
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self.samples = defaultdict(lambda: deque(maxlen=self.window))
+        self.counts = defaultdict(int)
+        self.errors = defaultdict(int)
+
+    def record(self, op, seconds, ok):
+        self.samples[op].append(seconds)
+        self.counts[op] += 1
+        if not ok: self.errors[op] += 1
+
+    def summary(self):
+        result = {}
+        for op, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            result[op] = {
+                "count": self.counts[op],
+                "errors": self.errors[op],
+                "p50_us": round(percentile(ordered, 50) * 1e6, 1),
+                "p99_us": round(percentile(ordered, 99) * 1e6, 1),
+                "max_us": round(ordered[-1] * 1e6, 1),
+            }
+        return result
+
+def percentile(ordered, p):
+    if not ordered: return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class KBServer:
+    """
+    Server query knowledge base dengan protokol JSON-lines: satu objek JSON
+    per baris, misalnya {"id": 1, "op": "classify", "hero": "antimage"}.
+    Setiap jawaban juga satu baris: {"id": 1, "ok": true, "result": ...}
+    atau {"id": 1, "ok": false, "error": "..."}.
+
+    Operasi: hero, classify, ability, heroes, query, stats, reload.
+    """
+    def __init__(self, main_file=MAIN_FILE, reload_interval=RELOAD_INTERVAL):
+        self.main_file = main_file
+        self.reload_interval = reload_interval
+        self.kb = KnowledgeBase(main_file)
+        self.stats = LatencyStats()
+        self.started = time.time()
+        self.reloads = 0
+        self.reload_errors = 0
+        self.connections = 0
+        self._reload_lock = asyncio.Lock()
+        log(f"Knowledge base dimuat: {len(self.kb.heroes)} hero, {len(self.kb.labels)} label, "
+            f"{len(self.kb.program.files)} file ({self.kb.load_time:.3f} s)")
+
+    def handle(self, request):
+        op = request.get("op")
+        kb = self.kb
+        if op == "hero": return kb.hero(field(request, "hero"))
+        if op == "classify": return kb.classify(field(request, "hero"))
+        if op == "ability": return kb.ability(field(request, "ability"))
+        if op == "heroes":
+            return kb.find_heroes(roles=as_list(request.get("role")), labels=as_list(request.get("label")),
+                                  attribute=request.get("attribute"), attack_type=request.get("attack_type"))
+        if op == "query":
+            return kb.query(field(request, "predicate"), list(request.get("args", [])), request.get("limit", QUERY_LIMIT))
+        if op == "stats":
+            return {
+                "uptime_s": round(time.time() - self.started, 1),
+                "heroes": len(kb.heroes),
+                "labels": len(kb.labels),
+                "load_time_s": round(kb.load_time, 4),
+                "reloads": self.reloads,
+                "reload_errors": self.reload_errors,
+                "connections": self.connections,
+                "latency": self.stats.summary(),
+            }
+        raise ValueError(f"operasi tidak dikenal: {op!r}")
+
+    async def respond(self, line):
+        """Jawaban (satu baris JSON) untuk satu baris request; `line` None berarti baris terlalu panjang."""
+        start = time.perf_counter()
+        request_id = None
+        op = "invalid"
+        try:
+            if line is None: raise ValueError(f"request melebihi {LINE_LIMIT} byte")
+            request = json.loads(line)
+            if not isinstance(request, dict): raise ValueError("request harus berupa objek JSON")
+            request_id = request.get("id")
+            if request.get("op") in OPERATIONS: op = request["op"]
+            if op == "reload":
+                result = {"reloaded": await self.reload(force=True)}
+            else:
+                result = self.handle(request)
+            response = {"id": request_id, "ok": True, "result": result}
+        except KeyError as e:
+            response = {"id": request_id, "ok": False, "error": e.args[0]}
+        except (ValueError, TypeError) as e:
+            response = {"id": request_id, "ok": False, "error": str(e)}
+        except Exception as e:
+            # Bug atau request aneh tidak boleh memutus koneksi klien
+            log(f"Error saat menjawab operasi {op}: {e!r}")
+            response = {"id": request_id, "ok": False, "error": f"error internal: {type(e).__name__}: {e}"}
+        self.stats.record(op, time.perf_counter() - start, response["ok"])
+        return json.dumps(response, separators=(",", ":")) + "\n"
+
+    async def serve_stream(self, reader, write):
+        self.connections += 1
+        try:
+            while True:
+                line = await read_request(reader)
+                if line == b"": break
+                if line is not None and not line.strip(): continue
+                await write(await self.respond(line))
+        finally:
+            self.connections -= 1
+
+    async def handle_connection(self, reader, writer):
+        async def write(text):
+            writer.write(text.encode("utf-8"))
+            await writer.drain()
+        try:
+            await self.serve_stream(reader, write)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def reload(self, force=False):
+        """
+        Memuat ulang knowledge base jika ada file .pl yang berubah (atau jika
+        `force`). Parsing dan inferensi berjalan di thread lain, jadi request
+        tetap dilayani dengan snapshot lama sampai snapshot baru siap.
+        """
+        async with self._reload_lock:
+            if not force and file_signature(self.kb.program.files) == self.kb.signature: return False
+            try:
+                kb = await asyncio.get_running_loop().run_in_executor(None, KnowledgeBase, self.main_file)
+            except Exception as e:
+                # Error apa pun (file hilang, sintaks, atau aturan yang gagal saat
+                # inferensi) tidak boleh menghentikan server maupun hot reload
+                self.reload_errors += 1
+                # Tandai signature sekarang agar file yang sama tidak dicoba terus-menerus
+                self.kb.signature = file_signature(self.kb.program.files)
+                log(f"Reload gagal, snapshot lama tetap dipakai: {type(e).__name__}: {e}")
+                return False
+            self.kb = kb
+            self.reloads += 1
+            log(f"Knowledge base dimuat ulang: {len(kb.heroes)} hero ({kb.load_time:.3f} s)")
+            return True
+
+    async def watch(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.reload()
+            except Exception as e:
+                # Satu pengecekan yang gagal tidak boleh mengakhiri task watcher
+                log(f"Pengecekan hot reload gagal: {type(e).__name__}: {e}")
+
+
+async def read_request(reader):
+    """
+    Membaca satu baris request. Baris yang melebihi batas buffer `reader`
+    (LINE_LIMIT) dibuang sampai newline berikutnya dan hasilnya None, agar
+    koneksi tetap bisa dipakai. Mengembalikan b"" saat EOF.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return b""
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+def field(request, name):
+    if name not in request: raise ValueError(f"field '{name}' wajib diisi")
+    return request[name]
+
+def as_list(value):
+    if value is None: return []
+    return value if isinstance(value, list) else [value]
+
+def log(message):
+    print(f"[kb_server] {message}", file=sys.stderr, flush=True)
+
+
+async def serve_stdio(server):
+    """Mode stdin/stdout: request dibaca dari stdin, jawaban ditulis ke stdout."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=LINE_LIMIT)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    async def write(text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    await server.serve_stream(reader, write)
+
+async def main(args):
+    server = KBServer(args.main, args.reload_interval)
+    watcher = asyncio.create_task(server.watch()) if args.reload_interval > 0 else None
+    try:
+        if args.stdio:
+            await serve_stdio(server)
+            return
+        if args.port is not None:
+            listener = await asyncio.start_server(server.handle_connection, args.host, args.port, limit=LINE_LIMIT)
+            log(f"Mendengarkan di {args.host}:{args.port}")
+        else:
+            if os.path.exists(args.socket): os.remove(args.socket)
+            listener = await asyncio.start_unix_server(server.handle_connection, args.socket, limit=LINE_LIMIT)
+            log(f"Mendengarkan di socket '{args.socket}'")
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        if watcher is not None: watcher.cancel()
+        if not args.stdio and args.port is None and os.path.exists(args.socket): os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server query knowledge base Dota 2 (JSON-lines, asyncio).")
+    parser.add_argument("--main", default=MAIN_FILE,
+                        help="file Prolog utama yang meng-include ABox, TBox, dan aturan KBS")
+    parser.add_argument("--socket", default=SOCKET_FILE, help="path socket Unix (default)")
+    parser.add_argument("--port", type=int, help="dengarkan di TCP port ini, bukan socket Unix")
+    parser.add_argument("--host", default="127.0.0.1", help="alamat TCP untuk --port")
+    parser.add_argument("--stdio", action="store_true", help="baca request dari stdin, tulis jawaban ke stdout")
+    parser.add_argument("--reload-interval", type=float, default=RELOAD_INTERVAL,
+                        help="detik antar pengecekan perubahan file .pl (0 = hot reload mati)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,553 @@
+import argparse
+import csv
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# File utama yang meng-include ABox, TBox, dan aturan KBS
+MAIN_FILE = "tubes1_main.pl"
+
+# File output tabel klasifikasi
+OUTPUT_FILE = "klasifikasi_dota2.csv"
+
+
+# === Parser subset Prolog ===
+# Hanya subset yang dipakai di file .pl proyek ini yang didukung:
+# fakta, aturan `Head :- Body`, konjungsi `,`, disjungsi `;`, negasi `\+`,
+# perbandingan `=`, `\=`, `>=`, `=<`, `>`, `<`, serta findall/3 dan length/2.
+
+class Var:
+    """Variabel Prolog. Setiap `_` diberi nama unik oleh parser."""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+    def __eq__(self, other):
+        return isinstance(other, Var) and other.name == self.name
+
+    def __hash__(self):
+        return hash(("var", self.name))
+
+
+TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+|%[^\n]*|/\*.*?\*/)
+  | (?P<num>\d+)
+  | (?P<var>[A-Z_][A-Za-z0-9_]*)
+  | (?P<atom>[a-z][A-Za-z0-9_]*|'(?:[^'\\]|\\.)*')
+  | (?P<op>:-|\\\+|\\=|>=|=<|[=<>(),;\[\]])
+  | (?P<end>\.(?=\s|%|$))
+""", re.VERBOSE | re.DOTALL)
+
+COMPARISONS = ("=", "\\=", ">=", "=<", ">", "<")
+
+
+def tokenize(text, path):
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        m = TOKEN_RE.match(text, pos)
+        if m is None:
+            line = text.count("\n", 0, pos) + 1
+            raise SyntaxError(f"{path}:{line}: token tidak dikenal: {text[pos:pos + 20]!r}")
+        kind = m.lastgroup
+        if kind != "ws":
+            value = m.group()
+            if kind == "num": value = int(value)
+            elif kind == "atom" and value.startswith("'"): value = value[1:-1]
+            tokens.append((kind, value))
+        pos = m.end()
+    return tokens
+
+
+class Parser:
+    def __init__(self, tokens, path):
+        self.tokens = tokens
+        self.pos = 0
+        self.path = path
+        self.anon = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect(self, value):
+        kind, got = self.next()
+        if got != value:
+            raise SyntaxError(f"{self.path}: diharapkan {value!r}, ditemukan {got!r}")
+
+    def clauses(self):
+        """Menghasilkan ('fact'|'rule'|'directive', ...) untuk setiap klausa."""
+        while self.pos < len(self.tokens):
+            if self.peek()[1] == ":-":
+                self.next()
+                yield ("directive", self.disjunction())
+            else:
+                head = self.term()
+                if self.peek()[1] == ":-":
+                    self.next()
+                    yield ("rule", head, self.disjunction())
+                else:
+                    yield ("fact", head)
+            kind, _ = self.next()
+            if kind != "end":
+                raise SyntaxError(f"{self.path}: klausa tidak diakhiri titik")
+
+    def disjunction(self):
+        branches = [self.conjunction()]
+        while self.peek()[1] == ";":
+            self.next()
+            branches.append(self.conjunction())
+        return branches[0] if len(branches) == 1 else ("or", branches)
+
+    def conjunction(self):
+        goals = [self.goal()]
+        while self.peek()[1] == ",":
+            self.next()
+            goals.append(self.goal())
+        return goals[0] if len(goals) == 1 else ("and", goals)
+
+    def goal(self):
+        kind, value = self.peek()
+        if value == "(":
+            self.next()
+            goal = self.disjunction()
+            self.expect(")")
+            return goal
+        if value == "\\+":
+            self.next()
+            return ("not", self.goal())
+        if value == "findall":
+            self.next()
+            self.expect("(")
+            template = self.term()
+            self.expect(",")
+            inner = self.goal()
+            self.expect(",")
+            result = self.term()
+            self.expect(")")
+            return ("findall", template, inner, result)
+        left = self.term()
+        if self.peek()[1] in COMPARISONS:
+            op = self.next()[1]
+            return ("cmp", op, left, self.term())
+        if isinstance(left, tuple) and left[0] == "struct":
+            return ("call", left[1], left[2])
+        return ("call", left, ())
+
+    def term(self):
+        kind, value = self.next()
+        if kind == "var":
+            if value == "_":
+                self.anon += 1
+                value = f"_G{self.anon}"
+            return Var(value)
+        if kind == "num":
+            return value
+        if value == "[":
+            self.expect("]")
+            return ()
+        if kind == "atom":
+            if self.peek()[1] == "(":
+                self.next()
+                args = [self.term()]
+                while self.peek()[1] == ",":
+                    self.next()
+                    args.append(self.term())
+                self.expect(")")
+                return ("struct", value, tuple(args))
+            return value
+        raise SyntaxError(f"{self.path}: term tidak valid: {value!r}")
+
+
+class Program:
+    """Fakta (EDB) dan aturan (IDB) hasil membaca file .pl beserta include-nya."""
+    def __init__(self):
+        self.facts = defaultdict(set)
+        self.rules = defaultdict(list)
+        self.order = []
+        self.files = []
+
+    def load(self, path):
+        self.files.append(path)
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        return self.load_text(text, path)
+
+    def load_text(self, text, path="<text>"):
+        """Seperti load, tetapi dari string. Include relatif terhadap folder `path`."""
+        parser = Parser(tokenize(text, path), path)
+        base = os.path.dirname(path)
+        for clause in parser.clauses():
+            if clause[0] == "directive":
+                goal = clause[1]
+                if goal[0] == "call" and goal[1] == "include":
+                    self.load(os.path.join(base, goal[2][0]))
+                continue
+            head = clause[1]
+            name, args = (head[1], head[2]) if isinstance(head, tuple) else (head, ())
+            if name not in self.facts and name not in self.rules:
+                self.order.append(name)
+            if clause[0] == "fact":
+                self.facts[name].add(args)
+            else:
+                self.rules[name].append((args, clause[2]))
+        return self
+
+    def derived_unary(self):
+        """Predikat aturan berarity 1, sesuai urutan definisi di file."""
+        return [name for name in self.order
+                if name in self.rules and all(len(args) == 1 for args, _ in self.rules[name])]
+
+
+# === Evaluasi ===
+
+def resolve(term, binding):
+    if isinstance(term, Var):
+        return binding.get(term.name, term)
+    if isinstance(term, tuple) and term and term[0] == "struct":
+        return ("struct", term[1], tuple(resolve(a, binding) for a in term[2]))
+    return term
+
+def unify(term, value, binding):
+    """Mengikat `term` (hasil resolve) ke nilai ground. Mengembalikan binding baru atau None."""
+    if isinstance(term, Var):
+        extended = dict(binding)
+        extended[term.name] = value
+        return extended
+    return binding if term == value else None
+
+def compare(op, left, right, binding):
+    if op == "=":
+        if isinstance(left, Var) and isinstance(right, Var):
+            raise ValueError("perbandingan dua variabel bebas tidak didukung")
+        return unify(left, right, binding) if isinstance(left, Var) else unify(right, left, binding)
+    if op == "\\=":
+        # Gagal jika kedua sisi bisa diunifikasi (termasuk jika salah satunya variabel bebas)
+        if isinstance(left, Var) or isinstance(right, Var): return None
+        return binding if left != right else None
+    if isinstance(left, Var) or isinstance(right, Var):
+        raise ValueError(f"argumen '{op}' belum terikat")
+    ok = {">=": left >= right, "=<": left <= right, ">": left > right, "<": left < right}[op]
+    return binding if ok else None
+
+
+class Relation:
+    """Himpunan tuple dengan index hash per kombinasi posisi argumen yang terikat."""
+    def __init__(self, tuples=()):
+        self.tuples = set(tuples)
+        self.indexes = {}
+
+    def add(self, row):
+        if row in self.tuples: return False
+        self.tuples.add(row)
+        self.indexes.clear()
+        return True
+
+    def lookup(self, positions, key):
+        if not positions: return self.tuples
+        index = self.indexes.get(positions)
+        if index is None:
+            index = self.indexes[positions] = defaultdict(list)
+            for row in self.tuples:
+                index[tuple(row[i] for i in positions)].append(row)
+        return index.get(key, ())
+
+
+class Engine:
+    """
+    Forward chaining: semua aturan dievaluasi bottom-up per stratum sampai
+    fixpoint, sehingga klasifikasi untuk semua hero dihitung dalam satu batch.
+    Predikat di dalam `\\+` dan findall harus sudah lengkap sebelum dipakai,
+    jadi predikat tersebut ditempatkan di stratum yang lebih rendah.
+    """
+    def __init__(self, program):
+        self.program = program
+        self.relations = defaultdict(Relation)
+        for name, rows in program.facts.items():
+            self.relations[name] = Relation(rows)
+        self.iterations = 0
+
+    def strata(self):
+        rules = self.program.rules
+        deps = {name: set() for name in rules}
+        for name, clauses in rules.items():
+            for _, body in clauses:
+                collect_deps(body, False, deps[name])
+        stratum = dict.fromkeys(rules, 0)
+        for _ in range(len(rules) + 1):
+            changed = False
+            for name, edges in deps.items():
+                for dep, negative in edges:
+                    if dep not in rules: continue
+                    needed = stratum[dep] + (1 if negative else 0)
+                    if needed > stratum[name]:
+                        stratum[name] = needed
+                        changed = True
+            if not changed: break
+        else:
+            raise ValueError("aturan tidak terstratifikasi (rekursi melalui negasi/findall)")
+        layers = defaultdict(list)
+        for name in self.program.order:
+            if name in rules: layers[stratum[name]].append(name)
+        return [layers[i] for i in sorted(layers)]
+
+    def run(self):
+        for layer in self.strata():
+            changed = True
+            while changed:
+                changed = False
+                self.iterations += 1
+                for name in layer:
+                    relation = self.relations[name]
+                    for head, body in self.program.rules[name]:
+                        for binding in self.solve(body, [{}]):
+                            row = tuple(resolve(a, binding) for a in head)
+                            if any(isinstance(v, Var) for v in row):
+                                raise ValueError(f"aturan '{name}' tidak range-restricted")
+                            if relation.add(row): changed = True
+        return self
+
+    def solve(self, goal, bindings):
+        kind = goal[0]
+        if kind == "and":
+            for sub in goal[1]:
+                bindings = self.solve(sub, bindings)
+                if not bindings: break
+            return bindings
+        if kind == "or":
+            return [b for branch in goal[1] for b in self.solve(branch, bindings)]
+        if kind == "not":
+            return [b for b in bindings if not self.solve(goal[1], [b])]
+        if kind == "cmp":
+            _, op, left, right = goal
+            result = []
+            for b in bindings:
+                extended = compare(op, resolve(left, b), resolve(right, b), b)
+                if extended is not None: result.append(extended)
+            return result
+        if kind == "findall":
+            _, template, inner, target = goal
+            result = []
+            for b in bindings:
+                found = tuple(resolve(template, s) for s in self.solve(inner, [b]))
+                extended = unify(resolve(target, b), found, b)
+                if extended is not None: result.append(extended)
+            return result
+        _, name, args = goal
+        if name == "length":
+            result = []
+            for b in bindings:
+                items = resolve(args[0], b)
+                if isinstance(items, Var): raise ValueError("length/2 dengan list belum terikat")
+                extended = unify(resolve(args[1], b), len(items), b)
+                if extended is not None: result.append(extended)
+            return result
+        relation = self.relations[name]
+        result = []
+        for b in bindings:
+            values = [resolve(a, b) for a in args]
+            positions = tuple(i for i, v in enumerate(values) if not isinstance(v, Var))
+            key = tuple(values[i] for i in positions)
+            for row in relation.lookup(positions, key):
+                extended = b
+                for i, v in enumerate(values):
+                    if isinstance(v, Var):
+                        extended = unify(resolve(v, extended), row[i], extended)
+                        if extended is None: break
+                if extended is not None: result.append(extended)
+        return result
+
+    def holds(self, name, *args):
+        return tuple(args) in self.relations[name].tuples
+
+
+def collect_deps(goal, negative, out):
+    kind = goal[0]
+    if kind in ("and", "or"):
+        for sub in goal[1]: collect_deps(sub, negative, out)
+    elif kind == "not":
+        collect_deps(goal[1], True, out)
+    elif kind == "findall":
+        collect_deps(goal[2], True, out)
+    elif kind == "call":
+        out.add((goal[1], negative))
+
+
+class TopDownSolver:
+    """
+    Pembuktian top-down satu query per hero, seperti bertanya ke Prolog
+    `?- is_hard_carry(axe).`. Hanya dipakai oleh --check sebagai pembanding
+    hasil forward chaining.
+    """
+    def __init__(self, program):
+        self.program = program
+        self.base = Engine(program)
+        self.fresh = 0
+
+    def prove(self, name, *args):
+        return bool(self.call(name, args, {}))
+
+    def call(self, name, args, binding):
+        if name not in self.program.rules:
+            return self.base.solve(("call", name, args), [binding])
+        values = [resolve(a, binding) for a in args]
+        result = []
+        for head, body in self.program.rules[name]:
+            self.fresh += 1
+            rename = {}
+            local = {}
+            ok = True
+            for term, value in zip(head, values):
+                term = rename_term(term, rename, self.fresh)
+                if isinstance(value, Var): continue
+                local = unify(resolve(term, local), value, local)
+                if local is None:
+                    ok = False
+                    break
+            if not ok: continue
+            renamed_head = [rename_term(t, rename, self.fresh) for t in head]
+            for solution in self.goal(rename_goal(body, rename, self.fresh), [local]):
+                extended = binding
+                for term, value in zip(renamed_head, values):
+                    if isinstance(value, Var):
+                        extended = unify(resolve(value, extended), resolve(term, solution), extended)
+                        if extended is None: break
+                if extended is not None: result.append(extended)
+        return result
+
+    def goal(self, goal, bindings):
+        kind = goal[0]
+        if kind == "and":
+            for sub in goal[1]:
+                bindings = self.goal(sub, bindings)
+            return bindings
+        if kind == "or":
+            return [b for branch in goal[1] for b in self.goal(branch, bindings)]
+        if kind == "not":
+            return [b for b in bindings if not self.goal(goal[1], [b])]
+        if kind == "findall":
+            _, template, inner, target = goal
+            result = []
+            for b in bindings:
+                found = tuple(resolve(template, s) for s in self.goal(inner, [b]))
+                extended = unify(resolve(target, b), found, b)
+                if extended is not None: result.append(extended)
+            return result
+        if kind == "call" and goal[1] in self.program.rules:
+            return [s for b in bindings for s in self.call(goal[1], goal[2], b)]
+        return self.base.solve(goal, bindings)
+
+
+def rename_term(term, rename, suffix):
+    if isinstance(term, Var):
+        if term.name not in rename: rename[term.name] = Var(f"{term.name}#{suffix}")
+        return rename[term.name]
+    if isinstance(term, tuple) and term and term[0] == "struct":
+        return ("struct", term[1], tuple(rename_term(a, rename, suffix) for a in term[2]))
+    return term
+
+def rename_goal(goal, rename, suffix):
+    kind = goal[0]
+    if kind in ("and", "or"):
+        return (kind, [rename_goal(g, rename, suffix) for g in goal[1]])
+    if kind == "not":
+        return ("not", rename_goal(goal[1], rename, suffix))
+    if kind == "cmp":
+        return ("cmp", goal[1], rename_term(goal[2], rename, suffix), rename_term(goal[3], rename, suffix))
+    if kind == "findall":
+        return ("findall", rename_term(goal[1], rename, suffix), rename_goal(goal[2], rename, suffix),
+                rename_term(goal[3], rename, suffix))
+    return ("call", goal[1], tuple(rename_term(a, rename, suffix) for a in goal[2]))
+
+
+# === Tabel klasifikasi ===
+
+def classify(main_file=MAIN_FILE):
+    """Memuat knowledge base dan menghitung semua klasifikasi. Mengembalikan (heroes, labels, engine)."""
+    program = Program().load(main_file)
+    engine = Engine(program).run()
+    heroes = sorted(row[0] for row in engine.relations["hero"].tuples)
+    labels = program.derived_unary()
+    return heroes, labels, engine
+
+def write_table(output_file, heroes, labels, engine):
+    with open(output_file, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["hero"] + labels)
+        for hero in heroes:
+            writer.writerow([hero] + [int(engine.holds(label, hero)) for label in labels])
+
+def swipl_classification(main_file, labels):
+    """Menjalankan SWI-Prolog untuk semua label. Mengembalikan {(label, hero)} atau None jika swipl tidak ada."""
+    swipl = shutil.which("swipl")
+    if swipl is None: return None
+    query = ("forall((member(P, [%s]), hero(H), once(call(P, H))), format('~w ~w~n', [P, H]))"
+             % ", ".join(labels))
+    out = subprocess.run([swipl, "-q", "-g", query, "-t", "halt", main_file],
+                         capture_output=True, text=True, check=True).stdout
+    return {tuple(line.split()) for line in out.splitlines() if len(line.split()) == 2 and line.split()[0] in labels}
+
+def check(main_file, heroes, labels, engine):
+    """Membandingkan hasil forward chaining dengan pembuktian per hero (dan SWI-Prolog jika tersedia)."""
+    batch = {(label, hero) for label in labels for hero in heroes if engine.holds(label, hero)}
+
+    solver = TopDownSolver(engine.program)
+    start = time.perf_counter()
+    top_down = {(label, hero) for label in labels for hero in heroes if solver.prove(label, hero)}
+    print(f"Pembuktian top-down per hero: {time.perf_counter() - start:.3f} s")
+
+    ok = report_diff("top-down", batch, top_down)
+    prolog = swipl_classification(main_file, labels)
+    if prolog is None:
+        print("swipl tidak ditemukan, pembandingan dengan SWI-Prolog dilewati.")
+    else:
+        ok = report_diff("SWI-Prolog", batch, prolog) and ok
+    return ok
+
+def report_diff(name, batch, other):
+    if batch == other:
+        print(f"SAMA: hasil forward chaining cocok dengan {name} ({len(batch)} klasifikasi).")
+        return True
+    print(f"BERBEDA dengan {name}:", file=sys.stderr)
+    for label, hero in sorted(batch - other): print(f"  hanya di engine: {label}({hero})", file=sys.stderr)
+    for label, hero in sorted(other - batch): print(f"  hanya di {name}: {label}({hero})", file=sys.stderr)
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hitung semua klasifikasi KBS Dota 2 untuk semua hero sekaligus.")
+    parser.add_argument("--main", default=MAIN_FILE,
+                        help="file Prolog utama yang meng-include ABox, TBox, dan aturan KBS")
+    parser.add_argument("--output", default=OUTPUT_FILE,
+                        help="file CSV tabel klasifikasi (hero x label)")
+    parser.add_argument("--check", action="store_true",
+                        help="bandingkan hasil dengan pembuktian per hero dan SWI-Prolog (jika terpasang)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    heroes, labels, engine = classify(args.main)
+    elapsed = time.perf_counter() - start
+    print(f"Forward chaining selesai: {len(heroes)} hero, {len(labels)} label, "
+          f"{engine.iterations} iterasi, {elapsed:.3f} s")
+
+    for label in labels:
+        count = sum(1 for hero in heroes if engine.holds(label, hero))
+        print(f"  {label:<28} {count:>4} hero")
+
+    write_table(args.output, heroes, labels, engine)
+    print(f"Tabel klasifikasi disimpan ke: {args.output}")
+
+    if args.check and not check(args.main, heroes, labels, engine):
+        sys.exit(1)
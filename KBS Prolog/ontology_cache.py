@@ -0,0 +1,242 @@
+import array
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import rdflib
+
+# checksum.py ada di folder Ontologi; aboxconvertprolog.py menambahkan folder itu ke sys.path
+from checksum import file_hash
+
+# Folder cache snapshot graph (relatif terhadap folder script ini)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ontology_cache")
+
+# Naikkan jika format snapshot berubah, agar snapshot lama tidak dipakai
+CACHE_VERSION = 1
+
+
+class TripleTable:
+    """
+    Tabel triple hasil parse ontologi dalam bentuk ringkas.
+    Setiap term (URI, literal, blank node) disimpan sekali di daftar `terms`,
+    dan setiap triple hanya berupa tiga indeks ke daftar itu di array `triples`.
+    Iterasi menghasilkan (s, p, o) seperti rdflib.Graph, sehingga bisa langsung
+    dipakai oleh extract_facts.
+    """
+    def __init__(self, terms, triples):
+        self.terms = terms
+        self.triples = triples
+
+    def __len__(self):
+        return len(self.triples) // 3
+
+    def __iter__(self):
+        terms, ids = self.terms, self.triples
+        for i in range(0, len(ids), 3):
+            yield terms[ids[i]], terms[ids[i + 1]], terms[ids[i + 2]]
+
+    @classmethod
+    def from_graph(cls, g):
+        """Membangun tabel dari rdflib.Graph dengan meng-intern semua term."""
+        index = {}
+        terms = []
+        triples = array.array("I")
+        for triple in g:
+            for term in triple:
+                term_id = index.get(term)
+                if term_id is None:
+                    term_id = index[term] = len(terms)
+                    terms.append(term)
+                triples.append(term_id)
+        return cls(terms, triples)
+
+
+def _encode_term(term):
+    if isinstance(term, rdflib.URIRef):
+        return ("u", str(term))
+    if isinstance(term, rdflib.Literal):
+        datatype = str(term.datatype) if term.datatype is not None else None
+        return ("l", str(term), datatype, term.language)
+    return ("b", str(term))
+
+def _decode_term(encoded):
+    kind = encoded[0]
+    if kind == "u":
+        return rdflib.URIRef(encoded[1])
+    if kind == "l":
+        _, lexical, datatype, lang = encoded
+        return rdflib.Literal(lexical, datatype=rdflib.URIRef(datatype) if datatype else None, lang=lang)
+    return rdflib.BNode(encoded[1])
+
+
+# Snapshot diberi nama "<sumber>-<hash>.triples". Sumber membedakan file OWL
+# monolitik ("owl") dari setiap kombinasi shard, agar snapshot masing-masing
+# tidak saling menghapus saat mode dipakai bergantian.
+def cache_path(source_hash, source="owl"):
+    return os.path.join(CACHE_DIR, f"{source}-{source_hash}.triples")
+
+def save_snapshot(table, source_hash, source="owl"):
+    """
+    Menyimpan TripleTable ke cache. Snapshot lain dari sumber yang sama
+    dihapus karena sudah tidak akan pernah cocok lagi; snapshot sumber lain
+    tetap disimpan.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    payload = {
+        "version": CACHE_VERSION,
+        "source_hash": source_hash,
+        "terms": [_encode_term(t) for t in table.terms],
+        "triples": table.triples.tobytes(),
+        "typecode": table.triples.typecode,
+    }
+    target = cache_path(source_hash, source)
+    tmp = target + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, target)
+
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(f"{source}-") and name.endswith(".triples") and name != os.path.basename(target):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+def load_snapshot(source_hash, source="owl"):
+    """
+    Memuat TripleTable dari cache, atau None jika tidak ada/tidak valid.
+    File yang terbaca tetapi isinya rusak (key hilang, typecode array salah,
+    indeks term di luar daftar) juga dianggap cache miss, sehingga pemanggil
+    mem-parsing ulang file OWL.
+    """
+    try:
+        with open(cache_path(source_hash, source), "rb") as f:
+            payload = pickle.load(f)
+        if payload.get("version") != CACHE_VERSION or payload.get("source_hash") != source_hash:
+            return None
+        triples = array.array(payload["typecode"])
+        triples.frombytes(payload["triples"])
+        terms = [_decode_term(t) for t in payload["terms"]]
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, IndexError, TypeError, ValueError):
+        return None
+    if len(triples) % 3 or (triples and max(triples) >= len(terms)):
+        return None
+    return TripleTable(terms, triples)
+
+def clear_cache():
+    """Menghapus semua snapshot di folder cache. Mengembalikan jumlah file yang dihapus."""
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+    removed = 0
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".triples") or name.endswith(".tmp"):
+            os.remove(os.path.join(CACHE_DIR, name))
+            removed += 1
+    return removed
+
+
+def _parse(paths):
+    g = rdflib.Graph()
+    for path in paths:
+        g.parse(path, format="xml")
+    return g
+
+def _load_cached(paths, source_hash, use_cache, source):
+    if not use_cache:
+        return _parse(paths), False
+
+    table = load_snapshot(source_hash, source)
+    if table is not None:
+        return table, True
+
+    table = TripleTable.from_graph(_parse(paths))
+    save_snapshot(table, source_hash, source)
+    return table, False
+
+def load_ontology_triples(path, use_cache=True):
+    """
+    Memuat triple ontologi dari `path`.
+    Jika use_cache=True dan ada snapshot dengan hash isi file yang sama,
+    snapshot itu yang dipakai; jika tidak, file RDF/XML di-parse dengan rdflib
+    lalu snapshot-nya disimpan untuk pemanggilan berikutnya.
+    Mengembalikan (triples, from_cache).
+    """
+    return _load_cached([path], file_hash(path) if use_cache else None, use_cache, "owl")
+
+
+def shard_files(directory, names):
+    """
+    Path file shard `names` dari direktori shard json_to_ontology.py --sharded,
+    menurut katalog shards.json di direktori itu.
+    """
+    with open(os.path.join(directory, "shards.json"), "r", encoding="utf-8") as f:
+        catalog = json.load(f)
+    return [os.path.join(directory, catalog["shards"][name]["file"]) for name in names]
+
+def load_shard_triples(paths, use_cache=True):
+    """
+    Seperti load_ontology_triples, tetapi untuk beberapa file shard yang
+    di-parse ke satu graph. Kunci cache adalah hash gabungan isi semua file,
+    sehingga snapshot ikut berubah jika salah satu shard berubah. Setiap
+    kombinasi shard (misalnya dengan/tanpa items untuk --sqlite) punya
+    snapshot sendiri.
+    Mengembalikan (triples, from_cache).
+    """
+    source = "shards_" + "_".join(os.path.splitext(os.path.basename(path))[0] for path in paths)
+    source_hash = None
+    if use_cache:
+        source_hash = hashlib.sha256("".join(file_hash(path) for path in paths).encode("ascii")).hexdigest()
+    return _load_cached(paths, source_hash, use_cache, source)
+
+
+def load_quadstore_triples(path, predicates=None):
+    """
+    Membaca triple langsung dari quadstore SQLite owlready2 yang ditulis oleh
+    json_to_ontology.py (--output-format sqlite/both), tanpa parse RDF/XML.
+    Jika `predicates` diberikan, hanya triple dengan predikat tersebut yang
+    dibaca, memakai index SQLite. Mengembalikan TripleTable.
+    """
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        iris = dict(db.execute("SELECT storid, iri FROM resources"))
+        storid_of = {iri: storid for storid, iri in iris.items()}
+
+        obj_query = "SELECT s, p, o FROM objs"
+        data_query = "SELECT s, p, o, d FROM datas"
+        params = ()
+        if predicates is not None:
+            params = tuple(storid_of[str(p)] for p in predicates if str(p) in storid_of)
+            condition = " WHERE p IN (%s)" % ",".join("?" * len(params))
+            obj_query += condition
+            data_query += condition
+
+        index = {}
+        terms = []
+        triples = array.array("I")
+
+        def intern(key, make):
+            term_id = index.get(key)
+            if term_id is None:
+                term_id = index[key] = len(terms)
+                terms.append(make())
+            return term_id
+
+        def resource(storid):
+            # storid negatif adalah blank node (tidak ada di tabel resources)
+            if storid < 0: return intern(storid, lambda: rdflib.BNode(f"b{-storid}"))
+            return intern(storid, lambda: rdflib.URIRef(iris[storid]))
+
+        def literal(value, d):
+            if isinstance(d, str) and d.startswith("@"):
+                make = lambda: rdflib.Literal(str(value), lang=d[1:])
+            elif d in (None, 0, 60):
+                make = lambda: rdflib.Literal(str(value))
+            else:
+                make = lambda: rdflib.Literal(str(value), datatype=rdflib.URIRef(iris[d]))
+            return intern(("literal", value, d), make)
+
+        for s, p, o in db.execute(obj_query, params):
+            triples.extend((resource(s), resource(p), resource(o)))
+        for s, p, o, d in db.execute(data_query, params):
+            triples.extend((resource(s), resource(p), literal(o, d)))
+    finally:
+        db.close()
+    return TripleTable(terms, triples)
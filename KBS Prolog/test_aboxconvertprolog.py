@@ -0,0 +1,17 @@
+import aboxconvertprolog
+from aboxconvertprolog import OUTPUT_FILE, convert_json
+
+
+def test_from_json_matches_abox(tmp_path):
+    """ABox dari file JSON harus identik byte per byte dengan abox_dota2.pl (hasil dari OWL)."""
+    output = tmp_path / "abox_dota2.pl"
+    assert convert_json(output_file=str(output))
+    with open(OUTPUT_FILE, "rb") as f: expected = f.read()
+    assert output.read_bytes() == expected
+
+
+def test_from_json_reports_missing_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(aboxconvertprolog, "HEROES_FILE", str(tmp_path / "heroes.json"))
+    output = tmp_path / "abox_dota2.pl"
+    assert not convert_json(output_file=str(output))
+    assert not output.exists()
@@ -0,0 +1,34 @@
+import pytest
+
+from hero_matrix import HeroMatrix, check
+
+
+@pytest.fixture(scope="module")
+def matrix(script_dir):
+    return HeroMatrix.from_abox()
+
+
+def heroes_with(matrix, *columns, min_active=None):
+    """Hero yang punya semua kolom boolean `columns` (dan minimal `min_active` ability aktif), dihitung tanpa where()."""
+    result = set(matrix.heroes)
+    for column in columns: result &= set(matrix.col(column).heroes())
+    if min_active is not None:
+        counts = matrix.counts["active_ability_count"]
+        result &= {hero for i, hero in enumerate(matrix.heroes) if counts[i] >= min_active}
+    return result
+
+
+@pytest.mark.parametrize("query, columns", [
+    ("active_ability_count >= 3 & is_nuker", ("is_nuker",)),
+    ("is_intelligence_hero & active_ability_count >= 3 & is_nuker", ("is_intelligence_hero", "is_nuker")),
+    ("is_intelligence_hero & active_ability_count >= 3", ("is_intelligence_hero",)),
+    ("active_ability_count>=3&is_intelligence_hero", ("is_intelligence_hero",)),
+])
+def test_comparison_in_any_position(matrix, query, columns):
+    expected = heroes_with(matrix, *columns, min_active=3)
+    assert expected
+    assert set(matrix.where(query).heroes()) == expected
+
+
+def test_columns_match_kbs_rules(matrix):
+    assert check(matrix)
@@ -0,0 +1,25 @@
+import pytest
+
+from kbs_engine import OUTPUT_FILE, TopDownSolver, classify, write_table
+
+
+@pytest.fixture(scope="module")
+def classification(script_dir):
+    return classify()
+
+
+def test_forward_chaining_matches_top_down(classification):
+    """Setiap klasifikasi hasil forward chaining harus sama dengan pembuktian top-down per hero."""
+    heroes, labels, engine = classification
+    solver = TopDownSolver(engine.program)
+    batch = {(label, hero) for label in labels for hero in heroes if engine.holds(label, hero)}
+    top_down = {(label, hero) for label in labels for hero in heroes if solver.prove(label, hero)}
+    assert batch
+    assert batch == top_down
+
+
+def test_table_matches_committed_csv(classification, tmp_path):
+    output = tmp_path / OUTPUT_FILE
+    write_table(str(output), *classification)
+    with open(OUTPUT_FILE, "rb") as f: expected = f.read()
+    assert output.read_bytes() == expected
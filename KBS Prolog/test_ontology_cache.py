@@ -0,0 +1,42 @@
+import pickle
+
+import pytest
+import rdflib
+
+import ontology_cache
+from ontology_cache import TripleTable, cache_path, load_snapshot, save_snapshot
+
+EX = rdflib.Namespace("http://example.org/")
+
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    """Snapshot kecil yang valid di folder cache sementara. Mengembalikan (path, payload)."""
+    monkeypatch.setattr(ontology_cache, "CACHE_DIR", str(tmp_path))
+    g = rdflib.Graph()
+    g.add((EX.antimage, EX.hasRole, EX.Carry))
+    g.add((EX.antimage, EX.localizedName, rdflib.Literal("Anti-Mage")))
+    save_snapshot(TripleTable.from_graph(g), "abc")
+    path = cache_path("abc")
+    with open(path, "rb") as f: payload = pickle.load(f)
+    return path, payload
+
+
+def test_snapshot_round_trip(snapshot):
+    table = load_snapshot("abc")
+    assert len(table) == 2
+    assert (EX.antimage, EX.hasRole, EX.Carry) in set(table)
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda p: {k: v for k, v in p.items() if k != "terms"},
+    lambda p: dict(p, typecode="Q!"),
+    lambda p: dict(p, triples=p["triples"][:-1]),
+    lambda p: dict(p, terms=p["terms"][:1]),
+    lambda p: dict(p, terms=[("l",)] + p["terms"][1:]),
+    lambda p: [p],
+])
+def test_corrupt_snapshot_is_a_cache_miss(snapshot, corrupt):
+    path, payload = snapshot
+    with open(path, "wb") as f: pickle.dump(corrupt(payload), f)
+    assert load_snapshot("abc") is None
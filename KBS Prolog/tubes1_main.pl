@@ -4,6 +4,8 @@
 :- include('abox_dota2.pl').
 :- include('tbox_dota2.pl').
 :- include('kbsrules_dota2.pl').
+:- include('item_tree_dota2.pl').
+:- include('hero_pairs_dota2.pl').
 
 :- initialization(main).
 
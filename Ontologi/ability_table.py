@@ -0,0 +1,314 @@
+import argparse
+import json
+import os
+import re
+import time
+
+import numpy as np
+
+from checksum import file_hash
+
+# Folder for the cached tables (relative to this script), keyed by the hash of abilities.json
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ability_table_cache")
+
+# Bump when the table layout changes so old caches are ignored
+CACHE_VERSION = 1
+
+# mc and cd are stored as rows too, under Dota's own attribute names
+MANA_COST_KEY = "abilitymanacost"
+COOLDOWN_KEY = "abilitycooldown"
+
+
+def parse_number(raw):
+    """Parses an attrib value such as "0.8", "-30%" or 12. Returns (value, is_percent) or None."""
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool): return float(raw), False
+    if not isinstance(raw, str): return None
+    text = raw.strip()
+    percent = text.endswith("%")
+    try:
+        return float(text.rstrip("%")), percent
+    except ValueError:
+        return None
+
+
+class AbilityTable:
+    """
+    Columnar table of every numeric ability value in abilities.json, one row
+    per (ability, attribute, level). Levels are 1-based. A scalar value
+    applies to every level of its ability, where the level count is the
+    longest per-level list among the ability's attrib, mc and cd.
+
+    Row columns: ability (index into `abilities`), attribute (index into
+    `attributes`), level, value, percent, mana_cost and cooldown (NaN when
+    the ability has none at that level). Per-ability columns: behaviors
+    (bitmask over `behavior_names`) and damage_type (index into
+    `damage_types`, -1 for none).
+
+    Values that cannot be parsed are listed in `errors` as
+    (ability, field, raw value) instead of being dropped silently.
+    """
+    ROW_COLUMNS = ("ability", "attribute", "level", "value", "percent", "mana_cost", "cooldown")
+
+    def __init__(self, arrays, errors=()):
+        self.abilities = arrays["abilities"]
+        self.attributes = arrays["attributes"]
+        self.behavior_names = arrays["behavior_names"]
+        self.damage_types = arrays["damage_types"]
+        self.behaviors = arrays["behaviors"]
+        self.damage_type = arrays["damage_type"]
+        for name in self.ROW_COLUMNS: setattr(self, name, arrays[name])
+        self.errors = list(errors)
+        self._attribute_ids = {key: i for i, key in enumerate(self.attributes.tolist())}
+        self._pattern_ids = {}
+
+    def __len__(self):
+        return len(self.value)
+
+    @classmethod
+    def from_json(cls, abilities_data):
+        abilities = sorted(abilities_data)
+        attribute_ids = {MANA_COST_KEY: 0, COOLDOWN_KEY: 1}
+        behavior_ids = {}
+        damage_ids = {}
+        rows = {name: [] for name in cls.ROW_COLUMNS}
+        behaviors = np.zeros(len(abilities), dtype=np.int64)
+        damage_type = np.full(len(abilities), -1, dtype=np.int16)
+        errors = []
+
+        def per_level(ability_key, field, raw):
+            values = raw if isinstance(raw, list) else [raw]
+            parsed = []
+            for value in values:
+                number = parse_number(value)
+                if number is None: errors.append((ability_key, field, value))
+                parsed.append(number)
+            return parsed, isinstance(raw, list)
+
+        for ability_id, ability_key in enumerate(abilities):
+            info = abilities_data[ability_key]
+            fields = []
+            for field in ("mc", "cd"):
+                if info.get(field) not in (None, "", []): fields.append((field, *per_level(ability_key, field, info[field])))
+            for attrib in info.get("attrib") or []:
+                if attrib.get("value") in (None, "", []): continue
+                fields.append((attrib["key"], *per_level(ability_key, attrib["key"], attrib["value"])))
+            if not fields: continue
+
+            n_levels = max(len(parsed) if is_list else 1 for _, parsed, is_list in fields)
+
+            def expand(parsed, is_list):
+                return parsed if is_list else parsed * n_levels
+
+            by_field = {field: expand(parsed, is_list) for field, parsed, is_list in fields}
+            mana = [v[0] if v else np.nan for v in by_field.get("mc", [])]
+            cooldown = [v[0] if v else np.nan for v in by_field.get("cd", [])]
+
+            for field, parsed, is_list in fields:
+                key = {"mc": MANA_COST_KEY, "cd": COOLDOWN_KEY}.get(field, field)
+                attribute_id = attribute_ids.setdefault(key, len(attribute_ids))
+                for level, number in enumerate(expand(parsed, is_list), 1):
+                    if number is None: continue
+                    rows["ability"].append(ability_id)
+                    rows["attribute"].append(attribute_id)
+                    rows["level"].append(level)
+                    rows["value"].append(number[0])
+                    rows["percent"].append(number[1])
+                    rows["mana_cost"].append(mana[level - 1] if level <= len(mana) else np.nan)
+                    rows["cooldown"].append(cooldown[level - 1] if level <= len(cooldown) else np.nan)
+
+            behavior_list = info.get("behavior")
+            if isinstance(behavior_list, str): behavior_list = [behavior_list]
+            for name in behavior_list or []:
+                behaviors[ability_id] |= 1 << behavior_ids.setdefault(name, len(behavior_ids))
+            if info.get("dmg_type"):
+                damage_type[ability_id] = damage_ids.setdefault(info["dmg_type"], len(damage_ids))
+
+        if len(behavior_ids) > 63: raise ValueError("more than 63 distinct behaviors do not fit the bitmask")
+
+        arrays = {
+            "abilities": np.array(abilities, dtype=str),
+            "attributes": np.array(list(attribute_ids), dtype=str),
+            "behavior_names": np.array(list(behavior_ids), dtype=str),
+            "damage_types": np.array(list(damage_ids), dtype=str),
+            "behaviors": behaviors,
+            "damage_type": damage_type,
+            "ability": np.array(rows["ability"], dtype=np.int32),
+            "attribute": np.array(rows["attribute"], dtype=np.int32),
+            "level": np.array(rows["level"], dtype=np.int16),
+            "value": np.array(rows["value"], dtype=np.float64),
+            "percent": np.array(rows["percent"], dtype=bool),
+            "mana_cost": np.array(rows["mana_cost"], dtype=np.float64),
+            "cooldown": np.array(rows["cooldown"], dtype=np.float64),
+        }
+        return cls(arrays, errors)
+
+    def save(self, path):
+        arrays = {name: getattr(self, name) for name in
+                  ("abilities", "attributes", "behavior_names", "damage_types", "behaviors", "damage_type") + self.ROW_COLUMNS}
+        errors = np.array([json.dumps(e) for e in self.errors], dtype=str)
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, version=np.array(CACHE_VERSION), errors=errors, **arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != CACHE_VERSION: return None
+            arrays = {name: data[name] for name in data.files}
+        return cls(arrays, [tuple(json.loads(e)) for e in arrays["errors"]])
+
+    # --- Queries ---
+
+    def attribute_ids(self, pattern):
+        """Ids of the attributes whose key matches the regular expression `pattern`."""
+        ids = self._pattern_ids.get(pattern)
+        if ids is None:
+            regex = re.compile(pattern)
+            ids = self._pattern_ids[pattern] = np.array([i for key, i in self._attribute_ids.items() if regex.search(key)], dtype=np.int32)
+        return ids
+
+    def pivot(self, pattern, level=None, reduce=np.fmax):
+        """
+        One value per ability for the attributes matching `pattern`, at
+        `level` (or each ability's highest level when None). Several matching
+        attributes on one ability are combined with `reduce` (max by default).
+        Abilities without a match get NaN.
+        """
+        mask = np.isin(self.attribute, self.attribute_ids(pattern))
+        if level is not None:
+            mask &= self.level == level
+        result = np.full(len(self.abilities), np.nan)
+        rows = np.flatnonzero(mask)
+        if level is None and len(rows):
+            # Keep only the highest level row of each (ability, attribute)
+            order = np.lexsort((self.level[rows], self.attribute[rows], self.ability[rows]))
+            rows = rows[order]
+            last = np.ones(len(rows), dtype=bool)
+            last[:-1] = (self.ability[rows][1:] != self.ability[rows][:-1]) | (self.attribute[rows][1:] != self.attribute[rows][:-1])
+            rows = rows[last]
+        reduce.at(result, self.ability[rows], self.value[rows])
+        return result
+
+    def has_behavior(self, name):
+        """Boolean mask over abilities that have the given behavior (e.g. "AOE")."""
+        names = self.behavior_names.tolist()
+        if name not in names: return np.zeros(len(self.abilities), dtype=bool)
+        return (self.behaviors >> names.index(name)) & 1 == 1
+
+    def rank(self, pattern, per=None, level=None, behavior=None, require=None, ascending=False, limit=10):
+        """
+        Ranks abilities by the attribute matching `pattern`, optionally
+        divided by the attribute matching `per`, restricted to abilities with
+        `behavior` and with a positive value for the attribute matching
+        `require`. Returns [(ability, score), ...].
+        """
+        score = self.pivot(pattern, level)
+        if per is not None:
+            denominator = self.pivot(per, level)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                score = np.where(denominator > 0, score / denominator, np.nan)
+        valid = ~np.isnan(score)
+        if behavior is not None: valid &= self.has_behavior(behavior)
+        if require is not None: valid &= self.pivot(require, level) > 0
+        candidates = np.flatnonzero(valid)
+        order = np.argsort(score[candidates] if ascending else -score[candidates], kind="stable")[:limit]
+        return [(self.abilities[i], float(score[i])) for i in candidates[order]]
+
+
+def load_table(path, use_cache=True):
+    """
+    Returns (AbilityTable, from_cache) for the abilities file at `path`. The
+    table is parsed once and cached as .npz under the SHA-256 of the file, so
+    it is rebuilt only when abilities.json changes.
+    """
+    if not use_cache:
+        with open(path, "r", encoding="utf-8") as f: return AbilityTable.from_json(json.load(f)), False
+
+    cache_file = os.path.join(CACHE_DIR, f"{file_hash(path)}.npz")
+    if os.path.exists(cache_file):
+        table = AbilityTable.load(cache_file)
+        if table is not None: return table, True
+
+    with open(path, "r", encoding="utf-8") as f: table = AbilityTable.from_json(json.load(f))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    table.save(cache_file)
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".npz") and name != os.path.basename(cache_file):
+            os.remove(os.path.join(CACHE_DIR, name))
+    return table, False
+
+
+if __name__ == '__main__':
+    ABILITIES_FILE = 'abilities.json'
+
+    parser = argparse.ArgumentParser(description="Query per-level numeric ability values from abilities.json.")
+    parser.add_argument("--rank", metavar="REGEX", help="rank abilities by the attribute whose key matches REGEX")
+    parser.add_argument("--per", metavar="REGEX", help="divide the ranked value by this attribute (e.g. abilitymanacost)")
+    parser.add_argument("--level", type=int, help="ability level to compare (default: each ability's highest level)")
+    parser.add_argument("--behavior", help='only abilities with this behavior, e.g. "AOE"')
+    parser.add_argument("--require", metavar="REGEX", help="only abilities with a positive value for this attribute")
+    parser.add_argument("--ascending", action="store_true", help="lowest values first")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--no-cache", action="store_true", help="always parse abilities.json, without reading or writing the cache")
+    parser.add_argument("--bench", action="store_true", help="time the query against parsing the JSON strings in a Python loop")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table, from_cache = load_table(ABILITIES_FILE, use_cache=not args.no_cache)
+    print(f"Ability table {'loaded from cache' if from_cache else 'built'}: {len(table)} rows, "
+          f"{len(table.abilities)} abilities, {len(table.attributes)} attributes "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms.")
+    if table.errors:
+        print(f"{len(table.errors)} values could not be parsed, e.g. {table.errors[:3]}")
+
+    if args.rank:
+        query = dict(pattern=args.rank, per=args.per, level=args.level, behavior=args.behavior,
+                     require=args.require, ascending=args.ascending, limit=args.limit)
+        start = time.perf_counter()
+        results = table.rank(**query)
+        print(f"\nQuery: {(time.perf_counter() - start) * 1000:.2f} ms")
+        for ability, score in results:
+            print(f"  {score:12.3f}  {ability}")
+
+        if args.bench:
+            repeat = 50
+            start = time.perf_counter()
+            for _ in range(repeat): table.rank(**query)
+            print(f"Vectorized:  {(time.perf_counter() - start) / repeat * 1000:.2f} ms per query")
+
+            rank_re, per_re = re.compile(args.rank), re.compile(args.per) if args.per else None
+            require_re = re.compile(args.require) if args.require else None
+
+            def at_level(raw, level):
+                values = raw if isinstance(raw, list) else [raw]
+                index = len(values) - 1 if level is None else level - 1
+                if index >= len(values) and isinstance(raw, list): return None
+                number = parse_number(values[min(index, len(values) - 1)])
+                return number[0] if number else None
+
+            def python_loop():
+                with open(ABILITIES_FILE, "r", encoding="utf-8") as f: data = json.load(f)
+                scores = []
+                for key, info in data.items():
+                    behaviors = info.get("behavior")
+                    if isinstance(behaviors, str): behaviors = [behaviors]
+                    if args.behavior and args.behavior not in (behaviors or []): continue
+                    values = {"abilitymanacost": info.get("mc"), "abilitycooldown": info.get("cd")}
+                    values.update({a["key"]: a.get("value") for a in info.get("attrib") or []})
+                    def best(regex):
+                        found = [at_level(v, args.level) for k, v in values.items() if v not in (None, "", []) and regex.search(k)]
+                        found = [v for v in found if v is not None]
+                        return max(found) if found else None
+                    score = best(rank_re)
+                    if score is None: continue
+                    if per_re:
+                        denominator = best(per_re)
+                        if not denominator or denominator <= 0: continue
+                        score /= denominator
+                    if require_re and not (best(require_re) or 0) > 0: continue
+                    scores.append((score, key))
+                return sorted(scores, reverse=not args.ascending)[:args.limit]
+
+            start = time.perf_counter()
+            for _ in range(3): python_loop()
+            print(f"Python loop: {(time.perf_counter() - start) / 3 * 1000:.2f} ms per query (parsing abilities.json each time)")
@@ -0,0 +1,194 @@
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+from synthetic_data import dataset_counts, generate, load_source, write_dataset
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ONTOLOGY_DIR = os.path.join(REPO_DIR, "Ontologi")
+PROLOG_DIR = os.path.join(REPO_DIR, "KBS Prolog")
+
+# name -> (folder the script lives in and runs from, script and arguments).
+# Runs go in this order: abox_owl converts the ontology written by the runs before it.
+RUNS = {
+    "ontology_full": ("Ontologi", ["json_to_ontology.py"]),
+    "ontology_bulk": ("Ontologi", ["json_to_ontology.py", "--bulk"]),
+    "ontology_parallel": ("Ontologi", ["json_to_ontology.py", "--workers", str(os.cpu_count() or 1)]),
+    "abox_owl": ("KBS Prolog", ["aboxconvertprolog.py", "--no-cache"]),
+    "abox_json": ("KBS Prolog", ["aboxconvertprolog.py", "--from-json"]),
+}
+
+# Stage counters used as the throughput unit, in order of preference
+THROUGHPUT_UNITS = ("records", "triples", "facts")
+
+# Stages shorter than this in the baseline are too noisy to compare
+MIN_STAGE_SECONDS = 0.05
+
+
+def run_script(name, workspace, profile_path):
+    """
+    Runs one pipeline script on the dataset in `workspace` and returns
+    (wall seconds, peak RSS in MiB, stage profile report). The script runs
+    from the repository but with its working directory in the workspace, so
+    it reads and writes the synthetic files there.
+    """
+    folder, argv = RUNS[name]
+    script_dir = ONTOLOGY_DIR if folder == "Ontologi" else PROLOG_DIR
+    cwd = os.path.join(workspace, folder)
+    command = [sys.executable, os.path.join(script_dir, argv[0]), *argv[1:],
+               "--profile", profile_path, "--profile-no-tracemalloc"]
+    with open(os.path.join(workspace, f"{name}.log"), "w", encoding="utf-8") as log:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=cwd, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(process.pid, 0)
+        wall = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"{name} failed with exit code {process.returncode}, see {log.name}")
+    # ru_maxrss is in KiB on Linux
+    peak_rss = usage.ru_maxrss / 1024
+    with open(profile_path, 'r', encoding='utf-8') as f: report = json.load(f)
+    return wall, peak_rss, report
+
+
+def summarize(wall, peak_rss, report, entities):
+    stages = {}
+    for stage in report["stages"]:
+        unit = next((u for u in THROUGHPUT_UNITS if stage["counters"].get(u)), None)
+        count = stage["counters"][unit] if unit else entities
+        stages[stage["name"]] = {
+            "wall_s": stage["wall_s"],
+            "unit": unit or "entities",
+            "count": count,
+            "per_s": round(count / stage["wall_s"], 1) if stage["wall_s"] else None,
+        }
+    return {
+        "wall_s": round(wall, 3),
+        "peak_rss_mib": round(peak_rss, 1),
+        "entities": entities,
+        "entities_per_s": round(entities / wall, 1),
+        "stages": stages,
+    }
+
+
+def run_suite(scales, runs, seed, workdir):
+    source = load_source(ONTOLOGY_DIR)
+    results = {}
+    for scale in scales:
+        workspace = os.path.join(workdir, f"{scale}x")
+        if os.path.exists(workspace): shutil.rmtree(workspace)
+        os.makedirs(os.path.join(workspace, "KBS Prolog"))
+        data = generate(source, scale, seed)
+        write_dataset(data, os.path.join(workspace, "Ontologi"))
+        counts = dataset_counts(data)
+        entities = sum(counts.values())
+        del data
+        print(f"\n{scale}x: {counts['heroes']} heroes, {counts['abilities']} abilities, {counts['items']} items")
+
+        results[str(scale)] = {"counts": counts}
+        for name in RUNS:
+            if name not in runs: continue
+            wall, peak_rss, report = run_script(name, workspace, os.path.join(workspace, f"{name}.profile.json"))
+            summary = results[str(scale)][name] = summarize(wall, peak_rss, report, entities)
+            print(f"  {name:<17} {wall:8.2f} s  {summary['entities_per_s']:>10,.0f} entities/s  "
+                  f"{peak_rss:7.1f} MiB peak RSS")
+    return results
+
+
+def scaling_lines(results):
+    """One line per run: wall time per scale and the exponent between consecutive scales (1.0 = linear)."""
+    scales = sorted(results, key=int)
+    runs = [name for name in RUNS if any(name in results[s] for s in scales)]
+    for name in runs:
+        points = [(int(s), results[s][name]["wall_s"]) for s in scales if name in results[s]]
+        cells = "  ".join(f"{s}x {t:.2f}s" for s, t in points)
+        exponents = [math.log(t2 / t1) / math.log(s2 / s1) for (s1, t1), (s2, t2) in zip(points, points[1:]) if t1 and s2 != s1]
+        curve = ", ".join(f"{e:.2f}" for e in exponents)
+        yield f"  {name:<17} {cells}" + (f"   exponent {curve}" if curve else "")
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """
+    Yields a line for every run or stage whose throughput fell (or peak RSS
+    grew) by more than `tolerance` compared with the baseline at the same scale.
+    """
+    for scale, runs in results.items():
+        for name, summary in runs.items():
+            if name == "counts": continue
+            base = baseline.get("results", {}).get(scale, {}).get(name)
+            if base is None: continue
+            if summary["entities_per_s"] < base["entities_per_s"] * (1 - tolerance):
+                yield (f"{scale}x {name}: {summary['entities_per_s']:,.0f} entities/s, "
+                       f"baseline {base['entities_per_s']:,.0f}")
+            if summary["peak_rss_mib"] > base["peak_rss_mib"] * (1 + tolerance):
+                yield f"{scale}x {name}: peak RSS {summary['peak_rss_mib']} MiB, baseline {base['peak_rss_mib']} MiB"
+            for stage, values in summary["stages"].items():
+                base_stage = base["stages"].get(stage)
+                if base_stage is None or base_stage["wall_s"] < MIN_STAGE_SECONDS or not base_stage["per_s"]: continue
+                if values["unit"] != base_stage["unit"] or values["per_s"] is None: continue
+                if values["per_s"] < base_stage["per_s"] * (1 - tolerance):
+                    yield (f"{scale}x {name} / {stage}: {values['per_s']:,.0f} {values['unit']}/s, "
+                           f"baseline {base_stage['per_s']:,.0f}")
+
+
+if __name__ == '__main__':
+    BASELINE_FILE = 'benchmark_baseline.json'
+    RESULTS_FILE = 'benchmark_results.json'
+    WORK_DIR = '.benchmark'
+
+    parser = argparse.ArgumentParser(description="Benchmark json_to_ontology.py and aboxconvertprolog.py on scaled synthetic datasets.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10],
+                        help="dataset sizes as multiples of the stock data (100 takes tens of minutes)")
+    parser.add_argument("--runs", nargs="+", choices=list(RUNS), default=list(RUNS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", default=WORK_DIR, help="where the datasets and outputs of every scale are written")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed throughput drop / memory growth against the baseline before failing")
+    parser.add_argument("--update-baseline", action="store_true", help=f"store these results as the new '{BASELINE_FILE}'")
+    args = parser.parse_args()
+
+    results = run_suite(args.scales, set(args.runs), args.seed, os.path.abspath(args.workdir))
+    output = {
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        # ontology_parallel uses this many workers; on 1 CPU it measures no speedup
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    with open(RESULTS_FILE, 'w', encoding='utf-8') as f: json.dump(output, f, indent=2)
+    print(f"\nResults written to '{RESULTS_FILE}'.")
+
+    if len(args.scales) > 1:
+        print("\nScaling (wall time):")
+        for line in scaling_lines(results): print(line)
+
+    if args.update_baseline:
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f: previous = json.load(f)
+            # Keep the scales and runs this invocation did not measure
+            for scale, runs in previous.get("results", {}).items():
+                for name, summary in runs.items(): output["results"].setdefault(scale, {}).setdefault(name, summary)
+        with open(args.baseline, 'w', encoding='utf-8') as f: json.dump(output, f, indent=2)
+        print(f"Baseline '{args.baseline}' updated.")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f: baseline = json.load(f)
+        if baseline.get("seed") != args.seed: print(f"\nWarning: baseline was recorded with seed {baseline.get('seed')}.")
+        if baseline.get("cpus") != output["cpus"]:
+            print(f"\nWarning: baseline was recorded with {baseline.get('cpus')} CPUs, this run has {output['cpus']}; "
+                  f"ontology_parallel is not comparable.")
+        regressions = list(compare_to_baseline(results, baseline, args.tolerance))
+        if regressions:
+            print(f"\nREGRESSION against '{args.baseline}' (tolerance {args.tolerance:.0%}):")
+            for line in regressions: print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against '{args.baseline}' (tolerance {args.tolerance:.0%}).")
+    else:
+        print(f"\nNo baseline at '{args.baseline}'; run with --update-baseline to record one.")
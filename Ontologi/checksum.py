@@ -0,0 +1,10 @@
+import hashlib
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents as hex, read in 1 MiB chunks. Used as a cache and manifest key."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
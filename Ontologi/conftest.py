@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+# The scripts in this folder open their JSON and OWL files relative to it
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def script_dir():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(SCRIPT_DIR)
+        yield SCRIPT_DIR
@@ -0,0 +1,279 @@
+import argparse
+import json
+import os
+import re
+import time
+from collections import defaultdict
+
+import numpy as np
+
+# Number of counter and synergy partners kept per hero
+TOP_K = 5
+
+# Rows of the pair matrix computed at once; memory use is BLOCK_SIZE x heroes
+BLOCK_SIZE = 512
+
+ROLES = ("Carry", "Support", "Nuker", "Disabler", "Initiator", "Durable", "Escape", "Pusher", "Jungler")
+DAMAGE_TYPES = ("Magical", "Physical", "Pure")
+
+DISABLE_RE = re.compile(r"\b(stun|root|hex|silence|sleep|taunt|fear|cyclone|disarm|leash)", re.IGNORECASE)
+ILLUSION_RE = re.compile(r"\billusion", re.IGNORECASE)
+
+# How well two roles complement each other in the same team (symmetric)
+ROLE_COMPLEMENT = {
+    ("Carry", "Support"): 1.0,
+    ("Initiator", "Nuker"): 0.8,
+    ("Disabler", "Nuker"): 0.6,
+    ("Initiator", "Carry"): 0.5,
+    ("Durable", "Carry"): 0.4,
+    ("Disabler", "Carry"): 0.4,
+    ("Pusher", "Support"): 0.3,
+}
+
+SYNERGY_WEIGHTS = {"roles": 1.0, "damage_mix": 0.5, "combo": 0.8, "attack_mix": 0.2}
+COUNTER_WEIGHTS = {"lockdown": 1.0, "aoe_vs_illusions": 0.8, "magic_vs_tanks": 0.6, "physical_vs_squishy": 0.4, "kiting": 0.3}
+
+
+class HeroProfileCollector:
+    """
+    Collects what the pair scores need from the record ops as they stream
+    past (see json_to_ontology.py): each hero's roles, attack type, stats and
+    abilities, and each ability's behaviors, damage type and description.
+    """
+    def __init__(self):
+        self.heroes = []
+        self.roles = defaultdict(set)
+        self.attack = {}
+        self.stats = defaultdict(dict)
+        self.hero_abilities = defaultdict(list)
+        self.behaviors = defaultdict(set)
+        self.damage = {}
+        self.descriptions = {}
+
+    def add_ops(self, ops):
+        for op in ops:
+            action, kind, name = op[0], op[1], op[2]
+            if kind == "hero":
+                if action == "new" and name not in self.roles and name not in self.attack:
+                    self.heroes.append(name)
+                elif action == "rel" and op[3] == "hasRole": self.roles[name].add(op[5])
+                elif action == "rel" and op[3] == "hasAttackType": self.attack[name] = op[5]
+                elif action == "rel" and op[3] == "hasAbility": self.hero_abilities[name].append(op[5])
+                elif action == "data" and op[3] in ("armor", "magicResistance"): self.stats[name][op[3]] = op[4]
+            elif kind == "ability" and action == "rel":
+                if op[3] == "hasBehavior": self.behaviors[name].add(op[5])
+                elif op[3] == "hasDamageType": self.damage[name] = op[5]
+            elif kind == "ability" and action == "data" and op[3] == "description":
+                self.descriptions[name] = op[4]
+
+    def track(self, records):
+        """Passes records through unchanged, collecting hero profiles on the way."""
+        for record_key, ops in records:
+            self.add_ops(ops)
+            yield record_key, ops
+
+    def features(self):
+        """Returns (hero names, HeroFeatures) for every hero seen."""
+        heroes = list(dict.fromkeys(self.heroes))
+        n = len(heroes)
+        roles = np.zeros((n, len(ROLES)), dtype=np.float32)
+        damage = np.zeros((n, len(DAMAGE_TYPES)), dtype=np.float32)
+        counts = np.zeros((n, 4), dtype=np.float32)  # aoe, disable, passive, illusion
+        melee = np.zeros(n, dtype=np.float32)
+        armor = np.zeros(n, dtype=np.float32)
+        magic_resistance = np.zeros(n, dtype=np.float32)
+
+        for i, hero in enumerate(heroes):
+            for role in self.roles[hero]:
+                if role in ROLES: roles[i, ROLES.index(role)] = 1
+            melee[i] = self.attack.get(hero) == "Melee"
+            armor[i] = self.stats[hero].get("armor", 0) or 0
+            magic_resistance[i] = self.stats[hero].get("magicResistance", 0) or 0
+            for ability in self.hero_abilities[hero]:
+                behaviors = self.behaviors.get(ability, set())
+                text = self.descriptions.get(ability, "")
+                passive = "Passive" in behaviors
+                if "AOE" in behaviors: counts[i, 0] += 1
+                if DISABLE_RE.search(text): counts[i, 1] += 1
+                if passive: counts[i, 2] += 1
+                if ILLUSION_RE.search(text): counts[i, 3] += 1
+                if not passive and self.damage.get(ability) in DAMAGE_TYPES:
+                    damage[i, DAMAGE_TYPES.index(self.damage[ability])] += 1
+        return heroes, HeroFeatures(roles, damage, counts, melee, armor, magic_resistance)
+
+
+class HeroFeatures:
+    """Per-hero feature arrays, normalized to [0, 1] where a score needs it."""
+    def __init__(self, roles, damage, counts, melee, armor, magic_resistance):
+        self.roles = roles
+        self.damage = damage
+        self.counts = counts
+        self.melee = melee
+        self.armor = armor
+        self.magic_resistance = magic_resistance
+
+        def unit(column):
+            peak = column.max() if len(column) else 0
+            return column / peak if peak > 0 else column
+
+        self.aoe, self.disable, self.passive, self.illusion = (unit(counts[:, j]) for j in range(4))
+        totals = damage.sum(axis=1, keepdims=True)
+        self.damage_share = np.divide(damage, totals, out=np.zeros_like(damage), where=totals > 0)
+        norms = np.linalg.norm(damage, axis=1, keepdims=True)
+        self.damage_unit = np.divide(damage, norms, out=np.zeros_like(damage), where=norms > 0)
+        self.has_damage = (totals[:, 0] > 0).astype(np.float32)
+        self.low_armor = 1 - unit(armor - armor.min()) if len(armor) else armor
+        self.low_magic_resistance = 1 - unit(magic_resistance - magic_resistance.min()) if len(magic_resistance) else magic_resistance
+
+    def __len__(self):
+        return len(self.melee)
+
+    def role(self, name):
+        return self.roles[:, ROLES.index(name)]
+
+    def take(self, index):
+        """Features of the heroes at `index` (used to build synthetic pools)."""
+        return HeroFeatures(self.roles[index], self.damage[index], self.counts[index], self.melee[index],
+                            self.armor[index], self.magic_resistance[index])
+
+
+def role_complement_matrix():
+    matrix = np.zeros((len(ROLES), len(ROLES)), dtype=np.float32)
+    for (a, b), weight in ROLE_COMPLEMENT.items():
+        matrix[ROLES.index(a), ROLES.index(b)] = matrix[ROLES.index(b), ROLES.index(a)] = weight
+    return matrix
+
+
+def synergy_block(f, rows):
+    """Synergy scores of heroes `rows` (a slice) with every hero, as a (len(rows), N) array."""
+    role_scores = (f.roles[rows] @ role_complement_matrix()) @ f.roles.T
+    damage_mix = (1 - f.damage_unit[rows] @ f.damage_unit.T) * np.outer(f.has_damage[rows], f.has_damage)
+    combo = np.outer(f.aoe[rows], f.disable) + np.outer(f.disable[rows], f.aoe)
+    attack_mix = np.outer(f.melee[rows], 1 - f.melee) + np.outer(1 - f.melee[rows], f.melee)
+    w = SYNERGY_WEIGHTS
+    return w["roles"] * role_scores + w["damage_mix"] * damage_mix + w["combo"] * combo + w["attack_mix"] * attack_mix
+
+
+def counter_block(f, rows):
+    """Scores of heroes `rows` countering every hero: entry [i, j] is how well row i counters hero j."""
+    magic = f.damage_share[rows, 0] + f.damage_share[rows, 2]
+    physical = f.damage_share[rows, 1]
+    w = COUNTER_WEIGHTS
+    return (w["lockdown"] * np.outer(f.disable[rows], f.role("Escape"))
+            + w["aoe_vs_illusions"] * np.outer(f.aoe[rows], f.illusion)
+            + w["magic_vs_tanks"] * np.outer(magic, f.role("Durable") * f.low_magic_resistance)
+            + w["physical_vs_squishy"] * np.outer(physical, (1 - f.role("Durable")) * f.low_armor)
+            + w["kiting"] * np.outer(1 - f.melee[rows], f.melee * f.role("Carry")))
+
+
+def top_k(scores, rows, k):
+    """Indices of the k best partners per row, best first, excluding the hero itself."""
+    scores = scores.copy()
+    scores[np.arange(len(scores)), np.arange(rows.start, rows.start + len(scores))] = -np.inf
+    k = min(k, scores.shape[1] - 1)
+    if k <= 0: return np.zeros((len(scores), 0), dtype=np.int64)
+    best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    best_scores = np.take_along_axis(scores, best, axis=1)
+    order = np.lexsort((best, -best_scores), axis=1)
+    return np.take_along_axis(best, order, axis=1)
+
+
+def top_pairs(features, k=TOP_K, block_size=BLOCK_SIZE):
+    """
+    Scores every hero pair block by block and returns (counters, synergies):
+    two (N, k) arrays holding, for each hero, the indices of the heroes it
+    counters best and synergizes with best. Only one block of the N x N
+    matrices exists at a time.
+    """
+    n = len(features)
+    counters = np.zeros((n, min(k, max(n - 1, 0))), dtype=np.int64)
+    synergies = np.zeros_like(counters)
+    for start in range(0, n, block_size):
+        rows = slice(start, min(start + block_size, n))
+        counters[rows] = top_k(counter_block(features, rows), rows, k)
+        synergies[rows] = top_k(synergy_block(features, rows), rows, k)
+    return counters, synergies
+
+
+def hero_pair_records(heroes, counters, synergies):
+    """Yields (record_key, ops) adding the counters / synergizesWith relations of every hero."""
+    for i, hero in enumerate(heroes):
+        ops = [("rel", "hero", hero, "counters", "hero", heroes[j], "Hero") for j in counters[i]]
+        ops += [("rel", "hero", hero, "synergizesWith", "hero", heroes[j], "Hero") for j in synergies[i]]
+        if ops: yield f"pairs:{hero}", ops
+
+
+def pair_records(collector, k=TOP_K):
+    """Yields the pair records for the heroes seen by a HeroProfileCollector."""
+    heroes, features = collector.features()
+    counters, synergies = top_pairs(features, k)
+    yield from hero_pair_records(heroes, counters, synergies)
+
+
+def prolog_name(hero):
+    """Same local name as the ABox: npc_dota_hero_antimage -> antimage."""
+    return hero.replace(" ", "_").lower().replace("npc_dota_hero_", "")
+
+def write_prolog(path, heroes, counters, synergies):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("% === Fakta Pasangan Hero ===\n")
+        f.write(f"% Dihasilkan oleh Ontologi/hero_pairs.py (top {counters.shape[1]} per hero)\n\n")
+        f.write("% counters(Hero, Lawan): Hero efektif melawan Lawan\n")
+        for i, hero in enumerate(heroes):
+            for j in counters[i]: f.write(f"counters({prolog_name(hero)}, {prolog_name(heroes[j])}).\n")
+        f.write("\n")
+        f.write("% synergizes_with(Hero, Rekan): Hero cocok satu tim dengan Rekan\n")
+        for i, hero in enumerate(heroes):
+            for j in synergies[i]: f.write(f"synergizes_with({prolog_name(hero)}, {prolog_name(heroes[j])}).\n")
+        f.write("\n")
+
+
+if __name__ == '__main__':
+    from json_to_ontology import hero_records, ability_records
+
+    HEROES_FILE = 'heroes.json'
+    HERO_ABILITIES_FILE = 'hero_abilities.json'
+    ABILITIES_FILE = 'abilities.json'
+    PROLOG_FILE = os.path.join('..', 'KBS Prolog', 'hero_pairs_dota2.pl')
+
+    parser = argparse.ArgumentParser(description="Score hero pairs and write the counters / synergizes_with facts.")
+    parser.add_argument("-k", type=int, default=TOP_K, help="partners kept per hero")
+    parser.add_argument("--no-export", action="store_true", help=f"do not write '{PROLOG_FILE}'")
+    parser.add_argument("--hero", help="print the counters and synergies of this hero (e.g. antimage)")
+    parser.add_argument("--bench", type=int, nargs="*", metavar="N",
+                        help="time the stage on synthetic pools of N heroes sampled from the real ones")
+    parser.add_argument("--budget", type=float, default=10.0, help="seconds each --bench pool must finish in")
+    args = parser.parse_args()
+
+    with open(HEROES_FILE, 'r', encoding='utf-8') as f: heroes_data = json.load(f)
+    with open(HERO_ABILITIES_FILE, 'r', encoding='utf-8') as f: hero_abilities_data = json.load(f)
+    with open(ABILITIES_FILE, 'r', encoding='utf-8') as f: abilities_data = json.load(f)
+
+    collector = HeroProfileCollector()
+    for record in collector.track(hero_records(heroes_data, hero_abilities_data)): pass
+    for record in collector.track(ability_records(abilities_data)): pass
+    heroes, features = collector.features()
+
+    start = time.perf_counter()
+    counters, synergies = top_pairs(features, args.k)
+    print(f"Scored {len(heroes) ** 2} pairs of {len(heroes)} heroes in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
+    if not args.no_export:
+        write_prolog(PROLOG_FILE, heroes, counters, synergies)
+        print(f"Prolog facts saved to '{PROLOG_FILE}'.")
+
+    if args.hero:
+        i = [prolog_name(h) for h in heroes].index(args.hero)
+        print(f"\n{args.hero} counters:", ", ".join(prolog_name(heroes[j]) for j in counters[i]))
+        print(f"{args.hero} synergizes with:", ", ".join(prolog_name(heroes[j]) for j in synergies[i]))
+
+    over_budget = False
+    for n in args.bench or []:
+        rng = np.random.default_rng(0)
+        pool = features.take(rng.integers(0, len(features), size=n))
+        start = time.perf_counter()
+        top_pairs(pool, args.k)
+        elapsed = time.perf_counter() - start
+        over_budget |= elapsed > args.budget
+        print(f"  {n:>6} heroes: {elapsed:7.3f} s {'(over budget)' if elapsed > args.budget else ''}")
+    if over_budget: exit(1)
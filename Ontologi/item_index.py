@@ -0,0 +1,282 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+
+from owlready2 import *
+
+ONTOLOGY_IRI = "http://www.semanticweb.org/dota2-ontology#"
+ITEM_TREE_IRI = "http://www.semanticweb.org/dota2-ontology/item-tree"
+
+
+class ItemBuildIndex:
+    """
+    Precomputed recipe tree of every item in items.json.
+
+    For each item that builds from components, or is used as a component,
+    the index stores:
+    - requires[item]: every item in its recipe tree (transitive requiresComponent)
+    - builds_into[item]: every item it is part of (transitive buildsInto)
+    - base_components[item]: ((base_item, count), ...) for the leaves of the tree
+    - recipe_cost[item]: gold for the recipe itself (0 if there is no recipe)
+    - total_cost[item]: recipe costs plus base component costs, rolled up
+    - depth[item]: 0 for base items, 1 + the deepest component otherwise
+    """
+    def __init__(self, items_data, remaining_cache_size=1 << 16):
+        self.cost = {key: info.get('cost') or 0 for key, info in items_data.items()}
+        self.components = {}
+        for key, info in items_data.items():
+            components = tuple(c for c in info.get('components') or () if c)
+            if components: self.components[key] = components
+
+        # Items referenced as components but missing from items.json are kept as free base items
+        self.items = set(self.components)
+        for components in self.components.values(): self.items.update(components)
+
+        self.recipe_cost = {}
+        for key, components in self.components.items():
+            recipe = items_data.get(f"recipe_{key}")
+            if recipe is not None and recipe.get('cost') is not None:
+                self.recipe_cost[key] = recipe['cost']
+            else:
+                self.recipe_cost[key] = max(0, self.cost[key] - sum(self.cost.get(c, 0) for c in components))
+
+        self.requires = {}
+        self.base_components = {}
+        self.total_cost = {}
+        self.depth = {}
+        for key in sorted(self.items): self._expand(key, ())
+
+        builds_into = {key: set() for key in self.items}
+        for key, required in self.requires.items():
+            for component in required: builds_into[component].add(key)
+        self.builds_into = {key: frozenset(parents) for key, parents in builds_into.items()}
+
+        self._remaining = lru_cache(maxsize=remaining_cache_size)(self._remaining_cost)
+
+    def _expand(self, key, path):
+        if key in self.depth: return
+        if key in path: raise ValueError(f"Recipe cycle: {' -> '.join(path + (key,))}")
+        components = self.components.get(key, ())
+        if not components:
+            self.requires[key] = frozenset()
+            self.base_components[key] = ()
+            self.total_cost[key] = self.cost.get(key, 0)
+            self.depth[key] = 0
+            return
+
+        required = set()
+        bases = Counter()
+        total = self.recipe_cost[key]
+        for component in components:
+            self._expand(component, path + (key,))
+            required.add(component)
+            required.update(self.requires[component])
+            total += self.total_cost[component]
+            if self.components.get(component):
+                for base, count in self.base_components[component]: bases[base] += count
+            else:
+                bases[component] += 1
+
+        self.requires[key] = frozenset(required)
+        self.base_components[key] = tuple(sorted(bases.items()))
+        self.total_cost[key] = total
+        self.depth[key] = 1 + max(self.depth[c] for c in components)
+
+    def remaining_cost(self, item, inventory=()):
+        """
+        Gold still needed to finish `item` when the items in `inventory`
+        (keys, repeated for duplicates) are already owned. Owned items are
+        used as high up the recipe tree as possible. Results are memoized
+        per (item, inventory).
+        """
+        return self._remaining(item, tuple(sorted(inventory)))
+
+    def _remaining_cost(self, item, inventory):
+        owned = Counter(inventory)
+
+        def need(key):
+            if owned[key] > 0:
+                owned[key] -= 1
+                return 0
+            components = self.components.get(key)
+            if not components: return self.cost.get(key, 0)
+            return self.recipe_cost[key] + sum(need(c) for c in components)
+
+        return need(item)
+
+    def write_prolog(self, path):
+        """Writes the index as Prolog facts, in the layout of abox_dota2.pl."""
+        items = sorted(self.items)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("% === Fakta Item Build Tree ===\n")
+            f.write("% Dihasilkan oleh Ontologi/item_index.py dari items.json\n\n")
+
+            f.write("% item_requires(Item, Komponen): transitif dari requiresComponent\n")
+            for key in items:
+                for component in sorted(self.requires[key]):
+                    f.write(f"item_requires({prolog_atom(key)}, {prolog_atom(component)}).\n")
+            f.write("\n")
+
+            f.write("% item_builds_into(Komponen, Item): transitif dari buildsInto\n")
+            for key in items:
+                for parent in sorted(self.builds_into[key]):
+                    f.write(f"item_builds_into({prolog_atom(key)}, {prolog_atom(parent)}).\n")
+            f.write("\n")
+
+            f.write("% item_base_component(Item, KomponenDasar, Jumlah)\n")
+            for key in items:
+                for base, count in self.base_components[key]:
+                    f.write(f"item_base_component({prolog_atom(key)}, {prolog_atom(base)}, {count}).\n")
+            f.write("\n")
+
+            f.write("% item_recipe_cost(Item, Gold)\n")
+            for key in sorted(self.recipe_cost):
+                f.write(f"item_recipe_cost({prolog_atom(key)}, {self.recipe_cost[key]}).\n")
+            f.write("\n")
+
+            f.write("% item_total_cost(Item, Gold)\n")
+            for key in items:
+                f.write(f"item_total_cost({prolog_atom(key)}, {self.total_cost[key]}).\n")
+            f.write("\n")
+
+            f.write("% item_recipe_depth(Item, Kedalaman)\n")
+            for key in items:
+                f.write(f"item_recipe_depth({prolog_atom(key)}, {self.depth[key]}).\n")
+            f.write("\n")
+
+    def write_owl(self, path, ontology_file):
+        """
+        Writes the index as an ontology that imports the main Dota 2 ontology,
+        which is loaded from `ontology_file`. Individuals and properties use the
+        main namespace and refer to its Item class, so the file can be loaded
+        alongside dota2_ontology.owl.
+        """
+        world = World()
+        main = world.get_ontology(os.path.abspath(ontology_file)).load()
+        Item = main.Item
+        if Item is None: raise ValueError(f"'{ontology_file}' has no Item class")
+        onto = world.get_ontology(ITEM_TREE_IRI)
+        onto.imported_ontologies.append(main)
+        ns = onto.get_namespace(ONTOLOGY_IRI)
+
+        with ns:
+            class requiresComponentTransitively(ObjectProperty, TransitiveProperty): domain = [Item]; range = [Item]
+            class buildsIntoTransitively(ObjectProperty, TransitiveProperty): inverse_property = requiresComponentTransitively
+            class hasBaseComponent(ObjectProperty): domain = [Item]; range = [Item]
+            class recipeCost(DataProperty, FunctionalProperty): domain = [Item]; range = [int]
+            class totalCost(DataProperty, FunctionalProperty): domain = [Item]; range = [int]
+            class recipeDepth(DataProperty, FunctionalProperty): domain = [Item]; range = [int]
+
+            individuals = {key: Item(key) for key in sorted(self.items)}
+            for key, item in individuals.items():
+                item.requiresComponentTransitively = [individuals[c] for c in sorted(self.requires[key])]
+                item.hasBaseComponent = [individuals[b] for b, _ in self.base_components[key]]
+                if key in self.recipe_cost: item.recipeCost = self.recipe_cost[key]
+                item.totalCost = self.total_cost[key]
+                item.recipeDepth = self.depth[key]
+
+        onto.save(file=path, format="rdfxml")
+
+
+def prolog_atom(name):
+    """Item keys are used as Prolog atoms, quoted when they are not plain lowercase atoms."""
+    if re.fullmatch(r"[a-z][a-zA-Z0-9_]*", name): return name
+    escaped = name.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+_index_cache = {}
+
+def get_index(path):
+    """
+    Returns the ItemBuildIndex for the items file at `path`, memoized per file.
+    The index is rebuilt only when the file content changes: a changed
+    size/mtime triggers a re-hash, and a changed hash triggers a rebuild.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _index_cache.get(path)
+    if cached is not None and cached[0] == signature: return cached[2]
+
+    with open(path, 'rb') as f: content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    if cached is not None and cached[1] == digest:
+        _index_cache[path] = (signature, digest, cached[2])
+        return cached[2]
+
+    index = ItemBuildIndex(json.loads(content))
+    _index_cache[path] = (signature, digest, index)
+    return index
+
+
+if __name__ == "__main__":
+    ITEMS_FILE = 'items.json'
+    PROLOG_FILE = os.path.join('..', 'KBS Prolog', 'item_tree_dota2.pl')
+    OWL_FILE = 'dota2_item_tree.owl'
+    ONTOLOGY_FILE = 'dota2_ontology.owl'
+
+    parser = argparse.ArgumentParser(description="Build the item recipe-tree index from items.json.")
+    parser.add_argument("--item", help="print the recipe tree summary of this item")
+    parser.add_argument("--inventory", default="",
+                        help="comma-separated owned items; with --item, prints the gold still needed")
+    parser.add_argument("--no-export", action="store_true",
+                        help=f"do not write '{PROLOG_FILE}' and '{OWL_FILE}'")
+    parser.add_argument("--bench", action="store_true",
+                        help="time closure and remaining-cost queries against walking items.json recursively")
+    args = parser.parse_args()
+
+    print(f"Building item index from '{ITEMS_FILE}'...")
+    start = time.perf_counter()
+    index = get_index(ITEMS_FILE)
+    print(f"Indexed {len(index.items)} items ({len(index.components)} with recipes) "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
+    if args.item:
+        key = args.item
+        print(f"\n{key}: depth {index.depth.get(key, 0)}, total cost {index.total_cost.get(key, index.cost.get(key, 0))}, "
+              f"recipe {index.recipe_cost.get(key, 0)}")
+        print("  base components:", ", ".join(f"{b} x{n}" for b, n in index.base_components.get(key, ())) or "-")
+        print("  builds into:", ", ".join(sorted(index.builds_into.get(key, ()))) or "-")
+        inventory = [i for i in args.inventory.split(",") if i]
+        if inventory:
+            print(f"  gold still needed with {inventory}: {index.remaining_cost(key, inventory)}")
+
+    if args.bench:
+        with open(ITEMS_FILE, 'r', encoding='utf-8') as f: items_data = json.load(f)
+
+        def walk_bases(key):
+            components = [c for c in items_data.get(key, {}).get('components') or () if c]
+            if not components: return [key]
+            return [b for c in components for b in walk_bases(c)]
+
+        def walk_parents(key):
+            parents = {k for k, v in items_data.items() if key in (v.get('components') or ())}
+            for parent in list(parents): parents |= walk_parents(parent)
+            return parents
+
+        crafted = sorted(index.components)
+        for label, func in [
+            ("base components, recursive walk", lambda k: Counter(walk_bases(k))),
+            ("base components, index", lambda k: index.base_components[k]),
+            ("builds into, recursive walk", walk_parents),
+            ("builds into, index", lambda k: index.builds_into[k]),
+            ("remaining cost, memoized", lambda k: index.remaining_cost(k, index.components[k][:1])),
+        ]:
+            start = time.perf_counter()
+            rounds = 0
+            while time.perf_counter() - start < 0.5:
+                for key in crafted: func(key)
+                rounds += 1
+            rate = rounds * len(crafted) / (time.perf_counter() - start)
+            print(f"  {label:<34} {rate:>12,.0f} queries/s")
+
+    if not args.no_export:
+        index.write_prolog(PROLOG_FILE)
+        print(f"Prolog facts saved to '{PROLOG_FILE}'.")
+        index.write_owl(OWL_FILE, ONTOLOGY_FILE)
+        print(f"Item tree ontology saved to '{OWL_FILE}'.")
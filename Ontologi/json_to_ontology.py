@@ -1,7 +1,18 @@
+import argparse
+import hashlib
+import io
+import itertools
 import json
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from owlready2 import *
 
+from checksum import file_hash
+from stage_profile import NULL_PROFILER, StageProfiler
+
+ONTOLOGY_IRI = "http://www.semanticweb.org/dota2-ontology#"
+
 def create_ontology_structure(onto):
     """
     Defines the entire class hierarchy (TBox), object properties, and data properties
@@ -120,239 +131,755 @@ def create_ontology_structure(onto):
         class synergizesWith(ObjectProperty): domain = [Hero]; range = [Hero]
 
 
-def populate_from_json(onto, heroes_data, hero_abilities_data, items_data, abilities_data):
+def iter_json_object(path, chunk_size=1 << 16):
+    """
+    Yields the (key, value) pairs of a file holding one top-level JSON object,
+    parsing it incrementally so only the record being decoded (plus one read
+    chunk) is in memory at a time. Raises json.JSONDecodeError on bad input.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf, pos, eof = "", 0, False
+
+        def more():
+            nonlocal buf, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk: eof = True
+            buf, pos = buf[pos:] + chunk, 0
+
+        def skip_ws():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n": pos += 1
+                if pos < len(buf) or eof: return
+                more()
+
+        def expect(char):
+            nonlocal pos
+            skip_ws()
+            if pos >= len(buf) or buf[pos] != char:
+                raise json.JSONDecodeError(f"Expecting '{char}'", buf, pos)
+            pos += 1
+
+        def decode():
+            # A number cut by the chunk boundary ("12" of "12.5e3") still decodes,
+            # so only accept a value once a delimiter is seen after it.
+            nonlocal pos
+            skip_ws()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                    if eof or (end < len(buf) and buf[end] in " \t\r\n,:}]"):
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof: raise
+                more()
+
+        expect("{")
+        skip_ws()
+        if pos < len(buf) and buf[pos] == "}": return
+        while True:
+            key = decode()
+            if not isinstance(key, str): raise json.JSONDecodeError("Expecting property name", buf, pos)
+            expect(":")
+            yield key, decode()
+            skip_ws()
+            if pos < len(buf) and buf[pos] == "}": return
+            expect(",")
+
+
+def _pairs(data):
+    """(key, record) pairs of a loaded JSON dict or of an iter_json_object stream."""
+    return data.items() if isinstance(data, dict) else data
+
+
+# Population is expressed as "ops": plain tuples describing one change to one
+# individual (always op[2]). Every op only writes triples whose subject is that
+# individual, which is what lets the incremental rebuild replay just the ops of
+# the individuals it has cleared.
+#   ("new", kind, name, cls)       create the individual, or add cls to its types
+#   ("ensure", kind, name, cls)    create it as cls only if it does not exist yet
+#   ("is_a", kind, name, cls)      append cls to its is_a
+#   ("data", kind, name, prop, value)
+#   ("rel", kind, name, prop, obj_kind, obj_name, obj_cls)
+class EntityRegistry:
+    """
+    Exact-name index of the individuals created while populating the ontology.
+    Heroes, abilities (including talents and facets) and items are kept in
+    separate tables so a JSON key can be resolved with a dict lookup instead of
+    a wildcard IRI search over the quadstore. When `onto` is given, names that
+    are not in the tables yet are looked up in that (already loaded) ontology.
+    """
+    def __init__(self, onto=None):
+        self.onto = onto
+        self.heroes = {}
+        self.abilities = {}
+        self.items = {}
+        self.units = {}
+        self.concepts = {}
+        self.classes = {}
+
+    def _class(self, onto, name):
+        cls = self.classes.get(name)
+        if cls is None: cls = self.classes[name] = onto[name]
+        return cls
+
+    def _table(self, kind, cls=None):
+        if kind == "concept": return self.concepts.setdefault(cls, {})
+        return {"hero": self.heroes, "ability": self.abilities, "item": self.items, "unit": self.units}[kind]
+
+    def _get_or_create(self, table, cls, name):
+        # Calling cls(name) on an existing individual of another class adds cls
+        # to its types, so only reuse the cached entity when it already fits.
+        entity = table.get(name)
+        if entity is None or not isinstance(entity, cls):
+            entity = cls(name)
+            table[name] = entity
+        return entity
+
+    def _lookup(self, table, name):
+        entity = table.get(name)
+        if entity is None and self.onto is not None:
+            entity = self.onto[name]
+            if entity is not None: table[name] = entity
+        return entity
+
+    def apply_ops(self, onto, ops, subjects=None):
+        """
+        Applies ops to the ontology. If `subjects` is given, only the ops whose
+        individual is in that set are applied.
+        """
+        for op in ops:
+            action, kind, name = op[0], op[1], op[2]
+            if subjects is not None and name not in subjects: continue
+            if action == "new":
+                cls = self._class(onto, op[3])
+                self._get_or_create(self._table(kind, cls), cls, name)
+            elif action == "ensure":
+                cls = self._class(onto, op[3])
+                table = self._table(kind, cls)
+                if self._lookup(table, name) is None: self._get_or_create(table, cls, name)
+            elif action == "is_a":
+                self._lookup(self._table(kind), name).is_a.append(self._class(onto, op[3]))
+            elif action == "data":
+                getattr(self._lookup(self._table(kind), name), op[3]).append(op[4])
+            elif action == "rel":
+                obj_cls = self._class(onto, op[6])
+                obj = self._get_or_create(self._table(op[4], obj_cls), obj_cls, op[5])
+                getattr(self._lookup(self._table(kind), name), op[3]).append(obj)
+
+
+SKIPPED_ABILITIES = ["dota_base_ability", "dota_empty_ability", "special_bonus_attributes", "generic_hidden"]
+
+
+def hero_records(heroes_data, hero_abilities_data):
+    """
+    Yields (record_key, ops) for every hero. Each talent of a hero is its own
+    record and is yielded just before the hero that owns it.
+    """
+    attr_map = {'str': 'Strength', 'agi': 'Agility', 'int': 'Intelligence', 'all': 'Universal'}
+    prop_map = {
+        "health": "base_health", "healthRegen": "base_health_regen",
+        "mana": "base_mana", "manaRegen": "base_mana_regen",
+        "armor": "base_armor", "magicResistance": "base_mr",
+        "baseMinAttackDamage": "base_attack_min", "baseMaxAttackDamage": "base_attack_max",
+        "strengthGain": "str_gain", "agilityGain": "agi_gain", "intelligenceGain": "int_gain",
+        "attackRange": "attack_range", "attackRate": "attack_rate",
+        "movementSpeed": "move_speed", "dayVision": "day_vision", "nightVision": "night_vision"
+    }
+
+    for hero_id, hero_info in heroes_data.items():
+        hero_name = hero_info['name']
+        ops = []
+
+        primary_attr = hero_info.get('primary_attr')
+        hero_class = 'Hero'
+        if primary_attr == 'str': hero_class = 'StrengthHero'
+        elif primary_attr == 'agi': hero_class = 'AgilityHero'
+        elif primary_attr == 'int': hero_class = 'IntelligenceHero'
+        elif primary_attr == 'all': hero_class = 'UniversalHero'
+
+        ops.append(("new", "hero", hero_name, hero_class))
+        ops.append(("data", "hero", hero_name, "localizedName", hero_info['localized_name']))
+        if 'img' in hero_info:
+            ops.append(("data", "hero", hero_name, "imageURL", f"https://api.opendota.com{hero_info['img']}"))
+
+        for prop_name, json_key in prop_map.items():
+            if json_key in hero_info and hero_info[json_key] is not None:
+                ops.append(("data", "hero", hero_name, prop_name, hero_info[json_key]))
+
+        for role_name in hero_info.get('roles', []):
+            role = role_name.replace(" ", "_")
+            ops.append(("new", "concept", role, "Role"))
+            ops.append(("rel", "hero", hero_name, "hasRole", "concept", role, "Role"))
+
+        if primary_attr in attr_map:
+            ops.append(("new", "concept", attr_map[primary_attr], "PrimaryAttribute"))
+            ops.append(("rel", "hero", hero_name, "hasPrimaryAttribute", "concept", attr_map[primary_attr], "PrimaryAttribute"))
+
+        if hero_info.get('attack_type'):
+            attack_type = hero_info['attack_type'].replace(" ", "_")
+            ops.append(("new", "concept", attack_type, "AttackType"))
+            ops.append(("rel", "hero", hero_name, "hasAttackType", "concept", attack_type, "AttackType"))
+
+        if hero_name in hero_abilities_data:
+            hero_specifics = hero_abilities_data[hero_name]
+            for idx, ability_name in enumerate(hero_specifics.get('abilities', [])):
+                if ability_name not in ["generic_hidden", "dota_base_ability"]:
+                    if idx <= 3: ability_class = 'BasicAbility'
+                    elif idx == 5: ability_class = 'UltimateAbility'
+                    else: ability_class = 'Ability'
+                    ops.append(("new", "ability", ability_name, ability_class))
+                    ops.append(("rel", "hero", hero_name, "hasAbility", "ability", ability_name, ability_class))
+
+            for talent_info in hero_specifics.get('talents', []):
+                talent_ops = [("new", "ability", talent_info['name'], 'Talent')]
+                if 'level' in talent_info:
+                    talent_ops.append(("data", "ability", talent_info['name'], "requiredLevel", talent_info['level']))
+                yield f"talent:{hero_name}/{talent_info['name']}", talent_ops
+                ops.append(("rel", "hero", hero_name, "hasTalent", "ability", talent_info['name'], 'Talent'))
+
+            for facet_info in hero_specifics.get('facets', []):
+                facet_name = facet_info['name']
+                ops.append(("new", "ability", facet_name, 'Facet'))
+                ops.append(("data", "ability", facet_name, "facetTitle", facet_info['title']))
+                ops.append(("data", "ability", facet_name, "facetDescription", facet_info['description']))
+                ops.append(("data", "ability", facet_name, "facetColor", facet_info['color']))
+                ops.append(("rel", "hero", hero_name, "hasFacet", "ability", facet_name, 'Facet'))
+
+        yield f"hero:{hero_name}", ops
+
+
+def item_records(items_data):
+    """Yields (record_key, ops) for every item of a dict or (key, record) stream."""
+    for item_key, item_info in _pairs(items_data):
+        ops = []
+        item_class = 'Item'
+        if 'tier' in item_info and item_info['tier']: item_class = 'NeutralItem'
+        ops.append(("new", "item", item_key, item_class))
+        if 'dname' in item_info: ops.append(("data", "item", item_key, "displayName", item_info['dname']))
+        if item_info.get('created', False): ops.append(("is_a", "item", item_key, 'CraftedItem'))
+        if 'component' in item_info.get('qual', ''): ops.append(("is_a", "item", item_key, 'ComponentItem'))
+        if 'consumable' in item_info.get('qual', ''): ops.append(("is_a", "item", item_key, 'ConsumableItem'))
+        if 'tier' in item_info and item_info['tier']: ops.append(("data", "item", item_key, "tier", item_info['tier']))
+
+        prop_map = {"cost": "cost", "lore": "lore", "notes": "notes"}
+        for prop, key in prop_map.items():
+            if key in item_info and item_info[key]: ops.append(("data", "item", item_key, prop, item_info[key]))
+        if 'img' in item_info: ops.append(("data", "item", item_key, "imageURL", f"https://api.opendota.com{item_info['img']}"))
+        if item_info.get('cd') and isinstance(item_info['cd'], (int, float)): ops.append(("data", "item", item_key, "cooldown", item_info['cd']))
+
+        if item_info.get('components'):
+            for component_key in item_info['components']:
+                if component_key:
+                    ops.append(("new", "item", component_key, 'Item'))
+                    ops.append(("rel", "item", item_key, "requiresComponent", "item", component_key, 'Item'))
+
+        behaviors = item_info.get('behavior')
+        if isinstance(behaviors, str): behaviors = [behaviors]
+        if isinstance(behaviors, list):
+            for behavior_name in behaviors:
+                behavior = behavior_name.replace(" ", "_")
+                ops.append(("new", "concept", behavior, 'Behavior'))
+                ops.append(("rel", "item", item_key, "hasBehavior", "concept", behavior, 'Behavior'))
+
+        yield f"item:{item_key}", ops
+
+
+def ability_records(abilities_data):
+    """Yields (record_key, ops) for every entry of abilities.json (dict or stream)."""
+    for ability_key, ability_info in _pairs(abilities_data):
+        if ability_key in SKIPPED_ABILITIES: continue
+        ops = [("ensure", "ability", ability_key, 'Ability')]
+
+        if 'dname' in ability_info and ability_info['dname']: ops.append(("data", "ability", ability_key, "displayName", ability_info['dname']))
+        if 'img' in ability_info: ops.append(("data", "ability", ability_key, "imageURL", f"https://api.opendota.com{ability_info['img']}"))
+        if 'desc' in ability_info: ops.append(("data", "ability", ability_key, "description", ability_info['desc']))
+        if 'dmg_type' in ability_info and ability_info['dmg_type']:
+            ops.append(("new", "concept", ability_info['dmg_type'], 'DamageType'))
+            ops.append(("rel", "ability", ability_key, "hasDamageType", "concept", ability_info['dmg_type'], 'DamageType'))
+
+        try:
+            if 'mc' in ability_info and ability_info['mc']: ops.append(("data", "ability", ability_key, "manaCost", int(ability_info['mc'])))
+            if 'cd' in ability_info and ability_info['cd']: ops.append(("data", "ability", ability_key, "cooldown", float(ability_info['cd'])))
+        except (ValueError, TypeError): pass
+
+        behaviors = ability_info.get('behavior')
+        if isinstance(behaviors, str): behaviors = [behaviors]
+        if isinstance(behaviors, list):
+            for behavior_name in behaviors:
+                behavior = behavior_name.replace(" ", "_")
+                ops.append(("new", "concept", behavior, 'Behavior'))
+                ops.append(("rel", "ability", ability_key, "hasBehavior", "concept", behavior, 'Behavior'))
+
+        yield f"ability:{ability_key}", ops
+
+
+# Records per task sent to a worker process by parallel_records
+RECORD_CHUNK_SIZE = 256
+
+
+def _record_chunk(kind, chunk, hero_abilities_data):
+    """Worker side of parallel_records: the records of one chunk of (key, record) pairs, as a list."""
+    if kind == "hero": return list(hero_records(dict(chunk), hero_abilities_data))
+    if kind == "item": return list(item_records(chunk))
+    return list(ability_records(chunk))
+
+
+def parallel_records(executor, kind, pairs, hero_abilities_data=None, chunk_size=RECORD_CHUNK_SIZE,
+                     in_flight=2 * (os.cpu_count() or 1)):
+    """
+    Yields the same (record_key, ops) stream as hero_records, item_records or
+    ability_records (`kind` "hero", "item" or "ability"), with the records
+    transformed in the worker processes of `executor`. The input is cut into
+    chunks of `chunk_size` pairs and the results are yielded in chunk order,
+    so the stream, and everything applied from it, is identical to the
+    serial one. At most `in_flight` chunks are submitted ahead of the one
+    being yielded, which keeps a streamed input (iter_json_object) streaming.
+    """
+    pairs = iter(_pairs(pairs))
+    pending = deque()
+
+    def submit():
+        chunk = list(itertools.islice(pairs, chunk_size))
+        if not chunk: return False
+        extra = None
+        if kind == "hero":
+            names = [info['name'] for _, info in chunk]
+            extra = {name: hero_abilities_data[name] for name in names if name in hero_abilities_data}
+        pending.append(executor.submit(_record_chunk, kind, chunk, extra))
+        return True
+
+    while len(pending) < in_flight and submit(): pass
+    while pending:
+        records = pending.popleft().result()
+        submit()
+        yield from records
+
+
+def transform_records(kind, data, hero_abilities_data=None, executor=None):
+    """The records of one phase: serially, or through parallel_records when an executor is given."""
+    if executor is not None: return parallel_records(executor, kind, data, hero_abilities_data)
+    if kind == "hero": return hero_records(data, hero_abilities_data)
+    if kind == "item": return item_records(data)
+    return ability_records(data)
+
+
+def hero_profiles(hero_pairs):
+    """
+    A hero_pairs.HeroProfileCollector if hero pair scoring is on, else None.
+    hero_pairs.py (and NumPy with it) is only imported when it is needed.
+    """
+    if not hero_pairs: return None
+    from hero_pairs import HeroProfileCollector
+    return HeroProfileCollector()
+
+
+def iter_records(heroes_data, hero_abilities_data, items_data, abilities_data, executor=None, hero_pairs=False):
+    """
+    Yields (record_key, ops) for the whole dataset, in population order. With
+    hero_pairs=True, the counters / synergizesWith records come last, since
+    scoring hero pairs needs every hero and ability profile first. With an
+    `executor`, the records are transformed in its worker processes (see
+    parallel_records).
+    """
+    profiles = hero_profiles(hero_pairs)
+    track = profiles.track if profiles is not None else iter
+    yield from track(transform_records("hero", heroes_data, hero_abilities_data, executor))
+    yield from transform_records("item", items_data, executor=executor)
+    yield from track(transform_records("ability", abilities_data, executor=executor))
+    if profiles is not None:
+        from hero_pairs import pair_records
+        yield from pair_records(profiles)
+
+
+def populate_from_json(onto, heroes_data, hero_abilities_data, items_data, abilities_data, registry=None, manifest=None,
+                       text_index=None, profiler=NULL_PROFILER, executor=None, hero_pairs=False):
     """
     Populates the ontology with individuals (ABox) from the loaded JSON data.
+    items_data and abilities_data may also be (key, record) streams such as
+    iter_json_object, in which case population runs while the files are parsed.
+    If `manifest` is given, the manifest entry of every applied record is stored in it.
+    If `text_index` (a TextIndexBuilder) is given, the text of every record is collected into it.
+    Each phase runs as a stage of `profiler` (see stage_profile.py).
+    With an `executor` (a ProcessPoolExecutor), the JSON records are turned into
+    ops in its worker processes and applied here, in the same order as serially.
+    With hero_pairs=True, the counters / synergizesWith relations are scored
+    and added last (see hero_pairs.py).
+    Returns the EntityRegistry holding every hero, ability and item created.
     """
+    if registry is None: registry = EntityRegistry()
+    profiles = hero_profiles(hero_pairs)
+    track = profiles.track if profiles is not None else iter
+
+    def records(source, counters):
+        source = profiler.count_records(source, counters)
+        if manifest is not None: source = track_manifest(source, manifest)
+        if text_index is not None: source = text_index.track(source)
+        return source
+
+    measure = lambda: {"triples": count_triples(onto.world)}
     with onto:
         print("Populating Heroes...")
-        created_concepts = set()
-
-        for hero_id, hero_info in heroes_data.items():
-            hero_name = hero_info['name']
-
-            primary_attr = hero_info.get('primary_attr')
-            hero_class = onto.Hero
-            if primary_attr == 'str': hero_class = onto.StrengthHero
-            elif primary_attr == 'agi': hero_class = onto.AgilityHero
-            elif primary_attr == 'int': hero_class = onto.IntelligenceHero
-            elif primary_attr == 'all': hero_class = onto.UniversalHero
-
-            hero = hero_class(hero_name)
-            hero.localizedName.append(hero_info['localized_name'])
-            if 'img' in hero_info:
-                hero.imageURL.append(f"https://api.opendota.com{hero_info['img']}")
-
-            prop_map = {
-                "health": "base_health", "healthRegen": "base_health_regen",
-                "mana": "base_mana", "manaRegen": "base_mana_regen",
-                "armor": "base_armor", "magicResistance": "base_mr",
-                "baseMinAttackDamage": "base_attack_min", "baseMaxAttackDamage": "base_attack_max",
-                "strengthGain": "str_gain", "agilityGain": "agi_gain", "intelligenceGain": "int_gain",
-                "attackRange": "attack_range", "attackRate": "attack_rate",
-                "movementSpeed": "move_speed", "dayVision": "day_vision", "nightVision": "night_vision"
-            }
-            for prop_name, json_key in prop_map.items():
-                if json_key in hero_info and hero_info[json_key] is not None:
-                    getattr(hero, prop_name).append(hero_info[json_key])
-
-            for role_name in hero_info.get('roles', []):
-                hero.hasRole.append(onto.Role(role_name.replace(" ", "_")))
-
-            attr_map = {'str': 'Strength', 'agi': 'Agility', 'int': 'Intelligence', 'all': 'Universal'}
-            if primary_attr in attr_map:
-                hero.hasPrimaryAttribute.append(onto.PrimaryAttribute(attr_map[primary_attr]))
-
-            if hero_info.get('attack_type'):
-                hero.hasAttackType.append(onto.AttackType(hero_info['attack_type'].replace(" ", "_")))
-
-            if hero_name in hero_abilities_data:
-                hero_specifics = hero_abilities_data[hero_name]
-                for idx, ability_name in enumerate(hero_specifics.get('abilities', [])):
-                    if ability_name not in ["generic_hidden", "dota_base_ability"]:
-                        if idx <= 3: ability_ind = onto.BasicAbility(ability_name)
-                        elif idx == 5: ability_ind = onto.UltimateAbility(ability_name)
-                        else: ability_ind = onto.Ability(ability_name)
-                        created_concepts.add(ability_name)
-                        hero.hasAbility.append(ability_ind)
-
-                for talent_info in hero_specifics.get('talents', []):
-                    talent_ind = onto.Talent(talent_info['name']); created_concepts.add(talent_info['name'])
-                    if 'level' in talent_info: talent_ind.requiredLevel.append(talent_info['level'])
-                    hero.hasTalent.append(talent_ind)
-
-                for facet_info in hero_specifics.get('facets', []):
-                    facet_ind = onto.Facet(facet_info['name']); created_concepts.add(facet_info['name'])
-                    facet_ind.facetTitle.append(facet_info['title'])
-                    facet_ind.facetDescription.append(facet_info['description'])
-                    facet_ind.facetColor.append(facet_info['color'])
-                    hero.hasFacet.append(facet_ind)
+        with profiler.stage("heroes", measure) as counters:
+            heroes = transform_records("hero", heroes_data, hero_abilities_data, executor)
+            for record_key, ops in records(track(heroes), counters):
+                registry.apply_ops(onto, ops)
 
         print("Populating Items...")
-        for item_key, item_info in items_data.items():
-            item_class = onto.Item
-            if 'tier' in item_info and item_info['tier']: item_class = onto.NeutralItem
-            item = item_class(item_key)
-            if 'dname' in item_info: item.displayName.append(item_info['dname'])
-            if item_info.get('created', False): item.is_a.append(onto.CraftedItem)
-            if 'component' in item_info.get('qual', ''): item.is_a.append(onto.ComponentItem)
-            if 'consumable' in item_info.get('qual', ''): item.is_a.append(onto.ConsumableItem)
-            if 'tier' in item_info and item_info['tier']: item.tier.append(item_info['tier'])
-
-            prop_map = {"cost": "cost", "lore": "lore", "notes": "notes"}
-            for prop, key in prop_map.items():
-                if key in item_info and item_info[key]: getattr(item, prop).append(item_info[key])
-            if 'img' in item_info: item.imageURL.append(f"https://api.opendota.com{item_info['img']}")
-            if item_info.get('cd') and isinstance(item_info['cd'], (int, float)): item.cooldown.append(item_info['cd'])
-
-            if item_info.get('components'):
-                for component_key in item_info['components']:
-                    if component_key: item.requiresComponent.append(onto.Item(component_key))
-
-            behaviors = item_info.get('behavior')
-            if isinstance(behaviors, str): behaviors = [behaviors]
-            if isinstance(behaviors, list):
-                for behavior_name in behaviors:
-                    item.hasBehavior.append(onto.Behavior(behavior_name.replace(" ", "_")))
+        with profiler.stage("items", measure) as counters:
+            for record_key, ops in records(transform_records("item", items_data, executor=executor), counters):
+                registry.apply_ops(onto, ops)
 
         print("Populating Abilities...")
-        for ability_key, ability_info in abilities_data.items():
-            if ability_key not in ["dota_base_ability", "dota_empty_ability", "special_bonus_attributes", "generic_hidden"]:
-                ability = onto.search_one(iri=f"*{ability_key}") or onto.Ability(ability_key)
+        with profiler.stage("abilities", measure) as counters:
+            abilities = transform_records("ability", abilities_data, executor=executor)
+            for record_key, ops in records(track(abilities), counters):
+                registry.apply_ops(onto, ops)
 
-                if 'dname' in ability_info and ability_info['dname']: ability.displayName.append(ability_info['dname'])
-                if 'img' in ability_info: ability.imageURL.append(f"https://api.opendota.com{ability_info['img']}")
-                if 'desc' in ability_info: ability.description.append(ability_info['desc'])
-                if 'dmg_type' in ability_info and ability_info['dmg_type']:
-                    ability.hasDamageType.append(onto.DamageType(ability_info['dmg_type']))
+        if profiles is not None:
+            from hero_pairs import pair_records
+            print("Populating Hero Pairs...")
+            with profiler.stage("hero_pairs", measure) as counters:
+                for record_key, ops in records(pair_records(profiles), counters):
+                    registry.apply_ops(onto, ops)
 
-                try:
-                    if 'mc' in ability_info and ability_info['mc']: ability.manaCost.append(int(ability_info['mc']))
-                    if 'cd' in ability_info and ability_info['cd']: ability.cooldown.append(float(ability_info['cd']))
-                except (ValueError, TypeError): pass
+    return registry
+
+
+def non_hero_unit_records():
+    """
+    Yields (record_key, ops) for the static non-hero units.
+    """
+    # Roshan
+    yield "unit:roshan_boss", [
+        ("new", "unit", "roshan_boss", "Roshan"),
+        ("data", "unit", "roshan_boss", "displayName", "Roshan"),
+        ("data", "unit", "roshan_boss", "health", 7500),
+        ("data", "unit", "roshan_boss", "armor", 20),
+        ("data", "unit", "roshan_boss", "movementSpeed", 270),
+        ("data", "unit", "roshan_boss", "experienceBounty", 225),
+        ("data", "unit", "roshan_boss", "spawnLocation", "Roshan Pit"),
+    ]
+
+    # Lane Creeps
+    creep_data = [
+        ("radiant_melee_creep", "LaneCreep", "Radiant Melee Creep", 550, 0, 325, 40, 18, 23, "Radiant Lanes"),
+        ("radiant_ranged_creep", "LaneCreep", "Radiant Ranged Creep", 300, 0, 325, 60, 28, 33, "Radiant Lanes"),
+        ("dire_melee_creep", "LaneCreep", "Dire Melee Creep", 550, 0, 325, 40, 18, 23, "Dire Lanes"),
+        ("dire_ranged_creep", "LaneCreep", "Dire Ranged Creep", 300, 0, 325, 60, 28, 33, "Dire Lanes")
+    ]
+    # Neutral Creeps (Sample)
+    neutrals = [
+        ("kobold_soldier", "Kobold Soldier", 300, 0, 315, 22, 14, 17, "Small Neutral Camp"),
+        ("satyr_mindstealer", "Satyr Mindstealer", 600, 0, 300, 42, 22, 26, "Medium Neutral Camp"),
+        ("centaur_conqueror", "Centaur Conqueror", 950, 2, 325, 62, 58, 68, "Large Neutral Camp"),
+        ("ancient_black_dragon", "Ancient Black Dragon", 2000, 4, 300, 180, 77, 91, "Ancient Neutral Camp")
+    ]
+    creeps = creep_data + [(name, "NeutralCreep", *rest) for name, *rest in neutrals]
+    for name, cls, dname, hp, arm, ms, exp, gmin, gmax, loc in creeps:
+        yield f"unit:{name}", [
+            ("new", "unit", name, cls),
+            ("data", "unit", name, "displayName", dname),
+            ("data", "unit", name, "health", hp),
+            ("data", "unit", name, "armor", arm),
+            ("data", "unit", name, "movementSpeed", ms),
+            ("data", "unit", name, "experienceBounty", exp),
+            ("data", "unit", name, "goldBountyMin", gmin),
+            ("data", "unit", name, "goldBountyMax", gmax),
+            ("data", "unit", name, "spawnLocation", loc),
+        ]
+
+
+def structure_records():
+    """
+    Yields (record_key, ops) for the static structures.
+    """
+    # Towers
+    tower_data = [
+        # Tier, Health, Armor, Dmg, Range, Gold, Exp
+        (1, 1800, 12, 100, 700, 125, 0),
+        (2, 2000, 14, 120, 700, 150, 0),
+        (3, 2000, 14, 120, 700, 175, 0),
+        (4, 2000, 20, 150, 700, 200, 0)
+    ]
+    for faction in ["radiant", "dire"]:
+        for tier, hp, arm, dmg, rng, gold, exp in tower_data:
+            name = f"{faction}_tier_{tier}_tower"
+            yield f"structure:{name}", [
+                ("new", "unit", name, "Tower"),
+                ("data", "unit", name, "displayName", f"{faction.capitalize()} Tier {tier} Tower"),
+                ("data", "unit", name, "health", hp),
+                ("data", "unit", name, "armor", arm),
+                ("data", "unit", name, "attackRate", 1.0),
+                ("data", "unit", name, "attackRange", rng),
+                ("data", "unit", name, "structureTier", tier),
+                ("data", "unit", name, "goldBounty", gold),
+                ("data", "unit", name, "experienceBounty", exp),
+                ("data", "unit", name, "trueSightRadius", 700),
+            ]
+
+    # Barracks
+    for faction in ["radiant", "dire"]:
+        for btype in ["melee", "ranged"]:
+            name = f"{faction}_{btype}_barracks"
+            yield f"structure:{name}", [
+                ("new", "unit", name, "Barracks"),
+                ("data", "unit", name, "displayName", f"{faction.capitalize()} {btype.capitalize()} Barracks"),
+                ("data", "unit", name, "health", 2200 if btype == "Melee" else 1300),
+                ("data", "unit", name, "armor", 12),
+                ("data", "unit", name, "healthRegen", 5.0),
+                ("data", "unit", name, "goldBounty", 150),
+            ]
 
-                behaviors = ability_info.get('behavior')
-                if isinstance(behaviors, str): behaviors = [behaviors]
-                if isinstance(behaviors, list):
-                    for behavior_name in behaviors:
-                        ability.hasBehavior.append(onto.Behavior(behavior_name.replace(" ", "_")))
+    # Ancients
+    for faction in ["radiant", "dire"]:
+        name = f"{faction}_ancient"
+        yield f"structure:{name}", [
+            ("new", "unit", name, "Ancient"),
+            ("data", "unit", name, "displayName", f"{faction.capitalize()} Ancient"),
+            ("data", "unit", name, "health", 4250),
+            ("data", "unit", name, "armor", 18),
+            ("data", "unit", name, "healthRegen", 12.0),
+        ]
+
+    # Fountains
+    for faction in ["radiant", "dire"]:
+        name = f"{faction}_fountain"
+        yield f"structure:{name}", [
+            ("new", "unit", name, "Fountain"),
+            ("data", "unit", name, "displayName", f"{faction.capitalize()} Fountain"),
+            ("data", "unit", name, "health", 200000),
+            ("data", "unit", name, "armor", 200),
+            ("data", "unit", name, "attackRange", 1200),
+            ("data", "unit", name, "trueSightRadius", 1200),
+        ]
 
 
-def populate_non_hero_units(onto):
+def populate_non_hero_units(onto, registry=None):
     """
     Populates the ontology with static data for non-hero units.
     """
     print("Populating Non-Hero Units...")
+    if registry is None: registry = EntityRegistry()
     with onto:
-        # Roshan
-        roshan = onto.Roshan("roshan_boss")
-        roshan.displayName.append("Roshan")
-        roshan.health.append(7500)
-        roshan.armor.append(20)
-        roshan.movementSpeed.append(270)
-        roshan.experienceBounty.append(225)
-        roshan.spawnLocation.append("Roshan Pit")
-
-        # Lane Creeps
-        creep_data = [
-            ("radiant_melee_creep", onto.LaneCreep, "Radiant Melee Creep", 550, 0, 325, 40, 18, 23, "Radiant Lanes"),
-            ("radiant_ranged_creep", onto.LaneCreep, "Radiant Ranged Creep", 300, 0, 325, 60, 28, 33, "Radiant Lanes"),
-            ("dire_melee_creep", onto.LaneCreep, "Dire Melee Creep", 550, 0, 325, 40, 18, 23, "Dire Lanes"),
-            ("dire_ranged_creep", onto.LaneCreep, "Dire Ranged Creep", 300, 0, 325, 60, 28, 33, "Dire Lanes")
-        ]
-        for name, cls, dname, hp, arm, ms, exp, gmin, gmax, loc in creep_data:
-            c = cls(name)
-            c.displayName.append(dname)
-            c.health.append(hp)
-            c.armor.append(arm)
-            c.movementSpeed.append(ms)
-            c.experienceBounty.append(exp)
-            c.goldBountyMin.append(gmin)
-            c.goldBountyMax.append(gmax)
-            c.spawnLocation.append(loc)
-
-        # Neutral Creeps (Sample)
-        neutrals = [
-            ("kobold_soldier", "Kobold Soldier", 300, 0, 315, 22, 14, 17, "Small Neutral Camp"),
-            ("satyr_mindstealer", "Satyr Mindstealer", 600, 0, 300, 42, 22, 26, "Medium Neutral Camp"),
-            ("centaur_conqueror", "Centaur Conqueror", 950, 2, 325, 62, 58, 68, "Large Neutral Camp"),
-            ("ancient_black_dragon", "Ancient Black Dragon", 2000, 4, 300, 180, 77, 91, "Ancient Neutral Camp")
-        ]
-        for name, dname, hp, arm, ms, exp, gmin, gmax, loc in neutrals:
-            n = onto.NeutralCreep(name)
-            n.displayName.append(dname)
-            n.health.append(hp)
-            n.armor.append(arm)
-            n.movementSpeed.append(ms)
-            n.experienceBounty.append(exp)
-            n.goldBountyMin.append(gmin)
-            n.goldBountyMax.append(gmax)
-            n.spawnLocation.append(loc)
-
-def populate_structures(onto):
+        for record_key, ops in non_hero_unit_records():
+            registry.apply_ops(onto, ops)
+
+
+def populate_structures(onto, registry=None):
     """
     Populates the ontology with static data for structures.
     """
     print("Populating Structures...")
+    if registry is None: registry = EntityRegistry()
     with onto:
-        # Towers
-        tower_data = [
-            # Tier, Health, Armor, Dmg, Range, Gold, Exp
-            (1, 1800, 12, 100, 700, 125, 0),
-            (2, 2000, 14, 120, 700, 150, 0),
-            (3, 2000, 14, 120, 700, 175, 0),
-            (4, 2000, 20, 150, 700, 200, 0)
-        ]
-        for faction in ["radiant", "dire"]:
-            for tier, hp, arm, dmg, rng, gold, exp in tower_data:
-                t = onto.Tower(f"{faction}_tier_{tier}_tower")
-                t.displayName.append(f"{faction.capitalize()} Tier {tier} Tower")
-                t.health.append(hp)
-                t.armor.append(arm)
-                t.attackRate.append(1.0)
-                t.attackRange.append(rng)
-                t.structureTier.append(tier)
-                t.goldBounty.append(gold)
-                t.experienceBounty.append(exp)
-                t.trueSightRadius.append(700)
-
-        # Barracks
-        for faction in ["radiant", "dire"]:
-            for btype in ["melee", "ranged"]:
-                b = onto.Barracks(f"{faction}_{btype}_barracks")
-                b.displayName.append(f"{faction.capitalize()} {btype.capitalize()} Barracks")
-                b.health.append(2200 if btype == "Melee" else 1300)
-                b.armor.append(12)
-                b.healthRegen.append(5.0)
-                b.goldBounty.append(150)
-
-        # Ancients
-        rad_ancient = onto.Ancient("radiant_ancient")
-        rad_ancient.displayName.append("Radiant Ancient")
-        rad_ancient.health.append(4250)
-        rad_ancient.armor.append(18)
-        rad_ancient.healthRegen.append(12.0)
-
-        dire_ancient = onto.Ancient("dire_ancient")
-        dire_ancient.displayName.append("Dire Ancient")
-        dire_ancient.health.append(4250)
-        dire_ancient.armor.append(18)
-        dire_ancient.healthRegen.append(12.0)
-
-        # Fountains
-        rad_fountain = onto.Fountain("radiant_fountain")
-        rad_fountain.displayName.append("Radiant Fountain")
-        rad_fountain.health.append(200000)
-        rad_fountain.armor.append(200)
-        rad_fountain.attackRange.append(1200)
-        rad_fountain.trueSightRadius.append(1200)
-
-        dire_fountain = onto.Fountain("dire_fountain")
-        dire_fountain.displayName.append("Dire Fountain")
-        dire_fountain.health.append(200000)
-        dire_fountain.armor.append(200)
-        dire_fountain.attackRange.append(1200)
-        dire_fountain.trueSightRadius.append(1200)
+        for record_key, ops in structure_records():
+            registry.apply_ops(onto, ops)
+
+
+def populate_bulk(onto, records, batch_size=50000):
+    """
+    Bulk-ingest alternative to EntityRegistry.apply_ops for a freshly created
+    ontology.
+
+    Instead of going through owlready2's per-attribute lists (property lookup,
+    list wrapper and one INSERT per value), every op is first resolved to raw
+    (subject, predicate, object) and (subject, predicate, value, datatype)
+    rows, with classes and properties looked up once. The rows are then
+    inserted into the quadstore with executemany, batch_size rows at a time.
+    The type rules are the same as for EntityRegistry.apply_ops, so the
+    resulting triples are identical. Returns the number of object and data triples inserted.
+    """
+    world = onto.world
+    graph = onto.graph
+    base_iri = onto.base_iri
+
+    resolved = {}
+    def resolve(name):
+        entity = resolved.get(name)
+        if entity is None: entity = resolved[name] = onto[name]
+        return entity
+
+    storids = {}
+    def storid(name):
+        s = storids.get(name)
+        if s is None: s = storids[name] = world._abbreviate(base_iri + name)
+        return s
+
+    types = {}
+    seen = set()
+    objs = []
+    datas = []
+
+    def get_or_create(kind, name, cls):
+        seen.add((kind, name))
+        entity_types = types.get(name)
+        if entity_types is None:
+            types[name] = [cls]
+            s = storid(name)
+            objs.append((s, rdf_type, owl_named_individual))
+            objs.append((s, rdf_type, cls.storid))
+        elif not any(issubclass(t, cls) for t in entity_types):
+            entity_types.append(cls)
+            objs.append((storid(name), rdf_type, cls.storid))
+
+    for record_key, ops in records:
+        for op in ops:
+            action, kind, name = op[0], op[1], op[2]
+            if action == "new":
+                get_or_create(kind, name, resolve(op[3]))
+            elif action == "ensure":
+                if (kind, name) not in seen: get_or_create(kind, name, resolve(op[3]))
+            elif action == "is_a":
+                cls = resolve(op[3])
+                types[name].append(cls)
+                objs.append((storid(name), rdf_type, cls.storid))
+            elif action == "data":
+                value, datatype = world._to_rdf(op[4])
+                datas.append((storid(name), resolve(op[3]).storid, value, datatype))
+            elif action == "rel":
+                get_or_create(op[4], op[5], resolve(op[6]))
+                objs.append((storid(name), resolve(op[3]).storid, storid(op[5])))
+
+    for i in range(0, len(objs), batch_size):
+        graph.db.executemany(f"INSERT OR IGNORE INTO objs VALUES ({graph.c},?,?,?)", objs[i:i + batch_size])
+    for i in range(0, len(datas), batch_size):
+        graph.db.executemany(f"INSERT OR IGNORE INTO datas VALUES ({graph.c},?,?,?,?)", datas[i:i + batch_size])
+    world.graph.analyze()
+    return len(objs), len(datas)
+
+
+def ops_digest(ops):
+    """Content hash of a record's ops (the manifest hash, and the record address in patch_store.py)."""
+    return hashlib.sha1(repr(ops).encode("utf-8")).hexdigest()
+
+
+def manifest_digest(manifest):
+    """
+    Content hash of a whole manifest. The text index stores it to record which
+    data it was built from, so --incremental only patches an index that
+    matches the manifest it starts from.
+    """
+    return hashlib.sha1(json.dumps(manifest, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def manifest_entry(ops):
+    """
+    Manifest entry of one record: the content hash of its ops and the
+    individuals those ops touch. Hashing the ops rather than the raw JSON means
+    fields the ontology never reads do not count as changes.
+    """
+    return {"hash": ops_digest(ops), "subjects": sorted({op[2] for op in ops})}
+
+
+def build_manifest(records):
+    """Maps every record key to its manifest_entry."""
+    return {record_key: manifest_entry(ops) for record_key, ops in records}
+
+
+def write_manifest(path, manifest, output_file):
+    """
+    Writes the record manifest together with the SHA-256 of the output file
+    it describes, so --incremental can tell when that file was rewritten
+    without this manifest (another output format) or replaced.
+    """
+    output = {"file": os.path.basename(output_file), "sha256": file_hash(output_file)}
+    with open(path, 'w', encoding='utf-8') as f: json.dump({"output": output, "records": manifest}, f)
+
+
+def read_manifest(path, output_file):
+    """
+    The records of the manifest at `path`, or None if either file is missing
+    or the manifest does not describe the current contents of `output_file`.
+    Manifests from before the output hash was stored also give None.
+    """
+    if not (os.path.exists(path) and os.path.exists(output_file)): return None
+    with open(path, 'r', encoding='utf-8') as f: manifest = json.load(f)
+    output = manifest.get("output")
+    if not isinstance(output, dict) or output.get("sha256") != file_hash(output_file): return None
+    return manifest["records"]
+
+
+def track_manifest(records, manifest):
+    """Passes records through unchanged, storing each one's manifest_entry on the way."""
+    for record_key, ops in records:
+        manifest[record_key] = manifest_entry(ops)
+        yield record_key, ops
+
+
+def populate_incremental(onto, records, old_manifest):
+    """
+    Updates an ontology that was built from the data described by
+    `old_manifest` so that it matches `records`.
+
+    Every individual touched by an added, changed or removed record (old or new
+    version) has all its asserted triples removed, and then only the ops for
+    those individuals are replayed in population order. The result has the same
+    triples as a full rebuild, but unchanged individuals are never touched.
+    Returns (new_manifest, report).
+    """
+    new_manifest = build_manifest(records)
+
+    report = {"added": [], "changed": [], "removed": []}
+    affected = set()
+    for record_key, entry in new_manifest.items():
+        old_entry = old_manifest.get(record_key)
+        if old_entry is None: report["added"].append(record_key)
+        elif old_entry["hash"] != entry["hash"]: report["changed"].append(record_key)
+        else: continue
+        affected.update(entry["subjects"])
+        if old_entry is not None: affected.update(old_entry["subjects"])
+    for record_key, old_entry in old_manifest.items():
+        if record_key not in new_manifest:
+            report["removed"].append(record_key)
+            affected.update(old_entry["subjects"])
+
+    with onto:
+        for name in affected:
+            entity = onto[name]
+            if entity is None: continue
+            onto._del_obj_triple_spo(entity.storid, None, None)
+            onto._del_data_triple_spod(entity.storid, None, None, None)
+            onto.world._entities.pop(entity.storid, None)
+
+        registry = EntityRegistry(onto)
+        for record_key, ops in records:
+            registry.apply_ops(onto, ops, subjects=affected)
+
+    report["affected_individuals"] = sorted(affected)
+    return new_manifest, report
+
+
+def count_triples(world):
+    """Number of object and data triples currently in the world's quadstore."""
+    return world.graph.execute("SELECT (SELECT COUNT(*) FROM objs) + (SELECT COUNT(*) FROM datas)").fetchone()[0]
+
+
+def ontology_triples(onto):
+    """
+    Set of N-Triples lines of the ontology as it reads back from RDF/XML, without
+    blank-node triples. Going through RDF/XML first matters because the XML
+    parser normalizes line endings inside literals.
+    """
+    xml = io.BytesIO()
+    onto.save(file=xml, format="rdfxml")
+    xml.seek(0)
+    reloaded = World().get_ontology(ONTOLOGY_IRI).load(fileobj=xml)
+    buffer = io.BytesIO()
+    reloaded.save(file=buffer, format="ntriples")
+    return {line for line in buffer.getvalue().decode("utf-8").splitlines() if line and "_:" not in line}
+
+
+def build_full_ontology(world, heroes_data, hero_abilities_data, items_data, abilities_data, hero_pairs=False):
+    """Builds the complete ontology from scratch in `world`."""
+    onto = world.get_ontology(ONTOLOGY_IRI)
+    create_ontology_structure(onto)
+    populate_from_json(onto, heroes_data, hero_abilities_data, items_data, abilities_data, hero_pairs=hero_pairs)
+    populate_non_hero_units(onto)
+    populate_structures(onto)
+    return onto
 
 
 if __name__ == '__main__':
@@ -361,6 +888,47 @@ if __name__ == '__main__':
     ITEMS_FILE = 'items.json'
     ABILITIES_FILE = 'abilities.json'
     OUTPUT_ONTOLOGY_FILE = 'dota2_ontology.owl'
+    MANIFEST_FILE = 'dota2_ontology.manifest.json'
+    QUADSTORE_MANIFEST_FILE = 'dota2_ontology.sqlite3.manifest.json'
+    CHANGES_FILE = 'dota2_ontology.changes.json'
+    QUADSTORE_FILE = 'dota2_ontology.sqlite3'
+    TEXT_INDEX_FILE = 'dota2_ontology.textindex'
+    SHARD_DIR = 'dota2_ontology_shards'
+    PROFILE_FILE = 'dota2_ontology.profile.json'
+    CPROFILE_FILE = 'dota2_ontology.prof'
+
+    parser = argparse.ArgumentParser(description="Convert the Dota 2 JSON data into an OWL ontology.")
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"update the existing '{OUTPUT_ONTOLOGY_FILE}' using '{MANIFEST_FILE}' (or the quadstore using "
+                             f"'{QUADSTORE_MANIFEST_FILE}'), touching only changed records")
+    parser.add_argument("--bulk", action="store_true",
+                        help="on a full rebuild, collect all triples first and insert them into the quadstore in batches")
+    parser.add_argument("--no-stream", action="store_true",
+                        help=f"load '{ITEMS_FILE}' and '{ABILITIES_FILE}' completely with json.load instead of streaming them")
+    parser.add_argument("--output-format", choices=["rdfxml", "sqlite", "both"], default="rdfxml",
+                        help=f"write '{OUTPUT_ONTOLOGY_FILE}' (rdfxml), the owlready2 SQLite quadstore '{QUADSTORE_FILE}' (sqlite), or both")
+    parser.add_argument("--sharded", nargs="?", const=SHARD_DIR, metavar="DIR",
+                        help=f"also write a TBox module plus per-type ABox shards for lazy loading (default '{SHARD_DIR}')")
+    parser.add_argument("--hero-pairs", action="store_true",
+                        help="score hero pairs (hero_pairs.py, needs NumPy) and add the counters / synergizesWith relations")
+    parser.add_argument("--no-text-index", action="store_true",
+                        help=f"skip writing the full-text index '{TEXT_INDEX_FILE}'")
+    parser.add_argument("--verify", action="store_true",
+                        help="after saving, rebuild from scratch in memory and check that both ontologies have the same triples")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="turn JSON records into ops in this many worker processes (1 = serially in this process; "
+                             "the speedup has not been measured on a multi-core machine yet)")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_FILE, metavar="PATH",
+                        help=f"record wall time, CPU time, tracemalloc peak memory and counters per stage as JSON (default '{PROFILE_FILE}')")
+    parser.add_argument("--profile-cprofile", nargs="?", const=CPROFILE_FILE, metavar="PATH",
+                        help=f"also run every stage under cProfile and dump the hottest one (default '{CPROFILE_FILE}'); implies --profile")
+    parser.add_argument("--profile-no-tracemalloc", action="store_true",
+                        help="profile without tracemalloc, which slows population down noticeably")
+    args = parser.parse_args()
+
+    if args.profile_cprofile and not args.profile: args.profile = PROFILE_FILE
+    profiler = (StageProfiler(trace_memory=not args.profile_no_tracemalloc, cprofile=bool(args.profile_cprofile))
+                if args.profile else NULL_PROFILER)
 
     required_files = [HEROES_FILE, HERO_ABILITIES_FILE, ITEMS_FILE, ABILITIES_FILE]
     if not all(os.path.exists(f) for f in required_files):
@@ -368,29 +936,169 @@ if __name__ == '__main__':
         print(f"Please ensure {', '.join(required_files)} are present in the same directory as the script.")
         exit()
 
-    onto = get_ontology("http://www.semanticweb.org/dota2-ontology#")
+    def load_streamed_data():
+        """items.json and abilities.json as (key, record) streams, or fully loaded with --no-stream."""
+        if args.no_stream:
+            with open(ITEMS_FILE, 'r', encoding='utf-8') as f: items = json.load(f)
+            with open(ABILITIES_FILE, 'r', encoding='utf-8') as f: abilities = json.load(f)
+            return items, abilities
+        return iter_json_object(ITEMS_FILE), iter_json_object(ABILITIES_FILE)
 
-    create_ontology_structure(onto)
-    print("Structure created.")
+    print("Step 1: Loading JSON data...")
+    try:
+        with profiler.stage("load_json") as counters:
+            with open(HEROES_FILE, 'r', encoding='utf-8') as f: heroes_data = json.load(f)
+            with open(HERO_ABILITIES_FILE, 'r', encoding='utf-8') as f: hero_abilities_data = json.load(f)
+            items_data, abilities_data = load_streamed_data()
+            counters["heroes"] = len(heroes_data)
+        if args.no_stream: print("JSON data loaded successfully.")
+        else: print(f"Hero data loaded; '{ITEMS_FILE}' and '{ABILITIES_FILE}' are streamed during population.")
+    except json.JSONDecodeError as e:
+        print(f"Error decoding JSON: {e}")
+        exit()
+
+    write_rdfxml = args.output_format in ("rdfxml", "both")
+    write_quadstore = args.output_format in ("sqlite", "both")
+
+    # An incremental run updates the output it is going to write: the quadstore
+    # in place when only the quadstore is written, otherwise the RDF/XML file.
+    # Each output has its own manifest, which must match the output's current hash.
+    incremental_source = OUTPUT_ONTOLOGY_FILE if write_rdfxml else QUADSTORE_FILE
+    incremental_manifest = MANIFEST_FILE if write_rdfxml else QUADSTORE_MANIFEST_FILE
+    incremental = args.incremental
+    old_manifest = read_manifest(incremental_manifest, incremental_source) if incremental else None
+    if incremental and old_manifest is None:
+        print(f"\n'{incremental_source}' or '{incremental_manifest}' not found, or the manifest does not describe "
+              f"the current '{incremental_source}'; falling back to a full rebuild.")
+        incremental = False
+
+    if write_quadstore:
+        if not (incremental and incremental_source == QUADSTORE_FILE) and os.path.exists(QUADSTORE_FILE):
+            os.remove(QUADSTORE_FILE)
+        world = World(filename=QUADSTORE_FILE)
+    else:
+        world = default_world
+    measure = lambda: {"triples": count_triples(world)}
+
+    # text_index.py (and NumPy with it) and ontology_shards.py are only imported when they are used
+    text_index = None
+    if not args.no_text_index:
+        from text_index import TextIndexBuilder, index_source, update_text_index, write_index
+        text_index = TextIndexBuilder(ONTOLOGY_IRI)
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
 
-    print("\nStep 2: Loading JSON data...")
     try:
-        with open(HEROES_FILE, 'r', encoding='utf-8') as f: heroes_data = json.load(f)
-        with open(HERO_ABILITIES_FILE, 'r', encoding='utf-8') as f: hero_abilities_data = json.load(f)
-        with open(ITEMS_FILE, 'r', encoding='utf-8') as f: items_data = json.load(f)
-        with open(ABILITIES_FILE, 'r', encoding='utf-8') as f: abilities_data = json.load(f)
-        print("JSON data loaded successfully.")
+        if incremental:
+            print(f"\nStep 2: Loading existing ontology from '{incremental_source}'...")
+            with profiler.stage("load_existing", measure):
+                onto = world.get_ontology(ONTOLOGY_IRI)
+                if incremental_source == QUADSTORE_FILE:
+                    onto.load()
+                else:
+                    with open(OUTPUT_ONTOLOGY_FILE, 'rb') as f: onto.load(fileobj=f)
+
+            print("\nStep 3: Applying changed records...")
+            with profiler.stage("collect_records") as counters:
+                # The records are diffed first and replayed afterwards, so they are kept as a list here.
+                records = list(profiler.count_records(
+                    iter_records(heroes_data, hero_abilities_data, items_data, abilities_data, executor, args.hero_pairs),
+                    counters))
+            with profiler.stage("apply_changes", measure) as counters:
+                manifest, report = populate_incremental(onto, records, old_manifest)
+                counters.update({key: len(report[key]) for key in ("added", "changed", "removed", "affected_individuals")})
+            with open(CHANGES_FILE, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+            print(f"{len(report['added'])} added, {len(report['changed'])} changed, {len(report['removed'])} removed records; "
+                  f"{len(report['affected_individuals'])} individuals updated.")
+            print(f"Change report written to '{CHANGES_FILE}'.")
+            if text_index is not None and index_source(TEXT_INDEX_FILE) == manifest_digest(old_manifest):
+                with profiler.stage("text_index_update"):
+                    update_text_index(TEXT_INDEX_FILE, records, report["affected_individuals"], ONTOLOGY_IRI,
+                                      manifest_digest(manifest))
+                print(f"Text index '{TEXT_INDEX_FILE}' updated for {len(report['affected_individuals'])} individuals.")
+            elif text_index is not None:
+                # No index, or one built from other data (e.g. after a --no-text-index run): rebuild it
+                if os.path.exists(TEXT_INDEX_FILE):
+                    print(f"Text index '{TEXT_INDEX_FILE}' does not match '{incremental_manifest}'; rebuilding it.")
+                for record_key, ops in records: text_index.add_ops(ops)
+        else:
+            print("\nStep 2: Creating ontology structure...")
+            with profiler.stage("create_structure", measure):
+                onto = world.get_ontology(ONTOLOGY_IRI)
+                create_ontology_structure(onto)
+            print("Structure created.")
+
+            manifest = {}
+            if args.bulk:
+                print("\nStep 3: Bulk-ingesting ontology data...")
+                with profiler.stage("bulk_ingest", measure) as counters:
+                    records = track_manifest(iter_records(heroes_data, hero_abilities_data, items_data, abilities_data, executor,
+                                                          args.hero_pairs), manifest)
+                    if text_index is not None: records = text_index.track(records)
+                    records = profiler.count_records(itertools.chain(records, non_hero_unit_records(), structure_records()), counters)
+                    n_objs, n_datas = populate_bulk(onto, records)
+                print(f"{n_objs} object and {n_datas} data triples inserted.")
+            else:
+                print("\nStep 3: Populating ontology with data...")
+                with profiler.stage("populate", measure):
+                    populate_from_json(onto, heroes_data, hero_abilities_data, items_data, abilities_data,
+                                       manifest=manifest, text_index=text_index, profiler=profiler, executor=executor,
+                                       hero_pairs=args.hero_pairs)
+                    with profiler.stage("non_hero_units", measure):
+                        populate_non_hero_units(onto)
+                    with profiler.stage("structures", measure):
+                        populate_structures(onto)
+            print("Population complete.")
     except json.JSONDecodeError as e:
         print(f"Error decoding JSON: {e}")
         exit()
 
-    print("\nStep 3: Populating ontology with data...")
-    populate_from_json(onto, heroes_data, hero_abilities_data, items_data, abilities_data)
-    populate_non_hero_units(onto)
-    populate_structures(onto)
-    print("Population complete.")
+    if executor is not None: executor.shutdown()
+
+    print("\nStep 4: Saving ontology...")
+    with profiler.stage("save"):
+        if write_rdfxml:
+            with profiler.stage("rdfxml") as counters:
+                onto.save(file=OUTPUT_ONTOLOGY_FILE, format="rdfxml")
+                counters["bytes"] = os.path.getsize(OUTPUT_ONTOLOGY_FILE)
+            print(f"Ontology saved to '{OUTPUT_ONTOLOGY_FILE}'.")
+        if write_quadstore:
+            with profiler.stage("quadstore"):
+                world.save()
+            print(f"Quadstore saved to '{QUADSTORE_FILE}'.")
+        with profiler.stage("manifest", records=len(manifest)):
+            if write_rdfxml: write_manifest(MANIFEST_FILE, manifest, OUTPUT_ONTOLOGY_FILE)
+            if write_quadstore: write_manifest(QUADSTORE_MANIFEST_FILE, manifest, QUADSTORE_FILE)
+        if args.sharded:
+            from ontology_shards import write_shards
+            with profiler.stage("shards") as counters:
+                counters.update(write_shards(onto, args.sharded))
+            print(f"TBox module and {counters['individuals']} individuals in shards saved to '{args.sharded}'.")
+        # Filled during population on a full build; left empty when an existing index was updated above
+        if text_index is not None and text_index.fields:
+            with profiler.stage("text_index", documents=len(text_index.fields)):
+                write_index(TEXT_INDEX_FILE, text_index.documents(), manifest_digest(manifest))
+            print(f"Text index saved to '{TEXT_INDEX_FILE}'.")
+
+    if args.verify:
+        print("\nVerifying against a full rebuild...")
+        with profiler.stage("verify") as counters:
+            full_onto = build_full_ontology(World(), heroes_data, hero_abilities_data, *load_streamed_data(),
+                                            hero_pairs=args.hero_pairs)
+            expected, actual = ontology_triples(full_onto), ontology_triples(onto)
+            missing, extra = expected - actual, actual - expected
+            counters.update(triples=len(actual), missing=len(missing), unexpected=len(extra))
+        if missing or extra:
+            print(f"Verification FAILED: {len(missing)} triples missing, {len(extra)} unexpected.")
+            exit(1)
+        print("Verification passed: the ontology matches a full rebuild.")
+
+    if profiler.enabled:
+        report = profiler.write(args.profile, "json_to_ontology.py", cprofile_path=args.profile_cprofile,
+                                mode="incremental" if incremental else "bulk" if args.bulk else "full",
+                                output_format=args.output_format, workers=args.workers, hero_pairs=args.hero_pairs,
+                                triples=count_triples(world))
+        print(f"\nStage profile written to '{args.profile}' (hottest stage: {report['hottest_stage']}).")
+        if args.profile_cprofile: print(f"cProfile of '{report['hottest_stage']}' dumped to '{args.profile_cprofile}'.")
 
-    print(f"\nStep 4: Saving ontology to '{OUTPUT_ONTOLOGY_FILE}'...")
-    onto.save(file=OUTPUT_ONTOLOGY_FILE, format="rdfxml")
-    print("Ontology saved successfully.")
-    print(f"\nYou can now open the '{OUTPUT_ONTOLOGY_FILE}' file in Protégé.")
+    if write_rdfxml:
+        print(f"\nYou can now open the '{OUTPUT_ONTOLOGY_FILE}' file in Protégé.")
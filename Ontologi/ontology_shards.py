@@ -0,0 +1,327 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from owlready2 import World, owl_named_individual, rdf_type
+
+CATALOG_FILE = "shards.json"
+TBOX_FILE = "tbox.owl"
+ALL_FILE = "all.owl"
+CATALOG_VERSION = 1
+
+# Shard name -> classes whose individuals it holds. An individual typed with
+# classes of several shards goes to the first one listed here (a Facet that is
+# also an Ability lives with the abilities). Individuals of no shard, i.e. the
+# GameMechanic vocabulary (roles, attributes, behaviors, ...), stay in the
+# TBox module, which every shard imports.
+SHARDS = {
+    "heroes": ["Hero"],
+    "abilities": ["Ability"],
+    "talents_facets": ["Talent", "Facet"],
+    "items": ["Item"],
+    "units": ["NonHeroUnit", "Structure"],
+}
+
+
+def shard_base(ontology_iri):
+    """http://.../dota2-ontology# -> http://.../dota2-ontology/, the prefix of the shard ontology IRIs."""
+    return ontology_iri.rstrip("#/") + "/"
+
+
+def _assign_shards(onto):
+    """
+    {individual storid: shard name} and {shard name: set of asserted class
+    storids of its individuals}, read straight from the quadstore.
+    """
+    rank = {}
+    for position, (shard, roots) in enumerate(SHARDS.items()):
+        for root in roots:
+            for cls in onto[root].descendants(): rank.setdefault(cls.storid, (position, shard))
+
+    types = {}
+    for s, o in onto.world.graph.execute("SELECT s, o FROM objs WHERE c = ? AND p = ?", (onto.graph.c, rdf_type)):
+        types.setdefault(s, set()).add(o)
+
+    assignment, classes = {}, {shard: set() for shard in SHARDS}
+    for s, asserted in types.items():
+        if owl_named_individual not in asserted: continue
+        ranked = [rank[t] for t in asserted if t in rank]
+        if not ranked: continue
+        shard = min(ranked)[1]
+        assignment[s] = shard
+        classes[shard].update(t for t in asserted if t != owl_named_individual)
+    return assignment, classes
+
+
+def _local_names(world, storids, ontology_iri):
+    names = set()
+    for storid in storids:
+        iri = world._unabbreviate(storid)
+        if iri.startswith(ontology_iri): names.add(iri[len(ontology_iri):])
+    return names
+
+
+def write_shards(onto, directory):
+    """
+    Writes `onto` as a TBox module plus one ABox shard per entry of SHARDS
+    into `directory`, together with an all.owl that imports every shard, a
+    Protégé catalog and shards.json, the index the lazy loader reads (which
+    classes and properties each shard holds).
+
+    The triples of every shard individual are moved into a shard ontology of
+    the same world for saving and moved back afterwards, so `onto` is left
+    as it was. Returns counters for the profiler.
+    """
+    world, main_c = onto.world, onto.graph.c
+    ontology_iri = onto.base_iri
+    base = shard_base(ontology_iri)
+    os.makedirs(directory, exist_ok=True)
+
+    assignment, shard_classes = _assign_shards(onto)
+    shards = {name: world.get_ontology(f"{base}{name}#") for name in SHARDS}
+    c_of = {name: shard.graph.c for name, shard in shards.items()}
+    db = world.graph.db
+
+    catalog = {"version": CATALOG_VERSION, "ontology_iri": ontology_iri,
+               "tbox": {"file": TBOX_FILE, "iri": ontology_iri.rstrip("#")}, "shards": {}}
+    counters = {"individuals": len(assignment)}
+    db.execute("CREATE TEMP TABLE shard_subjects (s INTEGER PRIMARY KEY, c INTEGER)")
+    try:
+        db.executemany("INSERT INTO shard_subjects VALUES (?, ?)", ((s, c_of[shard]) for s, shard in assignment.items()))
+        for table in ("objs", "datas"):
+            db.execute(f"UPDATE {table} SET c = (SELECT c FROM shard_subjects WHERE shard_subjects.s = {table}.s) "
+                       f"WHERE c = ? AND s IN (SELECT s FROM shard_subjects)", (main_c,))
+
+        for name, shard in shards.items():
+            c = c_of[name]
+            properties = {p for (p,) in db.execute("SELECT DISTINCT p FROM objs WHERE c = ? UNION "
+                                                   "SELECT DISTINCT p FROM datas WHERE c = ?", (c, c))}
+            triples = db.execute("SELECT (SELECT COUNT(*) FROM objs WHERE c = ?) + "
+                                 "(SELECT COUNT(*) FROM datas WHERE c = ?)", (c, c)).fetchone()[0]
+            classes = set()
+            for storid in shard_classes[name]: classes.update(a.storid for a in world._get_by_storid(storid).ancestors())
+            shard.imported_ontologies.append(onto)
+            shard.save(file=os.path.join(directory, f"{name}.owl"), format="rdfxml")
+            catalog["shards"][name] = {
+                "file": f"{name}.owl",
+                "iri": shard.base_iri.rstrip("#"),
+                "individuals": sum(1 for shard_name in assignment.values() if shard_name == name),
+                "triples": triples,
+                "classes": sorted(_local_names(world, classes, ontology_iri)),
+                "properties": sorted(_local_names(world, properties, ontology_iri)),
+            }
+            counters[f"{name}_triples"] = triples
+
+        onto.save(file=os.path.join(directory, TBOX_FILE), format="rdfxml")
+        everything = world.get_ontology(f"{base}all#")
+        everything.imported_ontologies.extend(shards.values())
+        everything.save(file=os.path.join(directory, ALL_FILE), format="rdfxml")
+        everything.destroy()
+    finally:
+        # Only the individuals' triples go back; each shard's own header and imports are dropped with it
+        for name, shard in shards.items():
+            for table in ("objs", "datas"):
+                db.execute(f"UPDATE {table} SET c = ? WHERE c = ? AND s != ?", (main_c, c_of[name], shard.storid))
+            shard.destroy()
+        db.execute("DROP TABLE shard_subjects")
+
+    with open(os.path.join(directory, CATALOG_FILE), "w", encoding="utf-8") as f:
+        json.dump(catalog, f, indent=2)
+        f.write("\n")
+    write_protege_catalog(directory, catalog)
+    counters["bytes"] = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+    return counters
+
+
+def write_protege_catalog(directory, catalog):
+    """catalog-v001.xml, so Protégé resolves the owl:imports between the files to the local copies."""
+    entries = [(catalog["tbox"]["iri"], catalog["tbox"]["file"])]
+    entries += [(shard["iri"], shard["file"]) for shard in catalog["shards"].values()]
+    with open(os.path.join(directory, "catalog-v001.xml"), "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n')
+        f.write('<catalog prefer="public" xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">\n')
+        for iri, file in entries: f.write(f'    <uri name="{iri}" uri="{file}"/>\n')
+        f.write('</catalog>\n')
+
+
+def read_catalog(directory):
+    with open(os.path.join(directory, CATALOG_FILE), "r", encoding="utf-8") as f: catalog = json.load(f)
+    if catalog.get("version") != CATALOG_VERSION:
+        raise ValueError(f"'{directory}' was written with shard catalog version {catalog.get('version')}, "
+                         f"expected {CATALOG_VERSION}; rerun json_to_ontology.py --sharded")
+    return catalog
+
+
+class ShardedOntology:
+    """
+    Lazy view of a sharded ontology directory. Only the TBox module (classes,
+    properties and the GameMechanic vocabulary) is loaded up front; a shard is
+    parsed the first time a class or property it holds is looked up, by name
+    (`sharded.Hero`, `sharded["hasRole"]`) or through individuals().
+
+    Individuals referenced from a loaded shard but living in one that is not
+    loaded yet come back without their types and data until that shard is
+    loaded, so look up what a consumer uses before walking the graph.
+    """
+    def __init__(self, directory, world=None):
+        self.directory = directory
+        self.catalog = read_catalog(directory)
+        self.world = world if world is not None else World()
+        self.loaded = []
+        self.tbox = self._parse(self.catalog["tbox"])
+        self.owners = {}
+        for name, shard in self.catalog["shards"].items():
+            for entity in shard["classes"] + shard["properties"]: self.owners.setdefault(entity, []).append(name)
+
+    def _parse(self, entry):
+        onto = self.world.get_ontology(entry["iri"])
+        with open(os.path.join(self.directory, entry["file"]), "rb") as f: onto.load(fileobj=f)
+        return onto
+
+    def load(self, shard):
+        if shard in self.loaded: return
+        self._parse(self.catalog["shards"][shard])
+        self.loaded.append(shard)
+
+    def load_all(self):
+        for shard in self.catalog["shards"]: self.load(shard)
+        return self
+
+    def require(self, name):
+        """The class or property `name`, after loading every shard that holds its instances or triples."""
+        for shard in self.owners.get(name, ()): self.load(shard)
+        return self.tbox[name]
+
+    __getitem__ = require
+
+    def __getattr__(self, name):
+        if name.startswith("_"): raise AttributeError(name)
+        entity = self.require(name)
+        if entity is None: raise AttributeError(f"the ontology has no class or property named {name!r}")
+        return entity
+
+    def individuals(self, class_name):
+        return list(self.require(class_name).instances(world=self.world))
+
+    def individual(self, name):
+        """Looks an individual up by local name, loading the remaining shards one at a time until it is found."""
+        for shard in [None, *self.catalog["shards"]]:
+            if shard is not None: self.load(shard)
+            individual = self.tbox[name]
+            if individual is not None: return individual
+        return None
+
+
+def _world_ntriples(world, exclude_prefix):
+    """N-Triples lines of every ontology in `world`, minus blank nodes and the headers of the shard ontologies."""
+    lines = set()
+    for onto in world.ontologies.values():
+        buffer = io.BytesIO()
+        onto.save(file=buffer, format="ntriples")
+        for line in buffer.getvalue().decode("utf-8").splitlines():
+            if line and "_:" not in line and not line.startswith(f"<{exclude_prefix}") and "owl#imports" not in line:
+                lines.add(line)
+    return lines
+
+
+def compare_with_monolithic(directory, ontology_file):
+    """(missing, unexpected) triples of the fully loaded shards against the monolithic RDF/XML file."""
+    catalog = read_catalog(directory)
+    prefix = shard_base(catalog["ontology_iri"])
+    sharded = ShardedOntology(directory).load_all()
+    world = World()
+    with open(ontology_file, "rb") as f: world.get_ontology(catalog["tbox"]["iri"]).load(fileobj=f)
+    expected, actual = _world_ntriples(world, prefix), _world_ntriples(sharded.world, prefix)
+    return expected - actual, actual - expected
+
+
+def hero_roles(heroes, has_role):
+    return {hero.name: sorted(role.name for role in has_role[hero]) for hero in heroes}
+
+
+def run_scenario(scenario, directory, ontology_file):
+    """One consumer of benchmark(): the heroes with their roles, from the monolithic file or the shards."""
+    start = time.perf_counter()
+    if scenario == "monolithic":
+        world = World()
+        with open(ontology_file, "rb") as f: onto = world.get_ontology(read_catalog(directory)["tbox"]["iri"]).load(fileobj=f)
+        loaded = time.perf_counter()
+        roles = hero_roles(onto.Hero.instances(world=world), onto.hasRole)
+        shards = ["all"]
+    else:
+        sharded = ShardedOntology(directory)
+        loaded = time.perf_counter()
+        roles = hero_roles(sharded.individuals("Hero"), sharded.hasRole)
+        shards = sharded.loaded
+    done = time.perf_counter()
+    return {"open_s": loaded - start, "query_s": done - loaded, "total_s": done - start, "shards": shards,
+            "heroes": len(roles), "roles": sum(map(len, roles.values())), "digest": hashlib.sha1(json.dumps(roles, sort_keys=True).encode()).hexdigest()}
+
+
+def benchmark(directory, ontology_file):
+    """
+    Runs the hero/role consumer once against the monolithic file and once
+    against the lazy shards, each in a fresh interpreter so peak RSS is
+    measured per consumer, and yields (scenario, result) pairs.
+    """
+    for scenario in ("monolithic", "sharded"):
+        command = [sys.executable, os.path.abspath(__file__), "--dir", directory, "--ontology", ontology_file,
+                   "--scenario", scenario]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE)
+        output = process.stdout.read()
+        _, status, usage = os.wait4(process.pid, 0)
+        if os.waitstatus_to_exitcode(status) != 0: raise RuntimeError(f"{scenario} consumer failed")
+        # ru_maxrss is in KiB on Linux
+        yield scenario, dict(json.loads(output), peak_rss_mib=usage.ru_maxrss / 1024)
+
+
+if __name__ == '__main__':
+    SHARD_DIR = 'dota2_ontology_shards'
+    ONTOLOGY_FILE = 'dota2_ontology.owl'
+
+    parser = argparse.ArgumentParser(description="Inspect, verify and benchmark the sharded ontology written by json_to_ontology.py --sharded.")
+    parser.add_argument("--dir", default=SHARD_DIR, help=f"shard directory (default '{SHARD_DIR}')")
+    parser.add_argument("--ontology", default=ONTOLOGY_FILE, help=f"monolithic ontology to compare with (default '{ONTOLOGY_FILE}')")
+    parser.add_argument("--verify", action="store_true", help="check that all shards together have the triples of the monolithic file")
+    parser.add_argument("--bench", action="store_true",
+                        help="compare startup time and peak RSS of a hero/role consumer on the monolithic file and the shards")
+    parser.add_argument("--scenario", choices=["monolithic", "sharded"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(run_scenario(args.scenario, args.dir, args.ontology)))
+        sys.exit(0)
+
+    catalog = read_catalog(args.dir)
+    print(f"'{args.dir}': TBox module '{catalog['tbox']['file']}' and {len(catalog['shards'])} shards")
+    for name, shard in catalog["shards"].items():
+        size = os.path.getsize(os.path.join(args.dir, shard["file"])) / 2**20
+        print(f"  {name:<15} {shard['individuals']:>6} individuals {shard['triples']:>7} triples {size:7.2f} MiB  "
+              f"{len(shard['classes'])} classes, {len(shard['properties'])} properties")
+
+    # Before --verify: a child process starts with the peak RSS of its parent at fork time
+    if args.bench:
+        results = dict(benchmark(args.dir, args.ontology))
+        for scenario, result in results.items():
+            print(f"  {scenario:<10} open {result['open_s'] * 1000:8.1f} ms  query {result['query_s'] * 1000:7.1f} ms  "
+                  f"total {result['total_s'] * 1000:8.1f} ms  {result['peak_rss_mib']:6.1f} MiB peak RSS  "
+                  f"({result['heroes']} heroes, shards: {', '.join(result['shards'])})")
+        if results["monolithic"]["digest"] != results["sharded"]["digest"]:
+            print("Results DIFFER between the monolithic file and the shards.")
+            sys.exit(1)
+        mono, shard = results["monolithic"], results["sharded"]
+        print(f"Same heroes and roles; {mono['total_s'] / shard['total_s']:.1f}x faster, "
+              f"{mono['peak_rss_mib'] - shard['peak_rss_mib']:.1f} MiB less peak RSS with the shards.")
+
+    if args.verify:
+        missing, extra = compare_with_monolithic(args.dir, args.ontology)
+        if missing or extra:
+            print(f"Verification FAILED: {len(missing)} triples missing, {len(extra)} unexpected.")
+            for line in sorted(missing)[:5]: print(f"  missing    {line}")
+            for line in sorted(extra)[:5]: print(f"  unexpected {line}")
+            sys.exit(1)
+        print(f"Verification passed: the shards load to the same triples as '{args.ontology}'.")
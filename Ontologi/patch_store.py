@@ -0,0 +1,437 @@
+import argparse
+import datetime
+import hashlib
+import itertools
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+import zlib
+from collections import Counter
+from owlready2 import World
+
+from json_to_ontology import (ONTOLOGY_IRI, build_manifest, create_ontology_structure, iter_records,
+                              non_hero_unit_records, ops_digest, populate_bulk, structure_records, write_manifest)
+from synthetic_data import DATA_FILES, evolve, load_source
+
+# A patch's record list is cut into chunks after every record key whose hash is
+# 0 modulo CHUNK_TARGET. The cut points depend only on the keys, so a changed,
+# added or removed record rewrites the one chunk around it and every other
+# chunk is shared with the previous patch.
+CHUNK_TARGET = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (hash BLOB PRIMARY KEY, ops BLOB NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS chunks (hash BLOB PRIMARY KEY, entries BLOB NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS patches (
+    name TEXT PRIMARY KEY, parent TEXT, created TEXT, records INTEGER,
+    added INTEGER, changed INTEGER, removed INTEGER, chunks TEXT NOT NULL
+);
+"""
+
+
+def _encode(value):
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+def _decode(blob):
+    return json.loads(zlib.decompress(blob))
+
+def _base_key(record_key):
+    """The record key as iter_records yields it, without the #n add() gives repeated keys."""
+    return record_key.rsplit("#", 1)[0] if "#" in record_key else record_key
+
+def _is_boundary(record_key):
+    return int.from_bytes(hashlib.sha1(record_key.encode("utf-8")).digest()[:4], "big") % CHUNK_TARGET == 0
+
+
+def dataset_records(heroes_data, hero_abilities_data, items_data, abilities_data):
+    """Every record of one dataset in population order, static units and structures included."""
+    return itertools.chain(iter_records(heroes_data, hero_abilities_data, items_data, abilities_data),
+                           non_hero_unit_records(), structure_records())
+
+
+class PatchStore:
+    """
+    Versioned store of json_to_ontology records, one version per game patch,
+    in a single SQLite file.
+
+    Every record's ops are stored once under their ops_digest, so a record
+    that is the same in many patches costs one row. A patch is the ordered
+    list of its (record key, digest) entries, cut into content-defined chunks
+    (see CHUNK_TARGET) that are also stored once under their own hash; the
+    patch row only lists its chunk hashes. Adding a patch therefore writes
+    the changed records and the chunks around them, and diff() compares two
+    patches by reading only the chunks they do not share.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def patches(self):
+        """The stored patches in the order they were added, as dicts."""
+        rows = self.db.execute("SELECT name, parent, created, records, added, changed, removed, chunks "
+                               "FROM patches ORDER BY rowid")
+        return [{"name": name, "parent": parent, "created": created, "records": records, "added": added,
+                 "changed": changed, "removed": removed, "chunks": len(json.loads(chunks))}
+                for name, parent, created, records, added, changed, removed, chunks in rows]
+
+    def latest(self):
+        row = self.db.execute("SELECT name FROM patches ORDER BY rowid DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def _root(self, name):
+        row = self.db.execute("SELECT chunks FROM patches WHERE name = ?", (name,)).fetchone()
+        if row is None: raise KeyError(f"unknown patch '{name}'")
+        return json.loads(row[0])
+
+    def _chunk(self, digest):
+        blob, = self.db.execute("SELECT entries FROM chunks WHERE hash = ?", (bytes.fromhex(digest),)).fetchone()
+        return _decode(blob)
+
+    def _put_chunk(self, entries):
+        data = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha1(data).hexdigest()
+        self.db.execute("INSERT OR IGNORE INTO chunks VALUES (?, ?)", (bytes.fromhex(digest), zlib.compress(data)))
+        return digest
+
+    def entries(self, name):
+        """Yields the (record key, digest) entries of a patch in population order, one chunk at a time."""
+        for digest in self._root(name): yield from map(tuple, self._chunk(digest))
+
+    def records(self, name):
+        """Yields the (record_key, ops) records of a patch in population order, as iter_records did."""
+        for digest in self._root(name):
+            chunk = self._chunk(digest)
+            keys = [bytes.fromhex(h) for _, h in chunk]
+            rows = self.db.execute(f"SELECT hash, ops FROM records WHERE hash IN ({','.join('?' * len(keys))})", keys)
+            ops = {h: blob for h, blob in rows}
+            for (record_key, h), key in zip(chunk, keys): yield _base_key(record_key), [tuple(op) for op in _decode(ops[key])]
+
+    def record_ops(self, digest):
+        row = self.db.execute("SELECT ops FROM records WHERE hash = ?", (bytes.fromhex(digest),)).fetchone()
+        if row is None: raise KeyError(f"unknown record {digest}")
+        return [tuple(op) for op in _decode(row[0])]
+
+    def add(self, name, records, parent=None):
+        """
+        Stores `records` as patch `name`, in one transaction. Only records
+        whose ops are not in the store yet are written. A record key that
+        repeats (a hero listing the same talent twice) is stored as key#2,
+        key#3, ... so keys stay unique within the patch. `parent` (by default
+        the latest patch) is the patch the change counts are taken against.
+        Returns a dict of what was written.
+        """
+        if self.db.execute("SELECT 1 FROM patches WHERE name = ?", (name,)).fetchone():
+            raise ValueError(f"patch '{name}' already exists")
+        if parent is None: parent = self.latest()
+        elif not self.db.execute("SELECT 1 FROM patches WHERE name = ?", (parent,)).fetchone():
+            raise KeyError(f"unknown patch '{parent}'")
+
+        stats = Counter()
+        seen = Counter()
+        root, chunk = [], []
+        with self.db:
+            chunk_rows = self.db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            for record_key, ops in records:
+                seen[record_key] += 1
+                if seen[record_key] > 1: record_key += f"#{seen[record_key]}"
+                digest = ops_digest(ops)
+                key = bytes.fromhex(digest)
+                if self.db.execute("SELECT 1 FROM records WHERE hash = ?", (key,)).fetchone() is None:
+                    blob = _encode(ops)
+                    self.db.execute("INSERT INTO records VALUES (?, ?)", (key, blob))
+                    stats["new_records"] += 1
+                    stats["new_bytes"] += len(blob)
+                chunk.append((record_key, digest))
+                if _is_boundary(record_key):
+                    root.append(self._put_chunk(chunk))
+                    chunk = []
+            if chunk: root.append(self._put_chunk(chunk))
+            stats["new_chunks"] = self.db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0] - chunk_rows
+
+            self.db.execute("INSERT INTO patches VALUES (?, ?, ?, ?, NULL, NULL, NULL, ?)",
+                            (name, parent, datetime.datetime.now().isoformat(timespec="seconds"), sum(seen.values()),
+                             json.dumps(root)))
+            if parent is not None:
+                changes = self.diff(parent, name)
+                self.db.execute("UPDATE patches SET added = ?, changed = ?, removed = ? WHERE name = ?",
+                                (len(changes["added"]), len(changes["changed"]), len(changes["removed"]), name))
+        return {"records": sum(seen.values()), "chunks": len(root), **stats}
+
+    def _unshared(self, old, new):
+        """The entries of the chunks that only one of the two patches has, as two dicts, and the chunks read."""
+        old_root, new_root = self._root(old), self._root(new)
+        shared = set(old_root) & set(new_root)
+        before = {key: h for digest in old_root if digest not in shared for key, h in self._chunk(digest)}
+        after = {key: h for digest in new_root if digest not in shared for key, h in self._chunk(digest)}
+        return before, after, len(old_root) + len(new_root) - 2 * len(shared)
+
+    def diff(self, old, new):
+        """
+        What changed from patch `old` to patch `new`: the added, changed and
+        removed record keys. A record key occurs once per patch, so a key in
+        a chunk both patches share is unchanged, and only the other chunks are
+        read. Record ops are not decoded at all.
+        """
+        before, after, chunks_read = self._unshared(old, new)
+        return {
+            "old": old,
+            "new": new,
+            "added": [key for key in after if key not in before],
+            "changed": [key for key, h in after.items() if key in before and before[key] != h],
+            "removed": [key for key in before if key not in after],
+            "chunks_read": chunks_read,
+        }
+
+    def changed_ops(self, old, new):
+        """Yields (record key, ops only in `old`, ops only in `new`) for every changed record."""
+        before, after, _ = self._unshared(old, new)
+        for key, h in after.items():
+            if key not in before or before[key] == h: continue
+            old_ops, new_ops = self.record_ops(before[key]), self.record_ops(h)
+            yield key, [op for op in old_ops if op not in new_ops], [op for op in new_ops if op not in old_ops]
+
+    def remove(self, name):
+        """Deletes a patch and every record and chunk no other patch uses. Returns (records, chunks) deleted."""
+        with self.db:
+            self._root(name)
+            self.db.execute("DELETE FROM patches WHERE name = ?", (name,))
+            self.db.execute("UPDATE patches SET parent = NULL WHERE parent = ?", (name,))
+            live_chunks = {digest for (chunks,) in self.db.execute("SELECT chunks FROM patches") for digest in json.loads(chunks)}
+            live_records = {h for digest in live_chunks for _, h in self._chunk(digest)}
+            dead_chunks = [(h,) for (h,) in self.db.execute("SELECT hash FROM chunks") if h.hex() not in live_chunks]
+            dead_records = [(h,) for (h,) in self.db.execute("SELECT hash FROM records") if h.hex() not in live_records]
+            self.db.executemany("DELETE FROM chunks WHERE hash = ?", dead_chunks)
+            self.db.executemany("DELETE FROM records WHERE hash = ?", dead_records)
+        self.db.execute("VACUUM")
+        return len(dead_records), len(dead_chunks)
+
+    def check(self):
+        """Yields a line for every stored record or chunk whose content no longer matches its hash, or is missing."""
+        for h, blob in self.db.execute("SELECT hash, ops FROM records"):
+            if ops_digest([tuple(op) for op in _decode(blob)]) != h.hex(): yield f"record {h.hex()}: hash mismatch"
+        for h, blob in self.db.execute("SELECT hash, entries FROM chunks"):
+            if hashlib.sha1(zlib.decompress(blob)).hexdigest() != h.hex(): yield f"chunk {h.hex()}: hash mismatch"
+        for patch in self.patches():
+            for digest in self._root(patch["name"]):
+                if not self.db.execute("SELECT 1 FROM chunks WHERE hash = ?", (bytes.fromhex(digest),)).fetchone():
+                    yield f"patch {patch['name']}: chunk {digest} missing"
+                    continue
+                for key, h in self._chunk(digest):
+                    if not self.db.execute("SELECT 1 FROM records WHERE hash = ?", (bytes.fromhex(h),)).fetchone():
+                        yield f"patch {patch['name']}: record {key} ({h}) missing"
+
+
+def export_owl(records, path):
+    """Writes the ontology of `records` as RDF/XML, the same triples json_to_ontology.py --bulk writes."""
+    onto = World().get_ontology(ONTOLOGY_IRI)
+    create_ontology_structure(onto)
+    populate_bulk(onto, records)
+    onto.save(file=path, format="rdfxml")
+
+
+def abox_facts(records):
+    """
+    The Prolog ABox facts of `records`, by the rules of aboxconvertprolog.py:
+    hero/primary_attribute/attack_type/has_role/has_ability from the hero
+    relations, and ability_type/damage_type only for abilities some hero has.
+    Every collection is a set of fact lines.
+    """
+    local = lambda name: name.replace(" ", "_").lower().replace("npc_dota_hero_", "")
+    facts = {name: set() for name in ("hero", "attack_type", "primary_attribute", "has_role", "has_ability",
+                                      "ability_type", "damage_type")}
+    details = []
+    hero_abilities = set()
+    for record_key, ops in records:
+        for op in ops:
+            if op[0] != "rel": continue
+            subject, prop, obj = local(op[2]), op[3], local(op[5])
+            if prop == "hasPrimaryAttribute":
+                facts["hero"].add(f"hero({subject}).\n")
+                facts["primary_attribute"].add(f"primary_attribute({subject}, {obj}).\n")
+            elif prop == "hasAttackType":
+                facts["attack_type"].add(f"attack_type({subject}, {obj}).\n")
+            elif prop == "hasRole":
+                facts["has_role"].add(f"has_role({subject}, {obj}).\n")
+            elif prop == "hasAbility":
+                facts["has_ability"].add(f"has_ability({subject}, {obj}).\n")
+                hero_abilities.add(op[5])
+            elif op[1] == "ability" and prop == "hasBehavior":
+                details.append((op[2], "ability_type", f"ability_type({subject}, {obj}).\n"))
+            elif op[1] == "ability" and prop == "hasDamageType":
+                details.append((op[2], "damage_type", f"damage_type({subject}, {obj}).\n"))
+    for ability, name, fact in details:
+        if ability in hero_abilities: facts[name].add(fact)
+    return facts
+
+
+def write_abox(path, facts):
+    """Writes abox_facts in the layout of aboxconvertprolog.py's abox_dota2.pl."""
+    sections = [
+        ("% === Fakta Hero ===\n", "hero"),
+        ("% Attack Types\n", "attack_type"),
+        ("% Properti: Atribut Utama (hasPrimaryAttribute)\n", "primary_attribute"),
+        ("% Properti: Role (hasRole)\n", "has_role"),
+        ("% Properti: Kepemilikan Ability (hasAbility)\n", "has_ability"),
+        ("% === Fakta Ability ===\n\n% Properti: Tipe Ability (abilityType)\n", "ability_type"),
+        ("% Properti: Tipe Damage (damageType)\n", "damage_type"),
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        for header, name in sections:
+            if name == "attack_type" and not facts[name]: continue
+            f.write(header)
+            f.writelines(sorted(facts[name]))
+            f.write("\n")
+
+
+def dataset_arguments(data):
+    """A synthetic_data dataset as the (heroes, hero_abilities, items, abilities) arguments of dataset_records."""
+    return [data[name] for name in ("heroes.json", "hero_abilities.json", "items.json", "abilities.json")]
+
+
+def benchmark(patches, change_rate, seed=0):
+    """
+    Stores `patches` successive synthetic patches (synthetic_data.evolve of
+    the stock data) in a scratch store and compares its size and diff time
+    with keeping a full ontology + ABox per patch and diffing fully decoded
+    versions.
+    """
+    source = load_source()
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PatchStore(os.path.join(tmp, "bench.sqlite3"))
+        owl_path, abox_path = os.path.join(tmp, "patch.owl"), os.path.join(tmp, "patch.pl")
+        data = source
+        add_time = 0.0
+        for i in range(patches):
+            if i: data = evolve(data, rng, change_rate, patch=i)
+            start = time.perf_counter()
+            stats = store.add(f"p{i}", dataset_records(*dataset_arguments(data)))
+            add_time += time.perf_counter() - start
+            if i == 0:
+                first = stats
+                start = time.perf_counter()
+                export_owl(store.records("p0"), owl_path)
+                export_time = time.perf_counter() - start
+                write_abox(abox_path, abox_facts(store.records("p0")))
+                full_size = os.path.getsize(owl_path) + os.path.getsize(abox_path)
+        store.db.execute("VACUUM")
+        store_size = os.path.getsize(store.path)
+
+        print(f"{patches} patches, {change_rate:.0%} of heroes/abilities/items retuned per patch, {first['records']} records each")
+        print(f"  store size           {store_size / 2**20:8.2f} MiB ({store_size / patches / 2**10:,.0f} KiB per patch)")
+        print(f"  full OWL + ABox      {patches * full_size / 2**20:8.2f} MiB ({full_size / 2**10:,.0f} KiB per patch)")
+        print(f"  first patch          {first['new_bytes'] / 2**10:8.0f} KiB of records, {first['chunks']} chunks")
+        print(f"  add patch            {add_time / patches * 1000:8.1f} ms per patch (record transform included)")
+        print(f"  export OWL           {export_time * 1000:8.1f} ms")
+
+        pairs = [(f"p{i}", f"p{i + 1}") for i in range(patches - 1)] + [("p0", f"p{patches - 1}")]
+        for label, diff in [
+            ("diff from index", lambda a, b: store.diff(a, b)),
+            ("diff decoded patches", lambda a, b: {k: ops_digest(ops) for k, ops in store.records(a)}
+                                                  != {k: ops_digest(ops) for k, ops in store.records(b)}),
+        ]:
+            start = time.perf_counter()
+            for a, b in pairs: diff(a, b)
+            print(f"  {label:<20} {(time.perf_counter() - start) / len(pairs) * 1000:8.2f} ms per pair")
+        last = store.diff("p0", f"p{patches - 1}")
+        print(f"  p0 -> p{patches - 1}: {len(last['added'])} added, {len(last['changed'])} changed, "
+              f"{len(last['removed'])} removed, {last['chunks_read']} of {first['chunks'] * 2} chunks read")
+        store.close()
+
+
+if __name__ == '__main__':
+    STORE_FILE = 'dota2_patches.sqlite3'
+
+    parser = argparse.ArgumentParser(description="Versioned store of the Dota 2 ontology records, one version per game patch.")
+    parser.add_argument("--store", default=STORE_FILE, help="SQLite file holding every stored patch")
+    parser.add_argument("--add", metavar="PATCH", help="store the JSON data in --data as this patch")
+    parser.add_argument("--data", default=".", help=f"folder holding {', '.join(DATA_FILES)} for --add")
+    parser.add_argument("--parent", help="with --add, the patch the change counts are taken against (default: the latest)")
+    parser.add_argument("--list", action="store_true", help="list the stored patches")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="print the records that changed between two patches")
+    parser.add_argument("--ops", action="store_true", help="with --diff, also print the ops removed and added per changed record")
+    parser.add_argument("--export", metavar="PATCH", help="write the ontology and the Prolog ABox of a stored patch")
+    parser.add_argument("--owl", help="with --export, the RDF/XML path (default 'dota2_ontology_<PATCH>.owl')")
+    parser.add_argument("--abox", help="with --export, the Prolog ABox path (default 'abox_dota2_<PATCH>.pl')")
+    parser.add_argument("--manifest", help="with --export, also write the record manifest json_to_ontology.py --incremental reads")
+    parser.add_argument("--remove", metavar="PATCH", help="delete a patch and the records only it uses")
+    parser.add_argument("--check", action="store_true", help="verify every stored record and chunk against its hash")
+    parser.add_argument("--bench", type=int, metavar="N", help="benchmark N synthetic patches in a scratch store")
+    parser.add_argument("--change-rate", type=float, default=0.02, help="with --bench, fraction of entities retuned per patch")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.change_rate)
+        exit()
+
+    with PatchStore(args.store) as store:
+        try:
+            if args.add:
+                start = time.perf_counter()
+                stats = store.add(args.add, dataset_records(*dataset_arguments(load_source(args.data))), args.parent)
+                print(f"Patch '{args.add}' stored in {time.perf_counter() - start:.2f} s: {stats['records']} records, "
+                      f"{stats.get('new_records', 0)} new ({stats.get('new_bytes', 0) / 2**10:.0f} KiB), "
+                      f"{stats.get('new_chunks', 0)} of {stats['chunks']} chunks new.")
+
+            if args.remove:
+                n_records, n_chunks = store.remove(args.remove)
+                print(f"Patch '{args.remove}' removed, with {n_records} records and {n_chunks} chunks no other patch used.")
+
+            if args.list:
+                for patch in store.patches():
+                    changes = (f"+{patch['added']} ~{patch['changed']} -{patch['removed']} since '{patch['parent']}'"
+                               if patch["parent"] else "")
+                    print(f"{patch['name']:<16} {patch['created']}  {patch['records']:>6} records  "
+                          f"{patch['chunks']:>4} chunks  {changes}")
+                print(f"Store '{args.store}': {os.path.getsize(args.store) / 2**20:.2f} MiB.")
+
+            if args.diff:
+                old, new = args.diff
+                start = time.perf_counter()
+                changes = store.diff(old, new)
+                elapsed = time.perf_counter() - start
+                for label, mark in (("added", "+"), ("changed", "~"), ("removed", "-")):
+                    for key in changes[label]: print(f"{mark} {key}")
+                if args.ops:
+                    for key, removed, added in store.changed_ops(old, new):
+                        print(f"\n{key}")
+                        for op in removed: print(f"  - {op}")
+                        for op in added: print(f"  + {op}")
+                print(f"{old} -> {new}: {len(changes['added'])} added, {len(changes['changed'])} changed, "
+                      f"{len(changes['removed'])} removed ({changes['chunks_read']} chunks read, {elapsed * 1000:.1f} ms).")
+
+            if args.export:
+                owl_path = args.owl or f"dota2_ontology_{args.export}.owl"
+                abox_path = args.abox or f"abox_dota2_{args.export}.pl"
+                start = time.perf_counter()
+                export_owl(store.records(args.export), owl_path)
+                write_abox(abox_path, abox_facts(store.records(args.export)))
+                print(f"Patch '{args.export}' exported to '{owl_path}' and '{abox_path}' in {time.perf_counter() - start:.2f} s.")
+                if args.manifest:
+                    # json_to_ontology.py keeps the static units and structures out of its manifest
+                    manifest_records = ((key, ops) for key, ops in store.records(args.export)
+                                        if not key.startswith(("unit:", "structure:")))
+                    write_manifest(args.manifest, build_manifest(manifest_records), owl_path)
+                    print(f"Manifest written to '{args.manifest}'.")
+
+            if args.check:
+                problems = list(store.check())
+                for line in problems: print(line)
+                if problems: exit(1)
+                print(f"Store '{args.store}' is consistent.")
+        except (KeyError, ValueError) as e:
+            print(f"Error: {e.args[0]}")
+            exit(1)
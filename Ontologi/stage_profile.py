@@ -0,0 +1,205 @@
+import argparse
+import cProfile
+import datetime
+import json
+import os
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+REPORT_VERSION = 1
+TOP_FUNCTIONS = 25
+
+
+class StageProfiler:
+    """
+    Records wall time, CPU time, tracemalloc memory and counters per named
+    pipeline stage. Stages nest; a nested stage is reported as "parent/child"
+    and its time also counts toward the parent (self_s excludes it).
+
+    stage() yields the stage's counter dict for the caller to fill in. If a
+    `measure` callable is given, it is called before and after the stage and
+    the change of each value it returns (e.g. triples in the quadstore) is
+    stored as a counter. A disabled profiler keeps the same interface and only
+    hands out a throwaway dict, so instrumented code runs the same way with
+    profiling off.
+
+    With cprofile=True every stage runs under its own cProfile.Profile (the
+    parent's is paused while a child runs), and write() dumps the profile of
+    the stage with the most self time.
+    """
+    def __init__(self, enabled=True, trace_memory=True, cprofile=False):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.cprofile = enabled and cprofile
+        self.stages = []
+        self._stack = []
+        self._profiles = {}
+        self._seen = Counter()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        if self.trace_memory and not tracemalloc.is_tracing(): tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name, measure=None, **counters):
+        if not self.enabled:
+            yield counters
+            return
+        parent = self._stack[-1] if self._stack else None
+        full_name = f"{parent['name']}/{name}" if parent else name
+        # A stage that runs more than once is reported as name#2, name#3, ...
+        self._seen[full_name] += 1
+        if self._seen[full_name] > 1: full_name += f"#{self._seen[full_name]}"
+        entry = {"name": full_name, "counters": counters, "children_s": 0.0}
+        self.stages.append(entry)
+
+        if self.trace_memory:
+            if parent is not None: parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            entry["memory_start"] = entry["peak"] = tracemalloc.get_traced_memory()[0]
+        if self.cprofile:
+            if parent is not None: self._profiles[parent["name"]].disable()
+            profile = self._profiles[full_name] = cProfile.Profile()
+            profile.enable()
+
+        self._stack.append(entry)
+        before = measure() if measure is not None else None
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield counters
+        finally:
+            entry["wall_s"] = time.perf_counter() - wall
+            entry["cpu_s"] = time.process_time() - cpu
+            self._stack.pop()
+            if measure is not None:
+                for key, value in measure().items(): counters[key] = value - before[key]
+            if self.cprofile:
+                self._profiles[full_name].disable()
+                if parent is not None: self._profiles[parent["name"]].enable()
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                entry["peak"] = max(entry["peak"], peak)
+                entry["retained"] = current - entry["memory_start"]
+                if parent is not None:
+                    parent["peak"] = max(parent["peak"], entry["peak"])
+                    tracemalloc.reset_peak()
+            if parent is not None: parent["children_s"] += entry["wall_s"]
+
+    def count_records(self, records, counters):
+        """Passes (record_key, ops) records through, counting records and ops into `counters`."""
+        if not self.enabled: return records
+
+        def counted():
+            for record_key, ops in records:
+                counters["records"] = counters.get("records", 0) + 1
+                counters["ops"] = counters.get("ops", 0) + len(ops)
+                yield record_key, ops
+        return counted()
+
+    def hottest(self):
+        finished = [s for s in self.stages if "wall_s" in s]
+        if not finished: return None
+        return max(finished, key=lambda s: s["wall_s"] - s["children_s"])["name"]
+
+    def report(self, script, **meta):
+        """The report as a dict with a stable key order, so two runs can be diffed line by line."""
+        stages = []
+        for s in self.stages:
+            if "wall_s" not in s: continue
+            stage = {
+                "name": s["name"],
+                "wall_s": round(s["wall_s"], 6),
+                "self_s": round(s["wall_s"] - s["children_s"], 6),
+                "cpu_s": round(s["cpu_s"], 6),
+            }
+            if self.trace_memory:
+                stage["peak_memory_bytes"] = s["peak"]
+                stage["retained_bytes"] = s["retained"]
+            stage["counters"] = dict(sorted(s["counters"].items()))
+            stages.append(stage)
+        total = {
+            "wall_s": round(time.perf_counter() - self._wall, 6),
+            "cpu_s": round(time.process_time() - self._cpu, 6),
+        }
+        if self.trace_memory: total["peak_memory_bytes"] = max((s["peak"] for s in self.stages if "peak" in s), default=0)
+        return {
+            "version": REPORT_VERSION,
+            "script": script,
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "argv": sys.argv[1:],
+            "python": platform.python_version(),
+            "tracemalloc": self.trace_memory,
+            "cprofile": self.cprofile,
+            **meta,
+            "total": total,
+            "hottest_stage": self.hottest(),
+            "stages": stages,
+        }
+
+    def write(self, path, script, cprofile_path=None, **meta):
+        """
+        Writes the JSON report to `path`. With cProfile enabled, also dumps the
+        hottest stage's profile to `cprofile_path` (pstats format) and adds its
+        top functions by own time to the report.
+        """
+        report = self.report(script, **meta)
+        if self.cprofile and report["hottest_stage"] is not None:
+            stats = pstats.Stats(self._profiles[report["hottest_stage"]])
+            if cprofile_path is not None: stats.dump_stats(cprofile_path)
+            top = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:TOP_FUNCTIONS]
+            report["cprofile_dump"] = {
+                "stage": report["hottest_stage"],
+                "file": cprofile_path,
+                "top": [{"function": f"{os.path.basename(file)}:{line}({func})", "calls": nc,
+                         "tottime_s": round(tt, 6), "cumtime_s": round(ct, 6)}
+                        for (file, line, func), (cc, nc, tt, ct, callers) in top],
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        return report
+
+# Shared disabled profiler, the default wherever profiling is optional
+NULL_PROFILER = StageProfiler(enabled=False)
+
+
+def compare_reports(old, new, threshold=0.05):
+    """Yields one line per stage with the wall time, CPU time and memory change between two reports."""
+    old_stages = {s["name"]: s for s in old["stages"]}
+    for key in ("tracemalloc", "cprofile"):
+        if old.get(key) != new.get(key):
+            yield f"warning: {key} was {old.get(key)} in the old run and {new.get(key)} in the new one; times are not comparable"
+    yield f"{'stage':<36} {'wall old':>9} {'wall new':>9} {'change':>8} {'cpu new':>9} {'peak MiB':>9}"
+    for stage in new["stages"]:
+        before = old_stages.pop(stage["name"], None)
+        peak = f"{stage['peak_memory_bytes'] / 2**20:9.1f}" if "peak_memory_bytes" in stage else f"{'-':>9}"
+        if before is None:
+            yield f"{stage['name']:<36} {'-':>9} {stage['wall_s']:9.3f} {'new':>8} {stage['cpu_s']:9.3f} {peak}"
+            continue
+        change = (stage["wall_s"] - before["wall_s"]) / before["wall_s"] if before["wall_s"] else 0.0
+        flag = " !" if change > threshold else ""
+        yield (f"{stage['name']:<36} {before['wall_s']:9.3f} {stage['wall_s']:9.3f} {change:+8.1%} "
+               f"{stage['cpu_s']:9.3f} {peak}{flag}")
+        for key in sorted(set(before["counters"]) | set(stage["counters"])):
+            a, b = before["counters"].get(key), stage["counters"].get(key)
+            if a != b: yield f"    {key}: {a} -> {b}"
+    for name in old_stages: yield f"{name:<36} (removed)"
+    yield (f"{'total':<36} {old['total']['wall_s']:9.3f} {new['total']['wall_s']:9.3f} "
+           f"{(new['total']['wall_s'] - old['total']['wall_s']) / old['total']['wall_s']:+8.1%}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare two stage profile reports (json_to_ontology.py / aboxconvertprolog.py --profile).")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="mark stages whose wall time grew by more than this fraction")
+    args = parser.parse_args()
+
+    with open(args.old, 'r', encoding='utf-8') as f: old = json.load(f)
+    with open(args.new, 'r', encoding='utf-8') as f: new = json.load(f)
+    for line in compare_reports(old, new, args.threshold): print(line)
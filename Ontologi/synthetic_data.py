@@ -0,0 +1,174 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+
+# Source files, in the layout json_to_ontology.py expects
+DATA_FILES = ("heroes.json", "hero_abilities.json", "abilities.json", "items.json")
+
+# Abilities every hero may list without them being hero-specific; they are kept once, unsuffixed
+SHARED_ABILITIES = {"dota_base_ability", "dota_empty_ability", "special_bonus_attributes", "generic_hidden"}
+
+# Hero and item ids of copy k are offset by k * ID_STRIDE so they never collide with the stock ids
+ID_STRIDE = 10000
+
+HERO_STATS = ("base_health", "base_health_regen", "base_mana", "base_mana_regen", "base_armor", "base_mr",
+              "base_attack_min", "base_attack_max", "base_str", "base_agi", "base_int", "str_gain", "agi_gain",
+              "int_gain", "attack_range", "attack_rate", "move_speed", "day_vision", "night_vision")
+ROLES = ("Carry", "Support", "Nuker", "Disabler", "Jungler", "Durable", "Escape", "Pusher", "Initiator")
+
+
+def load_source(source_dir="."):
+    data = {}
+    for name in DATA_FILES:
+        with open(os.path.join(source_dir, name), 'r', encoding='utf-8') as f: data[name] = json.load(f)
+    return data
+
+
+def _jitter(rng, value, spread=0.1):
+    """Scales a number by up to +-spread, keeping ints as ints."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)): return value
+    scaled = value * (1 + rng.uniform(-spread, spread))
+    return int(round(scaled)) if isinstance(value, int) else round(scaled, 2)
+
+
+def _copy(source, k, rng):
+    """
+    Copy k of the stock dataset. Every hero, ability, talent, facet and item
+    key gets the suffix _s<k> and every reference to it is renamed the same
+    way, so hero -> ability lists, talents, facets and item recipe trees stay
+    consistent inside the copy. Stats, costs and some roles are perturbed so
+    copies do not collapse into identical profiles (hero pair scores, text
+    index postings).
+    """
+    suffix = f"_s{k}"
+    rename = lambda name: name if name in SHARED_ABILITIES else name + suffix
+
+    heroes = {}
+    for hero_id, hero in source["heroes.json"].items():
+        hero = dict(hero)
+        hero["id"] = hero["id"] + k * ID_STRIDE
+        hero["name"] = hero["name"] + suffix
+        hero["localized_name"] = f"{hero['localized_name']} {k}"
+        for stat in HERO_STATS:
+            if stat in hero: hero[stat] = _jitter(rng, hero[stat])
+        roles = list(hero.get("roles", []))
+        if roles and rng.random() < 0.3: roles.pop(rng.randrange(len(roles)))
+        if rng.random() < 0.3:
+            extra = rng.choice(ROLES)
+            if extra not in roles: roles.append(extra)
+        hero["roles"] = roles
+        heroes[str(int(hero_id) + k * ID_STRIDE)] = hero
+
+    hero_abilities = {}
+    for hero_name, entry in source["hero_abilities.json"].items():
+        hero_abilities[hero_name + suffix] = {
+            "abilities": [rename(a) for a in entry.get("abilities", [])],
+            "talents": [dict(t, name=rename(t["name"])) for t in entry.get("talents", [])],
+            "facets": [dict(f, name=rename(f["name"]), title=f"{f['title']} {k}") for f in entry.get("facets", [])],
+        }
+
+    abilities = {rename(key): ability for key, ability in source["abilities.json"].items() if key not in SHARED_ABILITIES}
+
+    items = {}
+    for key, item in source["items.json"].items():
+        item = dict(item)
+        item["id"] = item["id"] + k * ID_STRIDE
+        if item.get("cost"): item["cost"] = _jitter(rng, item["cost"])
+        if item.get("components"): item["components"] = [rename(c) if c else c for c in item["components"]]
+        items[rename(key)] = item
+
+    return {"heroes.json": heroes, "hero_abilities.json": hero_abilities, "abilities.json": abilities, "items.json": items}
+
+
+def generate(source, scale, seed=0):
+    """
+    Returns the four datasets at `scale` times the size of `source`: copy 0 is
+    the stock data unchanged, copies 1..scale-1 come from _copy. Each copy
+    has its own random stream derived from (seed, k), so the first copies of
+    a 100x dataset are the same as the ones of the 10x dataset.
+    """
+    data = {name: dict(source[name]) for name in DATA_FILES}
+    for k in range(1, scale):
+        copy = _copy(source, k, random.Random(f"{seed}:{k}"))
+        for name in DATA_FILES: data[name].update(copy[name])
+    return data
+
+
+def _retune(rng, value, spread=0.1):
+    """_jitter for ability values, which are numbers, "20 16 12" strings or lists of those."""
+    if isinstance(value, list): return [_retune(rng, v, spread) for v in value]
+    if not isinstance(value, str): return _jitter(rng, value, spread)
+    tokens = value.split()
+    try: numbers = [float(t) for t in tokens]
+    except ValueError: return value
+    return " ".join(f"{_jitter(rng, n, spread):g}" for n in numbers)
+
+
+def evolve(data, rng, change_rate=0.02, patch=1):
+    """
+    The next "game patch" of a dataset: about `change_rate` of the heroes,
+    abilities and items get retuned stats, cooldowns, mana costs or costs,
+    one new item is added and one item nothing is built from is removed.
+    Returns a new dataset; `data` is not modified.
+    """
+    data = {name: dict(data[name]) for name in DATA_FILES}
+    for hero_id, hero in data["heroes.json"].items():
+        if rng.random() >= change_rate: continue
+        hero = data["heroes.json"][hero_id] = dict(hero)
+        for stat in rng.sample(HERO_STATS, 3):
+            if stat in hero: hero[stat] = _jitter(rng, hero[stat])
+
+    for key, ability in data["abilities.json"].items():
+        if rng.random() >= change_rate: continue
+        ability = data["abilities.json"][key] = dict(ability)
+        for field in ("cd", "mc"):
+            if ability.get(field): ability[field] = _retune(rng, ability[field])
+
+    items = data["items.json"]
+    for key, item in items.items():
+        if rng.random() < change_rate and item.get("cost"): items[key] = dict(item, cost=_jitter(rng, item["cost"]))
+    components = {c for item in items.values() for c in item.get("components") or () if c}
+    removable = sorted(key for key in items if key not in components)
+    if removable: del items[rng.choice(removable)]
+    template = items[rng.choice(sorted(items))]
+    items[f"patch_{patch}_item"] = dict(template, id=max(i["id"] for i in items.values()) + 1,
+                                         dname=f"Patch {patch} Item", components=None, created=False)
+    return data
+
+
+def write_dataset(data, out_dir):
+    """Writes the datasets to `out_dir` and returns {file name: sha256} of what was written."""
+    os.makedirs(out_dir, exist_ok=True)
+    digests = {}
+    for name in DATA_FILES:
+        content = json.dumps(data[name], ensure_ascii=False).encode("utf-8")
+        with open(os.path.join(out_dir, name), 'wb') as f: f.write(content)
+        digests[name] = hashlib.sha256(content).hexdigest()
+    return digests
+
+
+def dataset_counts(data):
+    return {
+        "heroes": len(data["heroes.json"]),
+        "abilities": len(data["abilities.json"]),
+        "items": len(data["items.json"]),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Write a scaled, structurally valid copy of the Dota 2 JSON data.")
+    parser.add_argument("--scale", type=int, default=10, help="number of copies of the stock dataset")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help="output directory (json_to_ontology.py can be run inside it)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    data = generate(load_source(), args.scale, args.seed)
+    digests = write_dataset(data, args.out)
+    counts = dataset_counts(data)
+    print(f"{args.scale}x dataset (seed {args.seed}) written to '{args.out}' in {time.perf_counter() - start:.2f} s: "
+          f"{counts['heroes']} heroes, {counts['abilities']} abilities, {counts['items']} items.")
+    for name, digest in digests.items(): print(f"  {name:<20} {digest[:16]}")
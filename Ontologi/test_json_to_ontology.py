@@ -0,0 +1,47 @@
+import copy
+import io
+import json
+
+import pytest
+from owlready2 import World
+
+from json_to_ontology import (ONTOLOGY_IRI, build_full_ontology, build_manifest, iter_records, ontology_triples,
+                              populate_incremental)
+
+DATA_FILES = ('heroes.json', 'hero_abilities.json', 'items.json', 'abilities.json')
+
+
+@pytest.fixture(scope="module")
+def dataset(script_dir):
+    data = []
+    for name in DATA_FILES:
+        with open(name, 'r', encoding='utf-8') as f: data.append(json.load(f))
+    return data
+
+
+def changed_dataset(dataset):
+    """A copy of the dataset with one hero, one item and one ability changed."""
+    heroes, hero_abilities, items, abilities = copy.deepcopy(dataset)
+    heroes['1']['localized_name'] = 'Anti-Mage (test)'
+    heroes['1']['roles'] = heroes['1']['roles'][:-1]
+    items['blink']['cost'] += 100
+    ability = abilities['necronomicon_warrior_last_will']
+    ability['desc'] = 'Deals pure damage to the unit that kills the Necronomicon Warrior.'
+    ability['dmg_type'] = 'Pure'
+    return heroes, hero_abilities, items, abilities
+
+
+def test_incremental_matches_full_rebuild(dataset):
+    # An ontology as --incremental finds it: saved as RDF/XML and loaded back, with its manifest
+    xml = io.BytesIO()
+    build_full_ontology(World(), *dataset).save(file=xml, format="rdfxml")
+    xml.seek(0)
+    onto = World().get_ontology(ONTOLOGY_IRI).load(fileobj=xml)
+    old_manifest = build_manifest(iter_records(*dataset))
+
+    changed = changed_dataset(dataset)
+    manifest, report = populate_incremental(onto, list(iter_records(*changed)), old_manifest)
+
+    assert len(report["changed"]) == 3 and not report["added"] and not report["removed"]
+    assert manifest == build_manifest(iter_records(*changed))
+    assert ontology_triples(onto) == ontology_triples(build_full_ontology(World(), *changed))
@@ -0,0 +1,331 @@
+import argparse
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import time
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+# Data properties whose values are indexed, in the order they appear in a document
+TEXT_PROPERTIES = ("displayName", "localizedName", "facetTitle", "description", "facetDescription", "lore", "notes")
+
+# Relations whose object name is indexed as text of the subject (a hero's roles, attribute and attack type)
+TEXT_RELATIONS = ("hasRole", "hasPrimaryAttribute", "hasAttackType")
+
+# Relations to other documents whose matches also count for the subject (a hero's abilities and facets)
+LINK_RELATIONS = ("hasAbility", "hasFacet")
+
+MAGIC = b"D2TI"
+FORMAT_VERSION = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TAG_RE = re.compile(r"<[^>]+>")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercases, strips accents and markup, and splits on anything that is not a letter or digit."""
+    text = unicodedata.normalize("NFKD", TAG_RE.sub(" ", text))
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return TOKEN_RE.findall(text)
+
+
+class TextIndexBuilder:
+    """
+    Collects the text data properties of every individual from the record ops
+    (see json_to_ontology.py) and turns them into documents: one per
+    individual, with the positions of every term. Fields are separated by a
+    one-position gap so a phrase never matches across two fields. The names of
+    a hero's roles, attribute and attack type are fields of the hero, and its
+    abilities and facets are kept as links (see TextIndex.search).
+    """
+    def __init__(self, base_iri, subjects=None):
+        self.base_iri = base_iri
+        self.subjects = subjects
+        self.fields = {}
+        self.links = defaultdict(list)
+
+    def add_ops(self, ops):
+        for op in ops:
+            if self.subjects is not None and op[2] not in self.subjects: continue
+            if op[0] == "data" and op[3] in TEXT_PROPERTIES and isinstance(op[4], str):
+                field = (op[3], op[4])
+            elif op[0] == "rel" and op[3] in TEXT_RELATIONS:
+                field = (op[3], op[5])
+            elif op[0] == "rel" and op[3] in LINK_RELATIONS:
+                self.links[op[2]].append(self.base_iri + op[5])
+                continue
+            else:
+                continue
+            kind, fields = self.fields.setdefault(op[2], (op[1], []))
+            fields.append(field)
+
+    def track(self, records):
+        """Passes records through unchanged, collecting their text on the way."""
+        for record_key, ops in records:
+            self.add_ops(ops)
+            yield record_key, ops
+
+    def documents(self):
+        """Yields (iri, kind, {term: [positions]}, length, [linked iris]) for every individual with text."""
+        for name, (kind, fields) in self.fields.items():
+            positions = defaultdict(list)
+            cursor = 0
+            for prop in TEXT_PROPERTIES + TEXT_RELATIONS:
+                for field_prop, text in fields:
+                    if field_prop != prop: continue
+                    tokens = tokenize(text)
+                    for offset, term in enumerate(tokens): positions[term].append(cursor + offset)
+                    cursor += len(tokens) + 1
+            length = sum(len(p) for p in positions.values())
+            if length: yield self.base_iri + name, kind, dict(positions), length, self.links.get(name, [])
+
+
+def write_index(path, documents, source=None):
+    """
+    Writes documents as an inverted index file:
+
+        MAGIC, version, header length, JSON header, postings
+
+    The header holds `source` (an identifier of the data the documents were
+    built from, see index_source), the document table (IRI, kind, length,
+    ids of the linked documents) and the vocabulary (term -> offset, document frequency, position count). The
+    postings of a term are four little-endian arrays: document ids (uint32,
+    ascending), precomputed BM25 impacts (float32), position offsets
+    (uint32, df + 1) and positions (uint32).
+    """
+    documents = sorted(documents, key=lambda d: d[0])
+    doc_id_of = {d[0]: i for i, d in enumerate(documents)}
+    n_docs = len(documents)
+    avg_length = sum(d[3] for d in documents) / n_docs if n_docs else 0.0
+
+    postings = defaultdict(list)
+    for doc_id, (iri, kind, positions, length, links) in enumerate(documents):
+        for term, term_positions in positions.items():
+            postings[term].append((doc_id, term_positions, length))
+
+    vocabulary = {}
+    blocks = []
+    offset = 0
+    for term in sorted(postings):
+        entries = postings[term]
+        df = len(entries)
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        doc_ids = np.array([e[0] for e in entries], dtype="<u4")
+        impacts = np.array([idf * len(p) * (BM25_K1 + 1) / (len(p) + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length))
+                            for _, p, length in entries], dtype="<f4")
+        pos_offsets = np.cumsum([0] + [len(p) for _, p, _ in entries], dtype="<u4")
+        positions = np.array([pos for _, p, _ in entries for pos in p], dtype="<u4")
+        block = doc_ids.tobytes() + impacts.tobytes() + pos_offsets.astype("<u4").tobytes() + positions.tobytes()
+        vocabulary[term] = (offset, df, len(positions))
+        blocks.append(block)
+        offset += len(block)
+
+    header = json.dumps({
+        "source": source,
+        "docs": [[iri, kind, length, sorted(doc_id_of[link] for link in set(links) if link in doc_id_of)]
+                 for iri, kind, _, length, links in documents],
+        "vocabulary": vocabulary,
+    }, separators=(",", ":")).encode("utf-8")
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + struct.pack("<II", FORMAT_VERSION, len(header)))
+        f.write(header)
+        for block in blocks: f.write(block)
+    os.replace(tmp, path)
+
+
+class TextIndex:
+    """
+    Read side of an index written by write_index. Only the header is parsed
+    on open; the postings stay in the memory-mapped file and a term's arrays
+    are viewed (not copied) the first time a query uses it.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:4] != MAGIC: raise ValueError(f"'{path}' is not a text index file")
+        version, header_length = struct.unpack_from("<II", self._map, 4)
+        if version != FORMAT_VERSION: raise ValueError(f"'{path}' has index format {version}, expected {FORMAT_VERSION}")
+        header = json.loads(self._map[12:12 + header_length])
+        self._base = 12 + header_length
+        self.source = header.get("source")
+        self.iris = [d[0] for d in header["docs"]]
+        self.kinds = np.array([d[1] for d in header["docs"]], dtype=object)
+        self.lengths = np.array([d[2] for d in header["docs"]], dtype=np.int32)
+        self.links = [d[3] for d in header["docs"]]
+        self.link_from = np.array([i for i, links in enumerate(self.links) for _ in links], dtype=np.uint32)
+        self.link_to = np.array([j for links in self.links for j in links], dtype=np.uint32)
+        self.vocabulary = header["vocabulary"]
+        self._postings = {}
+
+    def close(self):
+        self._postings.clear()
+        self._map.close()
+        self._file.close()
+
+    def __len__(self):
+        return len(self.iris)
+
+    def postings(self, term):
+        """(doc_ids, impacts, pos_offsets, positions) of a term, or None if it is not indexed."""
+        cached = self._postings.get(term)
+        if cached is not None: return cached
+        entry = self.vocabulary.get(term)
+        if entry is None: return None
+        offset, df, n_positions = entry
+        start = self._base + offset
+        doc_ids = np.frombuffer(self._map, dtype="<u4", count=df, offset=start)
+        impacts = np.frombuffer(self._map, dtype="<f4", count=df, offset=start + 4 * df)
+        pos_offsets = np.frombuffer(self._map, dtype="<u4", count=df + 1, offset=start + 8 * df)
+        positions = np.frombuffer(self._map, dtype="<u4", count=n_positions, offset=start + 12 * df + 4)
+        cached = self._postings[term] = (doc_ids, impacts, pos_offsets, positions)
+        return cached
+
+    def _phrase_docs(self, phrase):
+        """Ids of the documents containing the terms of `phrase` at consecutive positions."""
+        keys = None
+        for shift, term in enumerate(phrase):
+            doc_ids, _, pos_offsets, positions = self.postings(term)
+            owners = np.repeat(doc_ids.astype(np.uint64), np.diff(pos_offsets))
+            starts = positions.astype(np.int64) - shift
+            valid = starts >= 0
+            term_keys = (owners[valid] << np.uint64(32)) | starts[valid].astype(np.uint64)
+            keys = term_keys if keys is None else np.intersect1d(keys, term_keys, assume_unique=True)
+            if not len(keys): break
+        return np.unique(keys >> np.uint64(32)).astype(np.uint32)
+
+    def search(self, query, kinds=None, limit=10):
+        """
+        Returns up to `limit` (score, iri, kind) tuples for the documents that
+        contain every keyword and every "quoted phrase" of `query`, ranked by
+        BM25. A document with links (a hero) also matches through the linked
+        documents that match (its abilities and facets), and scores its own
+        score plus theirs. `kinds` optionally restricts the result to e.g.
+        ("hero", "item").
+        """
+        phrases = [tokenize(p) for p in re.findall(r'"([^"]*)"', query)]
+        phrases = [p for p in phrases if p]
+        terms = set(tokenize(re.sub(r'"[^"]*"', " ", query)))
+        for phrase in phrases: terms.update(phrase)
+        if not terms: return []
+
+        lists = []
+        for term in terms:
+            posting = self.postings(term)
+            if posting is None: return []
+            lists.append((term, posting))
+        lists.sort(key=lambda item: len(item[1][0]))
+
+        candidates = lists[0][1][0]
+        for _, (doc_ids, _, _, _) in lists[1:]:
+            candidates = candidates[np.isin(candidates, doc_ids, assume_unique=True)]
+            if not len(candidates): return []
+        if phrases:
+            for phrase in phrases:
+                candidates = candidates[np.isin(candidates, self._phrase_docs(phrase), assume_unique=True)]
+        if not len(candidates): return []
+
+        scores = np.zeros(len(candidates), dtype=np.float32)
+        for _, (doc_ids, impacts, _, _) in lists:
+            scores += impacts[np.searchsorted(doc_ids, candidates)]
+
+        hit = np.isin(self.link_to, candidates)
+        if hit.any():
+            gained = scores[np.searchsorted(candidates, self.link_to[hit])]
+            candidates, inverse = np.unique(np.concatenate((candidates, self.link_from[hit])), return_inverse=True)
+            scores = np.bincount(inverse, weights=np.concatenate((scores, gained))).astype(np.float32)
+        if kinds is not None:
+            keep = np.isin(self.kinds[candidates], list(kinds))
+            candidates, scores = candidates[keep], scores[keep]
+        if not len(candidates): return []
+        order = np.lexsort((candidates, -scores))[:limit]
+        return [(float(scores[i]), self.iris[candidates[i]], self.kinds[candidates[i]]) for i in order]
+
+    def documents(self):
+        """Yields (iri, kind, {term: [positions]}, length, [linked iris]) for every document, by inverting the postings."""
+        positions = [defaultdict(list) for _ in self.iris]
+        for term in self.vocabulary:
+            doc_ids, _, pos_offsets, term_positions = self.postings(term)
+            for i, doc_id in enumerate(doc_ids.tolist()):
+                positions[doc_id][term] = term_positions[pos_offsets[i]:pos_offsets[i + 1]].tolist()
+        for doc_id, iri in enumerate(self.iris):
+            yield (iri, self.kinds[doc_id], dict(positions[doc_id]), int(self.lengths[doc_id]),
+                   [self.iris[j] for j in self.links[doc_id]])
+
+
+def index_source(path):
+    """The `source` stored in the index at `path`, or None if there is no readable index."""
+    try:
+        index = TextIndex(path)
+    except (OSError, ValueError):
+        return None
+    try:
+        return index.source
+    finally:
+        index.close()
+
+
+def update_text_index(path, records, subjects, base_iri, source=None):
+    """
+    Updates an existing index after an incremental ontology build. Only the
+    individuals in `subjects` (the ones the changed records touched) are
+    re-tokenized from `records`; every other document is carried over from
+    the existing postings unchanged. The caller checks that the index was
+    built from the data the incremental build started from (index_source);
+    `source` identifies the updated data.
+    """
+    subjects = set(subjects)
+    builder = TextIndexBuilder(base_iri, subjects=subjects)
+    for record_key, ops in records: builder.add_ops(ops)
+
+    affected = {base_iri + name for name in subjects}
+    index = TextIndex(path)
+    try:
+        kept = [doc for doc in index.documents() if doc[0] not in affected]
+    finally:
+        index.close()
+    write_index(path, kept + list(builder.documents()), source)
+
+
+if __name__ == '__main__':
+    TEXT_INDEX_FILE = 'dota2_ontology.textindex'
+
+    parser = argparse.ArgumentParser(description="Search the text index written by json_to_ontology.py.")
+    parser.add_argument("query", help='keywords and "quoted phrases"; every one must match')
+    parser.add_argument("--kind", action="append", choices=["hero", "ability", "item", "unit", "concept"],
+                        help="only return individuals of this kind (repeatable)")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--bench", action="store_true", help="time the query and a linear scan over the same text")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = TextIndex(TEXT_INDEX_FILE)
+    print(f"Opened '{TEXT_INDEX_FILE}': {len(index)} documents, {len(index.vocabulary)} terms "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
+    start = time.perf_counter()
+    results = index.search(args.query, kinds=args.kind, limit=args.limit)
+    print(f"First query: {(time.perf_counter() - start) * 1000:.2f} ms")
+    for score, iri, kind in results:
+        print(f"  {score:7.3f}  {kind:<8} {iri.rsplit('#', 1)[-1]}")
+
+    if args.bench:
+        repeat = 2000
+        start = time.perf_counter()
+        for _ in range(repeat): index.search(args.query, kinds=args.kind, limit=args.limit)
+        print(f"Indexed search: {(time.perf_counter() - start) / repeat * 1e6:.1f} us per query")
+
+        documents = list(index.documents())
+        terms = tokenize(args.query)
+        start = time.perf_counter()
+        for _ in range(20): [iri for iri, _, positions, *_ in documents if all(t in positions for t in terms)]
+        print(f"Linear scan:    {(time.perf_counter() - start) / 20 * 1e6:.1f} us per query")